@@ -290,6 +290,8 @@ struct ClusterLog {
     1: required string message
     2: required string cluster_id
     3: required string log
+    /** Number of log lines up to and including this log, used as cursor for the next tail request */
+    4: optional i64 offset
 }
 
 /**
@@ -304,6 +306,30 @@ struct PlaybookResult {
     3: required string stderr
 }
 
+/**
+ * This Struct defines the state of an asynchronous operation.
+ */
+struct Operation {
+    /** Id of the operation */
+    1: required string id
+    /** Name of the call which is executed, e.g. create_snapshot */
+    2: required string type
+    /** pending, running, succeeded or failed */
+    3: required string status
+    /** Progress in percent: 0 pending, 50 running, 100 succeeded or failed */
+    4: required int progress
+    /** Result of the call, e.g. the id of the new snapshot */
+    5: optional string result
+    /** Error message if the operation failed */
+    6: optional string error
+    /** Parameters of the call */
+    7: optional map<string,string> params
+    /** Unix timestamp of the submission */
+    8: optional i64 created_at
+    /** Unix timestamp of the last status change */
+    9: optional i64 updated_at
+}
+
 exception MetadataServerNotAvailableException {
     1: string message
 }
@@ -413,6 +439,12 @@ service VirtualMachineService {
      */
     string get_client_version()
 
+    /**
+     * Check if the client finished its warmup and is ready for traffic.
+     * Returns true once all connectors are initialized and the caches are filled
+     */
+    bool is_ready()
+
     	/**
 	 * Gets the gateway ip.
 	 */
@@ -722,6 +754,20 @@ service VirtualMachineService {
     2:string user_id
     ) throws (1:BackendNotFoundException b)
 
+    /** Add users to a backend.
+    Returns: Result of every user, keyed by user id.*/
+    map<string,map<string,string>> add_users_to_backend(
+    1:i64 backend_id,
+    2:list<string> user_ids
+    ) throws (1:BackendNotFoundException b)
+
+    /** Delete users from a backend.
+    Returns: Result of every user, keyed by user id.*/
+    map<string,map<string,string>> delete_users_from_backend(
+    1:i64 backend_id,
+    2:list<string> user_ids
+    ) throws (1:BackendNotFoundException b)
+
     /** Activate Authentification for backend*/
     Backend activate_auth_for_backend(
     1:i64 backend_id
@@ -768,8 +814,17 @@ service VirtualMachineService {
 
 	ClusterLog get_cluster_log(1:string cluster_id) throws(1:ClusterNotFoundException c)
 
+	/** Get the log lines of a cluster after offset.
+	Returns: The new lines and the offset to request the following lines with.*/
+	ClusterLog get_cluster_log_tail(1:string cluster_id, 2:i64 offset) throws(1:ClusterNotFoundException c)
+
     ClusterState get_cluster_state(1:string cluster_id) throws(1:ClusterNotFoundException c)
 
+    /** Get the states of several clusters.
+    Clusters whose state could not be fetched in time are left out.
+    Returns: Cluster states keyed by cluster id.*/
+    map<string,ClusterState> get_cluster_states(1:list<string> cluster_ids)
+
 	string get_keypair_public_key_by_name(1:string key_name)
 
 	void delete_keypair(1:string key_name)
@@ -892,8 +947,108 @@ service VirtualMachineService {
 
     throws (1:VolumeNotFoundException e, 2: OpenStackConflictException c),
 
+    /**
+     * Create Snapshot in the background.
+     * Returns: Id of the operation, its result is the id of the new Snapshot
+     */
+    string create_snapshot_async(
+    /** Id of the server */
+    1:string openstack_id,
+
+    /** Name of new Snapshot */
+    2:string name,
+
+    /** unique username of the user who requested creation of Snapshot */
+    3:string username,
+
+    /** Tags with which the servers image is also tagged */
+    4:list<string> base_tags,
+
+    /** Description of the new snapshot*/
+    5:string description)
 
+    throws (1:DefaultException e),
+
+    /**
+     * Create volume by source volume in the background.
+     * Returns: Id of the operation, its result is the id of the new volume
+     */
+    string create_volume_by_source_volume_async(
+    /**  Name of volume*/
+    1:string volume_name,
 
+    /** Metadata for the new volume*/
+    2:map<string,string> metadata,
+
+    /**  ID of source volume*/
+    3:string source_volume_id)
+
+    throws (1:DefaultException e),
+
+    /**
+     * Create volume by volume snapshot in the background.
+     * Returns: Id of the operation, its result is the id of the new volume
+     */
+    string create_volume_by_volume_snap_async(
+    /**  Name of volume*/
+    1:string volume_name,
+
+    /** Metadata for the new volume*/
+    2:map<string,string> metadata,
+
+    /**  ID of volume snapshot*/
+    3:string volume_snap_id)
+
+    throws (1:DefaultException e),
+
+    /**
+     * Attach volume to server in the background.
+     * Returns: Id of the operation, its result is the attachment as JSON
+     */
+    string attach_volume_to_server_async(
+    /** Id of server*/
+    1:string openstack_id,
+
+    /** Id of volume*/
+    2:string volume_id)
+
+    throws (1:DefaultException e),
+
+    /**
+     * Delete volume attachment in the background.
+     * Returns: Id of the operation
+     */
+    string detach_volume_async(
+    /** Id of the attached volume */
+    1:string volume_id,
+
+    /** Id of the server where the volume is attached */
+    2:string server_id)
+
+    throws (1:DefaultException e),
+
+    /**
+     * Rescue server in the background.
+     * Returns: Id of the operation
+     */
+    string rescue_server_async(
+    /** Id of the server. */
+    1:string openstack_id,
+    2:string admin_pass,
+    3:string image_ref)
+
+    throws (1:DefaultException e),
+
+    /**
+     * Get the state of an operation.
+     */
+    Operation get_operation(1:string operation_id) throws (1:ResourceNotFoundException r),
+
+    /**
+     * List the most recent operations, newest first.
+     * Empty filters match every operation.
+     */
+    list<Operation> list_operations(1:string operation_type, 2:string status),
 
     /**
      * Resume Server.
@@ -6,6 +6,11 @@ Which can be used for the PortalClient.
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
 from simple_vm_client.bibigrid_connector.bibigrid_connector import BibigridConnector
 from simple_vm_client.flavor_resource_exporter_connector.flavor_resource_exporter_connector import (
     FlavorResourceExporterConnector,
@@ -14,6 +19,7 @@ from simple_vm_client.forc_connector.forc_connector import ForcConnector
 from simple_vm_client.openstack_connector.openstack_connector import OpenStackConnector
 from simple_vm_client.util import thrift_converter
 from simple_vm_client.util.logger import setup_custom_logger
+from simple_vm_client.util.operation_manager import OperationManager
 
 from .metadata_connector.metadata_connector import MetadataConnector
 from .ttypes import (
@@ -26,11 +32,14 @@ from .ttypes import (
     ClusterMessage,
     ClusterState,
     CondaPackage,
+    DefaultException,
     Flavor,
     FlavorResource,
     Image,
+    Operation,
     PlaybookResult,
     ResearchEnvironmentTemplate,
+    ResourceNotFoundException,
     Snapshot,
     VirtualMachineServerMetadata,
     Volume,
@@ -39,20 +48,185 @@ from .VirtualMachineService import Iface
 
 logger = setup_custom_logger(__name__)
 
+CONNECTOR_PENDING = "pending"
+CONNECTOR_READY = "ready"
+CONNECTOR_FAILED = "failed"
+WARMUP_RETRY_INTERVAL = 30
+# readiness only depends on these, the others are warmed up best-effort
+REQUIRED_CONNECTORS = ("openstack_connector",)
+
+
+class LazyConnector:
+    """
+    Connector attribute which is only built on first access.
+
+    Building a connector talks to the backing service, so this keeps it out of
+    the server startup. Once built, the connector is stored on the instance
+    and the descriptor is no longer consulted.
+    """
+
+    def __init__(self, factory: Callable[[str], Any]):
+        self.factory = factory
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, handler: VirtualMachineHandler, owner: type) -> Any:
+        if handler is None:
+            return self
+        return handler._init_connector(self.name, self.factory)
+
 
 class VirtualMachineHandler(Iface):
     """Handler which the PortalClient uses."""
 
+    # the lambdas look the classes up on call, so they can still be patched
+    openstack_connector = LazyConnector(
+        lambda config_file: OpenStackConnector(config_file=config_file)
+    )
+    bibigrid_connector = LazyConnector(
+        lambda config_file: BibigridConnector(config_file=config_file)
+    )
+    forc_connector = LazyConnector(
+        lambda config_file: ForcConnector(config_file=config_file)
+    )
+    metadata_connetor = LazyConnector(
+        lambda config_file: MetadataConnector(config_file=config_file)
+    )
+    flavor_resource_exporter = LazyConnector(
+        lambda config_file: FlavorResourceExporterConnector(config_file=config_file)
+    )
+    operation_manager = LazyConnector(
+        lambda config_file: OperationManager(config_file=config_file)
+    )
+
     def __init__(self, config_file: str):
-        self.openstack_connector = OpenStackConnector(config_file=config_file)
-        self.bibigrid_connector = BibigridConnector(config_file=config_file)
-        self.forc_connector = ForcConnector(config_file=config_file)
-        self.metadata_connetor = MetadataConnector(config_file=config_file)
-        self.flavor_resource_exporter = FlavorResourceExporterConnector(
-            config_file=config_file
-        )
+        self.config_file = config_file
+        self._connector_locks = {
+            name: threading.Lock() for name in self.get_connector_names()
+        }
+        self._connector_states: dict[str, dict[str, Any]] = {
+            name: {"state": CONNECTOR_PENDING} for name in self.get_connector_names()
+        }
+        self._ready = threading.Event()
+
+    @classmethod
+    def get_connector_names(cls) -> list[str]:
+        return [
+            name
+            for name, value in vars(cls).items()
+            if isinstance(value, LazyConnector)
+        ]
+
+    def _init_connector(self, name: str, factory: Callable[[str], Any]) -> Any:
+        with self._connector_locks[name]:
+            # another thread may have finished while we were waiting for the lock
+            if name in self.__dict__:
+                return self.__dict__[name]
+            logger.info(f"Initializing {name}")
+            start_time = time.monotonic()
+            try:
+                connector = factory(self.config_file)
+            except Exception as e:
+                self._connector_states[name] = {
+                    "state": CONNECTOR_FAILED,
+                    "error": str(e),
+                }
+                logger.exception(f"Initializing {name} failed")
+                raise
+            duration = round(time.monotonic() - start_time, 3)
+            self.__dict__[name] = connector
+            self._connector_states[name] = {
+                "state": CONNECTOR_READY,
+                "duration": duration,
+            }
+            logger.info(f"Initialized {name} in {duration}s")
+            return connector
+
+    def is_connector_initialized(self, name: str) -> bool:
+        return name in self.__dict__
+
+    def init_connectors(self) -> None:
+        """Build every connector right away instead of on first use."""
+        for name in self.get_connector_names():
+            getattr(self, name)
+
+    def get_connector_states(self) -> dict[str, dict[str, Any]]:
+        return {name: dict(state) for name, state in self._connector_states.items()}
+
+    def _warmup_connector(self, name: str) -> None:
+        connector = getattr(self, name)
+        warmup = getattr(connector, "warmup", None)
+        if warmup:
+            warmup()
+
+    def warmup(self) -> None:
+        """
+        Initialize all connectors concurrently and let them prefetch their caches.
+
+        Marks the handler as ready when the required connectors succeeded. A
+        failed optional connector is only logged and built again on first use.
+        """
+        start_time = time.monotonic()
+        names = self.get_connector_names()
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {
+                executor.submit(self._warmup_connector, name): name for name in names
+            }
+        failed = [futures[future] for future in futures if future.exception()]
+        optional_failed = [name for name in failed if name not in REQUIRED_CONNECTORS]
+        if optional_failed:
+            logger.warning(
+                f"Warmup failed for optional connectors: {', '.join(optional_failed)}"
+            )
+        required_failed = [name for name in failed if name in REQUIRED_CONNECTORS]
+        if required_failed:
+            raise DefaultException(
+                message=f"Warmup failed for: {', '.join(required_failed)}"
+            )
+        logger.info(f"Warmup finished in {round(time.monotonic() - start_time, 3)}s")
+        self._ready.set()
+
+    def start_warmup(self) -> threading.Thread:
+        """Run the warmup in the background, retrying until it succeeds."""
+
+        def run() -> None:
+            while True:
+                try:
+                    self.warmup()
+                    return
+                except Exception:
+                    logger.exception(
+                        f"Warmup failed, retrying in {WARMUP_RETRY_INTERVAL}s"
+                    )
+                    time.sleep(WARMUP_RETRY_INTERVAL)
+
+        thread = threading.Thread(target=run, name="warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def mark_ready(self) -> None:
+        self._ready.set()
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def get_readiness(self) -> dict[str, Any]:
+        readiness = {
+            "ready": self.is_ready(),
+            "connectors": self.get_connector_states(),
+        }
+        if self.is_connector_initialized("openstack_connector"):
+            readiness["openstack_session"] = (
+                self.openstack_connector.get_session_metrics()
+            )
+        return readiness
 
     def keyboard_interrupt_handler_playbooks(self) -> None:
+        if not self.is_connector_initialized("forc_connector"):
+            # no playbook can have been started yet
+            raise SystemExit(0)
         for k, v in self.forc_connector.active_playbooks.items():
             logger.info(f"Clearing traces of Playbook-VM for (openstack_id): {k}")
             self.openstack_connector.delete_keypair(
@@ -320,6 +494,111 @@ class VirtualMachineHandler(Iface):
             openstack_id=openstack_id, volume_id=volume_id
         )
 
+    def create_snapshot_async(
+        self,
+        openstack_id: str,
+        name: str,
+        username: str,
+        base_tags: list[str],
+        description: str,
+    ) -> str:
+        return self.operation_manager.submit(
+            "create_snapshot",
+            lambda: self.create_snapshot(
+                openstack_id=openstack_id,
+                name=name,
+                username=username,
+                base_tags=base_tags,
+                description=description,
+            ),
+            params={
+                "openstack_id": openstack_id,
+                "name": name,
+                "username": username,
+                "base_tags": base_tags,
+                "description": description,
+            },
+        )
+
+    def create_volume_by_source_volume_async(
+        self, volume_name: str, metadata: dict[str, str], source_volume_id: str
+    ) -> str:
+        return self.operation_manager.submit(
+            "create_volume_by_source_volume",
+            lambda: self.openstack_connector.create_volume_by_source_volume(
+                volume_name=volume_name,
+                metadata=metadata,
+                source_volume_id=source_volume_id,
+            ).id,
+            params={
+                "volume_name": volume_name,
+                "metadata": metadata,
+                "source_volume_id": source_volume_id,
+            },
+        )
+
+    def create_volume_by_volume_snap_async(
+        self, volume_name: str, metadata: dict[str, str], volume_snap_id: str
+    ) -> str:
+        return self.operation_manager.submit(
+            "create_volume_by_volume_snap",
+            lambda: self.openstack_connector.create_volume_by_volume_snap(
+                volume_name=volume_name,
+                metadata=metadata,
+                volume_snap_id=volume_snap_id,
+            ).id,
+            params={
+                "volume_name": volume_name,
+                "metadata": metadata,
+                "volume_snap_id": volume_snap_id,
+            },
+        )
+
+    def attach_volume_to_server_async(self, openstack_id: str, volume_id: str) -> str:
+        return self.operation_manager.submit(
+            "attach_volume_to_server",
+            lambda: self.attach_volume_to_server(
+                openstack_id=openstack_id, volume_id=volume_id
+            ),
+            params={"openstack_id": openstack_id, "volume_id": volume_id},
+        )
+
+    def detach_volume_async(self, volume_id: str, server_id: str) -> str:
+        return self.operation_manager.submit(
+            "detach_volume",
+            lambda: self.detach_volume(volume_id=volume_id, server_id=server_id),
+            params={"volume_id": volume_id, "server_id": server_id},
+        )
+
+    def rescue_server_async(
+        self, openstack_id: str, admin_pass: str = None, image_ref: str = None
+    ) -> str:
+        # the admin password must not end up in redis
+        return self.operation_manager.submit(
+            "rescue_server",
+            lambda: self.rescue_server(
+                openstack_id=openstack_id, admin_pass=admin_pass, image_ref=image_ref
+            ),
+            params={"openstack_id": openstack_id, "image_ref": image_ref},
+        )
+
+    def get_operation(self, operation_id: str) -> Operation:
+        operation = self.operation_manager.get_operation(operation_id)
+        if operation is None:
+            raise ResourceNotFoundException(
+                message=f"Operation {operation_id} not found",
+                resource_type="operation",
+                name_or_id=operation_id,
+            )
+        return operation
+
+    def list_operations(
+        self, operation_type: str = None, status: str = None
+    ) -> list[Operation]:
+        return self.operation_manager.list_operations(
+            operation_type=operation_type, status=status
+        )
+
     def get_limits(self) -> dict[str, str]:
         return self.openstack_connector.get_limits()
 
@@ -361,6 +640,20 @@ class VirtualMachineHandler(Iface):
             user_id=user_id, backend_id=backend_id
         )
 
+    def add_users_to_backend(
+        self, backend_id: str, user_ids: list[str]
+    ) -> dict[str, dict[str, str]]:
+        return self.forc_connector.add_users_to_backend(
+            backend_id=backend_id, user_ids=user_ids
+        )
+
+    def delete_users_from_backend(
+        self, backend_id: str, user_ids: list[str]
+    ) -> dict[str, dict[str, str]]:
+        return self.forc_connector.delete_users_from_backend(
+            backend_id=backend_id, user_ids=user_ids
+        )
+
     def activate_auth_for_backend(self, backend_id: str):
         return self.forc_connector.activate_auth_for_backend(backend_id=backend_id)
 
@@ -552,13 +845,11 @@ class VirtualMachineHandler(Iface):
         Returns:
             True if the connection is active, False otherwise.
         """
-        try:
-            # Use get_limits() which is a lightweight call to verify connection
-            self.openstack_connector.get_limits()
+        # the token check costs one Keystone request instead of two limit calls
+        if self.openstack_connector.is_token_valid():
             return True
-        except Exception:
-            logger.error("OpenStack connection check failed")
-            return False
+        logger.error("OpenStack connection check failed")
+        return False
 
     def get_security_group_id_by_name(self, security_group_name) -> str:
         return self.openstack_connector.get_security_group_id_by_name(
@@ -574,9 +865,17 @@ class VirtualMachineHandler(Iface):
     def get_cluster_log(self, cluster_id: str) -> ClusterLog:
         return self.bibigrid_connector.get_cluster_log(cluster_id=cluster_id)
 
+    def get_cluster_log_tail(self, cluster_id: str, offset: int) -> ClusterLog:
+        return self.bibigrid_connector.get_cluster_log_tail(
+            cluster_id=cluster_id, offset=offset
+        )
+
     def get_cluster_state(self, cluster_id: str) -> ClusterState:
         return self.bibigrid_connector.get_cluster_state(cluster_id=cluster_id)
 
+    def get_cluster_states(self, cluster_ids: list[str]) -> dict[str, ClusterState]:
+        return self.bibigrid_connector.get_cluster_states(cluster_ids=cluster_ids)
+
     def start_cluster(
         self,
         public_keys: list[str],
@@ -595,6 +894,26 @@ class VirtualMachineHandler(Iface):
     def terminate_cluster(self, cluster_id: str) -> dict[str, str]:
         return self.bibigrid_connector.terminate_cluster(cluster_id=cluster_id)
 
+    def scale_up_cluster(
+        self,
+        cluster_id: str,
+        image_name: str,
+        flavor_name: str,
+        count: int,
+        names: list[str],
+        start_idx: int,
+        batch_idx: int,
+    ) -> dict[str, list[str]]:
+        return self.openstack_connector.scale_up_cluster(
+            cluster_id=cluster_id,
+            image_name=image_name,
+            flavor_name=flavor_name,
+            count=count,
+            names=names,
+            start_idx=start_idx,
+            batch_idx=batch_idx,
+        )
+
     def add_cluster_machine(
         self,
         cluster_id: str,
@@ -8,6 +8,7 @@ from thrift.protocol import TBinaryProtocol
 from thrift.server import TServer
 from thrift.transport import TSocket, TSSLSocket, TTransport
 
+from simple_vm_client.util.health_server import start_health_server
 from simple_vm_client.VirtualMachineHandler import VirtualMachineHandler
 from simple_vm_client.VirtualMachineService import Processor
 
@@ -44,8 +45,20 @@ def startServer(config: str) -> None:
             CA_CERTS_PATH = cfg["server"].get("ca_certs_path", None)
 
         THREADS = cfg["server"]["threads"]
+        WARMUP = cfg["server"].get("warmup", True)
+        HEALTH_PORT = cfg["server"].get("health_port", None)
     click.echo(f"Server is running on port {PORT}")
     handler = VirtualMachineHandler(CONFIG_FILE)
+    if WARMUP:
+        click.echo("Warming up in the background")
+        handler.start_warmup()
+    else:
+        handler.mark_ready()
+    if HEALTH_PORT:
+        click.echo(f"Health endpoint is running on port {HEALTH_PORT}")
+        start_health_server(
+            host=HOST, port=HEALTH_PORT, readiness=handler.get_readiness
+        )
     processor = Processor(handler)
 
     if USE_SSL:
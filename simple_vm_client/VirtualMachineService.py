@@ -38,6 +38,13 @@ class Iface(object):
 
         """
 
+    def is_ready(self):
+        """
+        Check if the client finished its warmup and is ready for traffic.
+        Returns true once all connectors are initialized and the caches are filled
+
+        """
+
     def get_gateway_ip(self):
         """
         Gets the gateway ip.
@@ -466,6 +473,28 @@ class Iface(object):
 
         """
 
+    def add_users_to_backend(self, backend_id, user_ids):
+        """
+        Add users to a backend.
+        Returns: Result of every user, keyed by user id.
+
+        Parameters:
+         - backend_id
+         - user_ids
+
+        """
+
+    def delete_users_from_backend(self, backend_id, user_ids):
+        """
+        Delete users from a backend.
+        Returns: Result of every user, keyed by user id.
+
+        Parameters:
+         - backend_id
+         - user_ids
+
+        """
+
     def activate_auth_for_backend(self, backend_id):
         """
         Activate Authentification for backend
@@ -579,6 +608,17 @@ class Iface(object):
 
         """
 
+    def get_cluster_log_tail(self, cluster_id, offset):
+        """
+        Get the log lines of a cluster after offset.
+        Returns: The new lines and the offset to request the following lines with.
+
+        Parameters:
+         - cluster_id
+         - offset
+
+        """
+
     def get_cluster_state(self, cluster_id):
         """
         Parameters:
@@ -586,6 +626,17 @@ class Iface(object):
 
         """
 
+    def get_cluster_states(self, cluster_ids):
+        """
+        Get the states of several clusters.
+        Clusters whose state could not be fetched in time are left out.
+        Returns: Cluster states keyed by cluster id.
+
+        Parameters:
+         - cluster_ids
+
+        """
+
     def get_keypair_public_key_by_name(self, key_name):
         """
         Parameters:
@@ -731,6 +782,102 @@ class Iface(object):
 
         """
 
+    def create_snapshot_async(
+        self, openstack_id, name, username, base_tags, description
+    ):
+        """
+        Create Snapshot in the background.
+        Returns: Id of the operation, its result is the id of the new Snapshot
+
+        Parameters:
+         - openstack_id
+         - name
+         - username
+         - base_tags
+         - description
+
+        """
+
+    def create_volume_by_source_volume_async(
+        self, volume_name, metadata, source_volume_id
+    ):
+        """
+        Create volume by source volume in the background.
+        Returns: Id of the operation, its result is the id of the new volume
+
+        Parameters:
+         - volume_name
+         - metadata
+         - source_volume_id
+
+        """
+
+    def create_volume_by_volume_snap_async(self, volume_name, metadata, volume_snap_id):
+        """
+        Create volume by volume snapshot in the background.
+        Returns: Id of the operation, its result is the id of the new volume
+
+        Parameters:
+         - volume_name
+         - metadata
+         - volume_snap_id
+
+        """
+
+    def attach_volume_to_server_async(self, openstack_id, volume_id):
+        """
+        Attach volume to server in the background.
+        Returns: Id of the operation, its result is the attachment as JSON
+
+        Parameters:
+         - openstack_id
+         - volume_id
+
+        """
+
+    def detach_volume_async(self, volume_id, server_id):
+        """
+        Delete volume attachment in the background.
+        Returns: Id of the operation
+
+        Parameters:
+         - volume_id
+         - server_id
+
+        """
+
+    def rescue_server_async(self, openstack_id, admin_pass, image_ref):
+        """
+        Rescue server in the background.
+        Returns: Id of the operation
+
+        Parameters:
+         - openstack_id
+         - admin_pass
+         - image_ref
+
+        """
+
+    def get_operation(self, operation_id):
+        """
+        Get the state of an operation.
+
+        Parameters:
+         - operation_id
+
+        """
+
+    def list_operations(self, operation_type, status):
+        """
+        List the most recent operations, newest first.
+        Empty filters match every operation.
+
+        Parameters:
+         - operation_type
+         - status
+
+        """
+
     def resume_server(self, openstack_id):
         """
         Resume Server.
@@ -905,6 +1052,40 @@ class Client(Iface):
             "get_client_version failed: unknown result",
         )
 
+    def is_ready(self):
+        """
+        Check if the client finished its warmup and is ready for traffic.
+        Returns true once all connectors are initialized and the caches are filled
+
+        """
+        self.send_is_ready()
+        return self.recv_is_ready()
+
+    def send_is_ready(self):
+        self._oprot.writeMessageBegin("is_ready", TMessageType.CALL, self._seqid)
+        args = is_ready_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_is_ready(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = is_ready_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "is_ready failed: unknown result",
+        )
+
     def get_gateway_ip(self):
         """
         Gets the gateway ip.
@@ -2777,6 +2958,94 @@ class Client(Iface):
             "delete_user_from_backend failed: unknown result",
         )
 
+    def add_users_to_backend(self, backend_id, user_ids):
+        """
+        Add users to a backend.
+        Returns: Result of every user, keyed by user id.
+
+        Parameters:
+         - backend_id
+         - user_ids
+
+        """
+        self.send_add_users_to_backend(backend_id, user_ids)
+        return self.recv_add_users_to_backend()
+
+    def send_add_users_to_backend(self, backend_id, user_ids):
+        self._oprot.writeMessageBegin(
+            "add_users_to_backend", TMessageType.CALL, self._seqid
+        )
+        args = add_users_to_backend_args()
+        args.backend_id = backend_id
+        args.user_ids = user_ids
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_add_users_to_backend(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = add_users_to_backend_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.b is not None:
+            raise result.b
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "add_users_to_backend failed: unknown result",
+        )
+
+    def delete_users_from_backend(self, backend_id, user_ids):
+        """
+        Delete users from a backend.
+        Returns: Result of every user, keyed by user id.
+
+        Parameters:
+         - backend_id
+         - user_ids
+
+        """
+        self.send_delete_users_from_backend(backend_id, user_ids)
+        return self.recv_delete_users_from_backend()
+
+    def send_delete_users_from_backend(self, backend_id, user_ids):
+        self._oprot.writeMessageBegin(
+            "delete_users_from_backend", TMessageType.CALL, self._seqid
+        )
+        args = delete_users_from_backend_args()
+        args.backend_id = backend_id
+        args.user_ids = user_ids
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_delete_users_from_backend(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = delete_users_from_backend_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.b is not None:
+            raise result.b
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "delete_users_from_backend failed: unknown result",
+        )
+
     def activate_auth_for_backend(self, backend_id):
         """
         Activate Authentification for backend
@@ -3289,6 +3558,50 @@ class Client(Iface):
             "get_cluster_log failed: unknown result",
         )
 
+    def get_cluster_log_tail(self, cluster_id, offset):
+        """
+        Get the log lines of a cluster after offset.
+        Returns: The new lines and the offset to request the following lines with.
+
+        Parameters:
+         - cluster_id
+         - offset
+
+        """
+        self.send_get_cluster_log_tail(cluster_id, offset)
+        return self.recv_get_cluster_log_tail()
+
+    def send_get_cluster_log_tail(self, cluster_id, offset):
+        self._oprot.writeMessageBegin(
+            "get_cluster_log_tail", TMessageType.CALL, self._seqid
+        )
+        args = get_cluster_log_tail_args()
+        args.cluster_id = cluster_id
+        args.offset = offset
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_cluster_log_tail(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_cluster_log_tail_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.c is not None:
+            raise result.c
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "get_cluster_log_tail failed: unknown result",
+        )
+
     def get_cluster_state(self, cluster_id):
         """
         Parameters:
@@ -3328,6 +3641,47 @@ class Client(Iface):
             "get_cluster_state failed: unknown result",
         )
 
+    def get_cluster_states(self, cluster_ids):
+        """
+        Get the states of several clusters.
+        Clusters whose state could not be fetched in time are left out.
+        Returns: Cluster states keyed by cluster id.
+
+        Parameters:
+         - cluster_ids
+
+        """
+        self.send_get_cluster_states(cluster_ids)
+        return self.recv_get_cluster_states()
+
+    def send_get_cluster_states(self, cluster_ids):
+        self._oprot.writeMessageBegin(
+            "get_cluster_states", TMessageType.CALL, self._seqid
+        )
+        args = get_cluster_states_args()
+        args.cluster_ids = cluster_ids
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_cluster_states(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_cluster_states_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "get_cluster_states failed: unknown result",
+        )
+
     def get_keypair_public_key_by_name(self, key_name):
         """
         Parameters:
@@ -3946,26 +4300,43 @@ class Client(Iface):
             "attach_volume_to_server failed: unknown result",
         )
 
-    def resume_server(self, openstack_id):
+    def create_snapshot_async(
+        self, openstack_id, name, username, base_tags, description
+    ):
         """
-        Resume Server.
+        Create Snapshot in the background.
+        Returns: Id of the operation, its result is the id of the new Snapshot
 
         Parameters:
-         - openstack_id: Id of the server
+         - openstack_id
+         - name
+         - username
+         - base_tags
+         - description
 
         """
-        self.send_resume_server(openstack_id)
-        self.recv_resume_server()
+        self.send_create_snapshot_async(
+            openstack_id, name, username, base_tags, description
+        )
+        return self.recv_create_snapshot_async()
 
-    def send_resume_server(self, openstack_id):
-        self._oprot.writeMessageBegin("resume_server", TMessageType.CALL, self._seqid)
-        args = resume_server_args()
+    def send_create_snapshot_async(
+        self, openstack_id, name, username, base_tags, description
+    ):
+        self._oprot.writeMessageBegin(
+            "create_snapshot_async", TMessageType.CALL, self._seqid
+        )
+        args = create_snapshot_async_args()
         args.openstack_id = openstack_id
-        args.write(self._oprot)
-        self._oprot.writeMessageEnd()
+        args.name = name
+        args.username = username
+        args.base_tags = base_tags
+        args.description = description
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_resume_server(self):
+    def recv_create_snapshot_async(self):
         iprot = self._iprot
         fname, mtype, rseqid = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -3973,39 +4344,51 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = resume_server_result()
+        result = create_snapshot_async_result()
         result.read(iprot)
         iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
         if result.e is not None:
             raise result.e
-        if result.c is not None:
-            raise result.c
-        return
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "create_snapshot_async failed: unknown result",
+        )
 
-    def create_volume(self, volume_name, volume_storage, metadata):
+    def create_volume_by_source_volume_async(
+        self, volume_name, metadata, source_volume_id
+    ):
         """
-        Create volume.
+        Create volume by source volume in the background.
+        Returns: Id of the operation, its result is the id of the new volume
 
         Parameters:
-         - volume_name: Name of volume
-         - volume_storage: Diskspace in GB for new volume
-         - metadata: Metadata for the new volume
+         - volume_name
+         - metadata
+         - source_volume_id
 
         """
-        self.send_create_volume(volume_name, volume_storage, metadata)
-        return self.recv_create_volume()
+        self.send_create_volume_by_source_volume_async(
+            volume_name, metadata, source_volume_id
+        )
+        return self.recv_create_volume_by_source_volume_async()
 
-    def send_create_volume(self, volume_name, volume_storage, metadata):
-        self._oprot.writeMessageBegin("create_volume", TMessageType.CALL, self._seqid)
-        args = create_volume_args()
+    def send_create_volume_by_source_volume_async(
+        self, volume_name, metadata, source_volume_id
+    ):
+        self._oprot.writeMessageBegin(
+            "create_volume_by_source_volume_async", TMessageType.CALL, self._seqid
+        )
+        args = create_volume_by_source_volume_async_args()
         args.volume_name = volume_name
-        args.volume_storage = volume_storage
         args.metadata = metadata
+        args.source_volume_id = source_volume_id
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_create_volume(self):
+    def recv_create_volume_by_source_volume_async(self):
         iprot = self._iprot
         fname, mtype, rseqid = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -4013,49 +4396,49 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = create_volume_result()
+        result = create_volume_by_source_volume_async_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
-        if result.r is not None:
-            raise result.r
-        if result.n is not None:
-            raise result.n
+        if result.e is not None:
+            raise result.e
         raise TApplicationException(
-            TApplicationException.MISSING_RESULT, "create_volume failed: unknown result"
+            TApplicationException.MISSING_RESULT,
+            "create_volume_by_source_volume_async failed: unknown result",
         )
 
-    def create_volume_by_source_volume(self, volume_name, metadata, source_volume_id):
+    def create_volume_by_volume_snap_async(self, volume_name, metadata, volume_snap_id):
         """
-        Create volume by source volume.
+        Create volume by volume snapshot in the background.
+        Returns: Id of the operation, its result is the id of the new volume
 
         Parameters:
-         - volume_name: Name of volume
-         - metadata: Metadata for the new volume
-         - source_volume_id: ID of source volume
+         - volume_name
+         - metadata
+         - volume_snap_id
 
         """
-        self.send_create_volume_by_source_volume(
-            volume_name, metadata, source_volume_id
+        self.send_create_volume_by_volume_snap_async(
+            volume_name, metadata, volume_snap_id
         )
-        return self.recv_create_volume_by_source_volume()
+        return self.recv_create_volume_by_volume_snap_async()
 
-    def send_create_volume_by_source_volume(
-        self, volume_name, metadata, source_volume_id
+    def send_create_volume_by_volume_snap_async(
+        self, volume_name, metadata, volume_snap_id
     ):
         self._oprot.writeMessageBegin(
-            "create_volume_by_source_volume", TMessageType.CALL, self._seqid
+            "create_volume_by_volume_snap_async", TMessageType.CALL, self._seqid
         )
-        args = create_volume_by_source_volume_args()
+        args = create_volume_by_volume_snap_async_args()
         args.volume_name = volume_name
         args.metadata = metadata
-        args.source_volume_id = source_volume_id
+        args.volume_snap_id = volume_snap_id
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_create_volume_by_source_volume(self):
+    def recv_create_volume_by_volume_snap_async(self):
         iprot = self._iprot
         fname, mtype, rseqid = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -4063,46 +4446,43 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = create_volume_by_source_volume_result()
+        result = create_volume_by_volume_snap_async_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
-        if result.r is not None:
-            raise result.r
-        if result.n is not None:
-            raise result.n
+        if result.e is not None:
+            raise result.e
         raise TApplicationException(
             TApplicationException.MISSING_RESULT,
-            "create_volume_by_source_volume failed: unknown result",
+            "create_volume_by_volume_snap_async failed: unknown result",
         )
 
-    def create_volume_by_volume_snap(self, volume_name, metadata, volume_snap_id):
+    def attach_volume_to_server_async(self, openstack_id, volume_id):
         """
-        Create volume by volume snapshot.
+        Attach volume to server in the background.
+        Returns: Id of the operation, its result is the attachment as JSON
 
         Parameters:
-         - volume_name: Name of volume
-         - metadata: Metadata for the new volume
-         - volume_snap_id: ID of volume snapshot
+         - openstack_id
+         - volume_id
 
         """
-        self.send_create_volume_by_volume_snap(volume_name, metadata, volume_snap_id)
-        return self.recv_create_volume_by_volume_snap()
+        self.send_attach_volume_to_server_async(openstack_id, volume_id)
+        return self.recv_attach_volume_to_server_async()
 
-    def send_create_volume_by_volume_snap(self, volume_name, metadata, volume_snap_id):
+    def send_attach_volume_to_server_async(self, openstack_id, volume_id):
         self._oprot.writeMessageBegin(
-            "create_volume_by_volume_snap", TMessageType.CALL, self._seqid
+            "attach_volume_to_server_async", TMessageType.CALL, self._seqid
         )
-        args = create_volume_by_volume_snap_args()
-        args.volume_name = volume_name
-        args.metadata = metadata
-        args.volume_snap_id = volume_snap_id
+        args = attach_volume_to_server_async_args()
+        args.openstack_id = openstack_id
+        args.volume_id = volume_id
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_create_volume_by_volume_snap(self):
+    def recv_attach_volume_to_server_async(self):
         iprot = self._iprot
         fname, mtype, rseqid = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -4110,47 +4490,43 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = create_volume_by_volume_snap_result()
+        result = attach_volume_to_server_async_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
-        if result.r is not None:
-            raise result.r
-        if result.n is not None:
-            raise result.n
+        if result.e is not None:
+            raise result.e
         raise TApplicationException(
             TApplicationException.MISSING_RESULT,
-            "create_volume_by_volume_snap failed: unknown result",
+            "attach_volume_to_server_async failed: unknown result",
         )
 
-    def create_volume_snapshot(self, volume_id, name, description):
+    def detach_volume_async(self, volume_id, server_id):
         """
-        Create volume snapshot.
-        Returns: ID of created snapshot
+        Delete volume attachment in the background.
+        Returns: Id of the operation
 
         Parameters:
-         - volume_id: ID of source volume
-         - name: Name for the volume snapshot
-         - description: Description for the volume snapshot
+         - volume_id
+         - server_id
 
         """
-        self.send_create_volume_snapshot(volume_id, name, description)
-        return self.recv_create_volume_snapshot()
+        self.send_detach_volume_async(volume_id, server_id)
+        return self.recv_detach_volume_async()
 
-    def send_create_volume_snapshot(self, volume_id, name, description):
+    def send_detach_volume_async(self, volume_id, server_id):
         self._oprot.writeMessageBegin(
-            "create_volume_snapshot", TMessageType.CALL, self._seqid
+            "detach_volume_async", TMessageType.CALL, self._seqid
         )
-        args = create_volume_snapshot_args()
+        args = detach_volume_async_args()
         args.volume_id = volume_id
-        args.name = name
-        args.description = description
+        args.server_id = server_id
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_create_volume_snapshot(self):
+    def recv_detach_volume_async(self):
         iprot = self._iprot
         fname, mtype, rseqid = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -4158,43 +4534,45 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = create_volume_snapshot_result()
+        result = detach_volume_async_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
         if result.e is not None:
             raise result.e
-        if result.r is not None:
-            raise result.r
         raise TApplicationException(
             TApplicationException.MISSING_RESULT,
-            "create_volume_snapshot failed: unknown result",
+            "detach_volume_async failed: unknown result",
         )
 
-    def get_volume_snapshot(self, name_or_id):
+    def rescue_server_async(self, openstack_id, admin_pass, image_ref):
         """
-        Get volume snapshot.
-        Returns: Snapshot object of volume snapshot
+        Rescue server in the background.
+        Returns: Id of the operation
 
         Parameters:
-         - name_or_id: Name or ID of volume snapshot
+         - openstack_id
+         - admin_pass
+         - image_ref
 
         """
-        self.send_get_volume_snapshot(name_or_id)
-        return self.recv_get_volume_snapshot()
+        self.send_rescue_server_async(openstack_id, admin_pass, image_ref)
+        return self.recv_rescue_server_async()
 
-    def send_get_volume_snapshot(self, name_or_id):
+    def send_rescue_server_async(self, openstack_id, admin_pass, image_ref):
         self._oprot.writeMessageBegin(
-            "get_volume_snapshot", TMessageType.CALL, self._seqid
+            "rescue_server_async", TMessageType.CALL, self._seqid
         )
-        args = get_volume_snapshot_args()
-        args.name_or_id = name_or_id
+        args = rescue_server_async_args()
+        args.openstack_id = openstack_id
+        args.admin_pass = admin_pass
+        args.image_ref = image_ref
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_get_volume_snapshot(self):
+    def recv_rescue_server_async(self):
         iprot = self._iprot
         fname, mtype, rseqid = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -4202,7 +4580,46 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = get_volume_snapshot_result()
+        result = rescue_server_async_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.e is not None:
+            raise result.e
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "rescue_server_async failed: unknown result",
+        )
+
+    def get_operation(self, operation_id):
+        """
+        Get the state of an operation.
+
+        Parameters:
+         - operation_id
+
+        """
+        self.send_get_operation(operation_id)
+        return self.recv_get_operation()
+
+    def send_get_operation(self, operation_id):
+        self._oprot.writeMessageBegin("get_operation", TMessageType.CALL, self._seqid)
+        args = get_operation_args()
+        args.operation_id = operation_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_operation(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_operation_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
@@ -4211,31 +4628,32 @@ class Client(Iface):
             raise result.r
         raise TApplicationException(
             TApplicationException.MISSING_RESULT,
-            "get_volume_snapshot failed: unknown result",
+            "get_operation failed: unknown result",
         )
 
-    def delete_volume_snapshot(self, snapshot_id):
+    def list_operations(self, operation_type, status):
         """
-        Delete volume snapshot.
+        List the most recent operations, newest first.
+        Empty filters match every operation.
 
         Parameters:
-         - snapshot_id
+         - operation_type
+         - status
 
         """
-        self.send_delete_volume_snapshot(snapshot_id)
-        self.recv_delete_volume_snapshot()
+        self.send_list_operations(operation_type, status)
+        return self.recv_list_operations()
 
-    def send_delete_volume_snapshot(self, snapshot_id):
-        self._oprot.writeMessageBegin(
-            "delete_volume_snapshot", TMessageType.CALL, self._seqid
-        )
-        args = delete_volume_snapshot_args()
-        args.snapshot_id = snapshot_id
+    def send_list_operations(self, operation_type, status):
+        self._oprot.writeMessageBegin("list_operations", TMessageType.CALL, self._seqid)
+        args = list_operations_args()
+        args.operation_type = operation_type
+        args.status = status
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_delete_volume_snapshot(self):
+    def recv_list_operations(self):
         iprot = self._iprot
         fname, mtype, rseqid = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -4243,37 +4661,36 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = delete_volume_snapshot_result()
+        result = list_operations_result()
         result.read(iprot)
         iprot.readMessageEnd()
-        if result.c is not None:
-            raise result.c
-        if result.e is not None:
-            raise result.e
-        return
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "list_operations failed: unknown result",
+        )
 
-    def reboot_hard_server(self, openstack_id):
+    def resume_server(self, openstack_id):
         """
-        Reboot server.
+        Resume Server.
 
         Parameters:
          - openstack_id: Id of the server
 
         """
-        self.send_reboot_hard_server(openstack_id)
-        self.recv_reboot_hard_server()
+        self.send_resume_server(openstack_id)
+        self.recv_resume_server()
 
-    def send_reboot_hard_server(self, openstack_id):
-        self._oprot.writeMessageBegin(
-            "reboot_hard_server", TMessageType.CALL, self._seqid
-        )
-        args = reboot_hard_server_args()
+    def send_resume_server(self, openstack_id):
+        self._oprot.writeMessageBegin("resume_server", TMessageType.CALL, self._seqid)
+        args = resume_server_args()
         args.openstack_id = openstack_id
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_reboot_hard_server(self):
+    def recv_resume_server(self):
         iprot = self._iprot
         fname, mtype, rseqid = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -4281,7 +4698,7 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = reboot_hard_server_result()
+        result = resume_server_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.e is not None:
@@ -4290,28 +4707,30 @@ class Client(Iface):
             raise result.c
         return
 
-    def reboot_soft_server(self, openstack_id):
+    def create_volume(self, volume_name, volume_storage, metadata):
         """
-        Reboot server.
+        Create volume.
 
         Parameters:
-         - openstack_id: Id of the server
+         - volume_name: Name of volume
+         - volume_storage: Diskspace in GB for new volume
+         - metadata: Metadata for the new volume
 
         """
-        self.send_reboot_soft_server(openstack_id)
-        self.recv_reboot_soft_server()
+        self.send_create_volume(volume_name, volume_storage, metadata)
+        return self.recv_create_volume()
 
-    def send_reboot_soft_server(self, openstack_id):
-        self._oprot.writeMessageBegin(
-            "reboot_soft_server", TMessageType.CALL, self._seqid
-        )
-        args = reboot_soft_server_args()
-        args.openstack_id = openstack_id
+    def send_create_volume(self, volume_name, volume_storage, metadata):
+        self._oprot.writeMessageBegin("create_volume", TMessageType.CALL, self._seqid)
+        args = create_volume_args()
+        args.volume_name = volume_name
+        args.volume_storage = volume_storage
+        args.metadata = metadata
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_reboot_soft_server(self):
+    def recv_create_volume(self):
         iprot = self._iprot
         fname, mtype, rseqid = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -4319,97 +4738,404 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = reboot_soft_server_result()
+        result = create_volume_result()
         result.read(iprot)
         iprot.readMessageEnd()
-        if result.e is not None:
-            raise result.e
-        if result.c is not None:
-            raise result.c
-        return
+        if result.success is not None:
+            return result.success
+        if result.r is not None:
+            raise result.r
+        if result.n is not None:
+            raise result.n
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT, "create_volume failed: unknown result"
+        )
 
+    def create_volume_by_source_volume(self, volume_name, metadata, source_volume_id):
+        """
+        Create volume by source volume.
 
-class Processor(Iface, TProcessor):
-    def __init__(self, handler):
-        self._handler = handler
-        self._processMap = {}
-        self._processMap["is_version"] = Processor.process_is_version
-        self._processMap["get_client_version"] = Processor.process_get_client_version
-        self._processMap["get_gateway_ip"] = Processor.process_get_gateway_ip
-        self._processMap["get_calculation_values"] = (
-            Processor.process_get_calculation_values
-        )
-        self._processMap["import_keypair"] = Processor.process_import_keypair
-        self._processMap["get_vm_ports"] = Processor.process_get_vm_ports
-        self._processMap["add_udp_security_group"] = (
-            Processor.process_add_udp_security_group
-        )
-        self._processMap["add_research_environment_security_group"] = (
-            Processor.process_add_research_environment_security_group
-        )
-        self._processMap["add_project_security_group_to_server"] = (
-            Processor.process_add_project_security_group_to_server
-        )
-        self._processMap["add_metadata_to_server"] = (
-            Processor.process_add_metadata_to_server
-        )
-        self._processMap["get_flavors"] = Processor.process_get_flavors
-        self._processMap["get_images"] = Processor.process_get_images
-        self._processMap["get_public_images"] = Processor.process_get_public_images
-        self._processMap["get_private_images"] = Processor.process_get_private_images
-        self._processMap["get_image"] = Processor.process_get_image
-        self._processMap["get_volume"] = Processor.process_get_volume
-        self._processMap["get_volumes_by_ids"] = Processor.process_get_volumes_by_ids
-        self._processMap["resize_volume"] = Processor.process_resize_volume
-        self._processMap["open_port_range_for_vm_in_project"] = (
-            Processor.process_open_port_range_for_vm_in_project
-        )
-        self._processMap["delete_security_group_rule"] = (
-            Processor.process_delete_security_group_rule
-        )
-        self._processMap["remove_security_groups_from_server"] = (
-            Processor.process_remove_security_groups_from_server
+        Parameters:
+         - volume_name: Name of volume
+         - metadata: Metadata for the new volume
+         - source_volume_id: ID of source volume
+
+        """
+        self.send_create_volume_by_source_volume(
+            volume_name, metadata, source_volume_id
         )
-        self._processMap["delete_server"] = Processor.process_delete_server
-        self._processMap["rescue_server"] = Processor.process_rescue_server
-        self._processMap["unrescue_server"] = Processor.process_unrescue_server
-        self._processMap["start_server"] = Processor.process_start_server
-        self._processMap["is_bibigrid_available"] = (
-            Processor.process_is_bibigrid_available
+        return self.recv_create_volume_by_source_volume()
+
+    def send_create_volume_by_source_volume(
+        self, volume_name, metadata, source_volume_id
+    ):
+        self._oprot.writeMessageBegin(
+            "create_volume_by_source_volume", TMessageType.CALL, self._seqid
         )
-        self._processMap["is_openstack_connection_available"] = (
-            Processor.process_is_openstack_connection_available
+        args = create_volume_by_source_volume_args()
+        args.volume_name = volume_name
+        args.metadata = metadata
+        args.source_volume_id = source_volume_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_create_volume_by_source_volume(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = create_volume_by_source_volume_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.r is not None:
+            raise result.r
+        if result.n is not None:
+            raise result.n
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "create_volume_by_source_volume failed: unknown result",
         )
-        self._processMap["detach_ip_from_server"] = (
-            Processor.process_detach_ip_from_server
+
+    def create_volume_by_volume_snap(self, volume_name, metadata, volume_snap_id):
+        """
+        Create volume by volume snapshot.
+
+        Parameters:
+         - volume_name: Name of volume
+         - metadata: Metadata for the new volume
+         - volume_snap_id: ID of volume snapshot
+
+        """
+        self.send_create_volume_by_volume_snap(volume_name, metadata, volume_snap_id)
+        return self.recv_create_volume_by_volume_snap()
+
+    def send_create_volume_by_volume_snap(self, volume_name, metadata, volume_snap_id):
+        self._oprot.writeMessageBegin(
+            "create_volume_by_volume_snap", TMessageType.CALL, self._seqid
         )
-        self._processMap["start_server_with_custom_key"] = (
-            Processor.process_start_server_with_custom_key
+        args = create_volume_by_volume_snap_args()
+        args.volume_name = volume_name
+        args.metadata = metadata
+        args.volume_snap_id = volume_snap_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_create_volume_by_volume_snap(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = create_volume_by_volume_snap_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.r is not None:
+            raise result.r
+        if result.n is not None:
+            raise result.n
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "create_volume_by_volume_snap failed: unknown result",
         )
-        self._processMap["exist_server"] = Processor.process_exist_server
-        self._processMap["create_and_deploy_playbook"] = (
-            Processor.process_create_and_deploy_playbook
+
+    def create_volume_snapshot(self, volume_id, name, description):
+        """
+        Create volume snapshot.
+        Returns: ID of created snapshot
+
+        Parameters:
+         - volume_id: ID of source volume
+         - name: Name for the volume snapshot
+         - description: Description for the volume snapshot
+
+        """
+        self.send_create_volume_snapshot(volume_id, name, description)
+        return self.recv_create_volume_snapshot()
+
+    def send_create_volume_snapshot(self, volume_id, name, description):
+        self._oprot.writeMessageBegin(
+            "create_volume_snapshot", TMessageType.CALL, self._seqid
         )
-        self._processMap["get_playbook_logs"] = Processor.process_get_playbook_logs
-        self._processMap["has_forc"] = Processor.process_has_forc
-        self._processMap["get_forc_access_url"] = Processor.process_get_forc_access_url
-        self._processMap["create_backend"] = Processor.process_create_backend
-        self._processMap["get_backends"] = Processor.process_get_backends
-        self._processMap["get_backends_by_owner"] = (
-            Processor.process_get_backends_by_owner
+        args = create_volume_snapshot_args()
+        args.volume_id = volume_id
+        args.name = name
+        args.description = description
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_create_volume_snapshot(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = create_volume_snapshot_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.e is not None:
+            raise result.e
+        if result.r is not None:
+            raise result.r
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "create_volume_snapshot failed: unknown result",
         )
-        self._processMap["get_backends_by_template"] = (
-            Processor.process_get_backends_by_template
+
+    def get_volume_snapshot(self, name_or_id):
+        """
+        Get volume snapshot.
+        Returns: Snapshot object of volume snapshot
+
+        Parameters:
+         - name_or_id: Name or ID of volume snapshot
+
+        """
+        self.send_get_volume_snapshot(name_or_id)
+        return self.recv_get_volume_snapshot()
+
+    def send_get_volume_snapshot(self, name_or_id):
+        self._oprot.writeMessageBegin(
+            "get_volume_snapshot", TMessageType.CALL, self._seqid
         )
-        self._processMap["get_backend_by_id"] = Processor.process_get_backend_by_id
-        self._processMap["set_metadata_server_data"] = (
-            Processor.process_set_metadata_server_data
+        args = get_volume_snapshot_args()
+        args.name_or_id = name_or_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_volume_snapshot(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_volume_snapshot_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.r is not None:
+            raise result.r
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "get_volume_snapshot failed: unknown result",
         )
-        self._processMap["remove_metadata_server_data"] = (
-            Processor.process_remove_metadata_server_data
+
+    def delete_volume_snapshot(self, snapshot_id):
+        """
+        Delete volume snapshot.
+
+        Parameters:
+         - snapshot_id
+
+        """
+        self.send_delete_volume_snapshot(snapshot_id)
+        self.recv_delete_volume_snapshot()
+
+    def send_delete_volume_snapshot(self, snapshot_id):
+        self._oprot.writeMessageBegin(
+            "delete_volume_snapshot", TMessageType.CALL, self._seqid
         )
-        self._processMap["is_metadata_server_available"] = (
-            Processor.process_is_metadata_server_available
+        args = delete_volume_snapshot_args()
+        args.snapshot_id = snapshot_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_delete_volume_snapshot(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = delete_volume_snapshot_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.c is not None:
+            raise result.c
+        if result.e is not None:
+            raise result.e
+        return
+
+    def reboot_hard_server(self, openstack_id):
+        """
+        Reboot server.
+
+        Parameters:
+         - openstack_id: Id of the server
+
+        """
+        self.send_reboot_hard_server(openstack_id)
+        self.recv_reboot_hard_server()
+
+    def send_reboot_hard_server(self, openstack_id):
+        self._oprot.writeMessageBegin(
+            "reboot_hard_server", TMessageType.CALL, self._seqid
+        )
+        args = reboot_hard_server_args()
+        args.openstack_id = openstack_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_reboot_hard_server(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = reboot_hard_server_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.e is not None:
+            raise result.e
+        if result.c is not None:
+            raise result.c
+        return
+
+    def reboot_soft_server(self, openstack_id):
+        """
+        Reboot server.
+
+        Parameters:
+         - openstack_id: Id of the server
+
+        """
+        self.send_reboot_soft_server(openstack_id)
+        self.recv_reboot_soft_server()
+
+    def send_reboot_soft_server(self, openstack_id):
+        self._oprot.writeMessageBegin(
+            "reboot_soft_server", TMessageType.CALL, self._seqid
+        )
+        args = reboot_soft_server_args()
+        args.openstack_id = openstack_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_reboot_soft_server(self):
+        iprot = self._iprot
+        fname, mtype, rseqid = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = reboot_soft_server_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.e is not None:
+            raise result.e
+        if result.c is not None:
+            raise result.c
+        return
+
+
+class Processor(Iface, TProcessor):
+    def __init__(self, handler):
+        self._handler = handler
+        self._processMap = {}
+        self._processMap["is_version"] = Processor.process_is_version
+        self._processMap["get_client_version"] = Processor.process_get_client_version
+        self._processMap["is_ready"] = Processor.process_is_ready
+        self._processMap["get_gateway_ip"] = Processor.process_get_gateway_ip
+        self._processMap["get_calculation_values"] = (
+            Processor.process_get_calculation_values
+        )
+        self._processMap["import_keypair"] = Processor.process_import_keypair
+        self._processMap["get_vm_ports"] = Processor.process_get_vm_ports
+        self._processMap["add_udp_security_group"] = (
+            Processor.process_add_udp_security_group
+        )
+        self._processMap["add_research_environment_security_group"] = (
+            Processor.process_add_research_environment_security_group
+        )
+        self._processMap["add_project_security_group_to_server"] = (
+            Processor.process_add_project_security_group_to_server
+        )
+        self._processMap["add_metadata_to_server"] = (
+            Processor.process_add_metadata_to_server
+        )
+        self._processMap["get_flavors"] = Processor.process_get_flavors
+        self._processMap["get_images"] = Processor.process_get_images
+        self._processMap["get_public_images"] = Processor.process_get_public_images
+        self._processMap["get_private_images"] = Processor.process_get_private_images
+        self._processMap["get_image"] = Processor.process_get_image
+        self._processMap["get_volume"] = Processor.process_get_volume
+        self._processMap["get_volumes_by_ids"] = Processor.process_get_volumes_by_ids
+        self._processMap["resize_volume"] = Processor.process_resize_volume
+        self._processMap["open_port_range_for_vm_in_project"] = (
+            Processor.process_open_port_range_for_vm_in_project
+        )
+        self._processMap["delete_security_group_rule"] = (
+            Processor.process_delete_security_group_rule
+        )
+        self._processMap["remove_security_groups_from_server"] = (
+            Processor.process_remove_security_groups_from_server
+        )
+        self._processMap["delete_server"] = Processor.process_delete_server
+        self._processMap["rescue_server"] = Processor.process_rescue_server
+        self._processMap["unrescue_server"] = Processor.process_unrescue_server
+        self._processMap["start_server"] = Processor.process_start_server
+        self._processMap["is_bibigrid_available"] = (
+            Processor.process_is_bibigrid_available
+        )
+        self._processMap["is_openstack_connection_available"] = (
+            Processor.process_is_openstack_connection_available
+        )
+        self._processMap["detach_ip_from_server"] = (
+            Processor.process_detach_ip_from_server
+        )
+        self._processMap["start_server_with_custom_key"] = (
+            Processor.process_start_server_with_custom_key
+        )
+        self._processMap["exist_server"] = Processor.process_exist_server
+        self._processMap["create_and_deploy_playbook"] = (
+            Processor.process_create_and_deploy_playbook
+        )
+        self._processMap["get_playbook_logs"] = Processor.process_get_playbook_logs
+        self._processMap["has_forc"] = Processor.process_has_forc
+        self._processMap["get_forc_access_url"] = Processor.process_get_forc_access_url
+        self._processMap["create_backend"] = Processor.process_create_backend
+        self._processMap["get_backends"] = Processor.process_get_backends
+        self._processMap["get_backends_by_owner"] = (
+            Processor.process_get_backends_by_owner
+        )
+        self._processMap["get_backends_by_template"] = (
+            Processor.process_get_backends_by_template
+        )
+        self._processMap["get_backend_by_id"] = Processor.process_get_backend_by_id
+        self._processMap["set_metadata_server_data"] = (
+            Processor.process_set_metadata_server_data
+        )
+        self._processMap["remove_metadata_server_data"] = (
+            Processor.process_remove_metadata_server_data
+        )
+        self._processMap["is_metadata_server_available"] = (
+            Processor.process_is_metadata_server_available
         )
         self._processMap["delete_backend"] = Processor.process_delete_backend
         self._processMap["add_user_to_backend"] = Processor.process_add_user_to_backend
@@ -4419,6 +5145,12 @@ class Processor(Iface, TProcessor):
         self._processMap["delete_user_from_backend"] = (
             Processor.process_delete_user_from_backend
         )
+        self._processMap["add_users_to_backend"] = (
+            Processor.process_add_users_to_backend
+        )
+        self._processMap["delete_users_from_backend"] = (
+            Processor.process_delete_users_from_backend
+        )
         self._processMap["activate_auth_for_backend"] = (
             Processor.process_activate_auth_for_backend
         )
@@ -4443,7 +5175,11 @@ class Processor(Iface, TProcessor):
         self._processMap["add_cluster_machine"] = Processor.process_add_cluster_machine
         self._processMap["get_cluster_info"] = Processor.process_get_cluster_info
         self._processMap["get_cluster_log"] = Processor.process_get_cluster_log
+        self._processMap["get_cluster_log_tail"] = (
+            Processor.process_get_cluster_log_tail
+        )
         self._processMap["get_cluster_state"] = Processor.process_get_cluster_state
+        self._processMap["get_cluster_states"] = Processor.process_get_cluster_states
         self._processMap["get_keypair_public_key_by_name"] = (
             Processor.process_get_keypair_public_key_by_name
         )
@@ -4470,6 +5206,22 @@ class Processor(Iface, TProcessor):
         self._processMap["attach_volume_to_server"] = (
             Processor.process_attach_volume_to_server
         )
+        self._processMap["create_snapshot_async"] = (
+            Processor.process_create_snapshot_async
+        )
+        self._processMap["create_volume_by_source_volume_async"] = (
+            Processor.process_create_volume_by_source_volume_async
+        )
+        self._processMap["create_volume_by_volume_snap_async"] = (
+            Processor.process_create_volume_by_volume_snap_async
+        )
+        self._processMap["attach_volume_to_server_async"] = (
+            Processor.process_attach_volume_to_server_async
+        )
+        self._processMap["detach_volume_async"] = Processor.process_detach_volume_async
+        self._processMap["rescue_server_async"] = Processor.process_rescue_server_async
+        self._processMap["get_operation"] = Processor.process_get_operation
+        self._processMap["list_operations"] = Processor.process_list_operations
         self._processMap["resume_server"] = Processor.process_resume_server
         self._processMap["create_volume"] = Processor.process_create_volume
         self._processMap["create_volume_by_source_volume"] = (
@@ -4561,6 +5313,31 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
+    def process_is_ready(self, seqid, iprot, oprot):
+        args = is_ready_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = is_ready_result()
+        try:
+            result.success = self._handler.is_ready()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("is_ready", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
     def process_get_gateway_ip(self, seqid, iprot, oprot):
         args = get_gateway_ip_args()
         args.read(iprot)
@@ -5886,6 +6663,66 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
+    def process_add_users_to_backend(self, seqid, iprot, oprot):
+        args = add_users_to_backend_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = add_users_to_backend_result()
+        try:
+            result.success = self._handler.add_users_to_backend(
+                args.backend_id, args.user_ids
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except BackendNotFoundException as b:
+            msg_type = TMessageType.REPLY
+            result.b = b
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("add_users_to_backend", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_users_from_backend(self, seqid, iprot, oprot):
+        args = delete_users_from_backend_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_users_from_backend_result()
+        try:
+            result.success = self._handler.delete_users_from_backend(
+                args.backend_id, args.user_ids
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except BackendNotFoundException as b:
+            msg_type = TMessageType.REPLY
+            result.b = b
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_users_from_backend", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
     def process_activate_auth_for_backend(self, seqid, iprot, oprot):
         args = activate_auth_for_backend_args()
         args.read(iprot)
@@ -6221,6 +7058,36 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
+    def process_get_cluster_log_tail(self, seqid, iprot, oprot):
+        args = get_cluster_log_tail_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_cluster_log_tail_result()
+        try:
+            result.success = self._handler.get_cluster_log_tail(
+                args.cluster_id, args.offset
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except ClusterNotFoundException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_cluster_log_tail", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
     def process_get_cluster_state(self, seqid, iprot, oprot):
         args = get_cluster_state_args()
         args.read(iprot)
@@ -6249,6 +7116,31 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
+    def process_get_cluster_states(self, seqid, iprot, oprot):
+        args = get_cluster_states_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_cluster_states_result()
+        try:
+            result.success = self._handler.get_cluster_states(args.cluster_ids)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_cluster_states", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
     def process_get_keypair_public_key_by_name(self, seqid, iprot, oprot):
         args = get_keypair_public_key_by_name_args()
         args.read(iprot)
@@ -6719,6 +7611,245 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
+    def process_create_snapshot_async(self, seqid, iprot, oprot):
+        args = create_snapshot_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = create_snapshot_async_result()
+        try:
+            result.success = self._handler.create_snapshot_async(
+                args.openstack_id,
+                args.name,
+                args.username,
+                args.base_tags,
+                args.description,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except DefaultException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("create_snapshot_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_create_volume_by_source_volume_async(self, seqid, iprot, oprot):
+        args = create_volume_by_source_volume_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = create_volume_by_source_volume_async_result()
+        try:
+            result.success = self._handler.create_volume_by_source_volume_async(
+                args.volume_name, args.metadata, args.source_volume_id
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except DefaultException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("create_volume_by_source_volume_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_create_volume_by_volume_snap_async(self, seqid, iprot, oprot):
+        args = create_volume_by_volume_snap_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = create_volume_by_volume_snap_async_result()
+        try:
+            result.success = self._handler.create_volume_by_volume_snap_async(
+                args.volume_name, args.metadata, args.volume_snap_id
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except DefaultException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("create_volume_by_volume_snap_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_attach_volume_to_server_async(self, seqid, iprot, oprot):
+        args = attach_volume_to_server_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = attach_volume_to_server_async_result()
+        try:
+            result.success = self._handler.attach_volume_to_server_async(
+                args.openstack_id, args.volume_id
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except DefaultException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("attach_volume_to_server_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_detach_volume_async(self, seqid, iprot, oprot):
+        args = detach_volume_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = detach_volume_async_result()
+        try:
+            result.success = self._handler.detach_volume_async(
+                args.volume_id, args.server_id
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except DefaultException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("detach_volume_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_rescue_server_async(self, seqid, iprot, oprot):
+        args = rescue_server_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = rescue_server_async_result()
+        try:
+            result.success = self._handler.rescue_server_async(
+                args.openstack_id, args.admin_pass, args.image_ref
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except DefaultException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("rescue_server_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_operation(self, seqid, iprot, oprot):
+        args = get_operation_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_operation_result()
+        try:
+            result.success = self._handler.get_operation(args.operation_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except ResourceNotFoundException as r:
+            msg_type = TMessageType.REPLY
+            result.r = r
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_operation", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_list_operations(self, seqid, iprot, oprot):
+        args = list_operations_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = list_operations_result()
+        try:
+            result.success = self._handler.list_operations(
+                args.operation_type, args.status
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("list_operations", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
     def process_resume_server(self, seqid, iprot, oprot):
         args = resume_server_args()
         args.read(iprot)
@@ -6910,107 +8041,2164 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_delete_volume_snapshot(self, seqid, iprot, oprot):
-        args = delete_volume_snapshot_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = delete_volume_snapshot_result()
-        try:
-            self._handler.delete_volume_snapshot(args.snapshot_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except OpenStackConflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except DefaultException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
+    def process_delete_volume_snapshot(self, seqid, iprot, oprot):
+        args = delete_volume_snapshot_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_volume_snapshot_result()
+        try:
+            self._handler.delete_volume_snapshot(args.snapshot_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except OpenStackConflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except DefaultException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_volume_snapshot", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_reboot_hard_server(self, seqid, iprot, oprot):
+        args = reboot_hard_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = reboot_hard_server_result()
+        try:
+            self._handler.reboot_hard_server(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except ServerNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except OpenStackConflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("reboot_hard_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_reboot_soft_server(self, seqid, iprot, oprot):
+        args = reboot_soft_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = reboot_soft_server_result()
+        try:
+            self._handler.reboot_soft_server(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except ServerNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except OpenStackConflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("reboot_soft_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+
+class is_version_args(object):
+    """
+    Attributes:
+     - version
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        version=None,
+    ):
+        self.version = version
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.DOUBLE:
+                    self.version = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("is_version_args")
+        if self.version is not None:
+            oprot.writeFieldBegin("version", TType.DOUBLE, 1)
+            oprot.writeDouble(self.version)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(is_version_args)
+is_version_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.DOUBLE,
+        "version",
+        None,
+        None,
+    ),  # 1
+)
+
+
+class is_version_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("is_version_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(is_version_result)
+is_version_result.thrift_spec = (
+    (
+        0,
+        TType.BOOL,
+        "success",
+        None,
+        None,
+    ),  # 0
+)
+
+
+class get_client_version_args(object):
+    thrift_spec = None
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_client_version_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_client_version_args)
+get_client_version_args.thrift_spec = ()
+
+
+class get_client_version_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_client_version_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_client_version_result)
+get_client_version_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
+)
+
+
+class is_ready_args(object):
+    thrift_spec = None
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("is_ready_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(is_ready_args)
+is_ready_args.thrift_spec = ()
+
+
+class is_ready_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("is_ready_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(is_ready_result)
+is_ready_result.thrift_spec = (
+    (
+        0,
+        TType.BOOL,
+        "success",
+        None,
+        None,
+    ),  # 0
+)
+
+
+class get_gateway_ip_args(object):
+    thrift_spec = None
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_gateway_ip_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_gateway_ip_args)
+get_gateway_ip_args.thrift_spec = ()
+
+
+class get_gateway_ip_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    _ktype63, _vtype64, _size62 = iprot.readMapBegin()
+                    for _i66 in range(_size62):
+                        _key67 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val68 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key67] = _val68
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_gateway_ip_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter69, viter70 in self.success.items():
+                oprot.writeString(
+                    kiter69.encode("utf-8") if sys.version_info[0] == 2 else kiter69
+                )
+                oprot.writeString(
+                    viter70.encode("utf-8") if sys.version_info[0] == 2 else viter70
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_gateway_ip_result)
+get_gateway_ip_result.thrift_spec = (
+    (
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 0
+)
+
+
+class get_calculation_values_args(object):
+    thrift_spec = None
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_calculation_values_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_calculation_values_args)
+get_calculation_values_args.thrift_spec = ()
+
+
+class get_calculation_values_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    _ktype72, _vtype73, _size71 = iprot.readMapBegin()
+                    for _i75 in range(_size71):
+                        _key76 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val77 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key76] = _val77
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_calculation_values_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter78, viter79 in self.success.items():
+                oprot.writeString(
+                    kiter78.encode("utf-8") if sys.version_info[0] == 2 else kiter78
+                )
+                oprot.writeString(
+                    viter79.encode("utf-8") if sys.version_info[0] == 2 else viter79
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_calculation_values_result)
+get_calculation_values_result.thrift_spec = (
+    (
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 0
+)
+
+
+class import_keypair_args(object):
+    """
+    Attributes:
+     - keyname: Name for the keypair
+     - public_key: The public key
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        keyname=None,
+        public_key=None,
+    ):
+        self.keyname = keyname
+        self.public_key = public_key
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.keyname = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.public_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("import_keypair_args")
+        if self.keyname is not None:
+            oprot.writeFieldBegin("keyname", TType.STRING, 1)
+            oprot.writeString(
+                self.keyname.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.keyname
+            )
+            oprot.writeFieldEnd()
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 2)
+            oprot.writeString(
+                self.public_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.public_key
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(import_keypair_args)
+import_keypair_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "keyname",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "public_key",
+        "UTF8",
+        None,
+    ),  # 2
+)
+
+
+class import_keypair_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("import_keypair_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(import_keypair_result)
+import_keypair_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
+)
+
+
+class get_vm_ports_args(object):
+    """
+    Attributes:
+     - openstack_id: Id of server
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        openstack_id=None,
+    ):
+        self.openstack_id = openstack_id
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_vm_ports_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_vm_ports_args)
+get_vm_ports_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
+
+
+class get_vm_ports_result(object):
+    """
+    Attributes:
+     - success
+     - s
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        success=None,
+        s=None,
+    ):
+        self.success = success
+        self.s = s
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    _ktype81, _vtype82, _size80 = iprot.readMapBegin()
+                    for _i84 in range(_size80):
+                        _key85 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val86 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key85] = _val86
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.s = ServerNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_vm_ports_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter87, viter88 in self.success.items():
+                oprot.writeString(
+                    kiter87.encode("utf-8") if sys.version_info[0] == 2 else kiter87
+                )
+                oprot.writeString(
+                    viter88.encode("utf-8") if sys.version_info[0] == 2 else viter88
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 1)
+            self.s.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_vm_ports_result)
+get_vm_ports_result.thrift_spec = (
+    (
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "s",
+        [ServerNotFoundException, None],
+        None,
+    ),  # 1
+)
+
+
+class add_udp_security_group_args(object):
+    """
+    Attributes:
+     - server_id: OpenStack id of the server
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        server_id=None,
+    ):
+        self.server_id = server_id
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.server_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("add_udp_security_group_args")
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 1)
+            oprot.writeString(
+                self.server_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.server_id
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(add_udp_security_group_args)
+add_udp_security_group_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "server_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
+
+
+class add_udp_security_group_result(object):
+    """
+    Attributes:
+     - r
+     - s
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        r=None,
+        s=None,
+    ):
+        self.r = r
+        self.s = s
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.r = DefaultException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.s = ServerNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("add_udp_security_group_result")
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 1)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 2)
+            self.s.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(add_udp_security_group_result)
+add_udp_security_group_result.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRUCT,
+        "r",
+        [DefaultException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "s",
+        [ServerNotFoundException, None],
+        None,
+    ),  # 2
+)
+
+
+class add_research_environment_security_group_args(object):
+    """
+    Attributes:
+     - server_id: OpenStack id of the server
+     - security_group_name
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        server_id=None,
+        security_group_name=None,
+    ):
+        self.server_id = server_id
+        self.security_group_name = security_group_name
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.server_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.security_group_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("add_research_environment_security_group_args")
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 1)
+            oprot.writeString(
+                self.server_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.server_id
+            )
+            oprot.writeFieldEnd()
+        if self.security_group_name is not None:
+            oprot.writeFieldBegin("security_group_name", TType.STRING, 2)
+            oprot.writeString(
+                self.security_group_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.security_group_name
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(add_research_environment_security_group_args)
+add_research_environment_security_group_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "server_id",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "security_group_name",
+        "UTF8",
+        None,
+    ),  # 2
+)
+
+
+class add_research_environment_security_group_result(object):
+    """
+    Attributes:
+     - r
+     - s
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        r=None,
+        s=None,
+    ):
+        self.r = r
+        self.s = s
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.r = DefaultException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.s = ServerNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("add_research_environment_security_group_result")
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 1)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 2)
+            self.s.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(add_research_environment_security_group_result)
+add_research_environment_security_group_result.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRUCT,
+        "r",
+        [DefaultException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "s",
+        [ServerNotFoundException, None],
+        None,
+    ),  # 2
+)
+
+
+class add_project_security_group_to_server_args(object):
+    """
+    Attributes:
+     - server_id: OpenStack id of the server
+     - project_name
+     - project_id
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        server_id=None,
+        project_name=None,
+        project_id=None,
+    ):
+        self.server_id = server_id
+        self.project_name = project_name
+        self.project_id = project_id
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.server_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.project_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.project_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("add_project_security_group_to_server_args")
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 1)
+            oprot.writeString(
+                self.server_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.server_id
+            )
+            oprot.writeFieldEnd()
+        if self.project_name is not None:
+            oprot.writeFieldBegin("project_name", TType.STRING, 2)
+            oprot.writeString(
+                self.project_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.project_name
+            )
+            oprot.writeFieldEnd()
+        if self.project_id is not None:
+            oprot.writeFieldBegin("project_id", TType.STRING, 3)
+            oprot.writeString(
+                self.project_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.project_id
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(add_project_security_group_to_server_args)
+add_project_security_group_to_server_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "server_id",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "project_name",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "project_id",
+        "UTF8",
+        None,
+    ),  # 3
+)
+
+
+class add_project_security_group_to_server_result(object):
+    """
+    Attributes:
+     - r
+     - s
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        r=None,
+        s=None,
+    ):
+        self.r = r
+        self.s = s
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.r = DefaultException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.s = ServerNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("add_project_security_group_to_server_result")
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 1)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 2)
+            self.s.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(add_project_security_group_to_server_result)
+add_project_security_group_to_server_result.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRUCT,
+        "r",
+        [DefaultException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "s",
+        [ServerNotFoundException, None],
+        None,
+    ),  # 2
+)
+
+
+class add_metadata_to_server_args(object):
+    """
+    Attributes:
+     - openstack_id
+     - metadata
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        openstack_id=None,
+        metadata=None,
+    ):
+        self.openstack_id = openstack_id
+        self.metadata = metadata
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    _ktype90, _vtype91, _size89 = iprot.readMapBegin()
+                    for _i93 in range(_size89):
+                        _key94 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val95 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key94] = _val95
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("add_metadata_to_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 2)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter96, viter97 in self.metadata.items():
+                oprot.writeString(
+                    kiter96.encode("utf-8") if sys.version_info[0] == 2 else kiter96
+                )
+                oprot.writeString(
+                    viter97.encode("utf-8") if sys.version_info[0] == 2 else viter97
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(add_metadata_to_server_args)
+add_metadata_to_server_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 2
+)
+
+
+class add_metadata_to_server_result(object):
+    """
+    Attributes:
+     - r
+     - s
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        r=None,
+        s=None,
+    ):
+        self.r = r
+        self.s = s
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.r = DefaultException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.s = ServerNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("add_metadata_to_server_result")
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 1)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 2)
+            self.s.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(add_metadata_to_server_result)
+add_metadata_to_server_result.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRUCT,
+        "r",
+        [DefaultException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "s",
+        [ServerNotFoundException, None],
+        None,
+    ),  # 2
+)
+
+
+class get_flavors_args(object):
+    thrift_spec = None
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-        oprot.writeMessageBegin("delete_volume_snapshot", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+            return
+        oprot.writeStructBegin("get_flavors_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_reboot_hard_server(self, seqid, iprot, oprot):
-        args = reboot_hard_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = reboot_hard_server_result()
-        try:
-            self._handler.reboot_hard_server(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except ServerNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except OpenStackConflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("reboot_hard_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def validate(self):
+        return
 
-    def process_reboot_soft_server(self, seqid, iprot, oprot):
-        args = reboot_soft_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = reboot_soft_server_result()
-        try:
-            self._handler.reboot_soft_server(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except ServerNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except OpenStackConflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("reboot_soft_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
 
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
-# HELPER FUNCTIONS AND STRUCTURES
+    def __ne__(self, other):
+        return not (self == other)
 
 
-class is_version_args(object):
+all_structs.append(get_flavors_args)
+get_flavors_args.thrift_spec = ()
+
+
+class get_flavors_result(object):
     """
     Attributes:
-     - version
+     - success
 
     """
 
@@ -7018,9 +10206,9 @@ class is_version_args(object):
 
     def __init__(
         self,
-        version=None,
+        success=None,
     ):
-        self.version = version
+        self.success = success
 
     def read(self, iprot):
         if (
@@ -7035,9 +10223,15 @@ class is_version_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.DOUBLE:
-                    self.version = iprot.readDouble()
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype101, _size98 = iprot.readListBegin()
+                    for _i102 in range(_size98):
+                        _elem103 = Flavor()
+                        _elem103.read(iprot)
+                        self.success.append(_elem103)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -7052,10 +10246,13 @@ class is_version_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("is_version_args")
-        if self.version is not None:
-            oprot.writeFieldBegin("version", TType.DOUBLE, 1)
-            oprot.writeDouble(self.version)
+        oprot.writeStructBegin("get_flavors_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter104 in self.success:
+                iter104.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7074,20 +10271,69 @@ class is_version_args(object):
         return not (self == other)
 
 
-all_structs.append(is_version_args)
-is_version_args.thrift_spec = (
-    None,  # 0
+all_structs.append(get_flavors_result)
+get_flavors_result.thrift_spec = (
     (
-        1,
-        TType.DOUBLE,
-        "version",
-        None,
+        0,
+        TType.LIST,
+        "success",
+        (TType.STRUCT, [Flavor, None], False),
         None,
-    ),  # 1
+    ),  # 0
 )
 
 
-class is_version_result(object):
+class get_images_args(object):
+    thrift_spec = None
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_images_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_images_args)
+get_images_args.thrift_spec = ()
+
+
+class get_images_result(object):
     """
     Attributes:
      - success
@@ -7116,8 +10362,14 @@ class is_version_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype108, _size105 = iprot.readListBegin()
+                    for _i109 in range(_size105):
+                        _elem110 = Image()
+                        _elem110.read(iprot)
+                        self.success.append(_elem110)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -7132,10 +10384,13 @@ class is_version_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("is_version_result")
+        oprot.writeStructBegin("get_images_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter111 in self.success:
+                iter111.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7154,19 +10409,19 @@ class is_version_result(object):
         return not (self == other)
 
 
-all_structs.append(is_version_result)
-is_version_result.thrift_spec = (
+all_structs.append(get_images_result)
+get_images_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.LIST,
         "success",
-        None,
+        (TType.STRUCT, [Image, None], False),
         None,
     ),  # 0
 )
 
 
-class get_client_version_args(object):
+class get_public_images_args(object):
     thrift_spec = None
 
     def read(self, iprot):
@@ -7194,7 +10449,7 @@ class get_client_version_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_client_version_args")
+        oprot.writeStructBegin("get_public_images_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -7212,11 +10467,11 @@ class get_client_version_args(object):
         return not (self == other)
 
 
-all_structs.append(get_client_version_args)
-get_client_version_args.thrift_spec = ()
+all_structs.append(get_public_images_args)
+get_public_images_args.thrift_spec = ()
 
 
-class get_client_version_result(object):
+class get_public_images_result(object):
     """
     Attributes:
      - success
@@ -7245,12 +10500,14 @@ class get_client_version_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype115, _size112 = iprot.readListBegin()
+                    for _i116 in range(_size112):
+                        _elem117 = Image()
+                        _elem117.read(iprot)
+                        self.success.append(_elem117)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -7265,14 +10522,13 @@ class get_client_version_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_client_version_result")
+        oprot.writeStructBegin("get_public_images_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter118 in self.success:
+                iter118.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7291,19 +10547,19 @@ class get_client_version_result(object):
         return not (self == other)
 
 
-all_structs.append(get_client_version_result)
-get_client_version_result.thrift_spec = (
+all_structs.append(get_public_images_result)
+get_public_images_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.LIST,
         "success",
-        "UTF8",
+        (TType.STRUCT, [Image, None], False),
         None,
     ),  # 0
 )
 
 
-class get_gateway_ip_args(object):
+class get_private_images_args(object):
     thrift_spec = None
 
     def read(self, iprot):
@@ -7331,7 +10587,7 @@ class get_gateway_ip_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_gateway_ip_args")
+        oprot.writeStructBegin("get_private_images_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -7349,11 +10605,11 @@ class get_gateway_ip_args(object):
         return not (self == other)
 
 
-all_structs.append(get_gateway_ip_args)
-get_gateway_ip_args.thrift_spec = ()
+all_structs.append(get_private_images_args)
+get_private_images_args.thrift_spec = ()
 
 
-class get_gateway_ip_result(object):
+class get_private_images_result(object):
     """
     Attributes:
      - success
@@ -7382,22 +10638,14 @@ class get_gateway_ip_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    _ktype63, _vtype64, _size62 = iprot.readMapBegin()
-                    for _i66 in range(_size62):
-                        _key67 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val68 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key67] = _val68
-                    iprot.readMapEnd()
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype122, _size119 = iprot.readListBegin()
+                    for _i123 in range(_size119):
+                        _elem124 = Image()
+                        _elem124.read(iprot)
+                        self.success.append(_elem124)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -7412,18 +10660,13 @@ class get_gateway_ip_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_gateway_ip_result")
+        oprot.writeStructBegin("get_private_images_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter69, viter70 in self.success.items():
-                oprot.writeString(
-                    kiter69.encode("utf-8") if sys.version_info[0] == 2 else kiter69
-                )
-                oprot.writeString(
-                    viter70.encode("utf-8") if sys.version_info[0] == 2 else viter70
-                )
-            oprot.writeMapEnd()
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter125 in self.success:
+                iter125.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7442,21 +10685,36 @@ class get_gateway_ip_result(object):
         return not (self == other)
 
 
-all_structs.append(get_gateway_ip_result)
-get_gateway_ip_result.thrift_spec = (
+all_structs.append(get_private_images_result)
+get_private_images_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.LIST,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        (TType.STRUCT, [Image, None], False),
         None,
     ),  # 0
 )
 
 
-class get_calculation_values_args(object):
+class get_image_args(object):
+    """
+    Attributes:
+     - openstack_id
+     - ignore_not_active
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        openstack_id=None,
+        ignore_not_active=None,
+    ):
+        self.openstack_id = openstack_id
+        self.ignore_not_active = ignore_not_active
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -7470,6 +10728,20 @@ class get_calculation_values_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.BOOL:
+                    self.ignore_not_active = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -7482,7 +10754,19 @@ class get_calculation_values_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_calculation_values_args")
+        oprot.writeStructBegin("get_image_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
+        if self.ignore_not_active is not None:
+            oprot.writeFieldBegin("ignore_not_active", TType.BOOL, 2)
+            oprot.writeBool(self.ignore_not_active)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -7500,14 +10784,31 @@ class get_calculation_values_args(object):
         return not (self == other)
 
 
-all_structs.append(get_calculation_values_args)
-get_calculation_values_args.thrift_spec = ()
+all_structs.append(get_image_args)
+get_image_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.BOOL,
+        "ignore_not_active",
+        None,
+        None,
+    ),  # 2
+)
 
 
-class get_calculation_values_result(object):
+class get_image_result(object):
     """
     Attributes:
      - success
+     - i
 
     """
 
@@ -7516,8 +10817,10 @@ class get_calculation_values_result(object):
     def __init__(
         self,
         success=None,
+        i=None,
     ):
         self.success = success
+        self.i = i
 
     def read(self, iprot):
         if (
@@ -7533,22 +10836,14 @@ class get_calculation_values_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    _ktype72, _vtype73, _size71 = iprot.readMapBegin()
-                    for _i75 in range(_size71):
-                        _key76 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val77 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key76] = _val77
-                    iprot.readMapEnd()
+                if ftype == TType.STRUCT:
+                    self.success = Image()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.i = ImageNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -7563,18 +10858,14 @@ class get_calculation_values_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_calculation_values_result")
+        oprot.writeStructBegin("get_image_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter78, viter79 in self.success.items():
-                oprot.writeString(
-                    kiter78.encode("utf-8") if sys.version_info[0] == 2 else kiter78
-                )
-                oprot.writeString(
-                    viter79.encode("utf-8") if sys.version_info[0] == 2 else viter79
-                )
-            oprot.writeMapEnd()
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.i is not None:
+            oprot.writeFieldBegin("i", TType.STRUCT, 1)
+            self.i.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7593,23 +10884,29 @@ class get_calculation_values_result(object):
         return not (self == other)
 
 
-all_structs.append(get_calculation_values_result)
-get_calculation_values_result.thrift_spec = (
+all_structs.append(get_image_result)
+get_image_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.STRUCT,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        [Image, None],
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "i",
+        [ImageNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class import_keypair_args(object):
+class get_volume_args(object):
     """
     Attributes:
-     - keyname: Name for the keypair
-     - public_key: The public key
+     - volume_id
 
     """
 
@@ -7617,11 +10914,9 @@ class import_keypair_args(object):
 
     def __init__(
         self,
-        keyname=None,
-        public_key=None,
+        volume_id=None,
     ):
-        self.keyname = keyname
-        self.public_key = public_key
+        self.volume_id = volume_id
 
     def read(self, iprot):
         if (
@@ -7638,16 +10933,7 @@ class import_keypair_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.keyname = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.public_key = (
+                    self.volume_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -7665,22 +10951,14 @@ class import_keypair_args(object):
             oprot.trans.write(
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            return
-        oprot.writeStructBegin("import_keypair_args")
-        if self.keyname is not None:
-            oprot.writeFieldBegin("keyname", TType.STRING, 1)
-            oprot.writeString(
-                self.keyname.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.keyname
-            )
-            oprot.writeFieldEnd()
-        if self.public_key is not None:
-            oprot.writeFieldBegin("public_key", TType.STRING, 2)
+            return
+        oprot.writeStructBegin("get_volume_args")
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
             oprot.writeString(
-                self.public_key.encode("utf-8")
+                self.volume_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.public_key
+                else self.volume_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -7700,30 +10978,24 @@ class import_keypair_args(object):
         return not (self == other)
 
 
-all_structs.append(import_keypair_args)
-import_keypair_args.thrift_spec = (
+all_structs.append(get_volume_args)
+get_volume_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "keyname",
+        "volume_id",
         "UTF8",
         None,
     ),  # 1
-    (
-        2,
-        TType.STRING,
-        "public_key",
-        "UTF8",
-        None,
-    ),  # 2
 )
 
 
-class import_keypair_result(object):
+class get_volume_result(object):
     """
     Attributes:
      - success
+     - v
 
     """
 
@@ -7732,8 +11004,10 @@ class import_keypair_result(object):
     def __init__(
         self,
         success=None,
+        v=None,
     ):
         self.success = success
+        self.v = v
 
     def read(self, iprot):
         if (
@@ -7749,12 +11023,14 @@ class import_keypair_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.STRUCT:
+                    self.success = Volume()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.v = VolumeNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -7769,14 +11045,14 @@ class import_keypair_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("import_keypair_result")
+        oprot.writeStructBegin("get_volume_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.v is not None:
+            oprot.writeFieldBegin("v", TType.STRUCT, 1)
+            self.v.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7795,22 +11071,29 @@ class import_keypair_result(object):
         return not (self == other)
 
 
-all_structs.append(import_keypair_result)
-import_keypair_result.thrift_spec = (
+all_structs.append(get_volume_result)
+get_volume_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.STRUCT,
         "success",
-        "UTF8",
+        [Volume, None],
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "v",
+        [VolumeNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class get_vm_ports_args(object):
+class get_volumes_by_ids_args(object):
     """
     Attributes:
-     - openstack_id: Id of server
+     - volume_ids
 
     """
 
@@ -7818,9 +11101,9 @@ class get_vm_ports_args(object):
 
     def __init__(
         self,
-        openstack_id=None,
+        volume_ids=None,
     ):
-        self.openstack_id = openstack_id
+        self.volume_ids = volume_ids
 
     def read(self, iprot):
         if (
@@ -7836,12 +11119,17 @@ class get_vm_ports_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.openstack_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.LIST:
+                    self.volume_ids = []
+                    _etype129, _size126 = iprot.readListBegin()
+                    for _i130 in range(_size126):
+                        _elem131 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.volume_ids.append(_elem131)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -7856,14 +11144,15 @@ class get_vm_ports_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_vm_ports_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
-            oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
-            )
+        oprot.writeStructBegin("get_volumes_by_ids_args")
+        if self.volume_ids is not None:
+            oprot.writeFieldBegin("volume_ids", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.volume_ids))
+            for iter132 in self.volume_ids:
+                oprot.writeString(
+                    iter132.encode("utf-8") if sys.version_info[0] == 2 else iter132
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7882,24 +11171,23 @@ class get_vm_ports_args(object):
         return not (self == other)
 
 
-all_structs.append(get_vm_ports_args)
-get_vm_ports_args.thrift_spec = (
+all_structs.append(get_volumes_by_ids_args)
+get_volumes_by_ids_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "openstack_id",
-        "UTF8",
+        TType.LIST,
+        "volume_ids",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 1
 )
 
 
-class get_vm_ports_result(object):
+class get_volumes_by_ids_result(object):
     """
     Attributes:
      - success
-     - s
 
     """
 
@@ -7908,10 +11196,8 @@ class get_vm_ports_result(object):
     def __init__(
         self,
         success=None,
-        s=None,
     ):
         self.success = success
-        self.s = s
 
     def read(self, iprot):
         if (
@@ -7927,27 +11213,14 @@ class get_vm_ports_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    _ktype81, _vtype82, _size80 = iprot.readMapBegin()
-                    for _i84 in range(_size80):
-                        _key85 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val86 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key85] = _val86
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.s = ServerNotFoundException.read(iprot)
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype136, _size133 = iprot.readListBegin()
+                    for _i137 in range(_size133):
+                        _elem138 = Volume()
+                        _elem138.read(iprot)
+                        self.success.append(_elem138)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -7962,22 +11235,13 @@ class get_vm_ports_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_vm_ports_result")
+        oprot.writeStructBegin("get_volumes_by_ids_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter87, viter88 in self.success.items():
-                oprot.writeString(
-                    kiter87.encode("utf-8") if sys.version_info[0] == 2 else kiter87
-                )
-                oprot.writeString(
-                    viter88.encode("utf-8") if sys.version_info[0] == 2 else viter88
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 1)
-            self.s.write(oprot)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter139 in self.success:
+                iter139.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7996,29 +11260,23 @@ class get_vm_ports_result(object):
         return not (self == other)
 
 
-all_structs.append(get_vm_ports_result)
-get_vm_ports_result.thrift_spec = (
+all_structs.append(get_volumes_by_ids_result)
+get_volumes_by_ids_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.LIST,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        (TType.STRUCT, [Volume, None], False),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "s",
-        [ServerNotFoundException, None],
-        None,
-    ),  # 1
 )
 
 
-class add_udp_security_group_args(object):
+class resize_volume_args(object):
     """
     Attributes:
-     - server_id: OpenStack id of the server
+     - volume_id
+     - size
 
     """
 
@@ -8026,9 +11284,11 @@ class add_udp_security_group_args(object):
 
     def __init__(
         self,
-        server_id=None,
+        volume_id=None,
+        size=None,
     ):
-        self.server_id = server_id
+        self.volume_id = volume_id
+        self.size = size
 
     def read(self, iprot):
         if (
@@ -8045,13 +11305,18 @@ class add_udp_security_group_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.server_id = (
+                    self.volume_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.size = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -8064,15 +11329,19 @@ class add_udp_security_group_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_udp_security_group_args")
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 1)
+        oprot.writeStructBegin("resize_volume_args")
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
             oprot.writeString(
-                self.server_id.encode("utf-8")
+                self.volume_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.server_id
+                else self.volume_id
             )
             oprot.writeFieldEnd()
+        if self.size is not None:
+            oprot.writeFieldBegin("size", TType.I32, 2)
+            oprot.writeI32(self.size)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -8090,24 +11359,30 @@ class add_udp_security_group_args(object):
         return not (self == other)
 
 
-all_structs.append(add_udp_security_group_args)
-add_udp_security_group_args.thrift_spec = (
+all_structs.append(resize_volume_args)
+resize_volume_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "server_id",
+        "volume_id",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.I32,
+        "size",
+        None,
+        None,
+    ),  # 2
 )
 
 
-class add_udp_security_group_result(object):
+class resize_volume_result(object):
     """
     Attributes:
-     - r
-     - s
+     - v
 
     """
 
@@ -8115,11 +11390,9 @@ class add_udp_security_group_result(object):
 
     def __init__(
         self,
-        r=None,
-        s=None,
+        v=None,
     ):
-        self.r = r
-        self.s = s
+        self.v = v
 
     def read(self, iprot):
         if (
@@ -8131,17 +11404,12 @@ class add_udp_security_group_result(object):
             return
         iprot.readStructBegin()
         while True:
-            fname, ftype, fid = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.r = DefaultException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.s = ServerNotFoundException.read(iprot)
+                    self.v = VolumeNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -8156,14 +11424,10 @@ class add_udp_security_group_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_udp_security_group_result")
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 1)
-            self.r.write(oprot)
-            oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 2)
-            self.s.write(oprot)
+        oprot.writeStructBegin("resize_volume_result")
+        if self.v is not None:
+            oprot.writeFieldBegin("v", TType.STRUCT, 1)
+            self.v.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -8182,31 +11446,27 @@ class add_udp_security_group_result(object):
         return not (self == other)
 
 
-all_structs.append(add_udp_security_group_result)
-add_udp_security_group_result.thrift_spec = (
+all_structs.append(resize_volume_result)
+resize_volume_result.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRUCT,
-        "r",
-        [DefaultException, None],
+        "v",
+        [VolumeNotFoundException, None],
         None,
     ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "s",
-        [ServerNotFoundException, None],
-        None,
-    ),  # 2
 )
 
 
-class add_research_environment_security_group_args(object):
+class open_port_range_for_vm_in_project_args(object):
     """
     Attributes:
-     - server_id: OpenStack id of the server
-     - security_group_name
+     - range_start
+     - range_stop
+     - openstack_id
+     - ethertype
+     - protocol
 
     """
 
@@ -8214,11 +11474,17 @@ class add_research_environment_security_group_args(object):
 
     def __init__(
         self,
-        server_id=None,
-        security_group_name=None,
+        range_start=None,
+        range_stop=None,
+        openstack_id=None,
+        ethertype="IPv4",
+        protocol="TCP",
     ):
-        self.server_id = server_id
-        self.security_group_name = security_group_name
+        self.range_start = range_start
+        self.range_stop = range_stop
+        self.openstack_id = openstack_id
+        self.ethertype = ethertype
+        self.protocol = protocol
 
     def read(self, iprot):
         if (
@@ -8234,17 +11500,36 @@ class add_research_environment_security_group_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
+                if ftype == TType.I32:
+                    self.range_start = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.range_stop = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
                 if ftype == TType.STRING:
-                    self.server_id = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
+            elif fid == 4:
                 if ftype == TType.STRING:
-                    self.security_group_name = (
+                    self.ethertype = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.protocol = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -8263,21 +11548,37 @@ class add_research_environment_security_group_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_research_environment_security_group_args")
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 1)
+        oprot.writeStructBegin("open_port_range_for_vm_in_project_args")
+        if self.range_start is not None:
+            oprot.writeFieldBegin("range_start", TType.I32, 1)
+            oprot.writeI32(self.range_start)
+            oprot.writeFieldEnd()
+        if self.range_stop is not None:
+            oprot.writeFieldBegin("range_stop", TType.I32, 2)
+            oprot.writeI32(self.range_stop)
+            oprot.writeFieldEnd()
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 3)
             oprot.writeString(
-                self.server_id.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.server_id
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
-        if self.security_group_name is not None:
-            oprot.writeFieldBegin("security_group_name", TType.STRING, 2)
+        if self.ethertype is not None:
+            oprot.writeFieldBegin("ethertype", TType.STRING, 4)
             oprot.writeString(
-                self.security_group_name.encode("utf-8")
+                self.ethertype.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.security_group_name
+                else self.ethertype
+            )
+            oprot.writeFieldEnd()
+        if self.protocol is not None:
+            oprot.writeFieldBegin("protocol", TType.STRING, 5)
+            oprot.writeString(
+                self.protocol.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.protocol
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -8297,31 +11598,54 @@ class add_research_environment_security_group_args(object):
         return not (self == other)
 
 
-all_structs.append(add_research_environment_security_group_args)
-add_research_environment_security_group_args.thrift_spec = (
+all_structs.append(open_port_range_for_vm_in_project_args)
+open_port_range_for_vm_in_project_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "server_id",
-        "UTF8",
+        TType.I32,
+        "range_start",
+        None,
         None,
     ),  # 1
     (
         2,
+        TType.I32,
+        "range_stop",
+        None,
+        None,
+    ),  # 2
+    (
+        3,
         TType.STRING,
-        "security_group_name",
+        "openstack_id",
         "UTF8",
         None,
-    ),  # 2
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "ethertype",
+        "UTF8",
+        "IPv4",
+    ),  # 4
+    (
+        5,
+        TType.STRING,
+        "protocol",
+        "UTF8",
+        "TCP",
+    ),  # 5
 )
 
 
-class add_research_environment_security_group_result(object):
+class open_port_range_for_vm_in_project_result(object):
     """
     Attributes:
-     - r
-     - s
+     - success
+     - e
+     - v
+     - o
 
     """
 
@@ -8329,11 +11653,15 @@ class add_research_environment_security_group_result(object):
 
     def __init__(
         self,
-        r=None,
-        s=None,
+        success=None,
+        e=None,
+        v=None,
+        o=None,
     ):
-        self.r = r
-        self.s = s
+        self.success = success
+        self.e = e
+        self.v = v
+        self.o = o
 
     def read(self, iprot):
         if (
@@ -8348,14 +11676,28 @@ class add_research_environment_security_group_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.r = DefaultException.read(iprot)
+                    self.e = ServerNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.s = ServerNotFoundException.read(iprot)
+                    self.v = DefaultException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.o = OpenStackConflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -8370,14 +11712,26 @@ class add_research_environment_security_group_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_research_environment_security_group_result")
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 1)
-            self.r.write(oprot)
+        oprot.writeStructBegin("open_port_range_for_vm_in_project_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 2)
-            self.s.write(oprot)
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.v is not None:
+            oprot.writeFieldBegin("v", TType.STRUCT, 2)
+            self.v.write(oprot)
+            oprot.writeFieldEnd()
+        if self.o is not None:
+            oprot.writeFieldBegin("o", TType.STRUCT, 3)
+            self.o.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -8396,32 +11750,43 @@ class add_research_environment_security_group_result(object):
         return not (self == other)
 
 
-all_structs.append(add_research_environment_security_group_result)
-add_research_environment_security_group_result.thrift_spec = (
-    None,  # 0
+all_structs.append(open_port_range_for_vm_in_project_result)
+open_port_range_for_vm_in_project_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
     (
         1,
         TType.STRUCT,
-        "r",
-        [DefaultException, None],
+        "e",
+        [ServerNotFoundException, None],
         None,
     ),  # 1
     (
         2,
         TType.STRUCT,
-        "s",
-        [ServerNotFoundException, None],
+        "v",
+        [DefaultException, None],
         None,
     ),  # 2
+    (
+        3,
+        TType.STRUCT,
+        "o",
+        [OpenStackConflictException, None],
+        None,
+    ),  # 3
 )
 
 
-class add_project_security_group_to_server_args(object):
+class delete_security_group_rule_args(object):
     """
     Attributes:
-     - server_id: OpenStack id of the server
-     - project_name
-     - project_id
+     - openstack_id
 
     """
 
@@ -8429,13 +11794,9 @@ class add_project_security_group_to_server_args(object):
 
     def __init__(
         self,
-        server_id=None,
-        project_name=None,
-        project_id=None,
+        openstack_id=None,
     ):
-        self.server_id = server_id
-        self.project_name = project_name
-        self.project_id = project_id
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -8452,25 +11813,7 @@ class add_project_security_group_to_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.server_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.project_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.project_id = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -8489,29 +11832,13 @@ class add_project_security_group_to_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_project_security_group_to_server_args")
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 1)
-            oprot.writeString(
-                self.server_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.server_id
-            )
-            oprot.writeFieldEnd()
-        if self.project_name is not None:
-            oprot.writeFieldBegin("project_name", TType.STRING, 2)
-            oprot.writeString(
-                self.project_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.project_name
-            )
-            oprot.writeFieldEnd()
-        if self.project_id is not None:
-            oprot.writeFieldBegin("project_id", TType.STRING, 3)
+        oprot.writeStructBegin("delete_security_group_rule_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.project_id.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.project_id
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -8531,38 +11858,24 @@ class add_project_security_group_to_server_args(object):
         return not (self == other)
 
 
-all_structs.append(add_project_security_group_to_server_args)
-add_project_security_group_to_server_args.thrift_spec = (
+all_structs.append(delete_security_group_rule_args)
+delete_security_group_rule_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "server_id",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
-    (
-        2,
-        TType.STRING,
-        "project_name",
-        "UTF8",
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRING,
-        "project_id",
-        "UTF8",
-        None,
-    ),  # 3
 )
 
 
-class add_project_security_group_to_server_result(object):
+class delete_security_group_rule_result(object):
     """
     Attributes:
-     - r
-     - s
+     - e
+     - f
 
     """
 
@@ -8570,11 +11883,11 @@ class add_project_security_group_to_server_result(object):
 
     def __init__(
         self,
-        r=None,
-        s=None,
+        e=None,
+        f=None,
     ):
-        self.r = r
-        self.s = s
+        self.e = e
+        self.f = f
 
     def read(self, iprot):
         if (
@@ -8591,12 +11904,12 @@ class add_project_security_group_to_server_result(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.r = DefaultException.read(iprot)
+                    self.e = SecurityGroupRuleNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.s = ServerNotFoundException.read(iprot)
+                    self.f = DefaultException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -8611,14 +11924,14 @@ class add_project_security_group_to_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_project_security_group_to_server_result")
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 1)
-            self.r.write(oprot)
+        oprot.writeStructBegin("delete_security_group_rule_result")
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 2)
-            self.s.write(oprot)
+        if self.f is not None:
+            oprot.writeFieldBegin("f", TType.STRUCT, 2)
+            self.f.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -8637,31 +11950,30 @@ class add_project_security_group_to_server_result(object):
         return not (self == other)
 
 
-all_structs.append(add_project_security_group_to_server_result)
-add_project_security_group_to_server_result.thrift_spec = (
+all_structs.append(delete_security_group_rule_result)
+delete_security_group_rule_result.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRUCT,
-        "r",
-        [DefaultException, None],
+        "e",
+        [SecurityGroupRuleNotFoundException, None],
         None,
     ),  # 1
     (
         2,
         TType.STRUCT,
-        "s",
-        [ServerNotFoundException, None],
+        "f",
+        [DefaultException, None],
         None,
     ),  # 2
 )
 
 
-class add_metadata_to_server_args(object):
+class remove_security_groups_from_server_args(object):
     """
     Attributes:
      - openstack_id
-     - metadata
 
     """
 
@@ -8670,10 +11982,8 @@ class add_metadata_to_server_args(object):
     def __init__(
         self,
         openstack_id=None,
-        metadata=None,
     ):
         self.openstack_id = openstack_id
-        self.metadata = metadata
 
     def read(self, iprot):
         if (
@@ -8697,25 +12007,6 @@ class add_metadata_to_server_args(object):
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.MAP:
-                    self.metadata = {}
-                    _ktype90, _vtype91, _size89 = iprot.readMapBegin()
-                    for _i93 in range(_size89):
-                        _key94 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val95 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.metadata[_key94] = _val95
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -8728,7 +12019,7 @@ class add_metadata_to_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_metadata_to_server_args")
+        oprot.writeStructBegin("remove_security_groups_from_server_args")
         if self.openstack_id is not None:
             oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
@@ -8737,18 +12028,6 @@ class add_metadata_to_server_args(object):
                 else self.openstack_id
             )
             oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.MAP, 2)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
-            for kiter96, viter97 in self.metadata.items():
-                oprot.writeString(
-                    kiter96.encode("utf-8") if sys.version_info[0] == 2 else kiter96
-                )
-                oprot.writeString(
-                    viter97.encode("utf-8") if sys.version_info[0] == 2 else viter97
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -8766,8 +12045,8 @@ class add_metadata_to_server_args(object):
         return not (self == other)
 
 
-all_structs.append(add_metadata_to_server_args)
-add_metadata_to_server_args.thrift_spec = (
+all_structs.append(remove_security_groups_from_server_args)
+remove_security_groups_from_server_args.thrift_spec = (
     None,  # 0
     (
         1,
@@ -8776,21 +12055,14 @@ add_metadata_to_server_args.thrift_spec = (
         "UTF8",
         None,
     ),  # 1
-    (
-        2,
-        TType.MAP,
-        "metadata",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 2
 )
 
 
-class add_metadata_to_server_result(object):
+class remove_security_groups_from_server_result(object):
     """
     Attributes:
-     - r
-     - s
+     - e
+     - f
 
     """
 
@@ -8798,11 +12070,11 @@ class add_metadata_to_server_result(object):
 
     def __init__(
         self,
-        r=None,
-        s=None,
+        e=None,
+        f=None,
     ):
-        self.r = r
-        self.s = s
+        self.e = e
+        self.f = f
 
     def read(self, iprot):
         if (
@@ -8819,12 +12091,12 @@ class add_metadata_to_server_result(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.r = DefaultException.read(iprot)
+                    self.e = SecurityGroupRuleNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.s = ServerNotFoundException.read(iprot)
+                    self.f = OpenStackConflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -8839,14 +12111,14 @@ class add_metadata_to_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_metadata_to_server_result")
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 1)
-            self.r.write(oprot)
+        oprot.writeStructBegin("remove_security_groups_from_server_result")
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 2)
-            self.s.write(oprot)
+        if self.f is not None:
+            oprot.writeFieldBegin("f", TType.STRUCT, 2)
+            self.f.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -8865,80 +12137,30 @@ class add_metadata_to_server_result(object):
         return not (self == other)
 
 
-all_structs.append(add_metadata_to_server_result)
-add_metadata_to_server_result.thrift_spec = (
+all_structs.append(remove_security_groups_from_server_result)
+remove_security_groups_from_server_result.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRUCT,
-        "r",
-        [DefaultException, None],
+        "e",
+        [SecurityGroupRuleNotFoundException, None],
         None,
     ),  # 1
     (
         2,
         TType.STRUCT,
-        "s",
-        [ServerNotFoundException, None],
+        "f",
+        [OpenStackConflictException, None],
         None,
     ),  # 2
 )
 
 
-class get_flavors_args(object):
-    thrift_spec = None
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            fname, ftype, fid = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        self.validate()
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("get_flavors_args")
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(get_flavors_args)
-get_flavors_args.thrift_spec = ()
-
-
-class get_flavors_result(object):
+class delete_server_args(object):
     """
     Attributes:
-     - success
+     - openstack_id: Id of the server.
 
     """
 
@@ -8946,9 +12168,9 @@ class get_flavors_result(object):
 
     def __init__(
         self,
-        success=None,
+        openstack_id=None,
     ):
-        self.success = success
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -8963,15 +12185,13 @@ class get_flavors_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype101, _size98 = iprot.readListBegin()
-                    for _i102 in range(_size98):
-                        _elem103 = Flavor()
-                        _elem103.read(iprot)
-                        self.success.append(_elem103)
-                    iprot.readListEnd()
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -8986,13 +12206,14 @@ class get_flavors_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_flavors_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter104 in self.success:
-                iter104.write(oprot)
-            oprot.writeListEnd()
+        oprot.writeStructBegin("delete_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -9011,21 +12232,37 @@ class get_flavors_result(object):
         return not (self == other)
 
 
-all_structs.append(get_flavors_result)
-get_flavors_result.thrift_spec = (
+all_structs.append(delete_server_args)
+delete_server_args.thrift_spec = (
+    None,  # 0
     (
-        0,
-        TType.LIST,
-        "success",
-        (TType.STRUCT, [Flavor, None], False),
+        1,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
         None,
-    ),  # 0
+    ),  # 1
 )
 
 
-class get_images_args(object):
+class delete_server_result(object):
+    """
+    Attributes:
+     - e
+     - c
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        e=None,
+        c=None,
+    ):
+        self.e = e
+        self.c = c
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -9039,6 +12276,16 @@ class get_images_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = ServerNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.c = OpenStackConflictException.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -9051,7 +12298,15 @@ class get_images_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_images_args")
+        oprot.writeStructBegin("delete_server_result")
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -9069,14 +12324,32 @@ class get_images_args(object):
         return not (self == other)
 
 
-all_structs.append(get_images_args)
-get_images_args.thrift_spec = ()
+all_structs.append(delete_server_result)
+delete_server_result.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [ServerNotFoundException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [OpenStackConflictException, None],
+        None,
+    ),  # 2
+)
 
 
-class get_images_result(object):
+class rescue_server_args(object):
     """
     Attributes:
-     - success
+     - openstack_id: Id of the server.
+     - admin_pass
+     - image_ref
 
     """
 
@@ -9084,9 +12357,13 @@ class get_images_result(object):
 
     def __init__(
         self,
-        success=None,
+        openstack_id=None,
+        admin_pass=None,
+        image_ref=None,
     ):
-        self.success = success
+        self.openstack_id = openstack_id
+        self.admin_pass = admin_pass
+        self.image_ref = image_ref
 
     def read(self, iprot):
         if (
@@ -9101,15 +12378,31 @@ class get_images_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype108, _size105 = iprot.readListBegin()
-                    for _i109 in range(_size105):
-                        _elem110 = Image()
-                        _elem110.read(iprot)
-                        self.success.append(_elem110)
-                    iprot.readListEnd()
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.admin_pass = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.image_ref = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -9124,13 +12417,30 @@ class get_images_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_images_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter111 in self.success:
-                iter111.write(oprot)
-            oprot.writeListEnd()
+        oprot.writeStructBegin("rescue_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
+        if self.admin_pass is not None:
+            oprot.writeFieldBegin("admin_pass", TType.STRING, 2)
+            oprot.writeString(
+                self.admin_pass.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.admin_pass
+            )
+            oprot.writeFieldEnd()
+        if self.image_ref is not None:
+            oprot.writeFieldBegin("image_ref", TType.STRING, 3)
+            oprot.writeString(
+                self.image_ref.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.image_ref
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -9149,21 +12459,51 @@ class get_images_result(object):
         return not (self == other)
 
 
-all_structs.append(get_images_result)
-get_images_result.thrift_spec = (
+all_structs.append(rescue_server_args)
+rescue_server_args.thrift_spec = (
+    None,  # 0
     (
-        0,
-        TType.LIST,
-        "success",
-        (TType.STRUCT, [Image, None], False),
+        1,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
         None,
-    ),  # 0
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "admin_pass",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "image_ref",
+        "UTF8",
+        None,
+    ),  # 3
 )
 
 
-class get_public_images_args(object):
+class rescue_server_result(object):
+    """
+    Attributes:
+     - e
+     - c
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        e=None,
+        c=None,
+    ):
+        self.e = e
+        self.c = c
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -9177,6 +12517,16 @@ class get_public_images_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = ServerNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.c = OpenStackConflictException.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -9189,7 +12539,15 @@ class get_public_images_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_public_images_args")
+        oprot.writeStructBegin("rescue_server_result")
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -9207,14 +12565,30 @@ class get_public_images_args(object):
         return not (self == other)
 
 
-all_structs.append(get_public_images_args)
-get_public_images_args.thrift_spec = ()
+all_structs.append(rescue_server_result)
+rescue_server_result.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [ServerNotFoundException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [OpenStackConflictException, None],
+        None,
+    ),  # 2
+)
 
 
-class get_public_images_result(object):
+class unrescue_server_args(object):
     """
     Attributes:
-     - success
+     - openstack_id: Id of the server.
 
     """
 
@@ -9222,9 +12596,9 @@ class get_public_images_result(object):
 
     def __init__(
         self,
-        success=None,
+        openstack_id=None,
     ):
-        self.success = success
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -9239,15 +12613,13 @@ class get_public_images_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype115, _size112 = iprot.readListBegin()
-                    for _i116 in range(_size112):
-                        _elem117 = Image()
-                        _elem117.read(iprot)
-                        self.success.append(_elem117)
-                    iprot.readListEnd()
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -9262,13 +12634,14 @@ class get_public_images_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_public_images_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter118 in self.success:
-                iter118.write(oprot)
-            oprot.writeListEnd()
+        oprot.writeStructBegin("unrescue_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -9287,21 +12660,37 @@ class get_public_images_result(object):
         return not (self == other)
 
 
-all_structs.append(get_public_images_result)
-get_public_images_result.thrift_spec = (
+all_structs.append(unrescue_server_args)
+unrescue_server_args.thrift_spec = (
+    None,  # 0
     (
-        0,
-        TType.LIST,
-        "success",
-        (TType.STRUCT, [Image, None], False),
+        1,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
         None,
-    ),  # 0
+    ),  # 1
 )
 
 
-class get_private_images_args(object):
+class unrescue_server_result(object):
+    """
+    Attributes:
+     - e
+     - c
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        e=None,
+        c=None,
+    ):
+        self.e = e
+        self.c = c
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -9315,6 +12704,16 @@ class get_private_images_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = ServerNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.c = OpenStackConflictException.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -9327,7 +12726,15 @@ class get_private_images_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_private_images_args")
+        oprot.writeStructBegin("unrescue_server_result")
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -9345,14 +12752,44 @@ class get_private_images_args(object):
         return not (self == other)
 
 
-all_structs.append(get_private_images_args)
-get_private_images_args.thrift_spec = ()
+all_structs.append(unrescue_server_result)
+unrescue_server_result.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [ServerNotFoundException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [OpenStackConflictException, None],
+        None,
+    ),  # 2
+)
 
 
-class get_private_images_result(object):
+class start_server_args(object):
     """
     Attributes:
-     - success
+     - flavor_name: Name of the  Flavor to use.
+     - image_name: Name of the image to use.
+     - public_key: Public Key to use
+     - servername: Name for the new server
+     - metadata: Metadata for the new instance
+     - volume_ids_path_new
+     - volume_ids_path_attach
+     - additional_owner_keys
+     - additional_user_keys
+     - research_environment
+     - additional_security_group_ids
+     - slurm_version
+     - metadata_token
+     - metadata_endpoint
+     - additional_script
 
     """
 
@@ -9360,9 +12797,37 @@ class get_private_images_result(object):
 
     def __init__(
         self,
-        success=None,
+        flavor_name=None,
+        image_name=None,
+        public_key=None,
+        servername=None,
+        metadata=None,
+        volume_ids_path_new=None,
+        volume_ids_path_attach=None,
+        additional_owner_keys=None,
+        additional_user_keys=None,
+        research_environment=None,
+        additional_security_group_ids=None,
+        slurm_version=None,
+        metadata_token=None,
+        metadata_endpoint=None,
+        additional_script=None,
     ):
-        self.success = success
+        self.flavor_name = flavor_name
+        self.image_name = image_name
+        self.public_key = public_key
+        self.servername = servername
+        self.metadata = metadata
+        self.volume_ids_path_new = volume_ids_path_new
+        self.volume_ids_path_attach = volume_ids_path_attach
+        self.additional_owner_keys = additional_owner_keys
+        self.additional_user_keys = additional_user_keys
+        self.research_environment = research_environment
+        self.additional_security_group_ids = additional_security_group_ids
+        self.slurm_version = slurm_version
+        self.metadata_token = metadata_token
+        self.metadata_endpoint = metadata_endpoint
+        self.additional_script = additional_script
 
     def read(self, iprot):
         if (
@@ -9377,17 +12842,196 @@ class get_private_images_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.flavor_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.public_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.servername = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    _ktype141, _vtype142, _size140 = iprot.readMapBegin()
+                    for _i144 in range(_size140):
+                        _key145 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val146 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key145] = _val146
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_new = []
+                    _etype150, _size147 = iprot.readListBegin()
+                    for _i151 in range(_size147):
+                        _elem152 = {}
+                        _ktype154, _vtype155, _size153 = iprot.readMapBegin()
+                        for _i157 in range(_size153):
+                            _key158 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val159 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem152[_key158] = _val159
+                        iprot.readMapEnd()
+                        self.volume_ids_path_new.append(_elem152)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
                 if ftype == TType.LIST:
-                    self.success = []
-                    _etype122, _size119 = iprot.readListBegin()
-                    for _i123 in range(_size119):
-                        _elem124 = Image()
-                        _elem124.read(iprot)
-                        self.success.append(_elem124)
+                    self.volume_ids_path_attach = []
+                    _etype163, _size160 = iprot.readListBegin()
+                    for _i164 in range(_size160):
+                        _elem165 = {}
+                        _ktype167, _vtype168, _size166 = iprot.readMapBegin()
+                        for _i170 in range(_size166):
+                            _key171 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val172 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem165[_key171] = _val172
+                        iprot.readMapEnd()
+                        self.volume_ids_path_attach.append(_elem165)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.LIST:
+                    self.additional_owner_keys = []
+                    _etype176, _size173 = iprot.readListBegin()
+                    for _i177 in range(_size173):
+                        _elem178 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.additional_owner_keys.append(_elem178)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.LIST:
+                    self.additional_user_keys = []
+                    _etype182, _size179 = iprot.readListBegin()
+                    for _i183 in range(_size179):
+                        _elem184 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.additional_user_keys.append(_elem184)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.STRING:
+                    self.research_environment = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 12:
+                if ftype == TType.LIST:
+                    self.additional_security_group_ids = []
+                    _etype188, _size185 = iprot.readListBegin()
+                    for _i189 in range(_size185):
+                        _elem190 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.additional_security_group_ids.append(_elem190)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
+            elif fid == 13:
+                if ftype == TType.STRING:
+                    self.slurm_version = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 14:
+                if ftype == TType.STRING:
+                    self.metadata_token = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 15:
+                if ftype == TType.STRING:
+                    self.metadata_endpoint = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 16:
+                if ftype == TType.STRING:
+                    self.additional_script = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -9400,112 +13044,155 @@ class get_private_images_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_private_images_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter125 in self.success:
-                iter125.write(oprot)
+        oprot.writeStructBegin("start_server_args")
+        if self.flavor_name is not None:
+            oprot.writeFieldBegin("flavor_name", TType.STRING, 1)
+            oprot.writeString(
+                self.flavor_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.flavor_name
+            )
+            oprot.writeFieldEnd()
+        if self.image_name is not None:
+            oprot.writeFieldBegin("image_name", TType.STRING, 2)
+            oprot.writeString(
+                self.image_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.image_name
+            )
+            oprot.writeFieldEnd()
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 3)
+            oprot.writeString(
+                self.public_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.public_key
+            )
+            oprot.writeFieldEnd()
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 4)
+            oprot.writeString(
+                self.servername.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.servername
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 5)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter191, viter192 in self.metadata.items():
+                oprot.writeString(
+                    kiter191.encode("utf-8") if sys.version_info[0] == 2 else kiter191
+                )
+                oprot.writeString(
+                    viter192.encode("utf-8") if sys.version_info[0] == 2 else viter192
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_new is not None:
+            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 7)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
+            for iter193 in self.volume_ids_path_new:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter193))
+                for kiter194, viter195 in iter193.items():
+                    oprot.writeString(
+                        kiter194.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter194
+                    )
+                    oprot.writeString(
+                        viter195.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter195
+                    )
+                oprot.writeMapEnd()
             oprot.writeListEnd()
             oprot.writeFieldEnd()
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(get_private_images_result)
-get_private_images_result.thrift_spec = (
-    (
-        0,
-        TType.LIST,
-        "success",
-        (TType.STRUCT, [Image, None], False),
-        None,
-    ),  # 0
-)
-
-
-class get_image_args(object):
-    """
-    Attributes:
-     - openstack_id
-     - ignore_not_active
-
-    """
-
-    thrift_spec = None
-
-    def __init__(
-        self,
-        openstack_id=None,
-        ignore_not_active=None,
-    ):
-        self.openstack_id = openstack_id
-        self.ignore_not_active = ignore_not_active
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            fname, ftype, fid = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.openstack_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
+        if self.volume_ids_path_attach is not None:
+            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 8)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
+            for iter196 in self.volume_ids_path_attach:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter196))
+                for kiter197, viter198 in iter196.items():
+                    oprot.writeString(
+                        kiter197.encode("utf-8")
                         if sys.version_info[0] == 2
-                        else iprot.readString()
+                        else kiter197
                     )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.BOOL:
-                    self.ignore_not_active = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        self.validate()
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+                    oprot.writeString(
+                        viter198.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter198
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.additional_owner_keys is not None:
+            oprot.writeFieldBegin("additional_owner_keys", TType.LIST, 9)
+            oprot.writeListBegin(TType.STRING, len(self.additional_owner_keys))
+            for iter199 in self.additional_owner_keys:
+                oprot.writeString(
+                    iter199.encode("utf-8") if sys.version_info[0] == 2 else iter199
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.additional_user_keys is not None:
+            oprot.writeFieldBegin("additional_user_keys", TType.LIST, 10)
+            oprot.writeListBegin(TType.STRING, len(self.additional_user_keys))
+            for iter200 in self.additional_user_keys:
+                oprot.writeString(
+                    iter200.encode("utf-8") if sys.version_info[0] == 2 else iter200
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.research_environment is not None:
+            oprot.writeFieldBegin("research_environment", TType.STRING, 11)
+            oprot.writeString(
+                self.research_environment.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.research_environment
             )
-            return
-        oprot.writeStructBegin("get_image_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeFieldEnd()
+        if self.additional_security_group_ids is not None:
+            oprot.writeFieldBegin("additional_security_group_ids", TType.LIST, 12)
+            oprot.writeListBegin(TType.STRING, len(self.additional_security_group_ids))
+            for iter201 in self.additional_security_group_ids:
+                oprot.writeString(
+                    iter201.encode("utf-8") if sys.version_info[0] == 2 else iter201
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.slurm_version is not None:
+            oprot.writeFieldBegin("slurm_version", TType.STRING, 13)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.slurm_version.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.slurm_version
             )
             oprot.writeFieldEnd()
-        if self.ignore_not_active is not None:
-            oprot.writeFieldBegin("ignore_not_active", TType.BOOL, 2)
-            oprot.writeBool(self.ignore_not_active)
+        if self.metadata_token is not None:
+            oprot.writeFieldBegin("metadata_token", TType.STRING, 14)
+            oprot.writeString(
+                self.metadata_token.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.metadata_token
+            )
+            oprot.writeFieldEnd()
+        if self.metadata_endpoint is not None:
+            oprot.writeFieldBegin("metadata_endpoint", TType.STRING, 15)
+            oprot.writeString(
+                self.metadata_endpoint.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.metadata_endpoint
+            )
+            oprot.writeFieldEnd()
+        if self.additional_script is not None:
+            oprot.writeFieldBegin("additional_script", TType.STRING, 16)
+            oprot.writeString(
+                self.additional_script.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.additional_script
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -9524,129 +13211,127 @@ class get_image_args(object):
         return not (self == other)
 
 
-all_structs.append(get_image_args)
-get_image_args.thrift_spec = (
+all_structs.append(start_server_args)
+start_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "flavor_name",
         "UTF8",
         None,
     ),  # 1
     (
         2,
-        TType.BOOL,
-        "ignore_not_active",
-        None,
+        TType.STRING,
+        "image_name",
+        "UTF8",
         None,
     ),  # 2
-)
-
-
-class get_image_result(object):
-    """
-    Attributes:
-     - success
-     - i
-
-    """
-
-    thrift_spec = None
-
-    def __init__(
-        self,
-        success=None,
-        i=None,
-    ):
-        self.success = success
-        self.i = i
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            fname, ftype, fid = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = Image()
-                    self.success.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.i = ImageNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        self.validate()
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("get_image_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
-            oprot.writeFieldEnd()
-        if self.i is not None:
-            oprot.writeFieldBegin("i", TType.STRUCT, 1)
-            self.i.write(oprot)
-            oprot.writeFieldEnd()
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(get_image_result)
-get_image_result.thrift_spec = (
     (
-        0,
-        TType.STRUCT,
-        "success",
-        [Image, None],
+        3,
+        TType.STRING,
+        "public_key",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 4
+    (
+        5,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 5
+    None,  # 6
+    (
+        7,
+        TType.LIST,
+        "volume_ids_path_new",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 7
+    (
+        8,
+        TType.LIST,
+        "volume_ids_path_attach",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 8
+    (
+        9,
+        TType.LIST,
+        "additional_owner_keys",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 9
+    (
+        10,
+        TType.LIST,
+        "additional_user_keys",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 10
+    (
+        11,
+        TType.STRING,
+        "research_environment",
+        "UTF8",
+        None,
+    ),  # 11
+    (
+        12,
+        TType.LIST,
+        "additional_security_group_ids",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 12
+    (
+        13,
+        TType.STRING,
+        "slurm_version",
+        "UTF8",
         None,
-    ),  # 0
+    ),  # 13
     (
-        1,
-        TType.STRUCT,
-        "i",
-        [ImageNotFoundException, None],
+        14,
+        TType.STRING,
+        "metadata_token",
+        "UTF8",
         None,
-    ),  # 1
+    ),  # 14
+    (
+        15,
+        TType.STRING,
+        "metadata_endpoint",
+        "UTF8",
+        None,
+    ),  # 15
+    (
+        16,
+        TType.STRING,
+        "additional_script",
+        "UTF8",
+        None,
+    ),  # 16
 )
 
 
-class get_volume_args(object):
+class start_server_result(object):
     """
     Attributes:
-     - volume_id
+     - success
+     - e
+     - r
+     - i
+     - f
+     - o
 
     """
 
@@ -9654,9 +13339,19 @@ class get_volume_args(object):
 
     def __init__(
         self,
-        volume_id=None,
+        success=None,
+        e=None,
+        r=None,
+        i=None,
+        f=None,
+        o=None,
     ):
-        self.volume_id = volume_id
+        self.success = success
+        self.e = e
+        self.r = r
+        self.i = i
+        self.f = f
+        self.o = o
 
     def read(self, iprot):
         if (
@@ -9671,15 +13366,40 @@ class get_volume_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
+            if fid == 0:
                 if ftype == TType.STRING:
-                    self.volume_id = (
+                    self.success = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = NameAlreadyUsedException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.r = ResourceNotAvailableException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.i = ImageNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.f = FlavorNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRUCT:
+                    self.o = DefaultException.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -9692,15 +13412,35 @@ class get_volume_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_volume_args")
-        if self.volume_id is not None:
-            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
+        oprot.writeStructBegin("start_server_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
             oprot.writeString(
-                self.volume_id.encode("utf-8")
+                self.success.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.volume_id
+                else self.success
             )
             oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 2)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.i is not None:
+            oprot.writeFieldBegin("i", TType.STRUCT, 5)
+            self.i.write(oprot)
+            oprot.writeFieldEnd()
+        if self.f is not None:
+            oprot.writeFieldBegin("f", TType.STRUCT, 6)
+            self.f.write(oprot)
+            oprot.writeFieldEnd()
+        if self.o is not None:
+            oprot.writeFieldBegin("o", TType.STRUCT, 7)
+            self.o.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -9718,37 +13458,58 @@ class get_volume_args(object):
         return not (self == other)
 
 
-all_structs.append(get_volume_args)
-get_volume_args.thrift_spec = (
-    None,  # 0
+all_structs.append(start_server_result)
+start_server_result.thrift_spec = (
     (
-        1,
+        0,
         TType.STRING,
-        "volume_id",
+        "success",
         "UTF8",
         None,
+    ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [NameAlreadyUsedException, None],
+        None,
     ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "r",
+        [ResourceNotAvailableException, None],
+        None,
+    ),  # 2
+    None,  # 3
+    None,  # 4
+    (
+        5,
+        TType.STRUCT,
+        "i",
+        [ImageNotFoundException, None],
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRUCT,
+        "f",
+        [FlavorNotFoundException, None],
+        None,
+    ),  # 6
+    (
+        7,
+        TType.STRUCT,
+        "o",
+        [DefaultException, None],
+        None,
+    ),  # 7
 )
 
 
-class get_volume_result(object):
-    """
-    Attributes:
-     - success
-     - v
-
-    """
-
+class is_bibigrid_available_args(object):
     thrift_spec = None
 
-    def __init__(
-        self,
-        success=None,
-        v=None,
-    ):
-        self.success = success
-        self.v = v
-
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -9762,17 +13523,6 @@ class get_volume_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = Volume()
-                    self.success.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.v = VolumeNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -9785,15 +13535,7 @@ class get_volume_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_volume_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
-            oprot.writeFieldEnd()
-        if self.v is not None:
-            oprot.writeFieldBegin("v", TType.STRUCT, 1)
-            self.v.write(oprot)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("is_bibigrid_available_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -9811,29 +13553,14 @@ class get_volume_result(object):
         return not (self == other)
 
 
-all_structs.append(get_volume_result)
-get_volume_result.thrift_spec = (
-    (
-        0,
-        TType.STRUCT,
-        "success",
-        [Volume, None],
-        None,
-    ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "v",
-        [VolumeNotFoundException, None],
-        None,
-    ),  # 1
-)
+all_structs.append(is_bibigrid_available_args)
+is_bibigrid_available_args.thrift_spec = ()
 
 
-class get_volumes_by_ids_args(object):
+class is_bibigrid_available_result(object):
     """
     Attributes:
-     - volume_ids
+     - success
 
     """
 
@@ -9841,9 +13568,9 @@ class get_volumes_by_ids_args(object):
 
     def __init__(
         self,
-        volume_ids=None,
+        success=None,
     ):
-        self.volume_ids = volume_ids
+        self.success = success
 
     def read(self, iprot):
         if (
@@ -9858,18 +13585,9 @@ class get_volumes_by_ids_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.LIST:
-                    self.volume_ids = []
-                    _etype129, _size126 = iprot.readListBegin()
-                    for _i130 in range(_size126):
-                        _elem131 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.volume_ids.append(_elem131)
-                    iprot.readListEnd()
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -9881,18 +13599,13 @@ class get_volumes_by_ids_args(object):
         self.validate()
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("get_volumes_by_ids_args")
-        if self.volume_ids is not None:
-            oprot.writeFieldBegin("volume_ids", TType.LIST, 1)
-            oprot.writeListBegin(TType.STRING, len(self.volume_ids))
-            for iter132 in self.volume_ids:
-                oprot.writeString(
-                    iter132.encode("utf-8") if sys.version_info[0] == 2 else iter132
-                )
-            oprot.writeListEnd()
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("is_bibigrid_available_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -9911,34 +13624,21 @@ class get_volumes_by_ids_args(object):
         return not (self == other)
 
 
-all_structs.append(get_volumes_by_ids_args)
-get_volumes_by_ids_args.thrift_spec = (
-    None,  # 0
+all_structs.append(is_bibigrid_available_result)
+is_bibigrid_available_result.thrift_spec = (
     (
-        1,
-        TType.LIST,
-        "volume_ids",
-        (TType.STRING, "UTF8", False),
+        0,
+        TType.BOOL,
+        "success",
         None,
-    ),  # 1
+        None,
+    ),  # 0
 )
 
 
-class get_volumes_by_ids_result(object):
-    """
-    Attributes:
-     - success
-
-    """
-
+class is_openstack_connection_available_args(object):
     thrift_spec = None
 
-    def __init__(
-        self,
-        success=None,
-    ):
-        self.success = success
-
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -9952,17 +13652,6 @@ class get_volumes_by_ids_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype136, _size133 = iprot.readListBegin()
-                    for _i137 in range(_size133):
-                        _elem138 = Volume()
-                        _elem138.read(iprot)
-                        self.success.append(_elem138)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -9975,14 +13664,7 @@ class get_volumes_by_ids_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_volumes_by_ids_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter139 in self.success:
-                iter139.write(oprot)
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("is_openstack_connection_available_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -10000,23 +13682,14 @@ class get_volumes_by_ids_result(object):
         return not (self == other)
 
 
-all_structs.append(get_volumes_by_ids_result)
-get_volumes_by_ids_result.thrift_spec = (
-    (
-        0,
-        TType.LIST,
-        "success",
-        (TType.STRUCT, [Volume, None], False),
-        None,
-    ),  # 0
-)
+all_structs.append(is_openstack_connection_available_args)
+is_openstack_connection_available_args.thrift_spec = ()
 
 
-class resize_volume_args(object):
+class is_openstack_connection_available_result(object):
     """
     Attributes:
-     - volume_id
-     - size
+     - success
 
     """
 
@@ -10024,11 +13697,9 @@ class resize_volume_args(object):
 
     def __init__(
         self,
-        volume_id=None,
-        size=None,
+        success=None,
     ):
-        self.volume_id = volume_id
-        self.size = size
+        self.success = success
 
     def read(self, iprot):
         if (
@@ -10043,18 +13714,9 @@ class resize_volume_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.volume_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.I32:
-                    self.size = iprot.readI32()
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -10069,18 +13731,10 @@ class resize_volume_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("resize_volume_args")
-        if self.volume_id is not None:
-            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
-            oprot.writeString(
-                self.volume_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.volume_id
-            )
-            oprot.writeFieldEnd()
-        if self.size is not None:
-            oprot.writeFieldBegin("size", TType.I32, 2)
-            oprot.writeI32(self.size)
+        oprot.writeStructBegin("is_openstack_connection_available_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -10099,30 +13753,23 @@ class resize_volume_args(object):
         return not (self == other)
 
 
-all_structs.append(resize_volume_args)
-resize_volume_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRING,
-        "volume_id",
-        "UTF8",
-        None,
-    ),  # 1
+all_structs.append(is_openstack_connection_available_result)
+is_openstack_connection_available_result.thrift_spec = (
     (
-        2,
-        TType.I32,
-        "size",
+        0,
+        TType.BOOL,
+        "success",
         None,
         None,
-    ),  # 2
+    ),  # 0
 )
 
 
-class resize_volume_result(object):
+class detach_ip_from_server_args(object):
     """
     Attributes:
-     - v
+     - server_id
+     - floating_ip
 
     """
 
@@ -10130,9 +13777,11 @@ class resize_volume_result(object):
 
     def __init__(
         self,
-        v=None,
+        server_id=None,
+        floating_ip=None,
     ):
-        self.v = v
+        self.server_id = server_id
+        self.floating_ip = floating_ip
 
     def read(self, iprot):
         if (
@@ -10148,8 +13797,21 @@ class resize_volume_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.v = VolumeNotFoundException.read(iprot)
+                if ftype == TType.STRING:
+                    self.server_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.floating_ip = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -10164,10 +13826,22 @@ class resize_volume_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("resize_volume_result")
-        if self.v is not None:
-            oprot.writeFieldBegin("v", TType.STRUCT, 1)
-            self.v.write(oprot)
+        oprot.writeStructBegin("detach_ip_from_server_args")
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 1)
+            oprot.writeString(
+                self.server_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.server_id
+            )
+            oprot.writeFieldEnd()
+        if self.floating_ip is not None:
+            oprot.writeFieldBegin("floating_ip", TType.STRING, 2)
+            oprot.writeString(
+                self.floating_ip.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.floating_ip
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -10186,27 +13860,30 @@ class resize_volume_result(object):
         return not (self == other)
 
 
-all_structs.append(resize_volume_result)
-resize_volume_result.thrift_spec = (
+all_structs.append(detach_ip_from_server_args)
+detach_ip_from_server_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRUCT,
-        "v",
-        [VolumeNotFoundException, None],
+        TType.STRING,
+        "server_id",
+        "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "floating_ip",
+        "UTF8",
+        None,
+    ),  # 2
 )
 
 
-class open_port_range_for_vm_in_project_args(object):
+class detach_ip_from_server_result(object):
     """
     Attributes:
-     - range_start
-     - range_stop
-     - openstack_id
-     - ethertype
-     - protocol
+     - s
 
     """
 
@@ -10214,17 +13891,9 @@ class open_port_range_for_vm_in_project_args(object):
 
     def __init__(
         self,
-        range_start=None,
-        range_stop=None,
-        openstack_id=None,
-        ethertype="IPv4",
-        protocol="TCP",
+        s=None,
     ):
-        self.range_start = range_start
-        self.range_stop = range_stop
-        self.openstack_id = openstack_id
-        self.ethertype = ethertype
-        self.protocol = protocol
+        self.s = s
 
     def read(self, iprot):
         if (
@@ -10233,47 +13902,15 @@ class open_port_range_for_vm_in_project_args(object):
             and self.thrift_spec is not None
         ):
             iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            fname, ftype, fid = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 1:
-                if ftype == TType.I32:
-                    self.range_start = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.I32:
-                    self.range_stop = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.openstack_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRING:
-                    self.ethertype = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRING:
-                    self.protocol = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.s = ServerNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -10288,38 +13925,10 @@ class open_port_range_for_vm_in_project_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("open_port_range_for_vm_in_project_args")
-        if self.range_start is not None:
-            oprot.writeFieldBegin("range_start", TType.I32, 1)
-            oprot.writeI32(self.range_start)
-            oprot.writeFieldEnd()
-        if self.range_stop is not None:
-            oprot.writeFieldBegin("range_stop", TType.I32, 2)
-            oprot.writeI32(self.range_stop)
-            oprot.writeFieldEnd()
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 3)
-            oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
-            )
-            oprot.writeFieldEnd()
-        if self.ethertype is not None:
-            oprot.writeFieldBegin("ethertype", TType.STRING, 4)
-            oprot.writeString(
-                self.ethertype.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.ethertype
-            )
-            oprot.writeFieldEnd()
-        if self.protocol is not None:
-            oprot.writeFieldBegin("protocol", TType.STRING, 5)
-            oprot.writeString(
-                self.protocol.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.protocol
-            )
+        oprot.writeStructBegin("detach_ip_from_server_result")
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 1)
+            self.s.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -10338,54 +13947,35 @@ class open_port_range_for_vm_in_project_args(object):
         return not (self == other)
 
 
-all_structs.append(open_port_range_for_vm_in_project_args)
-open_port_range_for_vm_in_project_args.thrift_spec = (
+all_structs.append(detach_ip_from_server_result)
+detach_ip_from_server_result.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I32,
-        "range_start",
-        None,
+        TType.STRUCT,
+        "s",
+        [ServerNotFoundException, None],
         None,
     ),  # 1
-    (
-        2,
-        TType.I32,
-        "range_stop",
-        None,
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRING,
-        "openstack_id",
-        "UTF8",
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRING,
-        "ethertype",
-        "UTF8",
-        "IPv4",
-    ),  # 4
-    (
-        5,
-        TType.STRING,
-        "protocol",
-        "UTF8",
-        "TCP",
-    ),  # 5
 )
 
 
-class open_port_range_for_vm_in_project_result(object):
+class start_server_with_custom_key_args(object):
     """
     Attributes:
-     - success
-     - e
-     - v
-     - o
+     - flavor_name: Name of the  Flavor to use.
+     - image_name: Name of the image to use.
+     - servername: Name for the new server
+     - metadata: Metadata for the new instance
+     - research_environment
+     - volume_ids_path_new
+     - volume_ids_path_attach
+     - additional_security_group_ids
+     - additional_owner_keys
+     - additional_user_keys
+     - metadata_token
+     - metadata_endpoint
+     - additional_script
 
     """
 
@@ -10393,15 +13983,33 @@ class open_port_range_for_vm_in_project_result(object):
 
     def __init__(
         self,
-        success=None,
-        e=None,
-        v=None,
-        o=None,
+        flavor_name=None,
+        image_name=None,
+        servername=None,
+        metadata=None,
+        research_environment=None,
+        volume_ids_path_new=None,
+        volume_ids_path_attach=None,
+        additional_security_group_ids=None,
+        additional_owner_keys=None,
+        additional_user_keys=None,
+        metadata_token=None,
+        metadata_endpoint=None,
+        additional_script=None,
     ):
-        self.success = success
-        self.e = e
-        self.v = v
-        self.o = o
+        self.flavor_name = flavor_name
+        self.image_name = image_name
+        self.servername = servername
+        self.metadata = metadata
+        self.research_environment = research_environment
+        self.volume_ids_path_new = volume_ids_path_new
+        self.volume_ids_path_attach = volume_ids_path_attach
+        self.additional_security_group_ids = additional_security_group_ids
+        self.additional_owner_keys = additional_owner_keys
+        self.additional_user_keys = additional_user_keys
+        self.metadata_token = metadata_token
+        self.metadata_endpoint = metadata_endpoint
+        self.additional_script = additional_script
 
     def read(self, iprot):
         if (
@@ -10416,28 +14024,176 @@ class open_port_range_for_vm_in_project_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.flavor_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.servername = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    _ktype203, _vtype204, _size202 = iprot.readMapBegin()
+                    for _i206 in range(_size202):
+                        _key207 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val208 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key207] = _val208
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.research_environment = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_new = []
+                    _etype212, _size209 = iprot.readListBegin()
+                    for _i213 in range(_size209):
+                        _elem214 = {}
+                        _ktype216, _vtype217, _size215 = iprot.readMapBegin()
+                        for _i219 in range(_size215):
+                            _key220 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val221 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem214[_key220] = _val221
+                        iprot.readMapEnd()
+                        self.volume_ids_path_new.append(_elem214)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_attach = []
+                    _etype225, _size222 = iprot.readListBegin()
+                    for _i226 in range(_size222):
+                        _elem227 = {}
+                        _ktype229, _vtype230, _size228 = iprot.readMapBegin()
+                        for _i232 in range(_size228):
+                            _key233 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val234 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem227[_key233] = _val234
+                        iprot.readMapEnd()
+                        self.volume_ids_path_attach.append(_elem227)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.LIST:
+                    self.additional_security_group_ids = []
+                    _etype238, _size235 = iprot.readListBegin()
+                    for _i239 in range(_size235):
+                        _elem240 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.additional_security_group_ids.append(_elem240)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.LIST:
+                    self.additional_owner_keys = []
+                    _etype244, _size241 = iprot.readListBegin()
+                    for _i245 in range(_size241):
+                        _elem246 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.additional_owner_keys.append(_elem246)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.LIST:
+                    self.additional_user_keys = []
+                    _etype250, _size247 = iprot.readListBegin()
+                    for _i251 in range(_size247):
+                        _elem252 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.additional_user_keys.append(_elem252)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 12:
                 if ftype == TType.STRING:
-                    self.success = (
+                    self.metadata_token = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.v = DefaultException.read(iprot)
+            elif fid == 13:
+                if ftype == TType.STRING:
+                    self.metadata_endpoint = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRUCT:
-                    self.o = OpenStackConflictException.read(iprot)
+            elif fid == 14:
+                if ftype == TType.STRING:
+                    self.additional_script = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -10452,133 +14208,138 @@ class open_port_range_for_vm_in_project_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("open_port_range_for_vm_in_project_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
+        oprot.writeStructBegin("start_server_with_custom_key_args")
+        if self.flavor_name is not None:
+            oprot.writeFieldBegin("flavor_name", TType.STRING, 1)
             oprot.writeString(
-                self.success.encode("utf-8")
+                self.flavor_name.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.success
+                else self.flavor_name
             )
             oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+        if self.image_name is not None:
+            oprot.writeFieldBegin("image_name", TType.STRING, 2)
+            oprot.writeString(
+                self.image_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.image_name
+            )
             oprot.writeFieldEnd()
-        if self.v is not None:
-            oprot.writeFieldBegin("v", TType.STRUCT, 2)
-            self.v.write(oprot)
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 3)
+            oprot.writeString(
+                self.servername.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.servername
+            )
             oprot.writeFieldEnd()
-        if self.o is not None:
-            oprot.writeFieldBegin("o", TType.STRUCT, 3)
-            self.o.write(oprot)
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 4)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter253, viter254 in self.metadata.items():
+                oprot.writeString(
+                    kiter253.encode("utf-8") if sys.version_info[0] == 2 else kiter253
+                )
+                oprot.writeString(
+                    viter254.encode("utf-8") if sys.version_info[0] == 2 else viter254
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(open_port_range_for_vm_in_project_result)
-open_port_range_for_vm_in_project_result.thrift_spec = (
-    (
-        0,
-        TType.STRING,
-        "success",
-        "UTF8",
-        None,
-    ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [ServerNotFoundException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "v",
-        [DefaultException, None],
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRUCT,
-        "o",
-        [OpenStackConflictException, None],
-        None,
-    ),  # 3
-)
-
-
-class delete_security_group_rule_args(object):
-    """
-    Attributes:
-     - openstack_id
-
-    """
-
-    thrift_spec = None
-
-    def __init__(
-        self,
-        openstack_id=None,
-    ):
-        self.openstack_id = openstack_id
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            fname, ftype, fid = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.openstack_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
+        if self.research_environment is not None:
+            oprot.writeFieldBegin("research_environment", TType.STRING, 5)
+            oprot.writeString(
+                self.research_environment.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.research_environment
+            )
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_new is not None:
+            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 7)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
+            for iter255 in self.volume_ids_path_new:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter255))
+                for kiter256, viter257 in iter255.items():
+                    oprot.writeString(
+                        kiter256.encode("utf-8")
                         if sys.version_info[0] == 2
-                        else iprot.readString()
+                        else kiter256
                     )
-                else:
-                    iprot.skip(ftype)
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        self.validate()
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+                    oprot.writeString(
+                        viter257.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter257
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_attach is not None:
+            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 8)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
+            for iter258 in self.volume_ids_path_attach:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter258))
+                for kiter259, viter260 in iter258.items():
+                    oprot.writeString(
+                        kiter259.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter259
+                    )
+                    oprot.writeString(
+                        viter260.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter260
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.additional_security_group_ids is not None:
+            oprot.writeFieldBegin("additional_security_group_ids", TType.LIST, 9)
+            oprot.writeListBegin(TType.STRING, len(self.additional_security_group_ids))
+            for iter261 in self.additional_security_group_ids:
+                oprot.writeString(
+                    iter261.encode("utf-8") if sys.version_info[0] == 2 else iter261
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.additional_owner_keys is not None:
+            oprot.writeFieldBegin("additional_owner_keys", TType.LIST, 10)
+            oprot.writeListBegin(TType.STRING, len(self.additional_owner_keys))
+            for iter262 in self.additional_owner_keys:
+                oprot.writeString(
+                    iter262.encode("utf-8") if sys.version_info[0] == 2 else iter262
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.additional_user_keys is not None:
+            oprot.writeFieldBegin("additional_user_keys", TType.LIST, 11)
+            oprot.writeListBegin(TType.STRING, len(self.additional_user_keys))
+            for iter263 in self.additional_user_keys:
+                oprot.writeString(
+                    iter263.encode("utf-8") if sys.version_info[0] == 2 else iter263
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.metadata_token is not None:
+            oprot.writeFieldBegin("metadata_token", TType.STRING, 12)
+            oprot.writeString(
+                self.metadata_token.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.metadata_token
             )
-            return
-        oprot.writeStructBegin("delete_security_group_rule_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeFieldEnd()
+        if self.metadata_endpoint is not None:
+            oprot.writeFieldBegin("metadata_endpoint", TType.STRING, 13)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.metadata_endpoint.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.metadata_endpoint
+            )
+            oprot.writeFieldEnd()
+        if self.additional_script is not None:
+            oprot.writeFieldBegin("additional_script", TType.STRING, 14)
+            oprot.writeString(
+                self.additional_script.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.additional_script
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -10598,24 +14359,113 @@ class delete_security_group_rule_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_security_group_rule_args)
-delete_security_group_rule_args.thrift_spec = (
+all_structs.append(start_server_with_custom_key_args)
+start_server_with_custom_key_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "flavor_name",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "image_name",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRING,
+        "research_environment",
+        "UTF8",
+        None,
+    ),  # 5
+    None,  # 6
+    (
+        7,
+        TType.LIST,
+        "volume_ids_path_new",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 7
+    (
+        8,
+        TType.LIST,
+        "volume_ids_path_attach",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 8
+    (
+        9,
+        TType.LIST,
+        "additional_security_group_ids",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 9
+    (
+        10,
+        TType.LIST,
+        "additional_owner_keys",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 10
+    (
+        11,
+        TType.LIST,
+        "additional_user_keys",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 11
+    (
+        12,
+        TType.STRING,
+        "metadata_token",
+        "UTF8",
+        None,
+    ),  # 12
+    (
+        13,
+        TType.STRING,
+        "metadata_endpoint",
+        "UTF8",
+        None,
+    ),  # 13
+    (
+        14,
+        TType.STRING,
+        "additional_script",
+        "UTF8",
+        None,
+    ),  # 14
 )
 
 
-class delete_security_group_rule_result(object):
+class start_server_with_custom_key_result(object):
     """
     Attributes:
+     - success
      - e
+     - r
+     - i
      - f
+     - d
 
     """
 
@@ -10623,11 +14473,19 @@ class delete_security_group_rule_result(object):
 
     def __init__(
         self,
+        success=None,
         e=None,
+        r=None,
+        i=None,
         f=None,
+        d=None,
     ):
+        self.success = success
         self.e = e
+        self.r = r
+        self.i = i
         self.f = f
+        self.d = d
 
     def read(self, iprot):
         if (
@@ -10642,14 +14500,38 @@ class delete_security_group_rule_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = SecurityGroupRuleNotFoundException.read(iprot)
+                    self.e = NameAlreadyUsedException.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.f = DefaultException.read(iprot)
+                    self.r = ResourceNotAvailableException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.i = ImageNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.f = FlavorNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.d = DefaultException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -10664,15 +14546,35 @@ class delete_security_group_rule_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_security_group_rule_result")
+        oprot.writeStructBegin("start_server_with_custom_key_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
         if self.e is not None:
             oprot.writeFieldBegin("e", TType.STRUCT, 1)
             self.e.write(oprot)
             oprot.writeFieldEnd()
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 2)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.i is not None:
+            oprot.writeFieldBegin("i", TType.STRUCT, 3)
+            self.i.write(oprot)
+            oprot.writeFieldEnd()
         if self.f is not None:
-            oprot.writeFieldBegin("f", TType.STRUCT, 2)
+            oprot.writeFieldBegin("f", TType.STRUCT, 4)
             self.f.write(oprot)
             oprot.writeFieldEnd()
+        if self.d is not None:
+            oprot.writeFieldBegin("d", TType.STRUCT, 5)
+            self.d.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -10690,30 +14592,57 @@ class delete_security_group_rule_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_security_group_rule_result)
-delete_security_group_rule_result.thrift_spec = (
-    None,  # 0
+all_structs.append(start_server_with_custom_key_result)
+start_server_with_custom_key_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
     (
         1,
         TType.STRUCT,
         "e",
-        [SecurityGroupRuleNotFoundException, None],
+        [NameAlreadyUsedException, None],
         None,
     ),  # 1
     (
         2,
         TType.STRUCT,
+        "r",
+        [ResourceNotAvailableException, None],
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRUCT,
+        "i",
+        [ImageNotFoundException, None],
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRUCT,
         "f",
+        [FlavorNotFoundException, None],
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRUCT,
+        "d",
         [DefaultException, None],
         None,
-    ),  # 2
+    ),  # 5
 )
 
 
-class remove_security_groups_from_server_args(object):
+class exist_server_args(object):
     """
     Attributes:
-     - openstack_id
+     - name
 
     """
 
@@ -10721,9 +14650,9 @@ class remove_security_groups_from_server_args(object):
 
     def __init__(
         self,
-        openstack_id=None,
+        name=None,
     ):
-        self.openstack_id = openstack_id
+        self.name = name
 
     def read(self, iprot):
         if (
@@ -10740,7 +14669,7 @@ class remove_security_groups_from_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.name = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -10759,13 +14688,11 @@ class remove_security_groups_from_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("remove_security_groups_from_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("exist_server_args")
+        if self.name is not None:
+            oprot.writeFieldBegin("name", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
+                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -10785,24 +14712,23 @@ class remove_security_groups_from_server_args(object):
         return not (self == other)
 
 
-all_structs.append(remove_security_groups_from_server_args)
-remove_security_groups_from_server_args.thrift_spec = (
+all_structs.append(exist_server_args)
+exist_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "name",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class remove_security_groups_from_server_result(object):
+class exist_server_result(object):
     """
     Attributes:
-     - e
-     - f
+     - success
 
     """
 
@@ -10810,11 +14736,9 @@ class remove_security_groups_from_server_result(object):
 
     def __init__(
         self,
-        e=None,
-        f=None,
+        success=None,
     ):
-        self.e = e
-        self.f = f
+        self.success = success
 
     def read(self, iprot):
         if (
@@ -10829,14 +14753,9 @@ class remove_security_groups_from_server_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = SecurityGroupRuleNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.f = OpenStackConflictException.read(iprot)
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -10851,14 +14770,10 @@ class remove_security_groups_from_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("remove_security_groups_from_server_result")
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.f is not None:
-            oprot.writeFieldBegin("f", TType.STRUCT, 2)
-            self.f.write(oprot)
+        oprot.writeStructBegin("exist_server_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -10877,30 +14792,28 @@ class remove_security_groups_from_server_result(object):
         return not (self == other)
 
 
-all_structs.append(remove_security_groups_from_server_result)
-remove_security_groups_from_server_result.thrift_spec = (
-    None,  # 0
+all_structs.append(exist_server_result)
+exist_server_result.thrift_spec = (
     (
-        1,
-        TType.STRUCT,
-        "e",
-        [SecurityGroupRuleNotFoundException, None],
+        0,
+        TType.BOOL,
+        "success",
         None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "f",
-        [OpenStackConflictException, None],
         None,
-    ),  # 2
+    ),  # 0
 )
 
 
-class delete_server_args(object):
+class create_and_deploy_playbook_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server.
+     - public_key
+     - openstack_id
+     - conda_packages
+     - research_environment_template
+     - apt_packages
+     - create_only_backend
+     - base_url
 
     """
 
@@ -10908,9 +14821,21 @@ class delete_server_args(object):
 
     def __init__(
         self,
+        public_key=None,
         openstack_id=None,
+        conda_packages=None,
+        research_environment_template=None,
+        apt_packages=None,
+        create_only_backend=None,
+        base_url=None,
     ):
+        self.public_key = public_key
         self.openstack_id = openstack_id
+        self.conda_packages = conda_packages
+        self.research_environment_template = research_environment_template
+        self.apt_packages = apt_packages
+        self.create_only_backend = create_only_backend
+        self.base_url = base_url
 
     def read(self, iprot):
         if (
@@ -10926,6 +14851,15 @@ class delete_server_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
+                if ftype == TType.STRING:
+                    self.public_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
                 if ftype == TType.STRING:
                     self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
@@ -10934,6 +14868,54 @@ class delete_server_args(object):
                     )
                 else:
                     iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.LIST:
+                    self.conda_packages = []
+                    _etype267, _size264 = iprot.readListBegin()
+                    for _i268 in range(_size264):
+                        _elem269 = CondaPackage()
+                        _elem269.read(iprot)
+                        self.conda_packages.append(_elem269)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.research_environment_template = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.LIST:
+                    self.apt_packages = []
+                    _etype273, _size270 = iprot.readListBegin()
+                    for _i274 in range(_size270):
+                        _elem275 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.apt_packages.append(_elem275)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.BOOL:
+                    self.create_only_backend = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRING:
+                    self.base_url = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -10946,15 +14928,59 @@ class delete_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_server_args")
+        oprot.writeStructBegin("create_and_deploy_playbook_args")
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 1)
+            oprot.writeString(
+                self.public_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.public_key
+            )
+            oprot.writeFieldEnd()
         if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 2)
             oprot.writeString(
                 self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
                 else self.openstack_id
             )
             oprot.writeFieldEnd()
+        if self.conda_packages is not None:
+            oprot.writeFieldBegin("conda_packages", TType.LIST, 3)
+            oprot.writeListBegin(TType.STRUCT, len(self.conda_packages))
+            for iter276 in self.conda_packages:
+                iter276.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.research_environment_template is not None:
+            oprot.writeFieldBegin("research_environment_template", TType.STRING, 4)
+            oprot.writeString(
+                self.research_environment_template.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.research_environment_template
+            )
+            oprot.writeFieldEnd()
+        if self.apt_packages is not None:
+            oprot.writeFieldBegin("apt_packages", TType.LIST, 5)
+            oprot.writeListBegin(TType.STRING, len(self.apt_packages))
+            for iter277 in self.apt_packages:
+                oprot.writeString(
+                    iter277.encode("utf-8") if sys.version_info[0] == 2 else iter277
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.create_only_backend is not None:
+            oprot.writeFieldBegin("create_only_backend", TType.BOOL, 6)
+            oprot.writeBool(self.create_only_backend)
+            oprot.writeFieldEnd()
+        if self.base_url is not None:
+            oprot.writeFieldBegin("base_url", TType.STRING, 7)
+            oprot.writeString(
+                self.base_url.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.base_url
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -10972,24 +14998,66 @@ class delete_server_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_server_args)
-delete_server_args.thrift_spec = (
+all_structs.append(create_and_deploy_playbook_args)
+create_and_deploy_playbook_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "public_key",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.LIST,
+        "conda_packages",
+        (TType.STRUCT, [CondaPackage, None], False),
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "research_environment_template",
+        "UTF8",
+        None,
+    ),  # 4
+    (
+        5,
+        TType.LIST,
+        "apt_packages",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 5
+    (
+        6,
+        TType.BOOL,
+        "create_only_backend",
+        None,
+        None,
+    ),  # 6
+    (
+        7,
+        TType.STRING,
+        "base_url",
+        "UTF8",
+        None,
+    ),  # 7
 )
 
 
-class delete_server_result(object):
+class create_and_deploy_playbook_result(object):
     """
     Attributes:
-     - e
-     - c
+     - success
+     - s
 
     """
 
@@ -10997,11 +15065,11 @@ class delete_server_result(object):
 
     def __init__(
         self,
-        e=None,
-        c=None,
+        success=None,
+        s=None,
     ):
-        self.e = e
-        self.c = c
+        self.success = success
+        self.s = s
 
     def read(self, iprot):
         if (
@@ -11016,14 +15084,14 @@ class delete_server_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
+            if fid == 0:
+                if ftype == TType.I32:
+                    self.success = iprot.readI32()
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.c = OpenStackConflictException.read(iprot)
+                    self.s = ServerNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -11038,14 +15106,14 @@ class delete_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_server_result")
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+        oprot.writeStructBegin("create_and_deploy_playbook_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.I32, 0)
+            oprot.writeI32(self.success)
             oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 1)
+            self.s.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -11064,32 +15132,29 @@ class delete_server_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_server_result)
-delete_server_result.thrift_spec = (
-    None,  # 0
+all_structs.append(create_and_deploy_playbook_result)
+create_and_deploy_playbook_result.thrift_spec = (
+    (
+        0,
+        TType.I32,
+        "success",
+        None,
+        None,
+    ),  # 0
     (
         1,
         TType.STRUCT,
-        "e",
+        "s",
         [ServerNotFoundException, None],
         None,
     ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "c",
-        [OpenStackConflictException, None],
-        None,
-    ),  # 2
 )
 
 
-class rescue_server_args(object):
+class get_playbook_logs_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server.
-     - admin_pass
-     - image_ref
+     - openstack_id
 
     """
 
@@ -11098,12 +15163,8 @@ class rescue_server_args(object):
     def __init__(
         self,
         openstack_id=None,
-        admin_pass=None,
-        image_ref=None,
     ):
         self.openstack_id = openstack_id
-        self.admin_pass = admin_pass
-        self.image_ref = image_ref
 
     def read(self, iprot):
         if (
@@ -11127,24 +15188,6 @@ class rescue_server_args(object):
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.admin_pass = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.image_ref = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -11157,7 +15200,7 @@ class rescue_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("rescue_server_args")
+        oprot.writeStructBegin("get_playbook_logs_args")
         if self.openstack_id is not None:
             oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
@@ -11166,22 +15209,6 @@ class rescue_server_args(object):
                 else self.openstack_id
             )
             oprot.writeFieldEnd()
-        if self.admin_pass is not None:
-            oprot.writeFieldBegin("admin_pass", TType.STRING, 2)
-            oprot.writeString(
-                self.admin_pass.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.admin_pass
-            )
-            oprot.writeFieldEnd()
-        if self.image_ref is not None:
-            oprot.writeFieldBegin("image_ref", TType.STRING, 3)
-            oprot.writeString(
-                self.image_ref.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.image_ref
-            )
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -11199,8 +15226,8 @@ class rescue_server_args(object):
         return not (self == other)
 
 
-all_structs.append(rescue_server_args)
-rescue_server_args.thrift_spec = (
+all_structs.append(get_playbook_logs_args)
+get_playbook_logs_args.thrift_spec = (
     None,  # 0
     (
         1,
@@ -11209,28 +15236,14 @@ rescue_server_args.thrift_spec = (
         "UTF8",
         None,
     ),  # 1
-    (
-        2,
-        TType.STRING,
-        "admin_pass",
-        "UTF8",
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRING,
-        "image_ref",
-        "UTF8",
-        None,
-    ),  # 3
 )
 
 
-class rescue_server_result(object):
+class get_playbook_logs_result(object):
     """
     Attributes:
-     - e
-     - c
+     - success
+     - p
 
     """
 
@@ -11238,11 +15251,11 @@ class rescue_server_result(object):
 
     def __init__(
         self,
-        e=None,
-        c=None,
+        success=None,
+        p=None,
     ):
-        self.e = e
-        self.c = c
+        self.success = success
+        self.p = p
 
     def read(self, iprot):
         if (
@@ -11257,14 +15270,15 @@ class rescue_server_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
+            if fid == 0:
                 if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
+                    self.success = PlaybookResult()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.c = OpenStackConflictException.read(iprot)
+                    self.p = PlaybookNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -11279,14 +15293,14 @@ class rescue_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("rescue_server_result")
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+        oprot.writeStructBegin("get_playbook_logs_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
+        if self.p is not None:
+            oprot.writeFieldBegin("p", TType.STRUCT, 1)
+            self.p.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -11305,30 +15319,79 @@ class rescue_server_result(object):
         return not (self == other)
 
 
-all_structs.append(rescue_server_result)
-rescue_server_result.thrift_spec = (
-    None,  # 0
+all_structs.append(get_playbook_logs_result)
+get_playbook_logs_result.thrift_spec = (
     (
-        1,
+        0,
         TType.STRUCT,
-        "e",
-        [ServerNotFoundException, None],
+        "success",
+        [PlaybookResult, None],
         None,
-    ),  # 1
+    ),  # 0
     (
-        2,
+        1,
         TType.STRUCT,
-        "c",
-        [OpenStackConflictException, None],
+        "p",
+        [PlaybookNotFoundException, None],
         None,
-    ),  # 2
+    ),  # 1
 )
 
 
-class unrescue_server_args(object):
+class has_forc_args(object):
+    thrift_spec = None
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("has_forc_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(has_forc_args)
+has_forc_args.thrift_spec = ()
+
+
+class has_forc_result(object):
     """
     Attributes:
-     - openstack_id: Id of the server.
+     - success
 
     """
 
@@ -11336,9 +15399,9 @@ class unrescue_server_args(object):
 
     def __init__(
         self,
-        openstack_id=None,
+        success=None,
     ):
-        self.openstack_id = openstack_id
+        self.success = success
 
     def read(self, iprot):
         if (
@@ -11353,13 +15416,9 @@ class unrescue_server_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.openstack_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -11374,14 +15433,10 @@ class unrescue_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("unrescue_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
-            oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
-            )
+        oprot.writeStructBegin("has_forc_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -11400,37 +15455,21 @@ class unrescue_server_args(object):
         return not (self == other)
 
 
-all_structs.append(unrescue_server_args)
-unrescue_server_args.thrift_spec = (
-    None,  # 0
+all_structs.append(has_forc_result)
+has_forc_result.thrift_spec = (
     (
-        1,
-        TType.STRING,
-        "openstack_id",
-        "UTF8",
+        0,
+        TType.BOOL,
+        "success",
         None,
-    ),  # 1
-)
-
-
-class unrescue_server_result(object):
-    """
-    Attributes:
-     - e
-     - c
+        None,
+    ),  # 0
+)
 
-    """
 
+class get_forc_access_url_args(object):
     thrift_spec = None
 
-    def __init__(
-        self,
-        e=None,
-        c=None,
-    ):
-        self.e = e
-        self.c = c
-
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -11444,16 +15483,6 @@ class unrescue_server_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.c = OpenStackConflictException.read(iprot)
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -11466,15 +15495,7 @@ class unrescue_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("unrescue_server_result")
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("get_forc_access_url_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -11492,44 +15513,14 @@ class unrescue_server_result(object):
         return not (self == other)
 
 
-all_structs.append(unrescue_server_result)
-unrescue_server_result.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [ServerNotFoundException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "c",
-        [OpenStackConflictException, None],
-        None,
-    ),  # 2
-)
+all_structs.append(get_forc_access_url_args)
+get_forc_access_url_args.thrift_spec = ()
 
 
-class start_server_args(object):
+class get_forc_access_url_result(object):
     """
     Attributes:
-     - flavor_name: Name of the  Flavor to use.
-     - image_name: Name of the image to use.
-     - public_key: Public Key to use
-     - servername: Name for the new server
-     - metadata: Metadata for the new instance
-     - volume_ids_path_new
-     - volume_ids_path_attach
-     - additional_owner_keys
-     - additional_user_keys
-     - research_environment
-     - additional_security_group_ids
-     - slurm_version
-     - metadata_token
-     - metadata_endpoint
-     - additional_script
+     - success
 
     """
 
@@ -11537,37 +15528,9 @@ class start_server_args(object):
 
     def __init__(
         self,
-        flavor_name=None,
-        image_name=None,
-        public_key=None,
-        servername=None,
-        metadata=None,
-        volume_ids_path_new=None,
-        volume_ids_path_attach=None,
-        additional_owner_keys=None,
-        additional_user_keys=None,
-        research_environment=None,
-        additional_security_group_ids=None,
-        slurm_version=None,
-        metadata_token=None,
-        metadata_endpoint=None,
-        additional_script=None,
+        success=None,
     ):
-        self.flavor_name = flavor_name
-        self.image_name = image_name
-        self.public_key = public_key
-        self.servername = servername
-        self.metadata = metadata
-        self.volume_ids_path_new = volume_ids_path_new
-        self.volume_ids_path_attach = volume_ids_path_attach
-        self.additional_owner_keys = additional_owner_keys
-        self.additional_user_keys = additional_user_keys
-        self.research_environment = research_environment
-        self.additional_security_group_ids = additional_security_group_ids
-        self.slurm_version = slurm_version
-        self.metadata_token = metadata_token
-        self.metadata_endpoint = metadata_endpoint
-        self.additional_script = additional_script
+        self.success = success
 
     def read(self, iprot):
         if (
@@ -11579,193 +15542,135 @@ class start_server_args(object):
             return
         iprot.readStructBegin()
         while True:
-            fname, ftype, fid = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.flavor_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.image_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.public_key = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRING:
-                    self.servername = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.MAP:
-                    self.metadata = {}
-                    _ktype141, _vtype142, _size140 = iprot.readMapBegin()
-                    for _i144 in range(_size140):
-                        _key145 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val146 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.metadata[_key145] = _val146
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.LIST:
-                    self.volume_ids_path_new = []
-                    _etype150, _size147 = iprot.readListBegin()
-                    for _i151 in range(_size147):
-                        _elem152 = {}
-                        _ktype154, _vtype155, _size153 = iprot.readMapBegin()
-                        for _i157 in range(_size153):
-                            _key158 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val159 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem152[_key158] = _val159
-                        iprot.readMapEnd()
-                        self.volume_ids_path_new.append(_elem152)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 8:
-                if ftype == TType.LIST:
-                    self.volume_ids_path_attach = []
-                    _etype163, _size160 = iprot.readListBegin()
-                    for _i164 in range(_size160):
-                        _elem165 = {}
-                        _ktype167, _vtype168, _size166 = iprot.readMapBegin()
-                        for _i170 in range(_size166):
-                            _key171 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val172 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem165[_key171] = _val172
-                        iprot.readMapEnd()
-                        self.volume_ids_path_attach.append(_elem165)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 9:
-                if ftype == TType.LIST:
-                    self.additional_owner_keys = []
-                    _etype176, _size173 = iprot.readListBegin()
-                    for _i177 in range(_size173):
-                        _elem178 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.additional_owner_keys.append(_elem178)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 10:
-                if ftype == TType.LIST:
-                    self.additional_user_keys = []
-                    _etype182, _size179 = iprot.readListBegin()
-                    for _i183 in range(_size179):
-                        _elem184 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.additional_user_keys.append(_elem184)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 11:
-                if ftype == TType.STRING:
-                    self.research_environment = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 12:
-                if ftype == TType.LIST:
-                    self.additional_security_group_ids = []
-                    _etype188, _size185 = iprot.readListBegin()
-                    for _i189 in range(_size185):
-                        _elem190 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.additional_security_group_ids.append(_elem190)
-                    iprot.readListEnd()
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
-            elif fid == 13:
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_forc_access_url_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_forc_access_url_result)
+get_forc_access_url_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
+)
+
+
+class create_backend_args(object):
+    """
+    Attributes:
+     - owner
+     - user_path
+     - template
+     - upstream_url
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        owner=None,
+        user_path=None,
+        template=None,
+        upstream_url=None,
+    ):
+        self.owner = owner
+        self.user_path = user_path
+        self.template = template
+        self.upstream_url = upstream_url
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
                 if ftype == TType.STRING:
-                    self.slurm_version = (
+                    self.owner = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 14:
+            elif fid == 2:
                 if ftype == TType.STRING:
-                    self.metadata_token = (
+                    self.user_path = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 15:
+            elif fid == 3:
                 if ftype == TType.STRING:
-                    self.metadata_endpoint = (
+                    self.template = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 16:
+            elif fid == 4:
                 if ftype == TType.STRING:
-                    self.additional_script = (
+                    self.upstream_url = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -11784,154 +15689,35 @@ class start_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_server_args")
-        if self.flavor_name is not None:
-            oprot.writeFieldBegin("flavor_name", TType.STRING, 1)
-            oprot.writeString(
-                self.flavor_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.flavor_name
-            )
-            oprot.writeFieldEnd()
-        if self.image_name is not None:
-            oprot.writeFieldBegin("image_name", TType.STRING, 2)
-            oprot.writeString(
-                self.image_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.image_name
-            )
-            oprot.writeFieldEnd()
-        if self.public_key is not None:
-            oprot.writeFieldBegin("public_key", TType.STRING, 3)
-            oprot.writeString(
-                self.public_key.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.public_key
-            )
-            oprot.writeFieldEnd()
-        if self.servername is not None:
-            oprot.writeFieldBegin("servername", TType.STRING, 4)
-            oprot.writeString(
-                self.servername.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.servername
-            )
-            oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.MAP, 5)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
-            for kiter191, viter192 in self.metadata.items():
-                oprot.writeString(
-                    kiter191.encode("utf-8") if sys.version_info[0] == 2 else kiter191
-                )
-                oprot.writeString(
-                    viter192.encode("utf-8") if sys.version_info[0] == 2 else viter192
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.volume_ids_path_new is not None:
-            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 7)
-            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
-            for iter193 in self.volume_ids_path_new:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter193))
-                for kiter194, viter195 in iter193.items():
-                    oprot.writeString(
-                        kiter194.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter194
-                    )
-                    oprot.writeString(
-                        viter195.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter195
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.volume_ids_path_attach is not None:
-            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 8)
-            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
-            for iter196 in self.volume_ids_path_attach:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter196))
-                for kiter197, viter198 in iter196.items():
-                    oprot.writeString(
-                        kiter197.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter197
-                    )
-                    oprot.writeString(
-                        viter198.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter198
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.additional_owner_keys is not None:
-            oprot.writeFieldBegin("additional_owner_keys", TType.LIST, 9)
-            oprot.writeListBegin(TType.STRING, len(self.additional_owner_keys))
-            for iter199 in self.additional_owner_keys:
-                oprot.writeString(
-                    iter199.encode("utf-8") if sys.version_info[0] == 2 else iter199
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.additional_user_keys is not None:
-            oprot.writeFieldBegin("additional_user_keys", TType.LIST, 10)
-            oprot.writeListBegin(TType.STRING, len(self.additional_user_keys))
-            for iter200 in self.additional_user_keys:
-                oprot.writeString(
-                    iter200.encode("utf-8") if sys.version_info[0] == 2 else iter200
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.research_environment is not None:
-            oprot.writeFieldBegin("research_environment", TType.STRING, 11)
-            oprot.writeString(
-                self.research_environment.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.research_environment
-            )
-            oprot.writeFieldEnd()
-        if self.additional_security_group_ids is not None:
-            oprot.writeFieldBegin("additional_security_group_ids", TType.LIST, 12)
-            oprot.writeListBegin(TType.STRING, len(self.additional_security_group_ids))
-            for iter201 in self.additional_security_group_ids:
-                oprot.writeString(
-                    iter201.encode("utf-8") if sys.version_info[0] == 2 else iter201
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.slurm_version is not None:
-            oprot.writeFieldBegin("slurm_version", TType.STRING, 13)
+        oprot.writeStructBegin("create_backend_args")
+        if self.owner is not None:
+            oprot.writeFieldBegin("owner", TType.STRING, 1)
             oprot.writeString(
-                self.slurm_version.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.slurm_version
+                self.owner.encode("utf-8") if sys.version_info[0] == 2 else self.owner
             )
             oprot.writeFieldEnd()
-        if self.metadata_token is not None:
-            oprot.writeFieldBegin("metadata_token", TType.STRING, 14)
+        if self.user_path is not None:
+            oprot.writeFieldBegin("user_path", TType.STRING, 2)
             oprot.writeString(
-                self.metadata_token.encode("utf-8")
+                self.user_path.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.metadata_token
+                else self.user_path
             )
             oprot.writeFieldEnd()
-        if self.metadata_endpoint is not None:
-            oprot.writeFieldBegin("metadata_endpoint", TType.STRING, 15)
+        if self.template is not None:
+            oprot.writeFieldBegin("template", TType.STRING, 3)
             oprot.writeString(
-                self.metadata_endpoint.encode("utf-8")
+                self.template.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.metadata_endpoint
+                else self.template
             )
             oprot.writeFieldEnd()
-        if self.additional_script is not None:
-            oprot.writeFieldBegin("additional_script", TType.STRING, 16)
+        if self.upstream_url is not None:
+            oprot.writeFieldBegin("upstream_url", TType.STRING, 4)
             oprot.writeString(
-                self.additional_script.encode("utf-8")
+                self.upstream_url.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.additional_script
+                else self.upstream_url
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -11951,127 +15737,213 @@ class start_server_args(object):
         return not (self == other)
 
 
-all_structs.append(start_server_args)
-start_server_args.thrift_spec = (
+all_structs.append(create_backend_args)
+create_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "flavor_name",
+        "owner",
         "UTF8",
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "image_name",
+        "user_path",
         "UTF8",
         None,
     ),  # 2
     (
         3,
         TType.STRING,
-        "public_key",
+        "template",
         "UTF8",
         None,
     ),  # 3
     (
         4,
         TType.STRING,
-        "servername",
+        "upstream_url",
         "UTF8",
         None,
     ),  # 4
+)
+
+
+class create_backend_result(object):
+    """
+    Attributes:
+     - success
+     - e
+     - d
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        success=None,
+        e=None,
+        d=None,
+    ):
+        self.success = success
+        self.e = e
+        self.d = d
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Backend()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = TemplateNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.d = DefaultException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("create_backend_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.d is not None:
+            oprot.writeFieldBegin("d", TType.STRUCT, 2)
+            self.d.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(create_backend_result)
+create_backend_result.thrift_spec = (
     (
-        5,
-        TType.MAP,
-        "metadata",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 5
-    None,  # 6
-    (
-        7,
-        TType.LIST,
-        "volume_ids_path_new",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
-        None,
-    ),  # 7
-    (
-        8,
-        TType.LIST,
-        "volume_ids_path_attach",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
-        None,
-    ),  # 8
-    (
-        9,
-        TType.LIST,
-        "additional_owner_keys",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 9
-    (
-        10,
-        TType.LIST,
-        "additional_user_keys",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 10
-    (
-        11,
-        TType.STRING,
-        "research_environment",
-        "UTF8",
-        None,
-    ),  # 11
-    (
-        12,
-        TType.LIST,
-        "additional_security_group_ids",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 12
-    (
-        13,
-        TType.STRING,
-        "slurm_version",
-        "UTF8",
-        None,
-    ),  # 13
-    (
-        14,
-        TType.STRING,
-        "metadata_token",
-        "UTF8",
+        0,
+        TType.STRUCT,
+        "success",
+        [Backend, None],
         None,
-    ),  # 14
+    ),  # 0
     (
-        15,
-        TType.STRING,
-        "metadata_endpoint",
-        "UTF8",
+        1,
+        TType.STRUCT,
+        "e",
+        [TemplateNotFoundException, None],
         None,
-    ),  # 15
+    ),  # 1
     (
-        16,
-        TType.STRING,
-        "additional_script",
-        "UTF8",
+        2,
+        TType.STRUCT,
+        "d",
+        [DefaultException, None],
         None,
-    ),  # 16
+    ),  # 2
 )
 
 
-class start_server_result(object):
+class get_backends_args(object):
+    thrift_spec = None
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_backends_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_backends_args)
+get_backends_args.thrift_spec = ()
+
+
+class get_backends_result(object):
     """
     Attributes:
      - success
-     - e
-     - r
-     - i
-     - f
-     - o
+     - d
 
     """
 
@@ -12080,18 +15952,10 @@ class start_server_result(object):
     def __init__(
         self,
         success=None,
-        e=None,
-        r=None,
-        i=None,
-        f=None,
-        o=None,
+        d=None,
     ):
         self.success = success
-        self.e = e
-        self.r = r
-        self.i = i
-        self.f = f
-        self.o = o
+        self.d = d
 
     def read(self, iprot):
         if (
@@ -12107,37 +15971,19 @@ class start_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype281, _size278 = iprot.readListBegin()
+                    for _i282 in range(_size278):
+                        _elem283 = Backend()
+                        _elem283.read(iprot)
+                        self.success.append(_elem283)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = NameAlreadyUsedException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.r = ResourceNotAvailableException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRUCT:
-                    self.i = ImageNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRUCT:
-                    self.f = FlavorNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.STRUCT:
-                    self.o = DefaultException.read(iprot)
+                    self.d = DefaultException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -12152,34 +15998,17 @@ class start_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_server_result")
+        oprot.writeStructBegin("get_backends_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 2)
-            self.r.write(oprot)
-            oprot.writeFieldEnd()
-        if self.i is not None:
-            oprot.writeFieldBegin("i", TType.STRUCT, 5)
-            self.i.write(oprot)
-            oprot.writeFieldEnd()
-        if self.f is not None:
-            oprot.writeFieldBegin("f", TType.STRUCT, 6)
-            self.f.write(oprot)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter284 in self.success:
+                iter284.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
-        if self.o is not None:
-            oprot.writeFieldBegin("o", TType.STRUCT, 7)
-            self.o.write(oprot)
+        if self.d is not None:
+            oprot.writeFieldBegin("d", TType.STRUCT, 1)
+            self.d.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -12198,58 +16027,129 @@ class start_server_result(object):
         return not (self == other)
 
 
-all_structs.append(start_server_result)
-start_server_result.thrift_spec = (
+all_structs.append(get_backends_result)
+get_backends_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.LIST,
         "success",
-        "UTF8",
+        (TType.STRUCT, [Backend, None], False),
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "e",
-        [NameAlreadyUsedException, None],
+        "d",
+        [DefaultException, None],
         None,
     ),  # 1
+)
+
+
+class get_backends_by_owner_args(object):
+    """
+    Attributes:
+     - owner
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        owner=None,
+    ):
+        self.owner = owner
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.owner = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_backends_by_owner_args")
+        if self.owner is not None:
+            oprot.writeFieldBegin("owner", TType.STRING, 1)
+            oprot.writeString(
+                self.owner.encode("utf-8") if sys.version_info[0] == 2 else self.owner
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_backends_by_owner_args)
+get_backends_by_owner_args.thrift_spec = (
+    None,  # 0
     (
-        2,
-        TType.STRUCT,
-        "r",
-        [ResourceNotAvailableException, None],
-        None,
-    ),  # 2
-    None,  # 3
-    None,  # 4
-    (
-        5,
-        TType.STRUCT,
-        "i",
-        [ImageNotFoundException, None],
-        None,
-    ),  # 5
-    (
-        6,
-        TType.STRUCT,
-        "f",
-        [FlavorNotFoundException, None],
-        None,
-    ),  # 6
-    (
-        7,
-        TType.STRUCT,
-        "o",
-        [DefaultException, None],
+        1,
+        TType.STRING,
+        "owner",
+        "UTF8",
         None,
-    ),  # 7
+    ),  # 1
 )
 
 
-class is_bibigrid_available_args(object):
+class get_backends_by_owner_result(object):
+    """
+    Attributes:
+     - success
+     - d
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        success=None,
+        d=None,
+    ):
+        self.success = success
+        self.d = d
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -12263,6 +16163,22 @@ class is_bibigrid_available_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype288, _size285 = iprot.readListBegin()
+                    for _i289 in range(_size285):
+                        _elem290 = Backend()
+                        _elem290.read(iprot)
+                        self.success.append(_elem290)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.d = DefaultException.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -12275,7 +16191,18 @@ class is_bibigrid_available_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("is_bibigrid_available_args")
+        oprot.writeStructBegin("get_backends_by_owner_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter291 in self.success:
+                iter291.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.d is not None:
+            oprot.writeFieldBegin("d", TType.STRUCT, 1)
+            self.d.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -12293,14 +16220,29 @@ class is_bibigrid_available_args(object):
         return not (self == other)
 
 
-all_structs.append(is_bibigrid_available_args)
-is_bibigrid_available_args.thrift_spec = ()
+all_structs.append(get_backends_by_owner_result)
+get_backends_by_owner_result.thrift_spec = (
+    (
+        0,
+        TType.LIST,
+        "success",
+        (TType.STRUCT, [Backend, None], False),
+        None,
+    ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "d",
+        [DefaultException, None],
+        None,
+    ),  # 1
+)
 
 
-class is_bibigrid_available_result(object):
+class get_backends_by_template_args(object):
     """
     Attributes:
-     - success
+     - template
 
     """
 
@@ -12308,9 +16250,9 @@ class is_bibigrid_available_result(object):
 
     def __init__(
         self,
-        success=None,
+        template=None,
     ):
-        self.success = success
+        self.template = template
 
     def read(self, iprot):
         if (
@@ -12325,9 +16267,13 @@ class is_bibigrid_available_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.template = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -12342,10 +16288,14 @@ class is_bibigrid_available_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("is_bibigrid_available_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+        oprot.writeStructBegin("get_backends_by_template_args")
+        if self.template is not None:
+            oprot.writeFieldBegin("template", TType.STRING, 1)
+            oprot.writeString(
+                self.template.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.template
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -12364,21 +16314,37 @@ class is_bibigrid_available_result(object):
         return not (self == other)
 
 
-all_structs.append(is_bibigrid_available_result)
-is_bibigrid_available_result.thrift_spec = (
+all_structs.append(get_backends_by_template_args)
+get_backends_by_template_args.thrift_spec = (
+    None,  # 0
     (
-        0,
-        TType.BOOL,
-        "success",
-        None,
+        1,
+        TType.STRING,
+        "template",
+        "UTF8",
         None,
-    ),  # 0
+    ),  # 1
 )
 
 
-class is_openstack_connection_available_args(object):
+class get_backends_by_template_result(object):
+    """
+    Attributes:
+     - success
+     - d
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        success=None,
+        d=None,
+    ):
+        self.success = success
+        self.d = d
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -12392,6 +16358,22 @@ class is_openstack_connection_available_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype295, _size292 = iprot.readListBegin()
+                    for _i296 in range(_size292):
+                        _elem297 = Backend()
+                        _elem297.read(iprot)
+                        self.success.append(_elem297)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.d = DefaultException.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -12404,7 +16386,18 @@ class is_openstack_connection_available_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("is_openstack_connection_available_args")
+        oprot.writeStructBegin("get_backends_by_template_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter298 in self.success:
+                iter298.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.d is not None:
+            oprot.writeFieldBegin("d", TType.STRUCT, 1)
+            self.d.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -12422,14 +16415,29 @@ class is_openstack_connection_available_args(object):
         return not (self == other)
 
 
-all_structs.append(is_openstack_connection_available_args)
-is_openstack_connection_available_args.thrift_spec = ()
+all_structs.append(get_backends_by_template_result)
+get_backends_by_template_result.thrift_spec = (
+    (
+        0,
+        TType.LIST,
+        "success",
+        (TType.STRUCT, [Backend, None], False),
+        None,
+    ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "d",
+        [DefaultException, None],
+        None,
+    ),  # 1
+)
 
 
-class is_openstack_connection_available_result(object):
+class get_backend_by_id_args(object):
     """
     Attributes:
-     - success
+     - id
 
     """
 
@@ -12437,9 +16445,9 @@ class is_openstack_connection_available_result(object):
 
     def __init__(
         self,
-        success=None,
+        id=None,
     ):
-        self.success = success
+        self.id = id
 
     def read(self, iprot):
         if (
@@ -12454,9 +16462,9 @@ class is_openstack_connection_available_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -12471,10 +16479,10 @@ class is_openstack_connection_available_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("is_openstack_connection_available_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+        oprot.writeStructBegin("get_backend_by_id_args")
+        if self.id is not None:
+            oprot.writeFieldBegin("id", TType.I64, 1)
+            oprot.writeI64(self.id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -12493,23 +16501,25 @@ class is_openstack_connection_available_result(object):
         return not (self == other)
 
 
-all_structs.append(is_openstack_connection_available_result)
-is_openstack_connection_available_result.thrift_spec = (
+all_structs.append(get_backend_by_id_args)
+get_backend_by_id_args.thrift_spec = (
+    None,  # 0
     (
-        0,
-        TType.BOOL,
-        "success",
+        1,
+        TType.I64,
+        "id",
         None,
         None,
-    ),  # 0
+    ),  # 1
 )
 
 
-class detach_ip_from_server_args(object):
+class get_backend_by_id_result(object):
     """
     Attributes:
-     - server_id
-     - floating_ip
+     - success
+     - b
+     - d
 
     """
 
@@ -12517,11 +16527,13 @@ class detach_ip_from_server_args(object):
 
     def __init__(
         self,
-        server_id=None,
-        floating_ip=None,
+        success=None,
+        b=None,
+        d=None,
     ):
-        self.server_id = server_id
-        self.floating_ip = floating_ip
+        self.success = success
+        self.b = b
+        self.d = d
 
     def read(self, iprot):
         if (
@@ -12536,22 +16548,20 @@ class detach_ip_from_server_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.server_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Backend()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.b = BackendNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.floating_ip = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.STRUCT:
+                    self.d = DefaultException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -12566,22 +16576,18 @@ class detach_ip_from_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("detach_ip_from_server_args")
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 1)
-            oprot.writeString(
-                self.server_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.server_id
-            )
+        oprot.writeStructBegin("get_backend_by_id_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
-        if self.floating_ip is not None:
-            oprot.writeFieldBegin("floating_ip", TType.STRING, 2)
-            oprot.writeString(
-                self.floating_ip.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.floating_ip
-            )
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 1)
+            self.b.write(oprot)
+            oprot.writeFieldEnd()
+        if self.d is not None:
+            oprot.writeFieldBegin("d", TType.STRUCT, 2)
+            self.d.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -12600,30 +16606,37 @@ class detach_ip_from_server_args(object):
         return not (self == other)
 
 
-all_structs.append(detach_ip_from_server_args)
-detach_ip_from_server_args.thrift_spec = (
-    None,  # 0
+all_structs.append(get_backend_by_id_result)
+get_backend_by_id_result.thrift_spec = (
+    (
+        0,
+        TType.STRUCT,
+        "success",
+        [Backend, None],
+        None,
+    ),  # 0
     (
         1,
-        TType.STRING,
-        "server_id",
-        "UTF8",
+        TType.STRUCT,
+        "b",
+        [BackendNotFoundException, None],
         None,
     ),  # 1
     (
         2,
-        TType.STRING,
-        "floating_ip",
-        "UTF8",
+        TType.STRUCT,
+        "d",
+        [DefaultException, None],
         None,
     ),  # 2
 )
 
 
-class detach_ip_from_server_result(object):
+class set_metadata_server_data_args(object):
     """
     Attributes:
-     - s
+     - ip
+     - metadata
 
     """
 
@@ -12631,9 +16644,11 @@ class detach_ip_from_server_result(object):
 
     def __init__(
         self,
-        s=None,
+        ip=None,
+        metadata=None,
     ):
-        self.s = s
+        self.ip = ip
+        self.metadata = metadata
 
     def read(self, iprot):
         if (
@@ -12649,8 +16664,18 @@ class detach_ip_from_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
+                if ftype == TType.STRING:
+                    self.ip = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
                 if ftype == TType.STRUCT:
-                    self.s = ServerNotFoundException.read(iprot)
+                    self.metadata = VirtualMachineServerMetadata()
+                    self.metadata.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -12665,10 +16690,16 @@ class detach_ip_from_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("detach_ip_from_server_result")
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 1)
-            self.s.write(oprot)
+        oprot.writeStructBegin("set_metadata_server_data_args")
+        if self.ip is not None:
+            oprot.writeFieldBegin("ip", TType.STRING, 1)
+            oprot.writeString(
+                self.ip.encode("utf-8") if sys.version_info[0] == 2 else self.ip
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.STRUCT, 3)
+            self.metadata.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -12687,35 +16718,32 @@ class detach_ip_from_server_result(object):
         return not (self == other)
 
 
-all_structs.append(detach_ip_from_server_result)
-detach_ip_from_server_result.thrift_spec = (
+all_structs.append(set_metadata_server_data_args)
+set_metadata_server_data_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRUCT,
-        "s",
-        [ServerNotFoundException, None],
+        TType.STRING,
+        "ip",
+        "UTF8",
         None,
     ),  # 1
+    None,  # 2
+    (
+        3,
+        TType.STRUCT,
+        "metadata",
+        [VirtualMachineServerMetadata, None],
+        None,
+    ),  # 3
 )
 
 
-class start_server_with_custom_key_args(object):
+class set_metadata_server_data_result(object):
     """
     Attributes:
-     - flavor_name: Name of the  Flavor to use.
-     - image_name: Name of the image to use.
-     - servername: Name for the new server
-     - metadata: Metadata for the new instance
-     - research_environment
-     - volume_ids_path_new
-     - volume_ids_path_attach
-     - additional_security_group_ids
-     - additional_owner_keys
-     - additional_user_keys
-     - metadata_token
-     - metadata_endpoint
-     - additional_script
+     - m
+     - b
 
     """
 
@@ -12723,33 +16751,11 @@ class start_server_with_custom_key_args(object):
 
     def __init__(
         self,
-        flavor_name=None,
-        image_name=None,
-        servername=None,
-        metadata=None,
-        research_environment=None,
-        volume_ids_path_new=None,
-        volume_ids_path_attach=None,
-        additional_security_group_ids=None,
-        additional_owner_keys=None,
-        additional_user_keys=None,
-        metadata_token=None,
-        metadata_endpoint=None,
-        additional_script=None,
+        m=None,
+        b=None,
     ):
-        self.flavor_name = flavor_name
-        self.image_name = image_name
-        self.servername = servername
-        self.metadata = metadata
-        self.research_environment = research_environment
-        self.volume_ids_path_new = volume_ids_path_new
-        self.volume_ids_path_attach = volume_ids_path_attach
-        self.additional_security_group_ids = additional_security_group_ids
-        self.additional_owner_keys = additional_owner_keys
-        self.additional_user_keys = additional_user_keys
-        self.metadata_token = metadata_token
-        self.metadata_endpoint = metadata_endpoint
-        self.additional_script = additional_script
+        self.m = m
+        self.b = b
 
     def read(self, iprot):
         if (
@@ -12765,171 +16771,104 @@ class start_server_with_custom_key_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.flavor_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.image_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.servername = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.MAP:
-                    self.metadata = {}
-                    _ktype203, _vtype204, _size202 = iprot.readMapBegin()
-                    for _i206 in range(_size202):
-                        _key207 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val208 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.metadata[_key207] = _val208
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRING:
-                    self.research_environment = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.LIST:
-                    self.volume_ids_path_new = []
-                    _etype212, _size209 = iprot.readListBegin()
-                    for _i213 in range(_size209):
-                        _elem214 = {}
-                        _ktype216, _vtype217, _size215 = iprot.readMapBegin()
-                        for _i219 in range(_size215):
-                            _key220 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val221 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem214[_key220] = _val221
-                        iprot.readMapEnd()
-                        self.volume_ids_path_new.append(_elem214)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 8:
-                if ftype == TType.LIST:
-                    self.volume_ids_path_attach = []
-                    _etype225, _size222 = iprot.readListBegin()
-                    for _i226 in range(_size222):
-                        _elem227 = {}
-                        _ktype229, _vtype230, _size228 = iprot.readMapBegin()
-                        for _i232 in range(_size228):
-                            _key233 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val234 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem227[_key233] = _val234
-                        iprot.readMapEnd()
-                        self.volume_ids_path_attach.append(_elem227)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 9:
-                if ftype == TType.LIST:
-                    self.additional_security_group_ids = []
-                    _etype238, _size235 = iprot.readListBegin()
-                    for _i239 in range(_size235):
-                        _elem240 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.additional_security_group_ids.append(_elem240)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 10:
-                if ftype == TType.LIST:
-                    self.additional_owner_keys = []
-                    _etype244, _size241 = iprot.readListBegin()
-                    for _i245 in range(_size241):
-                        _elem246 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.additional_owner_keys.append(_elem246)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 11:
-                if ftype == TType.LIST:
-                    self.additional_user_keys = []
-                    _etype250, _size247 = iprot.readListBegin()
-                    for _i251 in range(_size247):
-                        _elem252 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.additional_user_keys.append(_elem252)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 12:
-                if ftype == TType.STRING:
-                    self.metadata_token = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.STRUCT:
+                    self.m = MetadataServerNotAvailableException.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 13:
-                if ftype == TType.STRING:
-                    self.metadata_endpoint = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.b = MetadataServerNotAllowedException.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 14:
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("set_metadata_server_data_result")
+        if self.m is not None:
+            oprot.writeFieldBegin("m", TType.STRUCT, 1)
+            self.m.write(oprot)
+            oprot.writeFieldEnd()
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 2)
+            self.b.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(set_metadata_server_data_result)
+set_metadata_server_data_result.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRUCT,
+        "m",
+        [MetadataServerNotAvailableException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "b",
+        [MetadataServerNotAllowedException, None],
+        None,
+    ),  # 2
+)
+
+
+class remove_metadata_server_data_args(object):
+    """
+    Attributes:
+     - ip
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        ip=None,
+    ):
+        self.ip = ip
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
                 if ftype == TType.STRING:
-                    self.additional_script = (
+                    self.ip = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -12948,139 +16887,104 @@ class start_server_with_custom_key_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_server_with_custom_key_args")
-        if self.flavor_name is not None:
-            oprot.writeFieldBegin("flavor_name", TType.STRING, 1)
-            oprot.writeString(
-                self.flavor_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.flavor_name
-            )
-            oprot.writeFieldEnd()
-        if self.image_name is not None:
-            oprot.writeFieldBegin("image_name", TType.STRING, 2)
-            oprot.writeString(
-                self.image_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.image_name
-            )
-            oprot.writeFieldEnd()
-        if self.servername is not None:
-            oprot.writeFieldBegin("servername", TType.STRING, 3)
-            oprot.writeString(
-                self.servername.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.servername
-            )
-            oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.MAP, 4)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
-            for kiter253, viter254 in self.metadata.items():
-                oprot.writeString(
-                    kiter253.encode("utf-8") if sys.version_info[0] == 2 else kiter253
-                )
-                oprot.writeString(
-                    viter254.encode("utf-8") if sys.version_info[0] == 2 else viter254
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.research_environment is not None:
-            oprot.writeFieldBegin("research_environment", TType.STRING, 5)
-            oprot.writeString(
-                self.research_environment.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.research_environment
-            )
-            oprot.writeFieldEnd()
-        if self.volume_ids_path_new is not None:
-            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 7)
-            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
-            for iter255 in self.volume_ids_path_new:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter255))
-                for kiter256, viter257 in iter255.items():
-                    oprot.writeString(
-                        kiter256.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter256
-                    )
-                    oprot.writeString(
-                        viter257.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter257
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.volume_ids_path_attach is not None:
-            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 8)
-            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
-            for iter258 in self.volume_ids_path_attach:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter258))
-                for kiter259, viter260 in iter258.items():
-                    oprot.writeString(
-                        kiter259.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter259
-                    )
-                    oprot.writeString(
-                        viter260.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter260
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.additional_security_group_ids is not None:
-            oprot.writeFieldBegin("additional_security_group_ids", TType.LIST, 9)
-            oprot.writeListBegin(TType.STRING, len(self.additional_security_group_ids))
-            for iter261 in self.additional_security_group_ids:
-                oprot.writeString(
-                    iter261.encode("utf-8") if sys.version_info[0] == 2 else iter261
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.additional_owner_keys is not None:
-            oprot.writeFieldBegin("additional_owner_keys", TType.LIST, 10)
-            oprot.writeListBegin(TType.STRING, len(self.additional_owner_keys))
-            for iter262 in self.additional_owner_keys:
-                oprot.writeString(
-                    iter262.encode("utf-8") if sys.version_info[0] == 2 else iter262
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.additional_user_keys is not None:
-            oprot.writeFieldBegin("additional_user_keys", TType.LIST, 11)
-            oprot.writeListBegin(TType.STRING, len(self.additional_user_keys))
-            for iter263 in self.additional_user_keys:
-                oprot.writeString(
-                    iter263.encode("utf-8") if sys.version_info[0] == 2 else iter263
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.metadata_token is not None:
-            oprot.writeFieldBegin("metadata_token", TType.STRING, 12)
+        oprot.writeStructBegin("remove_metadata_server_data_args")
+        if self.ip is not None:
+            oprot.writeFieldBegin("ip", TType.STRING, 1)
             oprot.writeString(
-                self.metadata_token.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.metadata_token
+                self.ip.encode("utf-8") if sys.version_info[0] == 2 else self.ip
             )
             oprot.writeFieldEnd()
-        if self.metadata_endpoint is not None:
-            oprot.writeFieldBegin("metadata_endpoint", TType.STRING, 13)
-            oprot.writeString(
-                self.metadata_endpoint.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.metadata_endpoint
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(remove_metadata_server_data_args)
+remove_metadata_server_data_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "ip",
+        "UTF8",
+        None,
+    ),  # 1
+)
+
+
+class remove_metadata_server_data_result(object):
+    """
+    Attributes:
+     - m
+     - b
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        m=None,
+        b=None,
+    ):
+        self.m = m
+        self.b = b
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.m = MetadataServerNotAvailableException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.b = MetadataServerNotAllowedException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
+            return
+        oprot.writeStructBegin("remove_metadata_server_data_result")
+        if self.m is not None:
+            oprot.writeFieldBegin("m", TType.STRUCT, 1)
+            self.m.write(oprot)
             oprot.writeFieldEnd()
-        if self.additional_script is not None:
-            oprot.writeFieldBegin("additional_script", TType.STRING, 14)
-            oprot.writeString(
-                self.additional_script.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.additional_script
-            )
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 2)
+            self.b.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13099,113 +17003,82 @@ class start_server_with_custom_key_args(object):
         return not (self == other)
 
 
-all_structs.append(start_server_with_custom_key_args)
-start_server_with_custom_key_args.thrift_spec = (
+all_structs.append(remove_metadata_server_data_result)
+remove_metadata_server_data_result.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "flavor_name",
-        "UTF8",
+        TType.STRUCT,
+        "m",
+        [MetadataServerNotAvailableException, None],
         None,
     ),  # 1
     (
         2,
-        TType.STRING,
-        "image_name",
-        "UTF8",
+        TType.STRUCT,
+        "b",
+        [MetadataServerNotAllowedException, None],
         None,
     ),  # 2
-    (
-        3,
-        TType.STRING,
-        "servername",
-        "UTF8",
-        None,
-    ),  # 3
-    (
-        4,
-        TType.MAP,
-        "metadata",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 4
-    (
-        5,
-        TType.STRING,
-        "research_environment",
-        "UTF8",
-        None,
-    ),  # 5
-    None,  # 6
-    (
-        7,
-        TType.LIST,
-        "volume_ids_path_new",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
-        None,
-    ),  # 7
-    (
-        8,
-        TType.LIST,
-        "volume_ids_path_attach",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
-        None,
-    ),  # 8
-    (
-        9,
-        TType.LIST,
-        "additional_security_group_ids",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 9
-    (
-        10,
-        TType.LIST,
-        "additional_owner_keys",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 10
-    (
-        11,
-        TType.LIST,
-        "additional_user_keys",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 11
-    (
-        12,
-        TType.STRING,
-        "metadata_token",
-        "UTF8",
-        None,
-    ),  # 12
-    (
-        13,
-        TType.STRING,
-        "metadata_endpoint",
-        "UTF8",
-        None,
-    ),  # 13
-    (
-        14,
-        TType.STRING,
-        "additional_script",
-        "UTF8",
-        None,
-    ),  # 14
 )
 
 
-class start_server_with_custom_key_result(object):
+class is_metadata_server_available_args(object):
+    thrift_spec = None
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("is_metadata_server_available_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(is_metadata_server_available_args)
+is_metadata_server_available_args.thrift_spec = ()
+
+
+class is_metadata_server_available_result(object):
     """
     Attributes:
      - success
-     - e
-     - r
-     - i
-     - f
-     - d
+     - m
+     - b
 
     """
 
@@ -13214,18 +17087,12 @@ class start_server_with_custom_key_result(object):
     def __init__(
         self,
         success=None,
-        e=None,
-        r=None,
-        i=None,
-        f=None,
-        d=None,
+        m=None,
+        b=None,
     ):
         self.success = success
-        self.e = e
-        self.r = r
-        self.i = i
-        self.f = f
-        self.d = d
+        self.m = m
+        self.b = b
 
     def read(self, iprot):
         if (
@@ -13239,39 +17106,20 @@ class start_server_with_custom_key_result(object):
         while True:
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
-                break
-            if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = NameAlreadyUsedException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.r = ResourceNotAvailableException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRUCT:
-                    self.i = ImageNotFoundException.read(iprot)
+                break
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
-            elif fid == 4:
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.f = FlavorNotFoundException.read(iprot)
+                    self.m = MetadataServerNotAvailableException.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 5:
+            elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.d = DefaultException.read(iprot)
+                    self.b = MetadataServerNotAllowedException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -13286,34 +17134,18 @@ class start_server_with_custom_key_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_server_with_custom_key_result")
+        oprot.writeStructBegin("is_metadata_server_available_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 2)
-            self.r.write(oprot)
-            oprot.writeFieldEnd()
-        if self.i is not None:
-            oprot.writeFieldBegin("i", TType.STRUCT, 3)
-            self.i.write(oprot)
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
             oprot.writeFieldEnd()
-        if self.f is not None:
-            oprot.writeFieldBegin("f", TType.STRUCT, 4)
-            self.f.write(oprot)
+        if self.m is not None:
+            oprot.writeFieldBegin("m", TType.STRUCT, 1)
+            self.m.write(oprot)
             oprot.writeFieldEnd()
-        if self.d is not None:
-            oprot.writeFieldBegin("d", TType.STRUCT, 5)
-            self.d.write(oprot)
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 2)
+            self.b.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13332,57 +17164,36 @@ class start_server_with_custom_key_result(object):
         return not (self == other)
 
 
-all_structs.append(start_server_with_custom_key_result)
-start_server_with_custom_key_result.thrift_spec = (
+all_structs.append(is_metadata_server_available_result)
+is_metadata_server_available_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.BOOL,
         "success",
-        "UTF8",
+        None,
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "e",
-        [NameAlreadyUsedException, None],
+        "m",
+        [MetadataServerNotAvailableException, None],
         None,
     ),  # 1
     (
         2,
         TType.STRUCT,
-        "r",
-        [ResourceNotAvailableException, None],
+        "b",
+        [MetadataServerNotAllowedException, None],
         None,
     ),  # 2
-    (
-        3,
-        TType.STRUCT,
-        "i",
-        [ImageNotFoundException, None],
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRUCT,
-        "f",
-        [FlavorNotFoundException, None],
-        None,
-    ),  # 4
-    (
-        5,
-        TType.STRUCT,
-        "d",
-        [DefaultException, None],
-        None,
-    ),  # 5
 )
 
 
-class exist_server_args(object):
+class delete_backend_args(object):
     """
     Attributes:
-     - name
+     - id
 
     """
 
@@ -13390,9 +17201,9 @@ class exist_server_args(object):
 
     def __init__(
         self,
-        name=None,
+        id=None,
     ):
-        self.name = name
+        self.id = id
 
     def read(self, iprot):
         if (
@@ -13408,12 +17219,8 @@ class exist_server_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.I64:
+                    self.id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -13428,12 +17235,10 @@ class exist_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("exist_server_args")
-        if self.name is not None:
-            oprot.writeFieldBegin("name", TType.STRING, 1)
-            oprot.writeString(
-                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
-            )
+        oprot.writeStructBegin("delete_backend_args")
+        if self.id is not None:
+            oprot.writeFieldBegin("id", TType.I64, 1)
+            oprot.writeI64(self.id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13452,23 +17257,23 @@ class exist_server_args(object):
         return not (self == other)
 
 
-all_structs.append(exist_server_args)
-exist_server_args.thrift_spec = (
+all_structs.append(delete_backend_args)
+delete_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "name",
-        "UTF8",
+        TType.I64,
+        "id",
+        None,
         None,
     ),  # 1
 )
 
 
-class exist_server_result(object):
+class delete_backend_result(object):
     """
     Attributes:
-     - success
+     - b
 
     """
 
@@ -13476,9 +17281,9 @@ class exist_server_result(object):
 
     def __init__(
         self,
-        success=None,
+        b=None,
     ):
-        self.success = success
+        self.b = b
 
     def read(self, iprot):
         if (
@@ -13493,9 +17298,9 @@ class exist_server_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.b = BackendNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -13510,10 +17315,10 @@ class exist_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("exist_server_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+        oprot.writeStructBegin("delete_backend_result")
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 1)
+            self.b.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13532,124 +17337,58 @@ class exist_server_result(object):
         return not (self == other)
 
 
-all_structs.append(exist_server_result)
-exist_server_result.thrift_spec = (
+all_structs.append(delete_backend_result)
+delete_backend_result.thrift_spec = (
+    None,  # 0
     (
-        0,
-        TType.BOOL,
-        "success",
-        None,
+        1,
+        TType.STRUCT,
+        "b",
+        [BackendNotFoundException, None],
         None,
-    ),  # 0
+    ),  # 1
 )
 
 
-class create_and_deploy_playbook_args(object):
+class add_user_to_backend_args(object):
     """
     Attributes:
-     - public_key
-     - openstack_id
-     - conda_packages
-     - research_environment_template
-     - apt_packages
-     - create_only_backend
-     - base_url
-
-    """
-
-    thrift_spec = None
-
-    def __init__(
-        self,
-        public_key=None,
-        openstack_id=None,
-        conda_packages=None,
-        research_environment_template=None,
-        apt_packages=None,
-        create_only_backend=None,
-        base_url=None,
-    ):
-        self.public_key = public_key
-        self.openstack_id = openstack_id
-        self.conda_packages = conda_packages
-        self.research_environment_template = research_environment_template
-        self.apt_packages = apt_packages
-        self.create_only_backend = create_only_backend
-        self.base_url = base_url
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            fname, ftype, fid = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.public_key = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.openstack_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.LIST:
-                    self.conda_packages = []
-                    _etype267, _size264 = iprot.readListBegin()
-                    for _i268 in range(_size264):
-                        _elem269 = CondaPackage()
-                        _elem269.read(iprot)
-                        self.conda_packages.append(_elem269)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRING:
-                    self.research_environment_template = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.LIST:
-                    self.apt_packages = []
-                    _etype273, _size270 = iprot.readListBegin()
-                    for _i274 in range(_size270):
-                        _elem275 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.apt_packages.append(_elem275)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.BOOL:
-                    self.create_only_backend = iprot.readBool()
+     - backend_id
+     - user_id
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        backend_id=None,
+        user_id=None,
+    ):
+        self.backend_id = backend_id
+        self.user_id = user_id
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.backend_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
-            elif fid == 7:
+            elif fid == 2:
                 if ftype == TType.STRING:
-                    self.base_url = (
+                    self.user_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -13668,57 +17407,17 @@ class create_and_deploy_playbook_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_and_deploy_playbook_args")
-        if self.public_key is not None:
-            oprot.writeFieldBegin("public_key", TType.STRING, 1)
-            oprot.writeString(
-                self.public_key.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.public_key
-            )
-            oprot.writeFieldEnd()
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 2)
-            oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
-            )
-            oprot.writeFieldEnd()
-        if self.conda_packages is not None:
-            oprot.writeFieldBegin("conda_packages", TType.LIST, 3)
-            oprot.writeListBegin(TType.STRUCT, len(self.conda_packages))
-            for iter276 in self.conda_packages:
-                iter276.write(oprot)
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.research_environment_template is not None:
-            oprot.writeFieldBegin("research_environment_template", TType.STRING, 4)
-            oprot.writeString(
-                self.research_environment_template.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.research_environment_template
-            )
-            oprot.writeFieldEnd()
-        if self.apt_packages is not None:
-            oprot.writeFieldBegin("apt_packages", TType.LIST, 5)
-            oprot.writeListBegin(TType.STRING, len(self.apt_packages))
-            for iter277 in self.apt_packages:
-                oprot.writeString(
-                    iter277.encode("utf-8") if sys.version_info[0] == 2 else iter277
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.create_only_backend is not None:
-            oprot.writeFieldBegin("create_only_backend", TType.BOOL, 6)
-            oprot.writeBool(self.create_only_backend)
+        oprot.writeStructBegin("add_user_to_backend_args")
+        if self.backend_id is not None:
+            oprot.writeFieldBegin("backend_id", TType.I64, 1)
+            oprot.writeI64(self.backend_id)
             oprot.writeFieldEnd()
-        if self.base_url is not None:
-            oprot.writeFieldBegin("base_url", TType.STRING, 7)
+        if self.user_id is not None:
+            oprot.writeFieldBegin("user_id", TType.STRING, 2)
             oprot.writeString(
-                self.base_url.encode("utf-8")
+                self.user_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.base_url
+                else self.user_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -13738,66 +17437,31 @@ class create_and_deploy_playbook_args(object):
         return not (self == other)
 
 
-all_structs.append(create_and_deploy_playbook_args)
-create_and_deploy_playbook_args.thrift_spec = (
+all_structs.append(add_user_to_backend_args)
+add_user_to_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "public_key",
-        "UTF8",
+        TType.I64,
+        "backend_id",
+        None,
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "openstack_id",
+        "user_id",
         "UTF8",
         None,
     ),  # 2
-    (
-        3,
-        TType.LIST,
-        "conda_packages",
-        (TType.STRUCT, [CondaPackage, None], False),
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRING,
-        "research_environment_template",
-        "UTF8",
-        None,
-    ),  # 4
-    (
-        5,
-        TType.LIST,
-        "apt_packages",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 5
-    (
-        6,
-        TType.BOOL,
-        "create_only_backend",
-        None,
-        None,
-    ),  # 6
-    (
-        7,
-        TType.STRING,
-        "base_url",
-        "UTF8",
-        None,
-    ),  # 7
 )
 
 
-class create_and_deploy_playbook_result(object):
+class add_user_to_backend_result(object):
     """
     Attributes:
      - success
-     - s
+     - b
 
     """
 
@@ -13806,10 +17470,10 @@ class create_and_deploy_playbook_result(object):
     def __init__(
         self,
         success=None,
-        s=None,
+        b=None,
     ):
         self.success = success
-        self.s = s
+        self.b = b
 
     def read(self, iprot):
         if (
@@ -13825,13 +17489,27 @@ class create_and_deploy_playbook_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.I32:
-                    self.success = iprot.readI32()
+                if ftype == TType.MAP:
+                    self.success = {}
+                    _ktype300, _vtype301, _size299 = iprot.readMapBegin()
+                    for _i303 in range(_size299):
+                        _key304 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val305 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key304] = _val305
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.s = ServerNotFoundException.read(iprot)
+                    self.b = BackendNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -13846,14 +17524,22 @@ class create_and_deploy_playbook_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_and_deploy_playbook_result")
+        oprot.writeStructBegin("add_user_to_backend_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.I32, 0)
-            oprot.writeI32(self.success)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter306, viter307 in self.success.items():
+                oprot.writeString(
+                    kiter306.encode("utf-8") if sys.version_info[0] == 2 else kiter306
+                )
+                oprot.writeString(
+                    viter307.encode("utf-8") if sys.version_info[0] == 2 else viter307
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 1)
-            self.s.write(oprot)
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 1)
+            self.b.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13872,29 +17558,29 @@ class create_and_deploy_playbook_result(object):
         return not (self == other)
 
 
-all_structs.append(create_and_deploy_playbook_result)
-create_and_deploy_playbook_result.thrift_spec = (
+all_structs.append(add_user_to_backend_result)
+add_user_to_backend_result.thrift_spec = (
     (
         0,
-        TType.I32,
+        TType.MAP,
         "success",
-        None,
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "s",
-        [ServerNotFoundException, None],
+        "b",
+        [BackendNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class get_playbook_logs_args(object):
+class get_users_from_backend_args(object):
     """
     Attributes:
-     - openstack_id
+     - backend_id
 
     """
 
@@ -13902,9 +17588,9 @@ class get_playbook_logs_args(object):
 
     def __init__(
         self,
-        openstack_id=None,
+        backend_id=None,
     ):
-        self.openstack_id = openstack_id
+        self.backend_id = backend_id
 
     def read(self, iprot):
         if (
@@ -13920,12 +17606,8 @@ class get_playbook_logs_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.openstack_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.I64:
+                    self.backend_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -13940,14 +17622,10 @@ class get_playbook_logs_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_playbook_logs_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
-            oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
-            )
+        oprot.writeStructBegin("get_users_from_backend_args")
+        if self.backend_id is not None:
+            oprot.writeFieldBegin("backend_id", TType.I64, 1)
+            oprot.writeI64(self.backend_id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13966,24 +17644,24 @@ class get_playbook_logs_args(object):
         return not (self == other)
 
 
-all_structs.append(get_playbook_logs_args)
-get_playbook_logs_args.thrift_spec = (
+all_structs.append(get_users_from_backend_args)
+get_users_from_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "openstack_id",
-        "UTF8",
+        TType.I64,
+        "backend_id",
+        None,
         None,
     ),  # 1
 )
 
 
-class get_playbook_logs_result(object):
+class get_users_from_backend_result(object):
     """
     Attributes:
      - success
-     - p
+     - b
 
     """
 
@@ -13992,10 +17670,10 @@ class get_playbook_logs_result(object):
     def __init__(
         self,
         success=None,
-        p=None,
+        b=None,
     ):
         self.success = success
-        self.p = p
+        self.b = b
 
     def read(self, iprot):
         if (
@@ -14011,14 +17689,22 @@ class get_playbook_logs_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = PlaybookResult()
-                    self.success.read(iprot)
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype311, _size308 = iprot.readListBegin()
+                    for _i312 in range(_size308):
+                        _elem313 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success.append(_elem313)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.p = PlaybookNotFoundException.read(iprot)
+                    self.b = BackendNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -14033,14 +17719,19 @@ class get_playbook_logs_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_playbook_logs_result")
+        oprot.writeStructBegin("get_users_from_backend_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRING, len(self.success))
+            for iter314 in self.success:
+                oprot.writeString(
+                    iter314.encode("utf-8") if sys.version_info[0] == 2 else iter314
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
-        if self.p is not None:
-            oprot.writeFieldBegin("p", TType.STRUCT, 1)
-            self.p.write(oprot)
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 1)
+            self.b.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14059,28 +17750,43 @@ class get_playbook_logs_result(object):
         return not (self == other)
 
 
-all_structs.append(get_playbook_logs_result)
-get_playbook_logs_result.thrift_spec = (
+all_structs.append(get_users_from_backend_result)
+get_users_from_backend_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.LIST,
         "success",
-        [PlaybookResult, None],
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "p",
-        [PlaybookNotFoundException, None],
+        "b",
+        [BackendNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class has_forc_args(object):
+class delete_user_from_backend_args(object):
+    """
+    Attributes:
+     - backend_id
+     - user_id
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        backend_id=None,
+        user_id=None,
+    ):
+        self.backend_id = backend_id
+        self.user_id = user_id
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -14094,6 +17800,20 @@ class has_forc_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.backend_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.user_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -14106,7 +17826,19 @@ class has_forc_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("has_forc_args")
+        oprot.writeStructBegin("delete_user_from_backend_args")
+        if self.backend_id is not None:
+            oprot.writeFieldBegin("backend_id", TType.I64, 1)
+            oprot.writeI64(self.backend_id)
+            oprot.writeFieldEnd()
+        if self.user_id is not None:
+            oprot.writeFieldBegin("user_id", TType.STRING, 2)
+            oprot.writeString(
+                self.user_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.user_id
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -14124,14 +17856,31 @@ class has_forc_args(object):
         return not (self == other)
 
 
-all_structs.append(has_forc_args)
-has_forc_args.thrift_spec = ()
+all_structs.append(delete_user_from_backend_args)
+delete_user_from_backend_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.I64,
+        "backend_id",
+        None,
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "user_id",
+        "UTF8",
+        None,
+    ),  # 2
+)
 
 
-class has_forc_result(object):
+class delete_user_from_backend_result(object):
     """
     Attributes:
      - success
+     - b
 
     """
 
@@ -14140,8 +17889,10 @@ class has_forc_result(object):
     def __init__(
         self,
         success=None,
+        b=None,
     ):
         self.success = success
+        self.b = b
 
     def read(self, iprot):
         if (
@@ -14157,8 +17908,27 @@ class has_forc_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+                if ftype == TType.MAP:
+                    self.success = {}
+                    _ktype316, _vtype317, _size315 = iprot.readMapBegin()
+                    for _i319 in range(_size315):
+                        _key320 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val321 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key320] = _val321
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.b = BackendNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -14173,10 +17943,22 @@ class has_forc_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("has_forc_result")
+        oprot.writeStructBegin("delete_user_from_backend_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter322, viter323 in self.success.items():
+                oprot.writeString(
+                    kiter322.encode("utf-8") if sys.version_info[0] == 2 else kiter322
+                )
+                oprot.writeString(
+                    viter323.encode("utf-8") if sys.version_info[0] == 2 else viter323
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 1)
+            self.b.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14195,21 +17977,43 @@ class has_forc_result(object):
         return not (self == other)
 
 
-all_structs.append(has_forc_result)
-has_forc_result.thrift_spec = (
+all_structs.append(delete_user_from_backend_result)
+delete_user_from_backend_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.MAP,
         "success",
-        None,
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "b",
+        [BackendNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class get_forc_access_url_args(object):
+class add_users_to_backend_args(object):
+    """
+    Attributes:
+     - backend_id
+     - user_ids
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        backend_id=None,
+        user_ids=None,
+    ):
+        self.backend_id = backend_id
+        self.user_ids = user_ids
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -14223,6 +18027,25 @@ class get_forc_access_url_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.backend_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.user_ids = []
+                    _etype463, _size462 = iprot.readListBegin()
+                    for _i464 in range(_size462):
+                        _elem465 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.user_ids.append(_elem465)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -14235,7 +18058,20 @@ class get_forc_access_url_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_forc_access_url_args")
+        oprot.writeStructBegin("add_users_to_backend_args")
+        if self.backend_id is not None:
+            oprot.writeFieldBegin("backend_id", TType.I64, 1)
+            oprot.writeI64(self.backend_id)
+            oprot.writeFieldEnd()
+        if self.user_ids is not None:
+            oprot.writeFieldBegin("user_ids", TType.LIST, 2)
+            oprot.writeListBegin(TType.STRING, len(self.user_ids))
+            for iter466 in self.user_ids:
+                oprot.writeString(
+                    iter466.encode("utf-8") if sys.version_info[0] == 2 else iter466
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -14253,14 +18089,31 @@ class get_forc_access_url_args(object):
         return not (self == other)
 
 
-all_structs.append(get_forc_access_url_args)
-get_forc_access_url_args.thrift_spec = ()
+all_structs.append(add_users_to_backend_args)
+add_users_to_backend_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.I64,
+        "backend_id",
+        None,
+        None,
+    ),  # 1
+    (
+        2,
+        TType.LIST,
+        "user_ids",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 2
+)
 
 
-class get_forc_access_url_result(object):
+class add_users_to_backend_result(object):
     """
     Attributes:
      - success
+     - b
 
     """
 
@@ -14269,8 +18122,10 @@ class get_forc_access_url_result(object):
     def __init__(
         self,
         success=None,
+        b=None,
     ):
         self.success = success
+        self.b = b
 
     def read(self, iprot):
         if (
@@ -14286,12 +18141,37 @@ class get_forc_access_url_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.MAP:
+                    self.success = {}
+                    _ktype468, _vtype469, _size467 = iprot.readMapBegin()
+                    for _i470 in range(_size467):
+                        _key471 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val472 = {}
+                        _ktype474, _vtype475, _size473 = iprot.readMapBegin()
+                        for _i476 in range(_size473):
+                            _key477 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val478 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val472[_key477] = _val478
+                        iprot.readMapEnd()
+                        self.success[_key471] = _val472
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.b = BackendNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -14300,20 +18180,38 @@ class get_forc_access_url_result(object):
         iprot.readStructEnd()
 
     def write(self, oprot):
-        self.validate()
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("get_forc_access_url_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
+            return
+        oprot.writeStructBegin("add_users_to_backend_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.MAP, len(self.success))
+            for kiter479, viter480 in self.success.items():
+                oprot.writeString(
+                    kiter479.encode("utf-8") if sys.version_info[0] == 2 else kiter479
+                )
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(viter480))
+                for kiter481, viter482 in viter480.items():
+                    oprot.writeString(
+                        kiter481.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter481
+                    )
+                    oprot.writeString(
+                        viter482.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter482
+                    )
+                oprot.writeMapEnd()
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 1)
+            self.b.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14332,25 +18230,36 @@ class get_forc_access_url_result(object):
         return not (self == other)
 
 
-all_structs.append(get_forc_access_url_result)
-get_forc_access_url_result.thrift_spec = (
+all_structs.append(add_users_to_backend_result)
+add_users_to_backend_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.MAP,
         "success",
-        "UTF8",
+        (
+            TType.STRING,
+            "UTF8",
+            TType.MAP,
+            (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+            False,
+        ),
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "b",
+        [BackendNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class create_backend_args(object):
+class delete_users_from_backend_args(object):
     """
     Attributes:
-     - owner
-     - user_path
-     - template
-     - upstream_url
+     - backend_id
+     - user_ids
 
     """
 
@@ -14358,15 +18267,11 @@ class create_backend_args(object):
 
     def __init__(
         self,
-        owner=None,
-        user_path=None,
-        template=None,
-        upstream_url=None,
+        backend_id=None,
+        user_ids=None,
     ):
-        self.owner = owner
-        self.user_path = user_path
-        self.template = template
-        self.upstream_url = upstream_url
+        self.backend_id = backend_id
+        self.user_ids = user_ids
 
     def read(self, iprot):
         if (
@@ -14382,39 +18287,22 @@ class create_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.owner = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.I64:
+                    self.backend_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.user_path = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.template = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRING:
-                    self.upstream_url = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.LIST:
+                    self.user_ids = []
+                    _etype484, _size483 = iprot.readListBegin()
+                    for _i485 in range(_size483):
+                        _elem486 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.user_ids.append(_elem486)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -14429,36 +18317,19 @@ class create_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_backend_args")
-        if self.owner is not None:
-            oprot.writeFieldBegin("owner", TType.STRING, 1)
-            oprot.writeString(
-                self.owner.encode("utf-8") if sys.version_info[0] == 2 else self.owner
-            )
-            oprot.writeFieldEnd()
-        if self.user_path is not None:
-            oprot.writeFieldBegin("user_path", TType.STRING, 2)
-            oprot.writeString(
-                self.user_path.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.user_path
-            )
-            oprot.writeFieldEnd()
-        if self.template is not None:
-            oprot.writeFieldBegin("template", TType.STRING, 3)
-            oprot.writeString(
-                self.template.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.template
-            )
+        oprot.writeStructBegin("delete_users_from_backend_args")
+        if self.backend_id is not None:
+            oprot.writeFieldBegin("backend_id", TType.I64, 1)
+            oprot.writeI64(self.backend_id)
             oprot.writeFieldEnd()
-        if self.upstream_url is not None:
-            oprot.writeFieldBegin("upstream_url", TType.STRING, 4)
-            oprot.writeString(
-                self.upstream_url.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.upstream_url
-            )
+        if self.user_ids is not None:
+            oprot.writeFieldBegin("user_ids", TType.LIST, 2)
+            oprot.writeListBegin(TType.STRING, len(self.user_ids))
+            for iter487 in self.user_ids:
+                oprot.writeString(
+                    iter487.encode("utf-8") if sys.version_info[0] == 2 else iter487
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14477,46 +18348,31 @@ class create_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(create_backend_args)
-create_backend_args.thrift_spec = (
+all_structs.append(delete_users_from_backend_args)
+delete_users_from_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "owner",
-        "UTF8",
+        TType.I64,
+        "backend_id",
+        None,
         None,
     ),  # 1
     (
         2,
-        TType.STRING,
-        "user_path",
-        "UTF8",
+        TType.LIST,
+        "user_ids",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 2
-    (
-        3,
-        TType.STRING,
-        "template",
-        "UTF8",
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRING,
-        "upstream_url",
-        "UTF8",
-        None,
-    ),  # 4
 )
 
 
-class create_backend_result(object):
+class delete_users_from_backend_result(object):
     """
     Attributes:
      - success
-     - e
-     - d
+     - b
 
     """
 
@@ -14525,12 +18381,10 @@ class create_backend_result(object):
     def __init__(
         self,
         success=None,
-        e=None,
-        d=None,
+        b=None,
     ):
         self.success = success
-        self.e = e
-        self.d = d
+        self.b = b
 
     def read(self, iprot):
         if (
@@ -14546,19 +18400,37 @@ class create_backend_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = Backend()
-                    self.success.read(iprot)
+                if ftype == TType.MAP:
+                    self.success = {}
+                    _ktype489, _vtype490, _size488 = iprot.readMapBegin()
+                    for _i491 in range(_size488):
+                        _key492 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val493 = {}
+                        _ktype495, _vtype496, _size494 = iprot.readMapBegin()
+                        for _i497 in range(_size494):
+                            _key498 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val499 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val493[_key498] = _val499
+                        iprot.readMapEnd()
+                        self.success[_key492] = _val493
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = TemplateNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.d = DefaultException.read(iprot)
+                    self.b = BackendNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -14573,18 +18445,32 @@ class create_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_backend_result")
+        oprot.writeStructBegin("delete_users_from_backend_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.MAP, len(self.success))
+            for kiter500, viter501 in self.success.items():
+                oprot.writeString(
+                    kiter500.encode("utf-8") if sys.version_info[0] == 2 else kiter500
+                )
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(viter501))
+                for kiter502, viter503 in viter501.items():
+                    oprot.writeString(
+                        kiter502.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter502
+                    )
+                    oprot.writeString(
+                        viter503.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter503
+                    )
+                oprot.writeMapEnd()
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
-        if self.d is not None:
-            oprot.writeFieldBegin("d", TType.STRUCT, 2)
-            self.d.write(oprot)
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 1)
+            self.b.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14603,35 +18489,46 @@ class create_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(create_backend_result)
-create_backend_result.thrift_spec = (
+all_structs.append(delete_users_from_backend_result)
+delete_users_from_backend_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.MAP,
         "success",
-        [Backend, None],
+        (
+            TType.STRING,
+            "UTF8",
+            TType.MAP,
+            (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+            False,
+        ),
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "e",
-        [TemplateNotFoundException, None],
+        "b",
+        [BackendNotFoundException, None],
         None,
     ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "d",
-        [DefaultException, None],
-        None,
-    ),  # 2
 )
 
 
-class get_backends_args(object):
+class activate_auth_for_backend_args(object):
+    """
+    Attributes:
+     - backend_id
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        backend_id=None,
+    ):
+        self.backend_id = backend_id
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -14645,6 +18542,11 @@ class get_backends_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.backend_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -14657,7 +18559,11 @@ class get_backends_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_args")
+        oprot.writeStructBegin("activate_auth_for_backend_args")
+        if self.backend_id is not None:
+            oprot.writeFieldBegin("backend_id", TType.I64, 1)
+            oprot.writeI64(self.backend_id)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -14675,15 +18581,24 @@ class get_backends_args(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_args)
-get_backends_args.thrift_spec = ()
+all_structs.append(activate_auth_for_backend_args)
+activate_auth_for_backend_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.I64,
+        "backend_id",
+        None,
+        None,
+    ),  # 1
+)
 
 
-class get_backends_result(object):
+class activate_auth_for_backend_result(object):
     """
     Attributes:
      - success
-     - d
+     - b
 
     """
 
@@ -14692,10 +18607,10 @@ class get_backends_result(object):
     def __init__(
         self,
         success=None,
-        d=None,
+        b=None,
     ):
         self.success = success
-        self.d = d
+        self.b = b
 
     def read(self, iprot):
         if (
@@ -14711,19 +18626,14 @@ class get_backends_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype281, _size278 = iprot.readListBegin()
-                    for _i282 in range(_size278):
-                        _elem283 = Backend()
-                        _elem283.read(iprot)
-                        self.success.append(_elem283)
-                    iprot.readListEnd()
+                if ftype == TType.STRUCT:
+                    self.success = Backend()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.d = DefaultException.read(iprot)
+                    self.b = BackendNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -14738,17 +18648,14 @@ class get_backends_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_result")
+        oprot.writeStructBegin("activate_auth_for_backend_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter284 in self.success:
-                iter284.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
-        if self.d is not None:
-            oprot.writeFieldBegin("d", TType.STRUCT, 1)
-            self.d.write(oprot)
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 1)
+            self.b.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14767,29 +18674,29 @@ class get_backends_result(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_result)
-get_backends_result.thrift_spec = (
+all_structs.append(activate_auth_for_backend_result)
+activate_auth_for_backend_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.STRUCT,
         "success",
-        (TType.STRUCT, [Backend, None], False),
+        [Backend, None],
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "d",
-        [DefaultException, None],
+        "b",
+        [BackendNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class get_backends_by_owner_args(object):
+class deactivate_auth_for_backend_args(object):
     """
     Attributes:
-     - owner
+     - backend_id
 
     """
 
@@ -14797,9 +18704,9 @@ class get_backends_by_owner_args(object):
 
     def __init__(
         self,
-        owner=None,
+        backend_id=None,
     ):
-        self.owner = owner
+        self.backend_id = backend_id
 
     def read(self, iprot):
         if (
@@ -14815,12 +18722,8 @@ class get_backends_by_owner_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.owner = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.I64:
+                    self.backend_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -14835,12 +18738,10 @@ class get_backends_by_owner_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_by_owner_args")
-        if self.owner is not None:
-            oprot.writeFieldBegin("owner", TType.STRING, 1)
-            oprot.writeString(
-                self.owner.encode("utf-8") if sys.version_info[0] == 2 else self.owner
-            )
+        oprot.writeStructBegin("deactivate_auth_for_backend_args")
+        if self.backend_id is not None:
+            oprot.writeFieldBegin("backend_id", TType.I64, 1)
+            oprot.writeI64(self.backend_id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14859,24 +18760,24 @@ class get_backends_by_owner_args(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_by_owner_args)
-get_backends_by_owner_args.thrift_spec = (
+all_structs.append(deactivate_auth_for_backend_args)
+deactivate_auth_for_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "owner",
-        "UTF8",
+        TType.I64,
+        "backend_id",
+        None,
         None,
     ),  # 1
 )
 
 
-class get_backends_by_owner_result(object):
+class deactivate_auth_for_backend_result(object):
     """
     Attributes:
      - success
-     - d
+     - b
 
     """
 
@@ -14885,10 +18786,10 @@ class get_backends_by_owner_result(object):
     def __init__(
         self,
         success=None,
-        d=None,
+        b=None,
     ):
         self.success = success
-        self.d = d
+        self.b = b
 
     def read(self, iprot):
         if (
@@ -14904,19 +18805,14 @@ class get_backends_by_owner_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype288, _size285 = iprot.readListBegin()
-                    for _i289 in range(_size285):
-                        _elem290 = Backend()
-                        _elem290.read(iprot)
-                        self.success.append(_elem290)
-                    iprot.readListEnd()
+                if ftype == TType.STRUCT:
+                    self.success = Backend()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.d = DefaultException.read(iprot)
+                    self.b = BackendNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -14931,17 +18827,14 @@ class get_backends_by_owner_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_by_owner_result")
+        oprot.writeStructBegin("deactivate_auth_for_backend_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter291 in self.success:
-                iter291.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
-        if self.d is not None:
-            oprot.writeFieldBegin("d", TType.STRUCT, 1)
-            self.d.write(oprot)
+        if self.b is not None:
+            oprot.writeFieldBegin("b", TType.STRUCT, 1)
+            self.b.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14960,40 +18853,28 @@ class get_backends_by_owner_result(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_by_owner_result)
-get_backends_by_owner_result.thrift_spec = (
+all_structs.append(deactivate_auth_for_backend_result)
+deactivate_auth_for_backend_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.STRUCT,
         "success",
-        (TType.STRUCT, [Backend, None], False),
+        [Backend, None],
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "d",
-        [DefaultException, None],
+        "b",
+        [BackendNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class get_backends_by_template_args(object):
-    """
-    Attributes:
-     - template
-
-    """
-
+class get_allowed_templates_args(object):
     thrift_spec = None
 
-    def __init__(
-        self,
-        template=None,
-    ):
-        self.template = template
-
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -15007,15 +18888,6 @@ class get_backends_by_template_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.template = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -15028,15 +18900,7 @@ class get_backends_by_template_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_by_template_args")
-        if self.template is not None:
-            oprot.writeFieldBegin("template", TType.STRING, 1)
-            oprot.writeString(
-                self.template.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.template
-            )
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("get_allowed_templates_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -15054,24 +18918,14 @@ class get_backends_by_template_args(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_by_template_args)
-get_backends_by_template_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRING,
-        "template",
-        "UTF8",
-        None,
-    ),  # 1
-)
+all_structs.append(get_allowed_templates_args)
+get_allowed_templates_args.thrift_spec = ()
 
 
-class get_backends_by_template_result(object):
+class get_allowed_templates_result(object):
     """
     Attributes:
      - success
-     - d
 
     """
 
@@ -15080,10 +18934,8 @@ class get_backends_by_template_result(object):
     def __init__(
         self,
         success=None,
-        d=None,
     ):
         self.success = success
-        self.d = d
 
     def read(self, iprot):
         if (
@@ -15101,19 +18953,14 @@ class get_backends_by_template_result(object):
             if fid == 0:
                 if ftype == TType.LIST:
                     self.success = []
-                    _etype295, _size292 = iprot.readListBegin()
-                    for _i296 in range(_size292):
-                        _elem297 = Backend()
-                        _elem297.read(iprot)
-                        self.success.append(_elem297)
+                    _etype327, _size324 = iprot.readListBegin()
+                    for _i328 in range(_size324):
+                        _elem329 = ResearchEnvironmentTemplate()
+                        _elem329.read(iprot)
+                        self.success.append(_elem329)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.d = DefaultException.read(iprot)
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -15126,18 +18973,14 @@ class get_backends_by_template_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_by_template_result")
+        oprot.writeStructBegin("get_allowed_templates_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.LIST, 0)
             oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter298 in self.success:
-                iter298.write(oprot)
+            for iter330 in self.success:
+                iter330.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
-        if self.d is not None:
-            oprot.writeFieldBegin("d", TType.STRUCT, 1)
-            self.d.write(oprot)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -15155,40 +18998,21 @@ class get_backends_by_template_result(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_by_template_result)
-get_backends_by_template_result.thrift_spec = (
+all_structs.append(get_allowed_templates_result)
+get_allowed_templates_result.thrift_spec = (
     (
         0,
         TType.LIST,
         "success",
-        (TType.STRUCT, [Backend, None], False),
+        (TType.STRUCT, [ResearchEnvironmentTemplate, None], False),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "d",
-        [DefaultException, None],
-        None,
-    ),  # 1
 )
 
 
-class get_backend_by_id_args(object):
-    """
-    Attributes:
-     - id
-
-    """
-
+class get_servers_args(object):
     thrift_spec = None
 
-    def __init__(
-        self,
-        id=None,
-    ):
-        self.id = id
-
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -15202,11 +19026,6 @@ class get_backend_by_id_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.I64:
-                    self.id = iprot.readI64()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -15215,15 +19034,11 @@ class get_backend_by_id_args(object):
     def write(self, oprot):
         self.validate()
         if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("get_backend_by_id_args")
-        if self.id is not None:
-            oprot.writeFieldBegin("id", TType.I64, 1)
-            oprot.writeI64(self.id)
-            oprot.writeFieldEnd()
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_servers_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -15241,25 +19056,14 @@ class get_backend_by_id_args(object):
         return not (self == other)
 
 
-all_structs.append(get_backend_by_id_args)
-get_backend_by_id_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.I64,
-        "id",
-        None,
-        None,
-    ),  # 1
-)
+all_structs.append(get_servers_args)
+get_servers_args.thrift_spec = ()
 
 
-class get_backend_by_id_result(object):
+class get_servers_result(object):
     """
     Attributes:
      - success
-     - b
-     - d
 
     """
 
@@ -15268,12 +19072,8 @@ class get_backend_by_id_result(object):
     def __init__(
         self,
         success=None,
-        b=None,
-        d=None,
     ):
         self.success = success
-        self.b = b
-        self.d = d
 
     def read(self, iprot):
         if (
@@ -15289,19 +19089,14 @@ class get_backend_by_id_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = Backend()
-                    self.success.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.b = BackendNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.d = DefaultException.read(iprot)
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype334, _size331 = iprot.readListBegin()
+                    for _i335 in range(_size331):
+                        _elem336 = VM()
+                        _elem336.read(iprot)
+                        self.success.append(_elem336)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -15316,18 +19111,13 @@ class get_backend_by_id_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backend_by_id_result")
+        oprot.writeStructBegin("get_servers_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
-            oprot.writeFieldEnd()
-        if self.b is not None:
-            oprot.writeFieldBegin("b", TType.STRUCT, 1)
-            self.b.write(oprot)
-            oprot.writeFieldEnd()
-        if self.d is not None:
-            oprot.writeFieldBegin("d", TType.STRUCT, 2)
-            self.d.write(oprot)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter337 in self.success:
+                iter337.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15346,37 +19136,22 @@ class get_backend_by_id_result(object):
         return not (self == other)
 
 
-all_structs.append(get_backend_by_id_result)
-get_backend_by_id_result.thrift_spec = (
+all_structs.append(get_servers_result)
+get_servers_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.LIST,
         "success",
-        [Backend, None],
+        (TType.STRUCT, [VM, None], False),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "b",
-        [BackendNotFoundException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "d",
-        [DefaultException, None],
-        None,
-    ),  # 2
 )
 
 
-class set_metadata_server_data_args(object):
+class get_servers_by_ids_args(object):
     """
     Attributes:
-     - ip
-     - metadata
+     - server_ids
 
     """
 
@@ -15384,11 +19159,9 @@ class set_metadata_server_data_args(object):
 
     def __init__(
         self,
-        ip=None,
-        metadata=None,
+        server_ids=None,
     ):
-        self.ip = ip
-        self.metadata = metadata
+        self.server_ids = server_ids
 
     def read(self, iprot):
         if (
@@ -15404,18 +19177,17 @@ class set_metadata_server_data_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.ip = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRUCT:
-                    self.metadata = VirtualMachineServerMetadata()
-                    self.metadata.read(iprot)
+                if ftype == TType.LIST:
+                    self.server_ids = []
+                    _etype341, _size338 = iprot.readListBegin()
+                    for _i342 in range(_size338):
+                        _elem343 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.server_ids.append(_elem343)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -15430,16 +19202,15 @@ class set_metadata_server_data_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("set_metadata_server_data_args")
-        if self.ip is not None:
-            oprot.writeFieldBegin("ip", TType.STRING, 1)
-            oprot.writeString(
-                self.ip.encode("utf-8") if sys.version_info[0] == 2 else self.ip
-            )
-            oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.STRUCT, 3)
-            self.metadata.write(oprot)
+        oprot.writeStructBegin("get_servers_by_ids_args")
+        if self.server_ids is not None:
+            oprot.writeFieldBegin("server_ids", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.server_ids))
+            for iter344 in self.server_ids:
+                oprot.writeString(
+                    iter344.encode("utf-8") if sys.version_info[0] == 2 else iter344
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15458,32 +19229,23 @@ class set_metadata_server_data_args(object):
         return not (self == other)
 
 
-all_structs.append(set_metadata_server_data_args)
-set_metadata_server_data_args.thrift_spec = (
+all_structs.append(get_servers_by_ids_args)
+get_servers_by_ids_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "ip",
-        "UTF8",
+        TType.LIST,
+        "server_ids",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 1
-    None,  # 2
-    (
-        3,
-        TType.STRUCT,
-        "metadata",
-        [VirtualMachineServerMetadata, None],
-        None,
-    ),  # 3
 )
 
 
-class set_metadata_server_data_result(object):
+class get_servers_by_ids_result(object):
     """
     Attributes:
-     - m
-     - b
+     - success
 
     """
 
@@ -15491,11 +19253,9 @@ class set_metadata_server_data_result(object):
 
     def __init__(
         self,
-        m=None,
-        b=None,
+        success=None,
     ):
-        self.m = m
-        self.b = b
+        self.success = success
 
     def read(self, iprot):
         if (
@@ -15510,14 +19270,15 @@ class set_metadata_server_data_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.m = MetadataServerNotAvailableException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.b = MetadataServerNotAllowedException.read(iprot)
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype348, _size345 = iprot.readListBegin()
+                    for _i349 in range(_size345):
+                        _elem350 = VM()
+                        _elem350.read(iprot)
+                        self.success.append(_elem350)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -15532,14 +19293,13 @@ class set_metadata_server_data_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("set_metadata_server_data_result")
-        if self.m is not None:
-            oprot.writeFieldBegin("m", TType.STRUCT, 1)
-            self.m.write(oprot)
-            oprot.writeFieldEnd()
-        if self.b is not None:
-            oprot.writeFieldBegin("b", TType.STRUCT, 2)
-            self.b.write(oprot)
+        oprot.writeStructBegin("get_servers_by_ids_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter351 in self.success:
+                iter351.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15558,41 +19318,21 @@ class set_metadata_server_data_result(object):
         return not (self == other)
 
 
-all_structs.append(set_metadata_server_data_result)
-set_metadata_server_data_result.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRUCT,
-        "m",
-        [MetadataServerNotAvailableException, None],
-        None,
-    ),  # 1
+all_structs.append(get_servers_by_ids_result)
+get_servers_by_ids_result.thrift_spec = (
     (
-        2,
-        TType.STRUCT,
-        "b",
-        [MetadataServerNotAllowedException, None],
+        0,
+        TType.LIST,
+        "success",
+        (TType.STRUCT, [VM, None], False),
         None,
-    ),  # 2
+    ),  # 0
 )
 
 
-class remove_metadata_server_data_args(object):
-    """
-    Attributes:
-     - ip
-
-    """
-
+class get_cluster_supported_ubuntu_os_versions_args(object):
     thrift_spec = None
 
-    def __init__(
-        self,
-        ip=None,
-    ):
-        self.ip = ip
-
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -15606,34 +19346,19 @@ class remove_metadata_server_data_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.ip = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
         iprot.readStructEnd()
 
     def write(self, oprot):
-        self.validate()
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("remove_metadata_server_data_args")
-        if self.ip is not None:
-            oprot.writeFieldBegin("ip", TType.STRING, 1)
-            oprot.writeString(
-                self.ip.encode("utf-8") if sys.version_info[0] == 2 else self.ip
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            oprot.writeFieldEnd()
+            return
+        oprot.writeStructBegin("get_cluster_supported_ubuntu_os_versions_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -15651,24 +19376,14 @@ class remove_metadata_server_data_args(object):
         return not (self == other)
 
 
-all_structs.append(remove_metadata_server_data_args)
-remove_metadata_server_data_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRING,
-        "ip",
-        "UTF8",
-        None,
-    ),  # 1
-)
+all_structs.append(get_cluster_supported_ubuntu_os_versions_args)
+get_cluster_supported_ubuntu_os_versions_args.thrift_spec = ()
 
 
-class remove_metadata_server_data_result(object):
+class get_cluster_supported_ubuntu_os_versions_result(object):
     """
     Attributes:
-     - m
-     - b
+     - success
 
     """
 
@@ -15676,11 +19391,9 @@ class remove_metadata_server_data_result(object):
 
     def __init__(
         self,
-        m=None,
-        b=None,
+        success=None,
     ):
-        self.m = m
-        self.b = b
+        self.success = success
 
     def read(self, iprot):
         if (
@@ -15695,14 +19408,18 @@ class remove_metadata_server_data_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.m = MetadataServerNotAvailableException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.b = MetadataServerNotAllowedException.read(iprot)
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype355, _size352 = iprot.readListBegin()
+                    for _i356 in range(_size352):
+                        _elem357 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success.append(_elem357)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -15717,14 +19434,15 @@ class remove_metadata_server_data_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("remove_metadata_server_data_result")
-        if self.m is not None:
-            oprot.writeFieldBegin("m", TType.STRUCT, 1)
-            self.m.write(oprot)
-            oprot.writeFieldEnd()
-        if self.b is not None:
-            oprot.writeFieldBegin("b", TType.STRUCT, 2)
-            self.b.write(oprot)
+        oprot.writeStructBegin("get_cluster_supported_ubuntu_os_versions_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRING, len(self.success))
+            for iter358 in self.success:
+                oprot.writeString(
+                    iter358.encode("utf-8") if sys.version_info[0] == 2 else iter358
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15743,29 +19461,33 @@ class remove_metadata_server_data_result(object):
         return not (self == other)
 
 
-all_structs.append(remove_metadata_server_data_result)
-remove_metadata_server_data_result.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRUCT,
-        "m",
-        [MetadataServerNotAvailableException, None],
-        None,
-    ),  # 1
+all_structs.append(get_cluster_supported_ubuntu_os_versions_result)
+get_cluster_supported_ubuntu_os_versions_result.thrift_spec = (
     (
-        2,
-        TType.STRUCT,
-        "b",
-        [MetadataServerNotAllowedException, None],
+        0,
+        TType.LIST,
+        "success",
+        (TType.STRING, "UTF8", False),
         None,
-    ),  # 2
+    ),  # 0
 )
 
 
-class is_metadata_server_available_args(object):
+class get_servers_by_bibigrid_id_args(object):
+    """
+    Attributes:
+     - bibigrid_id
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        bibigrid_id=None,
+    ):
+        self.bibigrid_id = bibigrid_id
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -15779,6 +19501,15 @@ class is_metadata_server_available_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.bibigrid_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -15791,7 +19522,15 @@ class is_metadata_server_available_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("is_metadata_server_available_args")
+        oprot.writeStructBegin("get_servers_by_bibigrid_id_args")
+        if self.bibigrid_id is not None:
+            oprot.writeFieldBegin("bibigrid_id", TType.STRING, 1)
+            oprot.writeString(
+                self.bibigrid_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.bibigrid_id
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -15809,16 +19548,23 @@ class is_metadata_server_available_args(object):
         return not (self == other)
 
 
-all_structs.append(is_metadata_server_available_args)
-is_metadata_server_available_args.thrift_spec = ()
+all_structs.append(get_servers_by_bibigrid_id_args)
+get_servers_by_bibigrid_id_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "bibigrid_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
 
 
-class is_metadata_server_available_result(object):
+class get_servers_by_bibigrid_id_result(object):
     """
     Attributes:
      - success
-     - m
-     - b
 
     """
 
@@ -15827,12 +19573,8 @@ class is_metadata_server_available_result(object):
     def __init__(
         self,
         success=None,
-        m=None,
-        b=None,
     ):
         self.success = success
-        self.m = m
-        self.b = b
 
     def read(self, iprot):
         if (
@@ -15848,18 +19590,14 @@ class is_metadata_server_available_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.m = MetadataServerNotAvailableException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.b = MetadataServerNotAllowedException.read(iprot)
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype362, _size359 = iprot.readListBegin()
+                    for _i363 in range(_size359):
+                        _elem364 = VM()
+                        _elem364.read(iprot)
+                        self.success.append(_elem364)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -15874,18 +19612,13 @@ class is_metadata_server_available_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("is_metadata_server_available_result")
+        oprot.writeStructBegin("get_servers_by_bibigrid_id_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
-            oprot.writeFieldEnd()
-        if self.m is not None:
-            oprot.writeFieldBegin("m", TType.STRUCT, 1)
-            self.m.write(oprot)
-            oprot.writeFieldEnd()
-        if self.b is not None:
-            oprot.writeFieldBegin("b", TType.STRUCT, 2)
-            self.b.write(oprot)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter365 in self.success:
+                iter365.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15904,36 +19637,22 @@ class is_metadata_server_available_result(object):
         return not (self == other)
 
 
-all_structs.append(is_metadata_server_available_result)
-is_metadata_server_available_result.thrift_spec = (
+all_structs.append(get_servers_by_bibigrid_id_result)
+get_servers_by_bibigrid_id_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.LIST,
         "success",
-        None,
+        (TType.STRUCT, [VM, None], False),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "m",
-        [MetadataServerNotAvailableException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "b",
-        [MetadataServerNotAllowedException, None],
-        None,
-    ),  # 2
 )
 
 
-class delete_backend_args(object):
+class get_security_group_id_by_name_args(object):
     """
     Attributes:
-     - id
+     - name
 
     """
 
@@ -15941,9 +19660,9 @@ class delete_backend_args(object):
 
     def __init__(
         self,
-        id=None,
+        name=None,
     ):
-        self.id = id
+        self.name = name
 
     def read(self, iprot):
         if (
@@ -15959,8 +19678,12 @@ class delete_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.id = iprot.readI64()
+                if ftype == TType.STRING:
+                    self.name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -15975,10 +19698,12 @@ class delete_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_backend_args")
-        if self.id is not None:
-            oprot.writeFieldBegin("id", TType.I64, 1)
-            oprot.writeI64(self.id)
+        oprot.writeStructBegin("get_security_group_id_by_name_args")
+        if self.name is not None:
+            oprot.writeFieldBegin("name", TType.STRING, 1)
+            oprot.writeString(
+                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15997,23 +19722,24 @@ class delete_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_backend_args)
-delete_backend_args.thrift_spec = (
+all_structs.append(get_security_group_id_by_name_args)
+get_security_group_id_by_name_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I64,
-        "id",
-        None,
+        TType.STRING,
+        "name",
+        "UTF8",
         None,
     ),  # 1
 )
 
 
-class delete_backend_result(object):
+class get_security_group_id_by_name_result(object):
     """
     Attributes:
-     - b
+     - success
+     - s
 
     """
 
@@ -16021,9 +19747,11 @@ class delete_backend_result(object):
 
     def __init__(
         self,
-        b=None,
+        success=None,
+        s=None,
     ):
-        self.b = b
+        self.success = success
+        self.s = s
 
     def read(self, iprot):
         if (
@@ -16038,9 +19766,18 @@ class delete_backend_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.b = BackendNotFoundException.read(iprot)
+                    self.s = SecurityGroupNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -16055,10 +19792,18 @@ class delete_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_backend_result")
-        if self.b is not None:
-            oprot.writeFieldBegin("b", TType.STRUCT, 1)
-            self.b.write(oprot)
+        oprot.writeStructBegin("get_security_group_id_by_name_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 1)
+            self.s.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16077,24 +19822,35 @@ class delete_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_backend_result)
-delete_backend_result.thrift_spec = (
-    None,  # 0
+all_structs.append(get_security_group_id_by_name_result)
+get_security_group_id_by_name_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
     (
         1,
         TType.STRUCT,
-        "b",
-        [BackendNotFoundException, None],
+        "s",
+        [SecurityGroupNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class add_user_to_backend_args(object):
+class scale_up_cluster_args(object):
     """
     Attributes:
-     - backend_id
-     - user_id
+     - cluster_id
+     - image_name
+     - flavor_name
+     - count
+     - names
+     - start_idx
+     - batch_idx
 
     """
 
@@ -16102,11 +19858,21 @@ class add_user_to_backend_args(object):
 
     def __init__(
         self,
-        backend_id=None,
-        user_id=None,
+        cluster_id=None,
+        image_name=None,
+        flavor_name=None,
+        count=None,
+        names=None,
+        start_idx=None,
+        batch_idx=None,
     ):
-        self.backend_id = backend_id
-        self.user_id = user_id
+        self.cluster_id = cluster_id
+        self.image_name = image_name
+        self.flavor_name = flavor_name
+        self.count = count
+        self.names = names
+        self.start_idx = start_idx
+        self.batch_idx = batch_idx
 
     def read(self, iprot):
         if (
@@ -16122,19 +19888,61 @@ class add_user_to_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.backend_id = iprot.readI64()
+                if ftype == TType.STRING:
+                    self.cluster_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRING:
-                    self.user_id = (
+                    self.image_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.flavor_name = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I32:
+                    self.count = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.LIST:
+                    self.names = []
+                    _etype369, _size366 = iprot.readListBegin()
+                    for _i370 in range(_size366):
+                        _elem371 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.names.append(_elem371)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.I32:
+                    self.start_idx = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.I32:
+                    self.batch_idx = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -16147,19 +19955,52 @@ class add_user_to_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_user_to_backend_args")
-        if self.backend_id is not None:
-            oprot.writeFieldBegin("backend_id", TType.I64, 1)
-            oprot.writeI64(self.backend_id)
+        oprot.writeStructBegin("scale_up_cluster_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+            oprot.writeString(
+                self.cluster_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_id
+            )
             oprot.writeFieldEnd()
-        if self.user_id is not None:
-            oprot.writeFieldBegin("user_id", TType.STRING, 2)
+        if self.image_name is not None:
+            oprot.writeFieldBegin("image_name", TType.STRING, 2)
             oprot.writeString(
-                self.user_id.encode("utf-8")
+                self.image_name.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.user_id
+                else self.image_name
+            )
+            oprot.writeFieldEnd()
+        if self.flavor_name is not None:
+            oprot.writeFieldBegin("flavor_name", TType.STRING, 3)
+            oprot.writeString(
+                self.flavor_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.flavor_name
             )
             oprot.writeFieldEnd()
+        if self.count is not None:
+            oprot.writeFieldBegin("count", TType.I32, 4)
+            oprot.writeI32(self.count)
+            oprot.writeFieldEnd()
+        if self.names is not None:
+            oprot.writeFieldBegin("names", TType.LIST, 5)
+            oprot.writeListBegin(TType.STRING, len(self.names))
+            for iter372 in self.names:
+                oprot.writeString(
+                    iter372.encode("utf-8") if sys.version_info[0] == 2 else iter372
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.start_idx is not None:
+            oprot.writeFieldBegin("start_idx", TType.I32, 6)
+            oprot.writeI32(self.start_idx)
+            oprot.writeFieldEnd()
+        if self.batch_idx is not None:
+            oprot.writeFieldBegin("batch_idx", TType.I32, 7)
+            oprot.writeI32(self.batch_idx)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -16177,31 +20018,65 @@ class add_user_to_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(add_user_to_backend_args)
-add_user_to_backend_args.thrift_spec = (
+all_structs.append(scale_up_cluster_args)
+scale_up_cluster_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I64,
-        "backend_id",
-        None,
+        TType.STRING,
+        "cluster_id",
+        "UTF8",
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "user_id",
+        "image_name",
         "UTF8",
         None,
     ),  # 2
+    (
+        3,
+        TType.STRING,
+        "flavor_name",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.I32,
+        "count",
+        None,
+        None,
+    ),  # 4
+    (
+        5,
+        TType.LIST,
+        "names",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 5
+    (
+        6,
+        TType.I32,
+        "start_idx",
+        None,
+        None,
+    ),  # 6
+    (
+        7,
+        TType.I32,
+        "batch_idx",
+        None,
+        None,
+    ),  # 7
 )
 
 
-class add_user_to_backend_result(object):
+class scale_up_cluster_result(object):
     """
     Attributes:
      - success
-     - b
 
     """
 
@@ -16210,10 +20085,8 @@ class add_user_to_backend_result(object):
     def __init__(
         self,
         success=None,
-        b=None,
     ):
         self.success = success
-        self.b = b
 
     def read(self, iprot):
         if (
@@ -16231,27 +20104,27 @@ class add_user_to_backend_result(object):
             if fid == 0:
                 if ftype == TType.MAP:
                     self.success = {}
-                    _ktype300, _vtype301, _size299 = iprot.readMapBegin()
-                    for _i303 in range(_size299):
-                        _key304 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val305 = (
+                    _ktype374, _vtype375, _size373 = iprot.readMapBegin()
+                    for _i377 in range(_size373):
+                        _key378 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.success[_key304] = _val305
+                        _val379 = []
+                        _etype383, _size380 = iprot.readListBegin()
+                        for _i384 in range(_size380):
+                            _elem385 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val379.append(_elem385)
+                        iprot.readListEnd()
+                        self.success[_key378] = _val379
                     iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.b = BackendNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -16264,23 +20137,22 @@ class add_user_to_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_user_to_backend_result")
+        oprot.writeStructBegin("scale_up_cluster_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter306, viter307 in self.success.items():
-                oprot.writeString(
-                    kiter306.encode("utf-8") if sys.version_info[0] == 2 else kiter306
-                )
+            oprot.writeMapBegin(TType.STRING, TType.LIST, len(self.success))
+            for kiter386, viter387 in self.success.items():
                 oprot.writeString(
-                    viter307.encode("utf-8") if sys.version_info[0] == 2 else viter307
+                    kiter386.encode("utf-8") if sys.version_info[0] == 2 else kiter386
                 )
+                oprot.writeListBegin(TType.STRING, len(viter387))
+                for iter388 in viter387:
+                    oprot.writeString(
+                        iter388.encode("utf-8") if sys.version_info[0] == 2 else iter388
+                    )
+                oprot.writeListEnd()
             oprot.writeMapEnd()
             oprot.writeFieldEnd()
-        if self.b is not None:
-            oprot.writeFieldBegin("b", TType.STRUCT, 1)
-            self.b.write(oprot)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -16298,29 +20170,30 @@ class add_user_to_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(add_user_to_backend_result)
-add_user_to_backend_result.thrift_spec = (
+all_structs.append(scale_up_cluster_result)
+scale_up_cluster_result.thrift_spec = (
     (
         0,
         TType.MAP,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        (TType.STRING, "UTF8", TType.LIST, (TType.STRING, "UTF8", False), False),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "b",
-        [BackendNotFoundException, None],
-        None,
-    ),  # 1
 )
 
 
-class get_users_from_backend_args(object):
+class add_cluster_machine_args(object):
     """
     Attributes:
-     - backend_id
+     - cluster_id
+     - cluster_user
+     - cluster_group_id
+     - image_name
+     - flavor_name
+     - name
+     - key_name
+     - batch_idx
+     - worker_idx
 
     """
 
@@ -16328,9 +20201,25 @@ class get_users_from_backend_args(object):
 
     def __init__(
         self,
-        backend_id=None,
+        cluster_id=None,
+        cluster_user=None,
+        cluster_group_id=None,
+        image_name=None,
+        flavor_name=None,
+        name=None,
+        key_name=None,
+        batch_idx=None,
+        worker_idx=None,
     ):
-        self.backend_id = backend_id
+        self.cluster_id = cluster_id
+        self.cluster_user = cluster_user
+        self.cluster_group_id = cluster_group_id
+        self.image_name = image_name
+        self.flavor_name = flavor_name
+        self.name = name
+        self.key_name = key_name
+        self.batch_idx = batch_idx
+        self.worker_idx = worker_idx
 
     def read(self, iprot):
         if (
@@ -16346,8 +20235,76 @@ class get_users_from_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.backend_id = iprot.readI64()
+                if ftype == TType.STRING:
+                    self.cluster_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.cluster_user = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.cluster_group_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.image_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.flavor_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRING:
+                    self.key_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.I32:
+                    self.batch_idx = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.I32:
+                    self.worker_idx = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -16362,10 +20319,68 @@ class get_users_from_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_users_from_backend_args")
-        if self.backend_id is not None:
-            oprot.writeFieldBegin("backend_id", TType.I64, 1)
-            oprot.writeI64(self.backend_id)
+        oprot.writeStructBegin("add_cluster_machine_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+            oprot.writeString(
+                self.cluster_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_id
+            )
+            oprot.writeFieldEnd()
+        if self.cluster_user is not None:
+            oprot.writeFieldBegin("cluster_user", TType.STRING, 2)
+            oprot.writeString(
+                self.cluster_user.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_user
+            )
+            oprot.writeFieldEnd()
+        if self.cluster_group_id is not None:
+            oprot.writeFieldBegin("cluster_group_id", TType.STRING, 3)
+            oprot.writeString(
+                self.cluster_group_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_group_id
+            )
+            oprot.writeFieldEnd()
+        if self.image_name is not None:
+            oprot.writeFieldBegin("image_name", TType.STRING, 4)
+            oprot.writeString(
+                self.image_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.image_name
+            )
+            oprot.writeFieldEnd()
+        if self.flavor_name is not None:
+            oprot.writeFieldBegin("flavor_name", TType.STRING, 5)
+            oprot.writeString(
+                self.flavor_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.flavor_name
+            )
+            oprot.writeFieldEnd()
+        if self.name is not None:
+            oprot.writeFieldBegin("name", TType.STRING, 6)
+            oprot.writeString(
+                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
+            )
+            oprot.writeFieldEnd()
+        if self.key_name is not None:
+            oprot.writeFieldBegin("key_name", TType.STRING, 7)
+            oprot.writeString(
+                self.key_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.key_name
+            )
+            oprot.writeFieldEnd()
+        if self.batch_idx is not None:
+            oprot.writeFieldBegin("batch_idx", TType.I32, 8)
+            oprot.writeI32(self.batch_idx)
+            oprot.writeFieldEnd()
+        if self.worker_idx is not None:
+            oprot.writeFieldBegin("worker_idx", TType.I32, 9)
+            oprot.writeI32(self.worker_idx)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16384,24 +20399,79 @@ class get_users_from_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(get_users_from_backend_args)
-get_users_from_backend_args.thrift_spec = (
+all_structs.append(add_cluster_machine_args)
+add_cluster_machine_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I64,
-        "backend_id",
+        TType.STRING,
+        "cluster_id",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "cluster_user",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "cluster_group_id",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "image_name",
+        "UTF8",
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRING,
+        "flavor_name",
+        "UTF8",
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRING,
+        "name",
+        "UTF8",
+        None,
+    ),  # 6
+    (
+        7,
+        TType.STRING,
+        "key_name",
+        "UTF8",
+        None,
+    ),  # 7
+    (
+        8,
+        TType.I32,
+        "batch_idx",
+        None,
+        None,
+    ),  # 8
+    (
+        9,
+        TType.I32,
+        "worker_idx",
         None,
         None,
-    ),  # 1
+    ),  # 9
 )
 
 
-class get_users_from_backend_result(object):
+class add_cluster_machine_result(object):
     """
     Attributes:
      - success
-     - b
 
     """
 
@@ -16410,10 +20480,8 @@ class get_users_from_backend_result(object):
     def __init__(
         self,
         success=None,
-        b=None,
     ):
         self.success = success
-        self.b = b
 
     def read(self, iprot):
         if (
@@ -16429,22 +20497,12 @@ class get_users_from_backend_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype311, _size308 = iprot.readListBegin()
-                    for _i312 in range(_size308):
-                        _elem313 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success.append(_elem313)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.b = BackendNotFoundException.read(iprot)
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -16459,19 +20517,14 @@ class get_users_from_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_users_from_backend_result")
+        oprot.writeStructBegin("add_cluster_machine_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRING, len(self.success))
-            for iter314 in self.success:
-                oprot.writeString(
-                    iter314.encode("utf-8") if sys.version_info[0] == 2 else iter314
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.b is not None:
-            oprot.writeFieldBegin("b", TType.STRUCT, 1)
-            self.b.write(oprot)
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16490,30 +20543,22 @@ class get_users_from_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(get_users_from_backend_result)
-get_users_from_backend_result.thrift_spec = (
+all_structs.append(add_cluster_machine_result)
+add_cluster_machine_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.STRING,
         "success",
-        (TType.STRING, "UTF8", False),
+        "UTF8",
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "b",
-        [BackendNotFoundException, None],
-        None,
-    ),  # 1
 )
 
 
-class delete_user_from_backend_args(object):
+class get_cluster_info_args(object):
     """
     Attributes:
-     - backend_id
-     - user_id
+     - cluster_id
 
     """
 
@@ -16521,11 +20566,9 @@ class delete_user_from_backend_args(object):
 
     def __init__(
         self,
-        backend_id=None,
-        user_id=None,
+        cluster_id=None,
     ):
-        self.backend_id = backend_id
-        self.user_id = user_id
+        self.cluster_id = cluster_id
 
     def read(self, iprot):
         if (
@@ -16541,13 +20584,8 @@ class delete_user_from_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.backend_id = iprot.readI64()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
                 if ftype == TType.STRING:
-                    self.user_id = (
+                    self.cluster_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -16566,17 +20604,13 @@ class delete_user_from_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_user_from_backend_args")
-        if self.backend_id is not None:
-            oprot.writeFieldBegin("backend_id", TType.I64, 1)
-            oprot.writeI64(self.backend_id)
-            oprot.writeFieldEnd()
-        if self.user_id is not None:
-            oprot.writeFieldBegin("user_id", TType.STRING, 2)
+        oprot.writeStructBegin("get_cluster_info_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
             oprot.writeString(
-                self.user_id.encode("utf-8")
+                self.cluster_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.user_id
+                else self.cluster_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -16596,31 +20630,24 @@ class delete_user_from_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_user_from_backend_args)
-delete_user_from_backend_args.thrift_spec = (
+all_structs.append(get_cluster_info_args)
+get_cluster_info_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I64,
-        "backend_id",
-        None,
-        None,
-    ),  # 1
-    (
-        2,
         TType.STRING,
-        "user_id",
+        "cluster_id",
         "UTF8",
         None,
-    ),  # 2
+    ),  # 1
 )
 
 
-class delete_user_from_backend_result(object):
+class get_cluster_info_result(object):
     """
     Attributes:
      - success
-     - b
+     - c
 
     """
 
@@ -16629,10 +20656,10 @@ class delete_user_from_backend_result(object):
     def __init__(
         self,
         success=None,
-        b=None,
+        c=None,
     ):
         self.success = success
-        self.b = b
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -16648,27 +20675,14 @@ class delete_user_from_backend_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    _ktype316, _vtype317, _size315 = iprot.readMapBegin()
-                    for _i319 in range(_size315):
-                        _key320 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val321 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key320] = _val321
-                    iprot.readMapEnd()
+                if ftype == TType.STRUCT:
+                    self.success = ClusterInfo()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.b = BackendNotFoundException.read(iprot)
+                    self.c = ClusterNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -16683,22 +20697,14 @@ class delete_user_from_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_user_from_backend_result")
+        oprot.writeStructBegin("get_cluster_info_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter322, viter323 in self.success.items():
-                oprot.writeString(
-                    kiter322.encode("utf-8") if sys.version_info[0] == 2 else kiter322
-                )
-                oprot.writeString(
-                    viter323.encode("utf-8") if sys.version_info[0] == 2 else viter323
-                )
-            oprot.writeMapEnd()
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
-        if self.b is not None:
-            oprot.writeFieldBegin("b", TType.STRUCT, 1)
-            self.b.write(oprot)
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 1)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16717,29 +20723,29 @@ class delete_user_from_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_user_from_backend_result)
-delete_user_from_backend_result.thrift_spec = (
+all_structs.append(get_cluster_info_result)
+get_cluster_info_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.STRUCT,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        [ClusterInfo, None],
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "b",
-        [BackendNotFoundException, None],
+        "c",
+        [ClusterNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class activate_auth_for_backend_args(object):
+class get_cluster_log_args(object):
     """
     Attributes:
-     - backend_id
+     - cluster_id
 
     """
 
@@ -16747,9 +20753,9 @@ class activate_auth_for_backend_args(object):
 
     def __init__(
         self,
-        backend_id=None,
+        cluster_id=None,
     ):
-        self.backend_id = backend_id
+        self.cluster_id = cluster_id
 
     def read(self, iprot):
         if (
@@ -16765,8 +20771,12 @@ class activate_auth_for_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.backend_id = iprot.readI64()
+                if ftype == TType.STRING:
+                    self.cluster_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -16781,10 +20791,14 @@ class activate_auth_for_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("activate_auth_for_backend_args")
-        if self.backend_id is not None:
-            oprot.writeFieldBegin("backend_id", TType.I64, 1)
-            oprot.writeI64(self.backend_id)
+        oprot.writeStructBegin("get_cluster_log_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+            oprot.writeString(
+                self.cluster_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_id
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16803,24 +20817,24 @@ class activate_auth_for_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(activate_auth_for_backend_args)
-activate_auth_for_backend_args.thrift_spec = (
+all_structs.append(get_cluster_log_args)
+get_cluster_log_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I64,
-        "backend_id",
-        None,
+        TType.STRING,
+        "cluster_id",
+        "UTF8",
         None,
     ),  # 1
 )
 
 
-class activate_auth_for_backend_result(object):
+class get_cluster_log_result(object):
     """
     Attributes:
      - success
-     - b
+     - c
 
     """
 
@@ -16829,10 +20843,10 @@ class activate_auth_for_backend_result(object):
     def __init__(
         self,
         success=None,
-        b=None,
+        c=None,
     ):
         self.success = success
-        self.b = b
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -16849,13 +20863,13 @@ class activate_auth_for_backend_result(object):
                 break
             if fid == 0:
                 if ftype == TType.STRUCT:
-                    self.success = Backend()
+                    self.success = ClusterLog()
                     self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.b = BackendNotFoundException.read(iprot)
+                    self.c = ClusterNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -16870,14 +20884,14 @@ class activate_auth_for_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("activate_auth_for_backend_result")
+        oprot.writeStructBegin("get_cluster_log_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.STRUCT, 0)
             self.success.write(oprot)
             oprot.writeFieldEnd()
-        if self.b is not None:
-            oprot.writeFieldBegin("b", TType.STRUCT, 1)
-            self.b.write(oprot)
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 1)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16896,29 +20910,30 @@ class activate_auth_for_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(activate_auth_for_backend_result)
-activate_auth_for_backend_result.thrift_spec = (
+all_structs.append(get_cluster_log_result)
+get_cluster_log_result.thrift_spec = (
     (
         0,
         TType.STRUCT,
         "success",
-        [Backend, None],
+        [ClusterLog, None],
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "b",
-        [BackendNotFoundException, None],
+        "c",
+        [ClusterNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class deactivate_auth_for_backend_args(object):
+class get_cluster_log_tail_args(object):
     """
     Attributes:
-     - backend_id
+     - cluster_id
+     - offset
 
     """
 
@@ -16926,9 +20941,11 @@ class deactivate_auth_for_backend_args(object):
 
     def __init__(
         self,
-        backend_id=None,
+        cluster_id=None,
+        offset=None,
     ):
-        self.backend_id = backend_id
+        self.cluster_id = cluster_id
+        self.offset = offset
 
     def read(self, iprot):
         if (
@@ -16944,8 +20961,17 @@ class deactivate_auth_for_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
+                if ftype == TType.STRING:
+                    self.cluster_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
                 if ftype == TType.I64:
-                    self.backend_id = iprot.readI64()
+                    self.offset = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -16960,10 +20986,18 @@ class deactivate_auth_for_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("deactivate_auth_for_backend_args")
-        if self.backend_id is not None:
-            oprot.writeFieldBegin("backend_id", TType.I64, 1)
-            oprot.writeI64(self.backend_id)
+        oprot.writeStructBegin("get_cluster_log_tail_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+            oprot.writeString(
+                self.cluster_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_id
+            )
+            oprot.writeFieldEnd()
+        if self.offset is not None:
+            oprot.writeFieldBegin("offset", TType.I64, 2)
+            oprot.writeI64(self.offset)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16982,24 +21016,31 @@ class deactivate_auth_for_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(deactivate_auth_for_backend_args)
-deactivate_auth_for_backend_args.thrift_spec = (
+all_structs.append(get_cluster_log_tail_args)
+get_cluster_log_tail_args.thrift_spec = (
     None,  # 0
     (
         1,
+        TType.STRING,
+        "cluster_id",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
         TType.I64,
-        "backend_id",
+        "offset",
         None,
         None,
-    ),  # 1
+    ),  # 2
 )
 
 
-class deactivate_auth_for_backend_result(object):
+class get_cluster_log_tail_result(object):
     """
     Attributes:
      - success
-     - b
+     - c
 
     """
 
@@ -17008,10 +21049,10 @@ class deactivate_auth_for_backend_result(object):
     def __init__(
         self,
         success=None,
-        b=None,
+        c=None,
     ):
         self.success = success
-        self.b = b
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -17028,13 +21069,13 @@ class deactivate_auth_for_backend_result(object):
                 break
             if fid == 0:
                 if ftype == TType.STRUCT:
-                    self.success = Backend()
+                    self.success = ClusterLog()
                     self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.b = BackendNotFoundException.read(iprot)
+                    self.c = ClusterNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -17049,14 +21090,14 @@ class deactivate_auth_for_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("deactivate_auth_for_backend_result")
+        oprot.writeStructBegin("get_cluster_log_tail_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.STRUCT, 0)
             self.success.write(oprot)
             oprot.writeFieldEnd()
-        if self.b is not None:
-            oprot.writeFieldBegin("b", TType.STRUCT, 1)
-            self.b.write(oprot)
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 1)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -17075,28 +21116,40 @@ class deactivate_auth_for_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(deactivate_auth_for_backend_result)
-deactivate_auth_for_backend_result.thrift_spec = (
+all_structs.append(get_cluster_log_tail_result)
+get_cluster_log_tail_result.thrift_spec = (
     (
         0,
         TType.STRUCT,
         "success",
-        [Backend, None],
+        [ClusterLog, None],
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "b",
-        [BackendNotFoundException, None],
+        "c",
+        [ClusterNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class get_allowed_templates_args(object):
+class get_cluster_state_args(object):
+    """
+    Attributes:
+     - cluster_id
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        cluster_id=None,
+    ):
+        self.cluster_id = cluster_id
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -17110,6 +21163,15 @@ class get_allowed_templates_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.cluster_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -17122,7 +21184,15 @@ class get_allowed_templates_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_allowed_templates_args")
+        oprot.writeStructBegin("get_cluster_state_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+            oprot.writeString(
+                self.cluster_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_id
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -17140,14 +21210,24 @@ class get_allowed_templates_args(object):
         return not (self == other)
 
 
-all_structs.append(get_allowed_templates_args)
-get_allowed_templates_args.thrift_spec = ()
+all_structs.append(get_cluster_state_args)
+get_cluster_state_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "cluster_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
 
 
-class get_allowed_templates_result(object):
+class get_cluster_state_result(object):
     """
     Attributes:
      - success
+     - c
 
     """
 
@@ -17156,8 +21236,10 @@ class get_allowed_templates_result(object):
     def __init__(
         self,
         success=None,
+        c=None,
     ):
         self.success = success
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -17173,14 +21255,14 @@ class get_allowed_templates_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype327, _size324 = iprot.readListBegin()
-                    for _i328 in range(_size324):
-                        _elem329 = ResearchEnvironmentTemplate()
-                        _elem329.read(iprot)
-                        self.success.append(_elem329)
-                    iprot.readListEnd()
+                if ftype == TType.STRUCT:
+                    self.success = ClusterState()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.c = ClusterNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -17195,13 +21277,14 @@ class get_allowed_templates_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_allowed_templates_result")
+        oprot.writeStructBegin("get_cluster_state_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter330 in self.success:
-                iter330.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 1)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -17220,21 +21303,40 @@ class get_allowed_templates_result(object):
         return not (self == other)
 
 
-all_structs.append(get_allowed_templates_result)
-get_allowed_templates_result.thrift_spec = (
+all_structs.append(get_cluster_state_result)
+get_cluster_state_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.STRUCT,
         "success",
-        (TType.STRUCT, [ResearchEnvironmentTemplate, None], False),
+        [ClusterState, None],
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "c",
+        [ClusterNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class get_servers_args(object):
+class get_cluster_states_args(object):
+    """
+    Attributes:
+     - cluster_ids
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        cluster_ids=None,
+    ):
+        self.cluster_ids = cluster_ids
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -17248,6 +21350,20 @@ class get_servers_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.cluster_ids = []
+                    _etype505, _size504 = iprot.readListBegin()
+                    for _i506 in range(_size504):
+                        _elem507 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.cluster_ids.append(_elem507)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -17260,7 +21376,16 @@ class get_servers_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_args")
+        oprot.writeStructBegin("get_cluster_states_args")
+        if self.cluster_ids is not None:
+            oprot.writeFieldBegin("cluster_ids", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.cluster_ids))
+            for iter508 in self.cluster_ids:
+                oprot.writeString(
+                    iter508.encode("utf-8") if sys.version_info[0] == 2 else iter508
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -17278,11 +21403,20 @@ class get_servers_args(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_args)
-get_servers_args.thrift_spec = ()
+all_structs.append(get_cluster_states_args)
+get_cluster_states_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.LIST,
+        "cluster_ids",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 1
+)
 
 
-class get_servers_result(object):
+class get_cluster_states_result(object):
     """
     Attributes:
      - success
@@ -17311,14 +21445,19 @@ class get_servers_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype334, _size331 = iprot.readListBegin()
-                    for _i335 in range(_size331):
-                        _elem336 = VM()
-                        _elem336.read(iprot)
-                        self.success.append(_elem336)
-                    iprot.readListEnd()
+                if ftype == TType.MAP:
+                    self.success = {}
+                    _ktype510, _vtype511, _size509 = iprot.readMapBegin()
+                    for _i512 in range(_size509):
+                        _key513 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val514 = ClusterState()
+                        _val514.read(iprot)
+                        self.success[_key513] = _val514
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -17333,13 +21472,16 @@ class get_servers_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_result")
+        oprot.writeStructBegin("get_cluster_states_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter337 in self.success:
-                iter337.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRUCT, len(self.success))
+            for kiter515, viter516 in self.success.items():
+                oprot.writeString(
+                    kiter515.encode("utf-8") if sys.version_info[0] == 2 else kiter515
+                )
+                viter516.write(oprot)
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -17358,22 +21500,22 @@ class get_servers_result(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_result)
-get_servers_result.thrift_spec = (
+all_structs.append(get_cluster_states_result)
+get_cluster_states_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.MAP,
         "success",
-        (TType.STRUCT, [VM, None], False),
+        (TType.STRING, "UTF8", TType.STRUCT, [ClusterState, None], False),
         None,
     ),  # 0
 )
 
 
-class get_servers_by_ids_args(object):
+class get_keypair_public_key_by_name_args(object):
     """
     Attributes:
-     - server_ids
+     - key_name
 
     """
 
@@ -17381,9 +21523,9 @@ class get_servers_by_ids_args(object):
 
     def __init__(
         self,
-        server_ids=None,
+        key_name=None,
     ):
-        self.server_ids = server_ids
+        self.key_name = key_name
 
     def read(self, iprot):
         if (
@@ -17399,17 +21541,12 @@ class get_servers_by_ids_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.LIST:
-                    self.server_ids = []
-                    _etype341, _size338 = iprot.readListBegin()
-                    for _i342 in range(_size338):
-                        _elem343 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.server_ids.append(_elem343)
-                    iprot.readListEnd()
+                if ftype == TType.STRING:
+                    self.key_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -17424,15 +21561,14 @@ class get_servers_by_ids_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_by_ids_args")
-        if self.server_ids is not None:
-            oprot.writeFieldBegin("server_ids", TType.LIST, 1)
-            oprot.writeListBegin(TType.STRING, len(self.server_ids))
-            for iter344 in self.server_ids:
-                oprot.writeString(
-                    iter344.encode("utf-8") if sys.version_info[0] == 2 else iter344
-                )
-            oprot.writeListEnd()
+        oprot.writeStructBegin("get_keypair_public_key_by_name_args")
+        if self.key_name is not None:
+            oprot.writeFieldBegin("key_name", TType.STRING, 1)
+            oprot.writeString(
+                self.key_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.key_name
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -17450,21 +21586,21 @@ class get_servers_by_ids_args(object):
     def __ne__(self, other):
         return not (self == other)
 
-
-all_structs.append(get_servers_by_ids_args)
-get_servers_by_ids_args.thrift_spec = (
+
+all_structs.append(get_keypair_public_key_by_name_args)
+get_keypair_public_key_by_name_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.LIST,
-        "server_ids",
-        (TType.STRING, "UTF8", False),
+        TType.STRING,
+        "key_name",
+        "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_servers_by_ids_result(object):
+class get_keypair_public_key_by_name_result(object):
     """
     Attributes:
      - success
@@ -17493,14 +21629,12 @@ class get_servers_by_ids_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype348, _size345 = iprot.readListBegin()
-                    for _i349 in range(_size345):
-                        _elem350 = VM()
-                        _elem350.read(iprot)
-                        self.success.append(_elem350)
-                    iprot.readListEnd()
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -17515,13 +21649,14 @@ class get_servers_by_ids_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_by_ids_result")
+        oprot.writeStructBegin("get_keypair_public_key_by_name_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter351 in self.success:
-                iter351.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -17540,21 +21675,33 @@ class get_servers_by_ids_result(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_by_ids_result)
-get_servers_by_ids_result.thrift_spec = (
+all_structs.append(get_keypair_public_key_by_name_result)
+get_keypair_public_key_by_name_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.STRING,
         "success",
-        (TType.STRUCT, [VM, None], False),
+        "UTF8",
         None,
     ),  # 0
 )
 
 
-class get_cluster_supported_ubuntu_os_versions_args(object):
+class delete_keypair_args(object):
+    """
+    Attributes:
+     - key_name
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        key_name=None,
+    ):
+        self.key_name = key_name
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -17568,6 +21715,15 @@ class get_cluster_supported_ubuntu_os_versions_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.key_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -17580,7 +21736,15 @@ class get_cluster_supported_ubuntu_os_versions_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_supported_ubuntu_os_versions_args")
+        oprot.writeStructBegin("delete_keypair_args")
+        if self.key_name is not None:
+            oprot.writeFieldBegin("key_name", TType.STRING, 1)
+            oprot.writeString(
+                self.key_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.key_name
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -17598,25 +21762,22 @@ class get_cluster_supported_ubuntu_os_versions_args(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_supported_ubuntu_os_versions_args)
-get_cluster_supported_ubuntu_os_versions_args.thrift_spec = ()
-
-
-class get_cluster_supported_ubuntu_os_versions_result(object):
-    """
-    Attributes:
-     - success
+all_structs.append(delete_keypair_args)
+delete_keypair_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "key_name",
+        "UTF8",
+        None,
+    ),  # 1
+)
 
-    """
 
+class delete_keypair_result(object):
     thrift_spec = None
 
-    def __init__(
-        self,
-        success=None,
-    ):
-        self.success = success
-
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -17630,20 +21791,6 @@ class get_cluster_supported_ubuntu_os_versions_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype355, _size352 = iprot.readListBegin()
-                    for _i356 in range(_size352):
-                        _elem357 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success.append(_elem357)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -17656,16 +21803,7 @@ class get_cluster_supported_ubuntu_os_versions_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_supported_ubuntu_os_versions_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRING, len(self.success))
-            for iter358 in self.success:
-                oprot.writeString(
-                    iter358.encode("utf-8") if sys.version_info[0] == 2 else iter358
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("delete_keypair_result")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -17683,22 +21821,14 @@ class get_cluster_supported_ubuntu_os_versions_result(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_supported_ubuntu_os_versions_result)
-get_cluster_supported_ubuntu_os_versions_result.thrift_spec = (
-    (
-        0,
-        TType.LIST,
-        "success",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 0
-)
+all_structs.append(delete_keypair_result)
+delete_keypair_result.thrift_spec = ()
 
 
-class get_servers_by_bibigrid_id_args(object):
+class add_default_security_groups_to_server_args(object):
     """
     Attributes:
-     - bibigrid_id
+     - openstack_id
 
     """
 
@@ -17706,9 +21836,9 @@ class get_servers_by_bibigrid_id_args(object):
 
     def __init__(
         self,
-        bibigrid_id=None,
+        openstack_id=None,
     ):
-        self.bibigrid_id = bibigrid_id
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -17725,7 +21855,7 @@ class get_servers_by_bibigrid_id_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.bibigrid_id = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -17744,13 +21874,13 @@ class get_servers_by_bibigrid_id_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_by_bibigrid_id_args")
-        if self.bibigrid_id is not None:
-            oprot.writeFieldBegin("bibigrid_id", TType.STRING, 1)
+        oprot.writeStructBegin("add_default_security_groups_to_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.bibigrid_id.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.bibigrid_id
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -17770,23 +21900,23 @@ class get_servers_by_bibigrid_id_args(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_by_bibigrid_id_args)
-get_servers_by_bibigrid_id_args.thrift_spec = (
+all_structs.append(add_default_security_groups_to_server_args)
+add_default_security_groups_to_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "bibigrid_id",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_servers_by_bibigrid_id_result(object):
+class add_default_security_groups_to_server_result(object):
     """
     Attributes:
-     - success
+     - e
 
     """
 
@@ -17794,9 +21924,9 @@ class get_servers_by_bibigrid_id_result(object):
 
     def __init__(
         self,
-        success=None,
+        e=None,
     ):
-        self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -17811,15 +21941,9 @@ class get_servers_by_bibigrid_id_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype362, _size359 = iprot.readListBegin()
-                    for _i363 in range(_size359):
-                        _elem364 = VM()
-                        _elem364.read(iprot)
-                        self.success.append(_elem364)
-                    iprot.readListEnd()
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = ServerNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -17834,13 +21958,10 @@ class get_servers_by_bibigrid_id_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_by_bibigrid_id_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter365 in self.success:
-                iter365.write(oprot)
-            oprot.writeListEnd()
+        oprot.writeStructBegin("add_default_security_groups_to_server_result")
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -17859,22 +21980,23 @@ class get_servers_by_bibigrid_id_result(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_by_bibigrid_id_result)
-get_servers_by_bibigrid_id_result.thrift_spec = (
+all_structs.append(add_default_security_groups_to_server_result)
+add_default_security_groups_to_server_result.thrift_spec = (
+    None,  # 0
     (
-        0,
-        TType.LIST,
-        "success",
-        (TType.STRUCT, [VM, None], False),
+        1,
+        TType.STRUCT,
+        "e",
+        [ServerNotFoundException, None],
         None,
-    ),  # 0
+    ),  # 1
 )
 
 
-class get_security_group_id_by_name_args(object):
+class get_server_console_args(object):
     """
     Attributes:
-     - name
+     - openstack_id
 
     """
 
@@ -17882,9 +22004,9 @@ class get_security_group_id_by_name_args(object):
 
     def __init__(
         self,
-        name=None,
+        openstack_id=None,
     ):
-        self.name = name
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -17901,7 +22023,7 @@ class get_security_group_id_by_name_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.name = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -17920,11 +22042,13 @@ class get_security_group_id_by_name_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_security_group_id_by_name_args")
-        if self.name is not None:
-            oprot.writeFieldBegin("name", TType.STRING, 1)
+        oprot.writeStructBegin("get_server_console_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -17944,24 +22068,24 @@ class get_security_group_id_by_name_args(object):
         return not (self == other)
 
 
-all_structs.append(get_security_group_id_by_name_args)
-get_security_group_id_by_name_args.thrift_spec = (
+all_structs.append(get_server_console_args)
+get_server_console_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "name",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_security_group_id_by_name_result(object):
+class get_server_console_result(object):
     """
     Attributes:
      - success
-     - s
+     - e
 
     """
 
@@ -17970,10 +22094,10 @@ class get_security_group_id_by_name_result(object):
     def __init__(
         self,
         success=None,
-        s=None,
+        e=None,
     ):
         self.success = success
-        self.s = s
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -17999,7 +22123,7 @@ class get_security_group_id_by_name_result(object):
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.s = SecurityGroupNotFoundException.read(iprot)
+                    self.e = ServerNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -18014,7 +22138,7 @@ class get_security_group_id_by_name_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_security_group_id_by_name_result")
+        oprot.writeStructBegin("get_server_console_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.STRING, 0)
             oprot.writeString(
@@ -18023,9 +22147,9 @@ class get_security_group_id_by_name_result(object):
                 else self.success
             )
             oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 1)
-            self.s.write(oprot)
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18044,8 +22168,8 @@ class get_security_group_id_by_name_result(object):
         return not (self == other)
 
 
-all_structs.append(get_security_group_id_by_name_result)
-get_security_group_id_by_name_result.thrift_spec = (
+all_structs.append(get_server_console_result)
+get_server_console_result.thrift_spec = (
     (
         0,
         TType.STRING,
@@ -18056,23 +22180,18 @@ get_security_group_id_by_name_result.thrift_spec = (
     (
         1,
         TType.STRUCT,
-        "s",
-        [SecurityGroupNotFoundException, None],
+        "e",
+        [ServerNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class scale_up_cluster_args(object):
+class get_server_args(object):
     """
     Attributes:
-     - cluster_id
-     - image_name
-     - flavor_name
-     - count
-     - names
-     - start_idx
-     - batch_idx
+     - openstack_id: Id of the server.
+     - no_connection
 
     """
 
@@ -18080,21 +22199,11 @@ class scale_up_cluster_args(object):
 
     def __init__(
         self,
-        cluster_id=None,
-        image_name=None,
-        flavor_name=None,
-        count=None,
-        names=None,
-        start_idx=None,
-        batch_idx=None,
+        openstack_id=None,
+        no_connection=None,
     ):
-        self.cluster_id = cluster_id
-        self.image_name = image_name
-        self.flavor_name = flavor_name
-        self.count = count
-        self.names = names
-        self.start_idx = start_idx
-        self.batch_idx = batch_idx
+        self.openstack_id = openstack_id
+        self.no_connection = no_connection
 
     def read(self, iprot):
         if (
@@ -18111,7 +22220,7 @@ class scale_up_cluster_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.cluster_id = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -18119,50 +22228,8 @@ class scale_up_cluster_args(object):
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.image_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.flavor_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.I32:
-                    self.count = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.LIST:
-                    self.names = []
-                    _etype369, _size366 = iprot.readListBegin()
-                    for _i370 in range(_size366):
-                        _elem371 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.names.append(_elem371)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.I32:
-                    self.start_idx = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.I32:
-                    self.batch_idx = iprot.readI32()
+                if ftype == TType.BOOL:
+                    self.no_connection = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -18177,51 +22244,18 @@ class scale_up_cluster_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("scale_up_cluster_args")
-        if self.cluster_id is not None:
-            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
-            oprot.writeString(
-                self.cluster_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.cluster_id
-            )
-            oprot.writeFieldEnd()
-        if self.image_name is not None:
-            oprot.writeFieldBegin("image_name", TType.STRING, 2)
-            oprot.writeString(
-                self.image_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.image_name
-            )
-            oprot.writeFieldEnd()
-        if self.flavor_name is not None:
-            oprot.writeFieldBegin("flavor_name", TType.STRING, 3)
+        oprot.writeStructBegin("get_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.flavor_name.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.flavor_name
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
-        if self.count is not None:
-            oprot.writeFieldBegin("count", TType.I32, 4)
-            oprot.writeI32(self.count)
-            oprot.writeFieldEnd()
-        if self.names is not None:
-            oprot.writeFieldBegin("names", TType.LIST, 5)
-            oprot.writeListBegin(TType.STRING, len(self.names))
-            for iter372 in self.names:
-                oprot.writeString(
-                    iter372.encode("utf-8") if sys.version_info[0] == 2 else iter372
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.start_idx is not None:
-            oprot.writeFieldBegin("start_idx", TType.I32, 6)
-            oprot.writeI32(self.start_idx)
-            oprot.writeFieldEnd()
-        if self.batch_idx is not None:
-            oprot.writeFieldBegin("batch_idx", TType.I32, 7)
-            oprot.writeI32(self.batch_idx)
+        if self.no_connection is not None:
+            oprot.writeFieldBegin("no_connection", TType.BOOL, 2)
+            oprot.writeBool(self.no_connection)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18240,65 +22274,31 @@ class scale_up_cluster_args(object):
         return not (self == other)
 
 
-all_structs.append(scale_up_cluster_args)
-scale_up_cluster_args.thrift_spec = (
+all_structs.append(get_server_args)
+get_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "cluster_id",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
     (
         2,
-        TType.STRING,
-        "image_name",
-        "UTF8",
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRING,
-        "flavor_name",
-        "UTF8",
-        None,
-    ),  # 3
-    (
-        4,
-        TType.I32,
-        "count",
-        None,
-        None,
-    ),  # 4
-    (
-        5,
-        TType.LIST,
-        "names",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 5
-    (
-        6,
-        TType.I32,
-        "start_idx",
-        None,
-        None,
-    ),  # 6
-    (
-        7,
-        TType.I32,
-        "batch_idx",
+        TType.BOOL,
+        "no_connection",
         None,
         None,
-    ),  # 7
+    ),  # 2
 )
 
 
-class scale_up_cluster_result(object):
+class get_server_result(object):
     """
     Attributes:
      - success
+     - e
 
     """
 
@@ -18307,8 +22307,10 @@ class scale_up_cluster_result(object):
     def __init__(
         self,
         success=None,
+        e=None,
     ):
         self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -18324,27 +22326,14 @@ class scale_up_cluster_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    _ktype374, _vtype375, _size373 = iprot.readMapBegin()
-                    for _i377 in range(_size373):
-                        _key378 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val379 = []
-                        _etype383, _size380 = iprot.readListBegin()
-                        for _i384 in range(_size380):
-                            _elem385 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val379.append(_elem385)
-                        iprot.readListEnd()
-                        self.success[_key378] = _val379
-                    iprot.readMapEnd()
+                if ftype == TType.STRUCT:
+                    self.success = VM()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = ServerNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -18359,21 +22348,14 @@ class scale_up_cluster_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("scale_up_cluster_result")
+        oprot.writeStructBegin("get_server_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.LIST, len(self.success))
-            for kiter386, viter387 in self.success.items():
-                oprot.writeString(
-                    kiter386.encode("utf-8") if sys.version_info[0] == 2 else kiter386
-                )
-                oprot.writeListBegin(TType.STRING, len(viter387))
-                for iter388 in viter387:
-                    oprot.writeString(
-                        iter388.encode("utf-8") if sys.version_info[0] == 2 else iter388
-                    )
-                oprot.writeListEnd()
-            oprot.writeMapEnd()
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18392,30 +22374,30 @@ class scale_up_cluster_result(object):
         return not (self == other)
 
 
-all_structs.append(scale_up_cluster_result)
-scale_up_cluster_result.thrift_spec = (
+all_structs.append(get_server_result)
+get_server_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.STRUCT,
         "success",
-        (TType.STRING, "UTF8", TType.LIST, (TType.STRING, "UTF8", False), False),
+        [VM, None],
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [ServerNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class add_cluster_machine_args(object):
+class get_server_by_unique_name_args(object):
     """
     Attributes:
-     - cluster_id
-     - cluster_user
-     - cluster_group_id
-     - image_name
-     - flavor_name
-     - name
-     - key_name
-     - batch_idx
-     - worker_idx
+     - unique_name: Id of the server.
+     - no_connection
 
     """
 
@@ -18423,25 +22405,11 @@ class add_cluster_machine_args(object):
 
     def __init__(
         self,
-        cluster_id=None,
-        cluster_user=None,
-        cluster_group_id=None,
-        image_name=None,
-        flavor_name=None,
-        name=None,
-        key_name=None,
-        batch_idx=None,
-        worker_idx=None,
+        unique_name=None,
+        no_connection=None,
     ):
-        self.cluster_id = cluster_id
-        self.cluster_user = cluster_user
-        self.cluster_group_id = cluster_group_id
-        self.image_name = image_name
-        self.flavor_name = flavor_name
-        self.name = name
-        self.key_name = key_name
-        self.batch_idx = batch_idx
-        self.worker_idx = worker_idx
+        self.unique_name = unique_name
+        self.no_connection = no_connection
 
     def read(self, iprot):
         if (
@@ -18458,7 +22426,7 @@ class add_cluster_machine_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.cluster_id = (
+                    self.unique_name = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -18466,67 +22434,8 @@ class add_cluster_machine_args(object):
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.cluster_user = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.cluster_group_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRING:
-                    self.image_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRING:
-                    self.flavor_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRING:
-                    self.name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.STRING:
-                    self.key_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 8:
-                if ftype == TType.I32:
-                    self.batch_idx = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 9:
-                if ftype == TType.I32:
-                    self.worker_idx = iprot.readI32()
+                if ftype == TType.BOOL:
+                    self.no_connection = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -18541,68 +22450,18 @@ class add_cluster_machine_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_cluster_machine_args")
-        if self.cluster_id is not None:
-            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
-            oprot.writeString(
-                self.cluster_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.cluster_id
-            )
-            oprot.writeFieldEnd()
-        if self.cluster_user is not None:
-            oprot.writeFieldBegin("cluster_user", TType.STRING, 2)
-            oprot.writeString(
-                self.cluster_user.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.cluster_user
-            )
-            oprot.writeFieldEnd()
-        if self.cluster_group_id is not None:
-            oprot.writeFieldBegin("cluster_group_id", TType.STRING, 3)
-            oprot.writeString(
-                self.cluster_group_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.cluster_group_id
-            )
-            oprot.writeFieldEnd()
-        if self.image_name is not None:
-            oprot.writeFieldBegin("image_name", TType.STRING, 4)
-            oprot.writeString(
-                self.image_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.image_name
-            )
-            oprot.writeFieldEnd()
-        if self.flavor_name is not None:
-            oprot.writeFieldBegin("flavor_name", TType.STRING, 5)
-            oprot.writeString(
-                self.flavor_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.flavor_name
-            )
-            oprot.writeFieldEnd()
-        if self.name is not None:
-            oprot.writeFieldBegin("name", TType.STRING, 6)
-            oprot.writeString(
-                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
-            )
-            oprot.writeFieldEnd()
-        if self.key_name is not None:
-            oprot.writeFieldBegin("key_name", TType.STRING, 7)
+        oprot.writeStructBegin("get_server_by_unique_name_args")
+        if self.unique_name is not None:
+            oprot.writeFieldBegin("unique_name", TType.STRING, 1)
             oprot.writeString(
-                self.key_name.encode("utf-8")
+                self.unique_name.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.key_name
+                else self.unique_name
             )
             oprot.writeFieldEnd()
-        if self.batch_idx is not None:
-            oprot.writeFieldBegin("batch_idx", TType.I32, 8)
-            oprot.writeI32(self.batch_idx)
-            oprot.writeFieldEnd()
-        if self.worker_idx is not None:
-            oprot.writeFieldBegin("worker_idx", TType.I32, 9)
-            oprot.writeI32(self.worker_idx)
+        if self.no_connection is not None:
+            oprot.writeFieldBegin("no_connection", TType.BOOL, 2)
+            oprot.writeBool(self.no_connection)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18621,79 +22480,31 @@ class add_cluster_machine_args(object):
         return not (self == other)
 
 
-all_structs.append(add_cluster_machine_args)
-add_cluster_machine_args.thrift_spec = (
+all_structs.append(get_server_by_unique_name_args)
+get_server_by_unique_name_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "cluster_id",
+        "unique_name",
         "UTF8",
         None,
     ),  # 1
     (
         2,
-        TType.STRING,
-        "cluster_user",
-        "UTF8",
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRING,
-        "cluster_group_id",
-        "UTF8",
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRING,
-        "image_name",
-        "UTF8",
-        None,
-    ),  # 4
-    (
-        5,
-        TType.STRING,
-        "flavor_name",
-        "UTF8",
-        None,
-    ),  # 5
-    (
-        6,
-        TType.STRING,
-        "name",
-        "UTF8",
-        None,
-    ),  # 6
-    (
-        7,
-        TType.STRING,
-        "key_name",
-        "UTF8",
-        None,
-    ),  # 7
-    (
-        8,
-        TType.I32,
-        "batch_idx",
-        None,
-        None,
-    ),  # 8
-    (
-        9,
-        TType.I32,
-        "worker_idx",
+        TType.BOOL,
+        "no_connection",
         None,
         None,
-    ),  # 9
+    ),  # 2
 )
 
 
-class add_cluster_machine_result(object):
+class get_server_by_unique_name_result(object):
     """
     Attributes:
      - success
+     - e
 
     """
 
@@ -18702,8 +22513,10 @@ class add_cluster_machine_result(object):
     def __init__(
         self,
         success=None,
+        e=None,
     ):
         self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -18719,12 +22532,14 @@ class add_cluster_machine_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.STRUCT:
+                    self.success = VM()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = ServerNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -18734,19 +22549,19 @@ class add_cluster_machine_result(object):
 
     def write(self, oprot):
         self.validate()
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("add_cluster_machine_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
+            return
+        oprot.writeStructBegin("get_server_by_unique_name_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18765,22 +22580,29 @@ class add_cluster_machine_result(object):
         return not (self == other)
 
 
-all_structs.append(add_cluster_machine_result)
-add_cluster_machine_result.thrift_spec = (
+all_structs.append(get_server_by_unique_name_result)
+get_server_by_unique_name_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.STRUCT,
         "success",
-        "UTF8",
+        [VM, None],
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [ServerNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class get_cluster_info_args(object):
+class stop_server_args(object):
     """
     Attributes:
-     - cluster_id
+     - openstack_id: Id of the server.
 
     """
 
@@ -18788,9 +22610,9 @@ class get_cluster_info_args(object):
 
     def __init__(
         self,
-        cluster_id=None,
+        openstack_id=None,
     ):
-        self.cluster_id = cluster_id
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -18807,7 +22629,7 @@ class get_cluster_info_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.cluster_id = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -18826,13 +22648,13 @@ class get_cluster_info_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_info_args")
-        if self.cluster_id is not None:
-            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+        oprot.writeStructBegin("stop_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.cluster_id.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.cluster_id
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -18852,23 +22674,23 @@ class get_cluster_info_args(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_info_args)
-get_cluster_info_args.thrift_spec = (
+all_structs.append(stop_server_args)
+stop_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "cluster_id",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_cluster_info_result(object):
+class stop_server_result(object):
     """
     Attributes:
-     - success
+     - e
      - c
 
     """
@@ -18877,10 +22699,10 @@ class get_cluster_info_result(object):
 
     def __init__(
         self,
-        success=None,
+        e=None,
         c=None,
     ):
-        self.success = success
+        self.e = e
         self.c = c
 
     def read(self, iprot):
@@ -18896,15 +22718,14 @@ class get_cluster_info_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
+            if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.success = ClusterInfo()
-                    self.success.read(iprot)
+                    self.e = ServerNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 1:
+            elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.c = ClusterNotFoundException.read(iprot)
+                    self.c = OpenStackConflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -18919,13 +22740,13 @@ class get_cluster_info_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_info_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+        oprot.writeStructBegin("stop_server_result")
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 1)
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
             self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -18945,29 +22766,34 @@ class get_cluster_info_result(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_info_result)
-get_cluster_info_result.thrift_spec = (
+all_structs.append(stop_server_result)
+stop_server_result.thrift_spec = (
+    None,  # 0
     (
-        0,
+        1,
         TType.STRUCT,
-        "success",
-        [ClusterInfo, None],
+        "e",
+        [ServerNotFoundException, None],
         None,
-    ),  # 0
+    ),  # 1
     (
-        1,
+        2,
         TType.STRUCT,
         "c",
-        [ClusterNotFoundException, None],
+        [OpenStackConflictException, None],
         None,
-    ),  # 1
+    ),  # 2
 )
 
 
-class get_cluster_log_args(object):
+class create_snapshot_args(object):
     """
     Attributes:
-     - cluster_id
+     - openstack_id: Id of the server
+     - name: Name of new Snapshot
+     - username: unique username of the user who requested creation of Snapshot
+     - base_tags: Tags with which the servers image is also tagged ( for connection information at the webapp)
+     - description: Description of the new snapshot
 
     """
 
@@ -18975,9 +22801,17 @@ class get_cluster_log_args(object):
 
     def __init__(
         self,
-        cluster_id=None,
+        openstack_id=None,
+        name=None,
+        username=None,
+        base_tags=None,
+        description=None,
     ):
-        self.cluster_id = cluster_id
+        self.openstack_id = openstack_id
+        self.name = name
+        self.username = username
+        self.base_tags = base_tags
+        self.description = description
 
     def read(self, iprot):
         if (
@@ -18994,7 +22828,48 @@ class get_cluster_log_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.cluster_id = (
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.username = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.LIST:
+                    self.base_tags = []
+                    _etype392, _size389 = iprot.readListBegin()
+                    for _i393 in range(_size389):
+                        _elem394 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.base_tags.append(_elem394)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.description = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -19013,13 +22888,44 @@ class get_cluster_log_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_log_args")
-        if self.cluster_id is not None:
-            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+        oprot.writeStructBegin("create_snapshot_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.cluster_id.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.cluster_id
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
+        if self.name is not None:
+            oprot.writeFieldBegin("name", TType.STRING, 2)
+            oprot.writeString(
+                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
+            )
+            oprot.writeFieldEnd()
+        if self.username is not None:
+            oprot.writeFieldBegin("username", TType.STRING, 3)
+            oprot.writeString(
+                self.username.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.username
+            )
+            oprot.writeFieldEnd()
+        if self.base_tags is not None:
+            oprot.writeFieldBegin("base_tags", TType.LIST, 4)
+            oprot.writeListBegin(TType.STRING, len(self.base_tags))
+            for iter395 in self.base_tags:
+                oprot.writeString(
+                    iter395.encode("utf-8") if sys.version_info[0] == 2 else iter395
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.description is not None:
+            oprot.writeFieldBegin("description", TType.STRING, 5)
+            oprot.writeString(
+                self.description.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.description
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -19039,23 +22945,52 @@ class get_cluster_log_args(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_log_args)
-get_cluster_log_args.thrift_spec = (
+all_structs.append(create_snapshot_args)
+create_snapshot_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "cluster_id",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "name",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "username",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.LIST,
+        "base_tags",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRING,
+        "description",
+        "UTF8",
+        None,
+    ),  # 5
 )
 
 
-class get_cluster_log_result(object):
+class create_snapshot_result(object):
     """
     Attributes:
      - success
+     - e
      - c
 
     """
@@ -19065,9 +23000,11 @@ class get_cluster_log_result(object):
     def __init__(
         self,
         success=None,
+        e=None,
         c=None,
     ):
         self.success = success
+        self.e = e
         self.c = c
 
     def read(self, iprot):
@@ -19084,14 +23021,22 @@ class get_cluster_log_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = ClusterLog()
-                    self.success.read(iprot)
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.c = ClusterNotFoundException.read(iprot)
+                    self.e = ServerNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.c = OpenStackConflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -19106,13 +23051,21 @@ class get_cluster_log_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_log_result")
+        oprot.writeStructBegin("create_snapshot_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 1)
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
             self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -19132,40 +23085,35 @@ class get_cluster_log_result(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_log_result)
-get_cluster_log_result.thrift_spec = (
+all_structs.append(create_snapshot_result)
+create_snapshot_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.STRING,
         "success",
-        [ClusterLog, None],
+        "UTF8",
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "c",
-        [ClusterNotFoundException, None],
+        "e",
+        [ServerNotFoundException, None],
         None,
     ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [OpenStackConflictException, None],
+        None,
+    ),  # 2
 )
 
 
-class get_cluster_state_args(object):
-    """
-    Attributes:
-     - cluster_id
-
-    """
-
+class get_limits_args(object):
     thrift_spec = None
 
-    def __init__(
-        self,
-        cluster_id=None,
-    ):
-        self.cluster_id = cluster_id
-
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -19179,15 +23127,6 @@ class get_cluster_state_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.cluster_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -19200,15 +23139,7 @@ class get_cluster_state_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_state_args")
-        if self.cluster_id is not None:
-            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
-            oprot.writeString(
-                self.cluster_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.cluster_id
-            )
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("get_limits_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -19226,24 +23157,14 @@ class get_cluster_state_args(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_state_args)
-get_cluster_state_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRING,
-        "cluster_id",
-        "UTF8",
-        None,
-    ),  # 1
-)
+all_structs.append(get_limits_args)
+get_limits_args.thrift_spec = ()
 
 
-class get_cluster_state_result(object):
+class get_limits_result(object):
     """
     Attributes:
      - success
-     - c
 
     """
 
@@ -19252,10 +23173,8 @@ class get_cluster_state_result(object):
     def __init__(
         self,
         success=None,
-        c=None,
     ):
         self.success = success
-        self.c = c
 
     def read(self, iprot):
         if (
@@ -19271,14 +23190,22 @@ class get_cluster_state_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = ClusterState()
-                    self.success.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.c = ClusterNotFoundException.read(iprot)
+                if ftype == TType.MAP:
+                    self.success = {}
+                    _ktype397, _vtype398, _size396 = iprot.readMapBegin()
+                    for _i400 in range(_size396):
+                        _key401 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val402 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key401] = _val402
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -19293,14 +23220,18 @@ class get_cluster_state_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_state_result")
+        oprot.writeStructBegin("get_limits_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
-            oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 1)
-            self.c.write(oprot)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter403, viter404 in self.success.items():
+                oprot.writeString(
+                    kiter403.encode("utf-8") if sys.version_info[0] == 2 else kiter403
+                )
+                oprot.writeString(
+                    viter404.encode("utf-8") if sys.version_info[0] == 2 else viter404
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -19319,40 +23250,21 @@ class get_cluster_state_result(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_state_result)
-get_cluster_state_result.thrift_spec = (
+all_structs.append(get_limits_result)
+get_limits_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.MAP,
         "success",
-        [ClusterState, None],
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "c",
-        [ClusterNotFoundException, None],
-        None,
-    ),  # 1
 )
 
 
-class get_keypair_public_key_by_name_args(object):
-    """
-    Attributes:
-     - key_name
-
-    """
-
+class get_flavor_resources_args(object):
     thrift_spec = None
 
-    def __init__(
-        self,
-        key_name=None,
-    ):
-        self.key_name = key_name
-
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -19366,15 +23278,6 @@ class get_keypair_public_key_by_name_args(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.key_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -19387,15 +23290,7 @@ class get_keypair_public_key_by_name_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_keypair_public_key_by_name_args")
-        if self.key_name is not None:
-            oprot.writeFieldBegin("key_name", TType.STRING, 1)
-            oprot.writeString(
-                self.key_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.key_name
-            )
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("get_flavor_resources_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -19413,20 +23308,11 @@ class get_keypair_public_key_by_name_args(object):
         return not (self == other)
 
 
-all_structs.append(get_keypair_public_key_by_name_args)
-get_keypair_public_key_by_name_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRING,
-        "key_name",
-        "UTF8",
-        None,
-    ),  # 1
-)
+all_structs.append(get_flavor_resources_args)
+get_flavor_resources_args.thrift_spec = ()
 
 
-class get_keypair_public_key_by_name_result(object):
+class get_flavor_resources_result(object):
     """
     Attributes:
      - success
@@ -19455,12 +23341,14 @@ class get_keypair_public_key_by_name_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype408, _size405 = iprot.readListBegin()
+                    for _i409 in range(_size405):
+                        _elem410 = FlavorResource()
+                        _elem410.read(iprot)
+                        self.success.append(_elem410)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -19475,14 +23363,13 @@ class get_keypair_public_key_by_name_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_keypair_public_key_by_name_result")
+        oprot.writeStructBegin("get_flavor_resources_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter411 in self.success:
+                iter411.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -19501,22 +23388,25 @@ class get_keypair_public_key_by_name_result(object):
         return not (self == other)
 
 
-all_structs.append(get_keypair_public_key_by_name_result)
-get_keypair_public_key_by_name_result.thrift_spec = (
+all_structs.append(get_flavor_resources_result)
+get_flavor_resources_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.LIST,
         "success",
-        "UTF8",
+        (TType.STRUCT, [FlavorResource, None], False),
         None,
     ),  # 0
 )
 
 
-class delete_keypair_args(object):
+class start_cluster_args(object):
     """
     Attributes:
-     - key_name
+     - public_keys
+     - master_instance
+     - worker_instances
+     - metadata
 
     """
 
@@ -19524,9 +23414,15 @@ class delete_keypair_args(object):
 
     def __init__(
         self,
-        key_name=None,
+        public_keys=None,
+        master_instance=None,
+        worker_instances=None,
+        metadata=None,
     ):
-        self.key_name = key_name
+        self.public_keys = public_keys
+        self.master_instance = master_instance
+        self.worker_instances = worker_instances
+        self.metadata = metadata
 
     def read(self, iprot):
         if (
@@ -19542,12 +23438,40 @@ class delete_keypair_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.key_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.LIST:
+                    self.public_keys = []
+                    _etype415, _size412 = iprot.readListBegin()
+                    for _i416 in range(_size412):
+                        _elem417 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.public_keys.append(_elem417)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.master_instance = ClusterInstance()
+                    self.master_instance.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.LIST:
+                    self.worker_instances = []
+                    _etype421, _size418 = iprot.readListBegin()
+                    for _i422 in range(_size418):
+                        _elem423 = ClusterInstance()
+                        _elem423.read(iprot)
+                        self.worker_instances.append(_elem423)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.metadata = ClusterInstanceMetadata()
+                    self.metadata.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -19562,14 +23486,30 @@ class delete_keypair_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_keypair_args")
-        if self.key_name is not None:
-            oprot.writeFieldBegin("key_name", TType.STRING, 1)
-            oprot.writeString(
-                self.key_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.key_name
-            )
+        oprot.writeStructBegin("start_cluster_args")
+        if self.public_keys is not None:
+            oprot.writeFieldBegin("public_keys", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.public_keys))
+            for iter424 in self.public_keys:
+                oprot.writeString(
+                    iter424.encode("utf-8") if sys.version_info[0] == 2 else iter424
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.master_instance is not None:
+            oprot.writeFieldBegin("master_instance", TType.STRUCT, 2)
+            self.master_instance.write(oprot)
+            oprot.writeFieldEnd()
+        if self.worker_instances is not None:
+            oprot.writeFieldBegin("worker_instances", TType.LIST, 3)
+            oprot.writeListBegin(TType.STRUCT, len(self.worker_instances))
+            for iter425 in self.worker_instances:
+                iter425.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.STRUCT, 4)
+            self.metadata.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -19588,22 +23528,55 @@ class delete_keypair_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_keypair_args)
-delete_keypair_args.thrift_spec = (
+all_structs.append(start_cluster_args)
+start_cluster_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "key_name",
-        "UTF8",
+        TType.LIST,
+        "public_keys",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "master_instance",
+        [ClusterInstance, None],
+        None,
+    ),  # 2
+    (
+        3,
+        TType.LIST,
+        "worker_instances",
+        (TType.STRUCT, [ClusterInstance, None], False),
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRUCT,
+        "metadata",
+        [ClusterInstanceMetadata, None],
+        None,
+    ),  # 4
 )
 
 
-class delete_keypair_result(object):
+class start_cluster_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
     thrift_spec = None
 
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -19617,6 +23590,12 @@ class delete_keypair_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = ClusterMessage()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -19629,7 +23608,11 @@ class delete_keypair_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_keypair_result")
+        oprot.writeStructBegin("start_cluster_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -19647,14 +23630,22 @@ class delete_keypair_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_keypair_result)
-delete_keypair_result.thrift_spec = ()
+all_structs.append(start_cluster_result)
+start_cluster_result.thrift_spec = (
+    (
+        0,
+        TType.STRUCT,
+        "success",
+        [ClusterMessage, None],
+        None,
+    ),  # 0
+)
 
 
-class add_default_security_groups_to_server_args(object):
+class terminate_cluster_args(object):
     """
     Attributes:
-     - openstack_id
+     - cluster_id
 
     """
 
@@ -19662,9 +23653,9 @@ class add_default_security_groups_to_server_args(object):
 
     def __init__(
         self,
-        openstack_id=None,
+        cluster_id=None,
     ):
-        self.openstack_id = openstack_id
+        self.cluster_id = cluster_id
 
     def read(self, iprot):
         if (
@@ -19681,7 +23672,7 @@ class add_default_security_groups_to_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.cluster_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -19700,13 +23691,13 @@ class add_default_security_groups_to_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_default_security_groups_to_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("terminate_cluster_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.cluster_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.cluster_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -19726,23 +23717,23 @@ class add_default_security_groups_to_server_args(object):
         return not (self == other)
 
 
-all_structs.append(add_default_security_groups_to_server_args)
-add_default_security_groups_to_server_args.thrift_spec = (
+all_structs.append(terminate_cluster_args)
+terminate_cluster_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "cluster_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class add_default_security_groups_to_server_result(object):
+class terminate_cluster_result(object):
     """
     Attributes:
-     - e
+     - c
 
     """
 
@@ -19750,9 +23741,9 @@ class add_default_security_groups_to_server_result(object):
 
     def __init__(
         self,
-        e=None,
+        c=None,
     ):
-        self.e = e
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -19769,7 +23760,7 @@ class add_default_security_groups_to_server_result(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
+                    self.c = ClusterNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -19784,10 +23775,10 @@ class add_default_security_groups_to_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_default_security_groups_to_server_result")
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+        oprot.writeStructBegin("terminate_cluster_result")
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 1)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -19806,23 +23797,23 @@ class add_default_security_groups_to_server_result(object):
         return not (self == other)
 
 
-all_structs.append(add_default_security_groups_to_server_result)
-add_default_security_groups_to_server_result.thrift_spec = (
+all_structs.append(terminate_cluster_result)
+terminate_cluster_result.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRUCT,
-        "e",
-        [ServerNotFoundException, None],
+        "c",
+        [ClusterNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class get_server_console_args(object):
+class delete_image_args(object):
     """
     Attributes:
-     - openstack_id
+     - image_id: Id of image
 
     """
 
@@ -19830,9 +23821,9 @@ class get_server_console_args(object):
 
     def __init__(
         self,
-        openstack_id=None,
+        image_id=None,
     ):
-        self.openstack_id = openstack_id
+        self.image_id = image_id
 
     def read(self, iprot):
         if (
@@ -19849,7 +23840,7 @@ class get_server_console_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.image_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -19868,13 +23859,13 @@ class get_server_console_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_server_console_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("delete_image_args")
+        if self.image_id is not None:
+            oprot.writeFieldBegin("image_id", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.image_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.image_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -19894,23 +23885,22 @@ class get_server_console_args(object):
         return not (self == other)
 
 
-all_structs.append(get_server_console_args)
-get_server_console_args.thrift_spec = (
+all_structs.append(delete_image_args)
+delete_image_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "image_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_server_console_result(object):
+class delete_image_result(object):
     """
     Attributes:
-     - success
      - e
 
     """
@@ -19919,10 +23909,8 @@ class get_server_console_result(object):
 
     def __init__(
         self,
-        success=None,
         e=None,
     ):
-        self.success = success
         self.e = e
 
     def read(self, iprot):
@@ -19938,18 +23926,9 @@ class get_server_console_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
+            if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
+                    self.e = ImageNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -19964,15 +23943,7 @@ class get_server_console_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_server_console_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("delete_image_result")
         if self.e is not None:
             oprot.writeFieldBegin("e", TType.STRUCT, 1)
             self.e.write(oprot)
@@ -19994,30 +23965,24 @@ class get_server_console_result(object):
         return not (self == other)
 
 
-all_structs.append(get_server_console_result)
-get_server_console_result.thrift_spec = (
-    (
-        0,
-        TType.STRING,
-        "success",
-        "UTF8",
-        None,
-    ),  # 0
+all_structs.append(delete_image_result)
+delete_image_result.thrift_spec = (
+    None,  # 0
     (
         1,
         TType.STRUCT,
         "e",
-        [ServerNotFoundException, None],
+        [ImageNotFoundException, None],
         None,
     ),  # 1
 )
 
 
-class get_server_args(object):
+class detach_volume_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server.
-     - no_connection
+     - volume_id: Id of the attached volume
+     - server_id: Id of the server where the volume is attached
 
     """
 
@@ -20025,11 +23990,11 @@ class get_server_args(object):
 
     def __init__(
         self,
-        openstack_id=None,
-        no_connection=None,
+        volume_id=None,
+        server_id=None,
     ):
-        self.openstack_id = openstack_id
-        self.no_connection = no_connection
+        self.volume_id = volume_id
+        self.server_id = server_id
 
     def read(self, iprot):
         if (
@@ -20046,7 +24011,7 @@ class get_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.volume_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -20054,8 +24019,12 @@ class get_server_args(object):
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.BOOL:
-                    self.no_connection = iprot.readBool()
+                if ftype == TType.STRING:
+                    self.server_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -20070,18 +24039,22 @@ class get_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("detach_volume_args")
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.volume_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.volume_id
             )
             oprot.writeFieldEnd()
-        if self.no_connection is not None:
-            oprot.writeFieldBegin("no_connection", TType.BOOL, 2)
-            oprot.writeBool(self.no_connection)
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 2)
+            oprot.writeString(
+                self.server_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.server_id
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -20100,31 +24073,32 @@ class get_server_args(object):
         return not (self == other)
 
 
-all_structs.append(get_server_args)
-get_server_args.thrift_spec = (
+all_structs.append(detach_volume_args)
+detach_volume_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "volume_id",
         "UTF8",
         None,
     ),  # 1
     (
         2,
-        TType.BOOL,
-        "no_connection",
-        None,
+        TType.STRING,
+        "server_id",
+        "UTF8",
         None,
     ),  # 2
 )
 
 
-class get_server_result(object):
+class detach_volume_result(object):
     """
     Attributes:
-     - success
      - e
+     - c
+     - v
 
     """
 
@@ -20132,11 +24106,13 @@ class get_server_result(object):
 
     def __init__(
         self,
-        success=None,
         e=None,
+        c=None,
+        v=None,
     ):
-        self.success = success
         self.e = e
+        self.c = c
+        self.v = v
 
     def read(self, iprot):
         if (
@@ -20151,15 +24127,19 @@ class get_server_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
+            if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.success = VM()
-                    self.success.read(iprot)
+                    self.e = ServerNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 1:
+            elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
+                    self.c = OpenStackConflictException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.v = VolumeNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -20174,15 +24154,19 @@ class get_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_server_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("detach_volume_result")
         if self.e is not None:
             oprot.writeFieldBegin("e", TType.STRUCT, 1)
             self.e.write(oprot)
             oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
+            oprot.writeFieldEnd()
+        if self.v is not None:
+            oprot.writeFieldBegin("v", TType.STRUCT, 3)
+            self.v.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -20200,15 +24184,9 @@ class get_server_result(object):
         return not (self == other)
 
 
-all_structs.append(get_server_result)
-get_server_result.thrift_spec = (
-    (
-        0,
-        TType.STRUCT,
-        "success",
-        [VM, None],
-        None,
-    ),  # 0
+all_structs.append(detach_volume_result)
+detach_volume_result.thrift_spec = (
+    None,  # 0
     (
         1,
         TType.STRUCT,
@@ -20216,14 +24194,27 @@ get_server_result.thrift_spec = (
         [ServerNotFoundException, None],
         None,
     ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [OpenStackConflictException, None],
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRUCT,
+        "v",
+        [VolumeNotFoundException, None],
+        None,
+    ),  # 3
 )
 
 
-class get_server_by_unique_name_args(object):
+class delete_volume_args(object):
     """
     Attributes:
-     - unique_name: Id of the server.
-     - no_connection
+     - volume_id
 
     """
 
@@ -20231,11 +24222,9 @@ class get_server_by_unique_name_args(object):
 
     def __init__(
         self,
-        unique_name=None,
-        no_connection=None,
+        volume_id=None,
     ):
-        self.unique_name = unique_name
-        self.no_connection = no_connection
+        self.volume_id = volume_id
 
     def read(self, iprot):
         if (
@@ -20252,18 +24241,13 @@ class get_server_by_unique_name_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.unique_name = (
+                    self.volume_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.BOOL:
-                    self.no_connection = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -20276,19 +24260,15 @@ class get_server_by_unique_name_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_server_by_unique_name_args")
-        if self.unique_name is not None:
-            oprot.writeFieldBegin("unique_name", TType.STRING, 1)
+        oprot.writeStructBegin("delete_volume_args")
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
             oprot.writeString(
-                self.unique_name.encode("utf-8")
+                self.volume_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.unique_name
+                else self.volume_id
             )
             oprot.writeFieldEnd()
-        if self.no_connection is not None:
-            oprot.writeFieldBegin("no_connection", TType.BOOL, 2)
-            oprot.writeBool(self.no_connection)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -20306,31 +24286,24 @@ class get_server_by_unique_name_args(object):
         return not (self == other)
 
 
-all_structs.append(get_server_by_unique_name_args)
-get_server_by_unique_name_args.thrift_spec = (
+all_structs.append(delete_volume_args)
+delete_volume_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "unique_name",
+        "volume_id",
         "UTF8",
         None,
     ),  # 1
-    (
-        2,
-        TType.BOOL,
-        "no_connection",
-        None,
-        None,
-    ),  # 2
 )
 
 
-class get_server_by_unique_name_result(object):
+class delete_volume_result(object):
     """
     Attributes:
-     - success
-     - e
+     - c
+     - v
 
     """
 
@@ -20338,11 +24311,11 @@ class get_server_by_unique_name_result(object):
 
     def __init__(
         self,
-        success=None,
-        e=None,
+        c=None,
+        v=None,
     ):
-        self.success = success
-        self.e = e
+        self.c = c
+        self.v = v
 
     def read(self, iprot):
         if (
@@ -20357,15 +24330,14 @@ class get_server_by_unique_name_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
+            if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.success = VM()
-                    self.success.read(iprot)
+                    self.c = OpenStackConflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 1:
+            elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
+                    self.v = VolumeNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -20380,14 +24352,14 @@ class get_server_by_unique_name_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_server_by_unique_name_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+        oprot.writeStructBegin("delete_volume_result")
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 1)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+        if self.v is not None:
+            oprot.writeFieldBegin("v", TType.STRUCT, 2)
+            self.v.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -20406,29 +24378,31 @@ class get_server_by_unique_name_result(object):
         return not (self == other)
 
 
-all_structs.append(get_server_by_unique_name_result)
-get_server_by_unique_name_result.thrift_spec = (
+all_structs.append(delete_volume_result)
+delete_volume_result.thrift_spec = (
+    None,  # 0
     (
-        0,
+        1,
         TType.STRUCT,
-        "success",
-        [VM, None],
+        "c",
+        [OpenStackConflictException, None],
         None,
-    ),  # 0
+    ),  # 1
     (
-        1,
+        2,
         TType.STRUCT,
-        "e",
-        [ServerNotFoundException, None],
+        "v",
+        [VolumeNotFoundException, None],
         None,
-    ),  # 1
+    ),  # 2
 )
 
 
-class stop_server_args(object):
+class attach_volume_to_server_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server.
+     - openstack_id: Id of server
+     - volume_id: Id of volume
 
     """
 
@@ -20437,8 +24411,10 @@ class stop_server_args(object):
     def __init__(
         self,
         openstack_id=None,
+        volume_id=None,
     ):
         self.openstack_id = openstack_id
+        self.volume_id = volume_id
 
     def read(self, iprot):
         if (
@@ -20462,6 +24438,15 @@ class stop_server_args(object):
                     )
                 else:
                     iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.volume_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -20474,7 +24459,7 @@ class stop_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("stop_server_args")
+        oprot.writeStructBegin("attach_volume_to_server_args")
         if self.openstack_id is not None:
             oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
@@ -20483,6 +24468,14 @@ class stop_server_args(object):
                 else self.openstack_id
             )
             oprot.writeFieldEnd()
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 2)
+            oprot.writeString(
+                self.volume_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.volume_id
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -20500,8 +24493,8 @@ class stop_server_args(object):
         return not (self == other)
 
 
-all_structs.append(stop_server_args)
-stop_server_args.thrift_spec = (
+all_structs.append(attach_volume_to_server_args)
+attach_volume_to_server_args.thrift_spec = (
     None,  # 0
     (
         1,
@@ -20510,12 +24503,20 @@ stop_server_args.thrift_spec = (
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "volume_id",
+        "UTF8",
+        None,
+    ),  # 2
 )
 
 
-class stop_server_result(object):
+class attach_volume_to_server_result(object):
     """
     Attributes:
+     - success
      - e
      - c
 
@@ -20525,9 +24526,11 @@ class stop_server_result(object):
 
     def __init__(
         self,
+        success=None,
         e=None,
         c=None,
     ):
+        self.success = success
         self.e = e
         self.c = c
 
@@ -20544,9 +24547,28 @@ class stop_server_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    _ktype427, _vtype428, _size426 = iprot.readMapBegin()
+                    for _i430 in range(_size426):
+                        _key431 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val432 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key431] = _val432
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
+                    self.e = VolumeNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
@@ -20566,7 +24588,19 @@ class stop_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("stop_server_result")
+        oprot.writeStructBegin("attach_volume_to_server_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter433, viter434 in self.success.items():
+                oprot.writeString(
+                    kiter433.encode("utf-8") if sys.version_info[0] == 2 else kiter433
+                )
+                oprot.writeString(
+                    viter434.encode("utf-8") if sys.version_info[0] == 2 else viter434
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
         if self.e is not None:
             oprot.writeFieldBegin("e", TType.STRUCT, 1)
             self.e.write(oprot)
@@ -20592,14 +24626,20 @@ class stop_server_result(object):
         return not (self == other)
 
 
-all_structs.append(stop_server_result)
-stop_server_result.thrift_spec = (
-    None,  # 0
+all_structs.append(attach_volume_to_server_result)
+attach_volume_to_server_result.thrift_spec = (
+    (
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 0
     (
         1,
         TType.STRUCT,
         "e",
-        [ServerNotFoundException, None],
+        [VolumeNotFoundException, None],
         None,
     ),  # 1
     (
@@ -20612,14 +24652,14 @@ stop_server_result.thrift_spec = (
 )
 
 
-class create_snapshot_args(object):
+class create_snapshot_async_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server
-     - name: Name of new Snapshot
-     - username: unique username of the user who requested creation of Snapshot
-     - base_tags: Tags with which the servers image is also tagged ( for connection information at the webapp)
-     - description: Description of the new snapshot
+     - openstack_id
+     - name
+     - username
+     - base_tags
+     - description
 
     """
 
@@ -20682,14 +24722,14 @@ class create_snapshot_args(object):
             elif fid == 4:
                 if ftype == TType.LIST:
                     self.base_tags = []
-                    _etype392, _size389 = iprot.readListBegin()
-                    for _i393 in range(_size389):
-                        _elem394 = (
+                    _etype518, _size517 = iprot.readListBegin()
+                    for _i519 in range(_size517):
+                        _elem520 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.base_tags.append(_elem394)
+                        self.base_tags.append(_elem520)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -20714,7 +24754,7 @@ class create_snapshot_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_snapshot_args")
+        oprot.writeStructBegin("create_snapshot_async_args")
         if self.openstack_id is not None:
             oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
@@ -20740,9 +24780,9 @@ class create_snapshot_args(object):
         if self.base_tags is not None:
             oprot.writeFieldBegin("base_tags", TType.LIST, 4)
             oprot.writeListBegin(TType.STRING, len(self.base_tags))
-            for iter395 in self.base_tags:
+            for iter521 in self.base_tags:
                 oprot.writeString(
-                    iter395.encode("utf-8") if sys.version_info[0] == 2 else iter395
+                    iter521.encode("utf-8") if sys.version_info[0] == 2 else iter521
                 )
             oprot.writeListEnd()
             oprot.writeFieldEnd()
@@ -20771,8 +24811,8 @@ class create_snapshot_args(object):
         return not (self == other)
 
 
-all_structs.append(create_snapshot_args)
-create_snapshot_args.thrift_spec = (
+all_structs.append(create_snapshot_async_args)
+create_snapshot_async_args.thrift_spec = (
     None,  # 0
     (
         1,
@@ -20812,12 +24852,11 @@ create_snapshot_args.thrift_spec = (
 )
 
 
-class create_snapshot_result(object):
+class create_snapshot_async_result(object):
     """
     Attributes:
      - success
      - e
-     - c
 
     """
 
@@ -20827,11 +24866,9 @@ class create_snapshot_result(object):
         self,
         success=None,
         e=None,
-        c=None,
     ):
         self.success = success
         self.e = e
-        self.c = c
 
     def read(self, iprot):
         if (
@@ -20857,12 +24894,7 @@ class create_snapshot_result(object):
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.c = OpenStackConflictException.read(iprot)
+                    self.e = DefaultException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -20877,7 +24909,7 @@ class create_snapshot_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_snapshot_result")
+        oprot.writeStructBegin("create_snapshot_async_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.STRING, 0)
             oprot.writeString(
@@ -20890,10 +24922,6 @@ class create_snapshot_result(object):
             oprot.writeFieldBegin("e", TType.STRUCT, 1)
             self.e.write(oprot)
             oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -20911,8 +24939,8 @@ class create_snapshot_result(object):
         return not (self == other)
 
 
-all_structs.append(create_snapshot_result)
-create_snapshot_result.thrift_spec = (
+all_structs.append(create_snapshot_async_result)
+create_snapshot_async_result.thrift_spec = (
     (
         0,
         TType.STRING,
@@ -20924,73 +24952,18 @@ create_snapshot_result.thrift_spec = (
         1,
         TType.STRUCT,
         "e",
-        [ServerNotFoundException, None],
+        [DefaultException, None],
         None,
     ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "c",
-        [OpenStackConflictException, None],
-        None,
-    ),  # 2
 )
 
 
-class get_limits_args(object):
-    thrift_spec = None
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            fname, ftype, fid = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        self.validate()
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("get_limits_args")
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(get_limits_args)
-get_limits_args.thrift_spec = ()
-
-
-class get_limits_result(object):
+class create_volume_by_source_volume_async_args(object):
     """
     Attributes:
-     - success
+     - volume_name
+     - metadata
+     - source_volume_id
 
     """
 
@@ -20998,9 +24971,13 @@ class get_limits_result(object):
 
     def __init__(
         self,
-        success=None,
+        volume_name=None,
+        metadata=None,
+        source_volume_id=None,
     ):
-        self.success = success
+        self.volume_name = volume_name
+        self.metadata = metadata
+        self.source_volume_id = source_volume_id
 
     def read(self, iprot):
         if (
@@ -21015,25 +24992,43 @@ class get_limits_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.volume_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
                 if ftype == TType.MAP:
-                    self.success = {}
-                    _ktype397, _vtype398, _size396 = iprot.readMapBegin()
-                    for _i400 in range(_size396):
-                        _key401 = (
+                    self.metadata = {}
+                    _ktype523, _vtype524, _size522 = iprot.readMapBegin()
+                    for _i525 in range(_size522):
+                        _key526 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        _val402 = (
+                        _val527 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.success[_key401] = _val402
+                        self.metadata[_key526] = _val527
                     iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.source_volume_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -21046,77 +25041,35 @@ class get_limits_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_limits_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter403, viter404 in self.success.items():
-                oprot.writeString(
-                    kiter403.encode("utf-8") if sys.version_info[0] == 2 else kiter403
-                )
-                oprot.writeString(
-                    viter404.encode("utf-8") if sys.version_info[0] == 2 else viter404
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(get_limits_result)
-get_limits_result.thrift_spec = (
-    (
-        0,
-        TType.MAP,
-        "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 0
-)
-
-
-class get_flavor_resources_args(object):
-    thrift_spec = None
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            fname, ftype, fid = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        self.validate()
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+        oprot.writeStructBegin("create_volume_by_source_volume_async_args")
+        if self.volume_name is not None:
+            oprot.writeFieldBegin("volume_name", TType.STRING, 1)
+            oprot.writeString(
+                self.volume_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.volume_name
             )
-            return
-        oprot.writeStructBegin("get_flavor_resources_args")
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 2)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter528, viter529 in self.metadata.items():
+                oprot.writeString(
+                    kiter528.encode("utf-8") if sys.version_info[0] == 2 else kiter528
+                )
+                oprot.writeString(
+                    viter529.encode("utf-8") if sys.version_info[0] == 2 else viter529
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.source_volume_id is not None:
+            oprot.writeFieldBegin("source_volume_id", TType.STRING, 3)
+            oprot.writeString(
+                self.source_volume_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.source_volume_id
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -21134,14 +25087,38 @@ class get_flavor_resources_args(object):
         return not (self == other)
 
 
-all_structs.append(get_flavor_resources_args)
-get_flavor_resources_args.thrift_spec = ()
+all_structs.append(create_volume_by_source_volume_async_args)
+create_volume_by_source_volume_async_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "volume_name",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "source_volume_id",
+        "UTF8",
+        None,
+    ),  # 3
+)
 
 
-class get_flavor_resources_result(object):
+class create_volume_by_source_volume_async_result(object):
     """
     Attributes:
      - success
+     - e
 
     """
 
@@ -21150,8 +25127,10 @@ class get_flavor_resources_result(object):
     def __init__(
         self,
         success=None,
+        e=None,
     ):
         self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -21167,14 +25146,17 @@ class get_flavor_resources_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    _etype408, _size405 = iprot.readListBegin()
-                    for _i409 in range(_size405):
-                        _elem410 = FlavorResource()
-                        _elem410.read(iprot)
-                        self.success.append(_elem410)
-                    iprot.readListEnd()
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = DefaultException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -21189,13 +25171,18 @@ class get_flavor_resources_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_flavor_resources_result")
+        oprot.writeStructBegin("create_volume_by_source_volume_async_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter411 in self.success:
-                iter411.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -21214,25 +25201,31 @@ class get_flavor_resources_result(object):
         return not (self == other)
 
 
-all_structs.append(get_flavor_resources_result)
-get_flavor_resources_result.thrift_spec = (
+all_structs.append(create_volume_by_source_volume_async_result)
+create_volume_by_source_volume_async_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.STRING,
         "success",
-        (TType.STRUCT, [FlavorResource, None], False),
+        "UTF8",
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [DefaultException, None],
+        None,
+    ),  # 1
 )
 
 
-class start_cluster_args(object):
+class create_volume_by_volume_snap_async_args(object):
     """
     Attributes:
-     - public_keys
-     - master_instance
-     - worker_instances
+     - volume_name
      - metadata
+     - volume_snap_id
 
     """
 
@@ -21240,15 +25233,13 @@ class start_cluster_args(object):
 
     def __init__(
         self,
-        public_keys=None,
-        master_instance=None,
-        worker_instances=None,
+        volume_name=None,
         metadata=None,
+        volume_snap_id=None,
     ):
-        self.public_keys = public_keys
-        self.master_instance = master_instance
-        self.worker_instances = worker_instances
+        self.volume_name = volume_name
         self.metadata = metadata
+        self.volume_snap_id = volume_snap_id
 
     def read(self, iprot):
         if (
@@ -21264,40 +25255,40 @@ class start_cluster_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.LIST:
-                    self.public_keys = []
-                    _etype415, _size412 = iprot.readListBegin()
-                    for _i416 in range(_size412):
-                        _elem417 = (
+                if ftype == TType.STRING:
+                    self.volume_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    _ktype531, _vtype532, _size530 = iprot.readMapBegin()
+                    for _i533 in range(_size530):
+                        _key534 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.public_keys.append(_elem417)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.master_instance = ClusterInstance()
-                    self.master_instance.read(iprot)
+                        _val535 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key534] = _val535
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 3:
-                if ftype == TType.LIST:
-                    self.worker_instances = []
-                    _etype421, _size418 = iprot.readListBegin()
-                    for _i422 in range(_size418):
-                        _elem423 = ClusterInstance()
-                        _elem423.read(iprot)
-                        self.worker_instances.append(_elem423)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRUCT:
-                    self.metadata = ClusterInstanceMetadata()
-                    self.metadata.read(iprot)
+                if ftype == TType.STRING:
+                    self.volume_snap_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -21312,30 +25303,34 @@ class start_cluster_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_cluster_args")
-        if self.public_keys is not None:
-            oprot.writeFieldBegin("public_keys", TType.LIST, 1)
-            oprot.writeListBegin(TType.STRING, len(self.public_keys))
-            for iter424 in self.public_keys:
+        oprot.writeStructBegin("create_volume_by_volume_snap_async_args")
+        if self.volume_name is not None:
+            oprot.writeFieldBegin("volume_name", TType.STRING, 1)
+            oprot.writeString(
+                self.volume_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.volume_name
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 2)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter536, viter537 in self.metadata.items():
                 oprot.writeString(
-                    iter424.encode("utf-8") if sys.version_info[0] == 2 else iter424
+                    kiter536.encode("utf-8") if sys.version_info[0] == 2 else kiter536
                 )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.master_instance is not None:
-            oprot.writeFieldBegin("master_instance", TType.STRUCT, 2)
-            self.master_instance.write(oprot)
-            oprot.writeFieldEnd()
-        if self.worker_instances is not None:
-            oprot.writeFieldBegin("worker_instances", TType.LIST, 3)
-            oprot.writeListBegin(TType.STRUCT, len(self.worker_instances))
-            for iter425 in self.worker_instances:
-                iter425.write(oprot)
-            oprot.writeListEnd()
+                oprot.writeString(
+                    viter537.encode("utf-8") if sys.version_info[0] == 2 else viter537
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.STRUCT, 4)
-            self.metadata.write(oprot)
+        if self.volume_snap_id is not None:
+            oprot.writeFieldBegin("volume_snap_id", TType.STRING, 3)
+            oprot.writeString(
+                self.volume_snap_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.volume_snap_id
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -21354,44 +25349,38 @@ class start_cluster_args(object):
         return not (self == other)
 
 
-all_structs.append(start_cluster_args)
-start_cluster_args.thrift_spec = (
+all_structs.append(create_volume_by_volume_snap_async_args)
+create_volume_by_volume_snap_async_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.LIST,
-        "public_keys",
-        (TType.STRING, "UTF8", False),
+        TType.STRING,
+        "volume_name",
+        "UTF8",
         None,
     ),  # 1
     (
         2,
-        TType.STRUCT,
-        "master_instance",
-        [ClusterInstance, None],
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 2
     (
         3,
-        TType.LIST,
-        "worker_instances",
-        (TType.STRUCT, [ClusterInstance, None], False),
+        TType.STRING,
+        "volume_snap_id",
+        "UTF8",
         None,
     ),  # 3
-    (
-        4,
-        TType.STRUCT,
-        "metadata",
-        [ClusterInstanceMetadata, None],
-        None,
-    ),  # 4
 )
 
 
-class start_cluster_result(object):
+class create_volume_by_volume_snap_async_result(object):
     """
     Attributes:
      - success
+     - e
 
     """
 
@@ -21400,8 +25389,10 @@ class start_cluster_result(object):
     def __init__(
         self,
         success=None,
+        e=None,
     ):
         self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -21417,9 +25408,17 @@ class start_cluster_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.success = ClusterMessage()
-                    self.success.read(iprot)
+                    self.e = DefaultException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -21434,10 +25433,18 @@ class start_cluster_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_cluster_result")
+        oprot.writeStructBegin("create_volume_by_volume_snap_async_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -21456,22 +25463,30 @@ class start_cluster_result(object):
         return not (self == other)
 
 
-all_structs.append(start_cluster_result)
-start_cluster_result.thrift_spec = (
+all_structs.append(create_volume_by_volume_snap_async_result)
+create_volume_by_volume_snap_async_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.STRING,
         "success",
-        [ClusterMessage, None],
+        "UTF8",
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [DefaultException, None],
+        None,
+    ),  # 1
 )
 
 
-class terminate_cluster_args(object):
+class attach_volume_to_server_async_args(object):
     """
     Attributes:
-     - cluster_id
+     - openstack_id
+     - volume_id
 
     """
 
@@ -21479,9 +25494,11 @@ class terminate_cluster_args(object):
 
     def __init__(
         self,
-        cluster_id=None,
+        openstack_id=None,
+        volume_id=None,
     ):
-        self.cluster_id = cluster_id
+        self.openstack_id = openstack_id
+        self.volume_id = volume_id
 
     def read(self, iprot):
         if (
@@ -21498,7 +25515,16 @@ class terminate_cluster_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.cluster_id = (
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.volume_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -21517,13 +25543,21 @@ class terminate_cluster_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("terminate_cluster_args")
-        if self.cluster_id is not None:
-            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+        oprot.writeStructBegin("attach_volume_to_server_async_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.cluster_id.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.cluster_id
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 2)
+            oprot.writeString(
+                self.volume_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.volume_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -21543,23 +25577,31 @@ class terminate_cluster_args(object):
         return not (self == other)
 
 
-all_structs.append(terminate_cluster_args)
-terminate_cluster_args.thrift_spec = (
+all_structs.append(attach_volume_to_server_async_args)
+attach_volume_to_server_async_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "cluster_id",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "volume_id",
+        "UTF8",
+        None,
+    ),  # 2
 )
 
 
-class terminate_cluster_result(object):
+class attach_volume_to_server_async_result(object):
     """
     Attributes:
-     - c
+     - success
+     - e
 
     """
 
@@ -21567,9 +25609,11 @@ class terminate_cluster_result(object):
 
     def __init__(
         self,
-        c=None,
+        success=None,
+        e=None,
     ):
-        self.c = c
+        self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -21584,9 +25628,18 @@ class terminate_cluster_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.c = ClusterNotFoundException.read(iprot)
+                    self.e = DefaultException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -21601,10 +25654,18 @@ class terminate_cluster_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("terminate_cluster_result")
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 1)
-            self.c.write(oprot)
+        oprot.writeStructBegin("attach_volume_to_server_async_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -21623,23 +25684,30 @@ class terminate_cluster_result(object):
         return not (self == other)
 
 
-all_structs.append(terminate_cluster_result)
-terminate_cluster_result.thrift_spec = (
-    None,  # 0
+all_structs.append(attach_volume_to_server_async_result)
+attach_volume_to_server_async_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
     (
         1,
         TType.STRUCT,
-        "c",
-        [ClusterNotFoundException, None],
+        "e",
+        [DefaultException, None],
         None,
     ),  # 1
 )
 
 
-class delete_image_args(object):
+class detach_volume_async_args(object):
     """
     Attributes:
-     - image_id: Id of image
+     - volume_id
+     - server_id
 
     """
 
@@ -21647,9 +25715,11 @@ class delete_image_args(object):
 
     def __init__(
         self,
-        image_id=None,
+        volume_id=None,
+        server_id=None,
     ):
-        self.image_id = image_id
+        self.volume_id = volume_id
+        self.server_id = server_id
 
     def read(self, iprot):
         if (
@@ -21666,7 +25736,16 @@ class delete_image_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.image_id = (
+                    self.volume_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.server_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -21685,13 +25764,21 @@ class delete_image_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_image_args")
-        if self.image_id is not None:
-            oprot.writeFieldBegin("image_id", TType.STRING, 1)
+        oprot.writeStructBegin("detach_volume_async_args")
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
             oprot.writeString(
-                self.image_id.encode("utf-8")
+                self.volume_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.image_id
+                else self.volume_id
+            )
+            oprot.writeFieldEnd()
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 2)
+            oprot.writeString(
+                self.server_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.server_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -21711,22 +25798,30 @@ class delete_image_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_image_args)
-delete_image_args.thrift_spec = (
+all_structs.append(detach_volume_async_args)
+detach_volume_async_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "image_id",
+        "volume_id",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "server_id",
+        "UTF8",
+        None,
+    ),  # 2
 )
 
 
-class delete_image_result(object):
+class detach_volume_async_result(object):
     """
     Attributes:
+     - success
      - e
 
     """
@@ -21735,8 +25830,10 @@ class delete_image_result(object):
 
     def __init__(
         self,
+        success=None,
         e=None,
     ):
+        self.success = success
         self.e = e
 
     def read(self, iprot):
@@ -21752,9 +25849,18 @@ class delete_image_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = ImageNotFoundException.read(iprot)
+                    self.e = DefaultException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -21769,7 +25875,15 @@ class delete_image_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_image_result")
+        oprot.writeStructBegin("detach_volume_async_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
         if self.e is not None:
             oprot.writeFieldBegin("e", TType.STRUCT, 1)
             self.e.write(oprot)
@@ -21791,24 +25905,31 @@ class delete_image_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_image_result)
-delete_image_result.thrift_spec = (
-    None,  # 0
+all_structs.append(detach_volume_async_result)
+detach_volume_async_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
     (
         1,
         TType.STRUCT,
         "e",
-        [ImageNotFoundException, None],
+        [DefaultException, None],
         None,
     ),  # 1
 )
 
 
-class detach_volume_args(object):
+class rescue_server_async_args(object):
     """
     Attributes:
-     - volume_id: Id of the attached volume
-     - server_id: Id of the server where the volume is attached
+     - openstack_id
+     - admin_pass
+     - image_ref
 
     """
 
@@ -21816,11 +25937,13 @@ class detach_volume_args(object):
 
     def __init__(
         self,
-        volume_id=None,
-        server_id=None,
+        openstack_id=None,
+        admin_pass=None,
+        image_ref=None,
     ):
-        self.volume_id = volume_id
-        self.server_id = server_id
+        self.openstack_id = openstack_id
+        self.admin_pass = admin_pass
+        self.image_ref = image_ref
 
     def read(self, iprot):
         if (
@@ -21837,7 +25960,7 @@ class detach_volume_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.volume_id = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -21846,7 +25969,16 @@ class detach_volume_args(object):
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRING:
-                    self.server_id = (
+                    self.admin_pass = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.image_ref = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -21865,21 +25997,29 @@ class detach_volume_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("detach_volume_args")
-        if self.volume_id is not None:
-            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
+        oprot.writeStructBegin("rescue_server_async_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.volume_id.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.volume_id
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 2)
+        if self.admin_pass is not None:
+            oprot.writeFieldBegin("admin_pass", TType.STRING, 2)
+            oprot.writeString(
+                self.admin_pass.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.admin_pass
+            )
+            oprot.writeFieldEnd()
+        if self.image_ref is not None:
+            oprot.writeFieldBegin("image_ref", TType.STRING, 3)
             oprot.writeString(
-                self.server_id.encode("utf-8")
+                self.image_ref.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.server_id
+                else self.image_ref
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -21899,32 +26039,38 @@ class detach_volume_args(object):
         return not (self == other)
 
 
-all_structs.append(detach_volume_args)
-detach_volume_args.thrift_spec = (
+all_structs.append(rescue_server_async_args)
+rescue_server_async_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "volume_id",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "server_id",
+        "admin_pass",
         "UTF8",
         None,
     ),  # 2
+    (
+        3,
+        TType.STRING,
+        "image_ref",
+        "UTF8",
+        None,
+    ),  # 3
 )
 
 
-class detach_volume_result(object):
+class rescue_server_async_result(object):
     """
     Attributes:
+     - success
      - e
-     - c
-     - v
 
     """
 
@@ -21932,13 +26078,11 @@ class detach_volume_result(object):
 
     def __init__(
         self,
+        success=None,
         e=None,
-        c=None,
-        v=None,
     ):
+        self.success = success
         self.e = e
-        self.c = c
-        self.v = v
 
     def read(self, iprot):
         if (
@@ -21953,19 +26097,18 @@ class detach_volume_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = ServerNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.c = OpenStackConflictException.read(iprot)
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
-            elif fid == 3:
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.v = VolumeNotFoundException.read(iprot)
+                    self.e = DefaultException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -21980,19 +26123,19 @@ class detach_volume_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("detach_volume_result")
+        oprot.writeStructBegin("rescue_server_async_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
         if self.e is not None:
             oprot.writeFieldBegin("e", TType.STRUCT, 1)
             self.e.write(oprot)
             oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
-            oprot.writeFieldEnd()
-        if self.v is not None:
-            oprot.writeFieldBegin("v", TType.STRUCT, 3)
-            self.v.write(oprot)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -22010,37 +26153,29 @@ class detach_volume_result(object):
         return not (self == other)
 
 
-all_structs.append(detach_volume_result)
-detach_volume_result.thrift_spec = (
-    None,  # 0
+all_structs.append(rescue_server_async_result)
+rescue_server_async_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
     (
         1,
         TType.STRUCT,
         "e",
-        [ServerNotFoundException, None],
+        [DefaultException, None],
         None,
     ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "c",
-        [OpenStackConflictException, None],
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRUCT,
-        "v",
-        [VolumeNotFoundException, None],
-        None,
-    ),  # 3
 )
 
 
-class delete_volume_args(object):
+class get_operation_args(object):
     """
     Attributes:
-     - volume_id
+     - operation_id
 
     """
 
@@ -22048,9 +26183,9 @@ class delete_volume_args(object):
 
     def __init__(
         self,
-        volume_id=None,
+        operation_id=None,
     ):
-        self.volume_id = volume_id
+        self.operation_id = operation_id
 
     def read(self, iprot):
         if (
@@ -22067,7 +26202,7 @@ class delete_volume_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.volume_id = (
+                    self.operation_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -22086,13 +26221,13 @@ class delete_volume_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_volume_args")
-        if self.volume_id is not None:
-            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
+        oprot.writeStructBegin("get_operation_args")
+        if self.operation_id is not None:
+            oprot.writeFieldBegin("operation_id", TType.STRING, 1)
             oprot.writeString(
-                self.volume_id.encode("utf-8")
+                self.operation_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.volume_id
+                else self.operation_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -22112,24 +26247,24 @@ class delete_volume_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_volume_args)
-delete_volume_args.thrift_spec = (
+all_structs.append(get_operation_args)
+get_operation_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "volume_id",
+        "operation_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class delete_volume_result(object):
+class get_operation_result(object):
     """
     Attributes:
-     - c
-     - v
+     - success
+     - r
 
     """
 
@@ -22137,11 +26272,11 @@ class delete_volume_result(object):
 
     def __init__(
         self,
-        c=None,
-        v=None,
+        success=None,
+        r=None,
     ):
-        self.c = c
-        self.v = v
+        self.success = success
+        self.r = r
 
     def read(self, iprot):
         if (
@@ -22156,14 +26291,15 @@ class delete_volume_result(object):
             fname, ftype, fid = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
+            if fid == 0:
                 if ftype == TType.STRUCT:
-                    self.c = OpenStackConflictException.read(iprot)
+                    self.success = Operation()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.v = VolumeNotFoundException.read(iprot)
+                    self.r = ResourceNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -22178,14 +26314,14 @@ class delete_volume_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_volume_result")
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 1)
-            self.c.write(oprot)
+        oprot.writeStructBegin("get_operation_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
-        if self.v is not None:
-            oprot.writeFieldBegin("v", TType.STRUCT, 2)
-            self.v.write(oprot)
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 1)
+            self.r.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -22204,31 +26340,30 @@ class delete_volume_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_volume_result)
-delete_volume_result.thrift_spec = (
-    None,  # 0
+all_structs.append(get_operation_result)
+get_operation_result.thrift_spec = (
     (
-        1,
+        0,
         TType.STRUCT,
-        "c",
-        [OpenStackConflictException, None],
+        "success",
+        [Operation, None],
         None,
-    ),  # 1
+    ),  # 0
     (
-        2,
+        1,
         TType.STRUCT,
-        "v",
-        [VolumeNotFoundException, None],
+        "r",
+        [ResourceNotFoundException, None],
         None,
-    ),  # 2
+    ),  # 1
 )
 
 
-class attach_volume_to_server_args(object):
+class list_operations_args(object):
     """
     Attributes:
-     - openstack_id: Id of server
-     - volume_id: Id of volume
+     - operation_type
+     - status
 
     """
 
@@ -22236,11 +26371,11 @@ class attach_volume_to_server_args(object):
 
     def __init__(
         self,
-        openstack_id=None,
-        volume_id=None,
+        operation_type=None,
+        status=None,
     ):
-        self.openstack_id = openstack_id
-        self.volume_id = volume_id
+        self.operation_type = operation_type
+        self.status = status
 
     def read(self, iprot):
         if (
@@ -22257,7 +26392,7 @@ class attach_volume_to_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.operation_type = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -22266,7 +26401,7 @@ class attach_volume_to_server_args(object):
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRING:
-                    self.volume_id = (
+                    self.status = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -22285,21 +26420,19 @@ class attach_volume_to_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("attach_volume_to_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("list_operations_args")
+        if self.operation_type is not None:
+            oprot.writeFieldBegin("operation_type", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.operation_type.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.operation_type
             )
             oprot.writeFieldEnd()
-        if self.volume_id is not None:
-            oprot.writeFieldBegin("volume_id", TType.STRING, 2)
+        if self.status is not None:
+            oprot.writeFieldBegin("status", TType.STRING, 2)
             oprot.writeString(
-                self.volume_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.volume_id
+                self.status.encode("utf-8") if sys.version_info[0] == 2 else self.status
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -22319,32 +26452,30 @@ class attach_volume_to_server_args(object):
         return not (self == other)
 
 
-all_structs.append(attach_volume_to_server_args)
-attach_volume_to_server_args.thrift_spec = (
+all_structs.append(list_operations_args)
+list_operations_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "operation_type",
         "UTF8",
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "volume_id",
+        "status",
         "UTF8",
         None,
     ),  # 2
 )
 
 
-class attach_volume_to_server_result(object):
+class list_operations_result(object):
     """
     Attributes:
      - success
-     - e
-     - c
 
     """
 
@@ -22353,12 +26484,8 @@ class attach_volume_to_server_result(object):
     def __init__(
         self,
         success=None,
-        e=None,
-        c=None,
     ):
         self.success = success
-        self.e = e
-        self.c = c
 
     def read(self, iprot):
         if (
@@ -22374,32 +26501,14 @@ class attach_volume_to_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    _ktype427, _vtype428, _size426 = iprot.readMapBegin()
-                    for _i430 in range(_size426):
-                        _key431 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val432 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key431] = _val432
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = VolumeNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.c = OpenStackConflictException.read(iprot)
+                if ftype == TType.LIST:
+                    self.success = []
+                    _etype539, _size538 = iprot.readListBegin()
+                    for _i540 in range(_size538):
+                        _elem541 = Operation()
+                        _elem541.read(iprot)
+                        self.success.append(_elem541)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -22414,26 +26523,13 @@ class attach_volume_to_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("attach_volume_to_server_result")
+        oprot.writeStructBegin("list_operations_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter433, viter434 in self.success.items():
-                oprot.writeString(
-                    kiter433.encode("utf-8") if sys.version_info[0] == 2 else kiter433
-                )
-                oprot.writeString(
-                    viter434.encode("utf-8") if sys.version_info[0] == 2 else viter434
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter542 in self.success:
+                iter542.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -22452,29 +26548,15 @@ class attach_volume_to_server_result(object):
         return not (self == other)
 
 
-all_structs.append(attach_volume_to_server_result)
-attach_volume_to_server_result.thrift_spec = (
+all_structs.append(list_operations_result)
+list_operations_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.LIST,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        (TType.STRUCT, [Operation, None], False),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [VolumeNotFoundException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "c",
-        [OpenStackConflictException, None],
-        None,
-    ),  # 2
 )
 
 
@@ -0,0 +1,117 @@
+import argparse
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import time
+from logging.handlers import QueueListener, RotatingFileHandler
+
+from simple_vm_client.util.logger import (
+    LOG_DATE_FORMAT,
+    LOG_FORMAT,
+    ColoredFormatter,
+    JsonFormatter,
+    Lazy,
+    LogQueueHandler,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+SERVER_IDS = [f"server-{i}" for i in range(500)]
+
+
+def _create_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    bench_logger = logging.getLogger(f"benchmark.{name}")
+    bench_logger.handlers = [handler]
+    bench_logger.propagate = False
+    bench_logger.setLevel(logging.INFO)
+    return bench_logger
+
+
+def _file_handler(log_dir: str, name: str, formatter: logging.Formatter):
+    handler = RotatingFileHandler(
+        os.path.join(log_dir, f"{name}.log"), maxBytes=1 << 30, backupCount=1
+    )
+    handler.setFormatter(formatter)
+    return handler
+
+
+def time_records(bench_logger: logging.Logger, num_records: int, level: int) -> float:
+    start_time = time.perf_counter()
+    for i in range(num_records):
+        bench_logger.log(
+            level,
+            "Server fetched successfully",
+            extra={"server_id": SERVER_IDS[i % len(SERVER_IDS)], "count": i},
+        )
+    return time.perf_counter() - start_time
+
+
+def time_disabled(bench_logger: logging.Logger, num_records: int, lazy: bool) -> float:
+    start_time = time.perf_counter()
+    for _ in range(num_records):
+        server_ids = (
+            Lazy(lambda: [server_id for server_id in SERVER_IDS])
+            if lazy
+            else [server_id for server_id in SERVER_IDS]
+        )
+        bench_logger.debug("Servers fetched", extra={"server_ids": server_ids})
+    return time.perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Logging overhead benchmark")
+    parser.add_argument(
+        "--num-records", type=int, default=20000, help="Number of records to log"
+    )
+    args = parser.parse_args()
+
+    log_dir = tempfile.mkdtemp(prefix="benchmark_logging_")
+    text_formatter = ColoredFormatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    json_formatter = JsonFormatter(datefmt=LOG_DATE_FORMAT)
+
+    def report(name: str, elapsed_time: float) -> None:
+        logger.info(
+            f"{args.num_records} records ({name}) - {elapsed_time:.3f} seconds,"
+            f" {elapsed_time / args.num_records * 1000000:.1f} us per record"
+        )
+
+    try:
+        for name, formatter in [("text", text_formatter), ("json", json_formatter)]:
+            handler = _file_handler(log_dir, f"sync_{name}", formatter)
+            report(
+                f"{name} file handler in the calling thread",
+                time_records(
+                    _create_logger(f"sync_{name}", handler),
+                    args.num_records,
+                    logging.INFO,
+                ),
+            )
+            handler.close()
+
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            handler = _file_handler(log_dir, f"queued_{name}", formatter)
+            listener = QueueListener(log_queue, handler)
+            listener.start()
+            report(
+                f"{name} file handler behind the queue, calling thread only",
+                time_records(
+                    _create_logger(f"queued_{name}", LogQueueHandler(log_queue)),
+                    args.num_records,
+                    logging.INFO,
+                ),
+            )
+            listener.stop()
+            handler.close()
+
+        disabled_logger = _create_logger("disabled", logging.NullHandler())
+        for lazy in [False, True]:
+            report(
+                f"disabled DEBUG with {'lazy' if lazy else 'eager'} extra list",
+                time_disabled(disabled_logger, args.num_records, lazy=lazy),
+            )
+    finally:
+        shutil.rmtree(log_dir, ignore_errors=True)
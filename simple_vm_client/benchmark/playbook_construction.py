@@ -0,0 +1,157 @@
+import argparse
+import importlib.util
+import logging
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import patch
+
+import redis
+import yaml
+
+from simple_vm_client.forc_connector.playbook import playbook as playbook_module
+from simple_vm_client.forc_connector.playbook.playbook import CONDA, Playbook
+from simple_vm_client.forc_connector.template.template import Template
+from simple_vm_client.ttypes import CondaPackage
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+TEMPLATE = "vscode"
+
+
+def _create_workspace() -> str:
+    workspace_dir = tempfile.mkdtemp(prefix="benchmark_workspace_")
+    plays_dir = Template.get_playbook_dir()
+    for name in os.listdir(plays_dir):
+        path = os.path.join(plays_dir, name)
+        if os.path.isfile(path):
+            shutil.copy(path, workspace_dir)
+
+    vars_files = {
+        os.path.join(CONDA, f"{CONDA}_vars_file.yml"): {
+            f"{CONDA}_vars": {"packages": {}, "channels": ["conda-forge", "bioconda"]}
+        },
+        os.path.join(TEMPLATE, f"{TEMPLATE}_vars_file.yml"): {
+            f"{TEMPLATE}_vars": {
+                "template_version": None,
+                "create_only_backend": False,
+                "base_url": None,
+                "port": 8080,
+                "extensions": [f"extension-{i}" for i in range(50)],
+            }
+        },
+    }
+    for file_path, data in vars_files.items():
+        path = os.path.join(workspace_dir, file_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as yaml_file:
+            yaml.safe_dump(data, yaml_file)
+    return os.path.join(workspace_dir, "")
+
+
+def _ruamel_yaml_methods(yaml_exec) -> dict:
+    """Playbook methods as they were before the switch to libyaml."""
+
+    def load_workspace_yaml(self, file_path: str):
+        with open(os.path.join(self.workspace_dir, file_path), mode="r") as yaml_file:
+            return yaml_exec.load(yaml_file)
+
+    def write_yaml(self, file_name: str, data) -> None:
+        target = os.path.join(self.directory.name, file_name)
+        if os.path.islink(target):
+            os.unlink(target)
+        with open(target, mode="w") as yaml_file:
+            yaml_exec.dump(data, yaml_file)
+
+    return {"load_workspace_yaml": load_workspace_yaml, "write_yaml": write_yaml}
+
+
+def construct_playbooks(num_vms: int, variant: str) -> float:
+    pool = redis.ConnectionPool()
+    conda_packages = [
+        CondaPackage(name=f"package{i}", version="1.0.0", build="0") for i in range(20)
+    ]
+    patches = []
+    if variant == "ruamel":
+        import ruamel.yaml
+
+        yaml_exec = ruamel.yaml.YAML()
+        patches = [
+            patch.object(Playbook, name, method)
+            for name, method in _ruamel_yaml_methods(yaml_exec).items()
+        ]
+    for method_patch in patches:
+        method_patch.start()
+    playbooks = []
+    try:
+        start_time = time.perf_counter()
+        for i in range(num_vms):
+            if variant != "libyaml_cached":
+                playbook_module.parsed_yaml_cache.clear()
+            playbooks.append(
+                Playbook(
+                    ip="192.168.0.1",
+                    port=30000 + i,
+                    research_environment_template=TEMPLATE,
+                    research_environment_template_version="v1",
+                    create_only_backend=False,
+                    conda_packages=conda_packages,
+                    apt_packages=["curl", "mosh", "htop"],
+                    osi_private_key="private_key",
+                    public_key="public_key",
+                    pool=pool,
+                    cloud_site="bielefeld",
+                    base_url="https://localhost",
+                )
+            )
+        elapsed_time = time.perf_counter() - start_time
+    finally:
+        for method_patch in patches:
+            method_patch.stop()
+    for playbook in playbooks:
+        playbook.directory.cleanup()
+        Template.release_playbook_workspace(playbook.workspace_dir)
+    return elapsed_time
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Playbook construction benchmark")
+    parser.add_argument(
+        "--num-vms",
+        type=int,
+        default=100,
+        help="Number of playbooks to construct",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=5,
+        help="Rounds per variant, the best one is reported",
+    )
+    args = parser.parse_args()
+    logging.getLogger(playbook_module.__name__).setLevel(logging.WARNING)
+
+    variants = ["libyaml", "libyaml_cached"]
+    # the round-trip path used before, ruamel.yaml is no requirement anymore
+    if importlib.util.find_spec("ruamel") and importlib.util.find_spec("ruamel.yaml"):
+        variants.insert(0, "ruamel")
+    else:
+        logger.warning("ruamel.yaml is not installed, skipping the old path")
+
+    workspace_dir = _create_workspace()
+    try:
+        with patch.object(Template, "workspace_dir", workspace_dir):
+            for variant in variants:
+                elapsed_time = min(
+                    construct_playbooks(args.num_vms, variant=variant)
+                    for _ in range(args.rounds)
+                )
+                logger.info(
+                    f"{args.num_vms} playbooks ({variant}) - {elapsed_time:.2f} seconds,"
+                    f" {elapsed_time / args.num_vms * 1000:.1f} ms per VM"
+                )
+    finally:
+        shutil.rmtree(workspace_dir, ignore_errors=True)
@@ -0,0 +1,126 @@
+import argparse
+import logging
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import ExitStack, closing
+from unittest.mock import MagicMock, patch
+
+from thrift.protocol import TBinaryProtocol
+from thrift.server import TServer
+from thrift.transport import TSocket, TTransport
+
+from simple_vm_client import VirtualMachineHandler as handler_module
+from simple_vm_client.VirtualMachineHandler import VirtualMachineHandler
+from simple_vm_client.VirtualMachineService import Client, Processor
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+CONNECTOR_CLASSES = [
+    "OpenStackConnector",
+    "BibigridConnector",
+    "ForcConnector",
+    "MetadataConnector",
+    "FlavorResourceExporterConnector",
+]
+
+
+def _slow_connector(delay: float) -> MagicMock:
+    def build(config_file: str) -> MagicMock:
+        time.sleep(delay)
+        connector = MagicMock()
+        connector.get_images.return_value = []
+        return connector
+
+    return MagicMock(side_effect=build)
+
+
+def _free_port() -> int:
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _first_request(port: int, deadline: float) -> None:
+    while True:
+        transport = TTransport.TBufferedTransport(TSocket.TSocket("127.0.0.1", port))
+        try:
+            transport.open()
+        except TTransport.TTransportException:
+            if time.perf_counter() > deadline:
+                raise
+            time.sleep(0.005)
+            continue
+        try:
+            Client(TBinaryProtocol.TBinaryProtocol(transport)).get_images()
+        finally:
+            transport.close()
+        return
+
+
+def time_to_first_request(delay: float, eager: bool) -> float:
+    """Start a server with connectors which take `delay` seconds to build."""
+    port = _free_port()
+    start_time = time.perf_counter()
+    with ExitStack() as stack:
+        for name in CONNECTOR_CLASSES:
+            stack.enter_context(
+                patch.object(handler_module, name, _slow_connector(delay))
+            )
+
+        def serve() -> None:
+            handler = VirtualMachineHandler("benchmark_config.yml")
+            if eager:
+                handler.init_connectors()
+            server = TServer.TThreadPoolServer(
+                Processor(handler),
+                TSocket.TServerSocket(host="127.0.0.1", port=port),
+                TTransport.TBufferedTransportFactory(),
+                TBinaryProtocol.TBinaryProtocolFactory(),
+                daemon=True,
+            )
+            server.setNumThreads(4)
+            server.serve()
+
+        threading.Thread(target=serve, daemon=True).start()
+        _first_request(port, deadline=start_time + 60 + delay * 10)
+    return time.perf_counter() - start_time
+
+
+def import_time() -> float:
+    """Import the server module in a fresh interpreter."""
+    code = (
+        "import time; start_time = time.perf_counter(); "
+        "import simple_vm_client.VirtualMachineServer; "
+        "print(time.perf_counter() - start_time)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server startup benchmark")
+    parser.add_argument(
+        "--connector-delay",
+        type=float,
+        default=1.0,
+        help="Seconds each simulated connector takes to initialize",
+    )
+    args = parser.parse_args()
+    logging.getLogger(handler_module.__name__).setLevel(logging.WARNING)
+    # connection attempts before the server listens are expected to fail
+    logging.getLogger(TSocket.__name__).setLevel(logging.CRITICAL)
+
+    logger.info(f"Importing the server module - {import_time():.2f} seconds")
+    for eager in [True, False]:
+        elapsed_time = time_to_first_request(args.connector_delay, eager=eager)
+        logger.info(
+            f"Time to first request ({'eager' if eager else 'lazy'} connectors)"
+            f" - {elapsed_time:.2f} seconds"
+        )
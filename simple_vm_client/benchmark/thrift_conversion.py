@@ -0,0 +1,111 @@
+import argparse
+import logging
+import time
+
+from openstack.compute.v2.flavor import Flavor as OpenStack_Flavor
+from openstack.compute.v2.server import Server as OpenStack_Server
+from openstack.image.v2.image import Image as OpenStack_Image
+
+from simple_vm_client.util import thrift_converter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _create_servers(
+    num_servers: int, num_flavors: int, num_images: int
+) -> list[OpenStack_Server]:
+    flavors = [
+        OpenStack_Flavor(
+            id=f"flavor-{i}",
+            name=f"de.NBI {i}",
+            vcpus=i + 1,
+            ram=(i + 1) * 2048,
+            disk=20,
+            ephemeral=0,
+            description="",
+        )
+        for i in range(num_flavors)
+    ]
+    images = [
+        OpenStack_Image(
+            id=f"image-{i}",
+            name=f"Ubuntu-22.04-{i}",
+            min_disk=20,
+            min_ram=1024,
+            status="active",
+            created_at="2024-01-01T00:00:00Z",
+            updated_at="2024-01-02T00:00:00Z",
+            tags=["portalclient", "ubuntu"],
+            properties={"image_type": "image", "description": "Ubuntu"},
+        )
+        for i in range(num_images)
+    ]
+    servers = []
+    for i in range(num_servers):
+        server = OpenStack_Server.existing(
+            **{
+                "id": f"server-{i}",
+                "name": f"vm-{i}",
+                "tenant_id": "project",
+                "key_name": f"key-{i}",
+                "created": "2024-01-03T00:00:00Z",
+                "OS-EXT-STS:vm_state": "active",
+                "OS-EXT-STS:task_state": None,
+                "metadata": {"project_name": "benchmark", "elixir_id": f"user-{i}"},
+                "addresses": {
+                    "portalexternalnetwork": [
+                        {
+                            "OS-EXT-IPS:type": "fixed",
+                            "addr": f"192.168.{i // 250}.{i % 250}",
+                        }
+                    ]
+                },
+                "os-extended-volumes:volumes_attached": [{"id": f"volume-{i}"}],
+            }
+        )
+        # OpenStackConnector replaces the flavor/image references with shared resources
+        server.flavor = flavors[i % num_flavors]
+        server.image = images[i % num_images]
+        servers.append(server)
+    return servers
+
+
+def convert_attributes(servers: list[OpenStack_Server]) -> float:
+    start_time = time.perf_counter()
+    for server in servers:
+        thrift_converter._os_to_thrift_server_attributes(openstack_server=server)
+    return time.perf_counter() - start_time
+
+
+def convert_records(servers: list[OpenStack_Server]) -> float:
+    start_time = time.perf_counter()
+    thrift_converter.os_to_thrift_servers(openstack_servers=servers)
+    return time.perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server to VM conversion benchmark")
+    parser.add_argument(
+        "--num-servers", type=int, default=5000, help="Number of servers to convert"
+    )
+    parser.add_argument(
+        "--num-flavors", type=int, default=20, help="Number of distinct flavors"
+    )
+    parser.add_argument(
+        "--num-images", type=int, default=50, help="Number of distinct images"
+    )
+    args = parser.parse_args()
+
+    servers = _create_servers(args.num_servers, args.num_flavors, args.num_images)
+    for name, convert in [
+        ("attribute access", convert_attributes),
+        ("raw body records, cold cache", convert_records),
+        ("raw body records, warm cache", convert_records),
+    ]:
+        elapsed_time = convert(servers)
+        logger.info(
+            f"{args.num_servers} servers ({name}) - {elapsed_time:.3f} seconds,"
+            f" {elapsed_time / args.num_servers * 1000000:.1f} us per VM"
+        )
@@ -1,3 +1,8 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+
 import requests
 import yaml
 from requests.adapters import HTTPAdapter
@@ -16,6 +21,66 @@ from simple_vm_client.util.logger import setup_custom_logger
 
 logger = setup_custom_logger(__name__)
 DEFAULT_TIMEOUT = (5, 30)
+CLUSTER_STATES_WORKERS = 10
+CLUSTER_STATES_DEADLINE = 20
+CLUSTER_STATE_CACHE_TTL = 10
+# number of lines requested per log tail poll
+CLUSTER_LOG_TAIL_WINDOW = 500
+CLUSTER_LOG_BUFFER_LINES = 5000
+CLUSTER_LOG_TAIL_TTL = 60 * 60
+CLUSTER_TERMINAL_STATES = {"running", "failed", "terminated"}
+
+
+class ClusterLogTail:
+    """
+    Cursor and the last lines of a cluster log.
+
+    offset is the number of complete log lines seen so far, lines holds the
+    last of them.
+    """
+
+    def __init__(self, max_lines: int = CLUSTER_LOG_BUFFER_LINES):
+        self.offset = 0
+        self.lines: deque[str] = deque(maxlen=max_lines)
+        self.loaded = False
+        self.last_access = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reset(self, lines: list[str]) -> None:
+        self.lines.clear()
+        self.lines.extend(lines)
+        self.offset = len(lines)
+        self.loaded = True
+
+    def merge(self, window: list[str], window_size: int) -> bool:
+        """
+        Append the lines of window, the last lines of the log, which follow
+        the known lines.
+
+        Returns:
+            bool: False if the window does not overlap with the known lines.
+        """
+        seen = self.offset
+        if len(window) < window_size:
+            # the window holds the whole log
+            if len(window) < seen:
+                return False
+            self.lines.extend(window[seen:])
+            self.offset = len(window)
+            return True
+        known = list(self.lines)
+        for new_lines in range(len(window)):
+            overlap = len(window) - new_lines
+            if overlap <= len(known) and known[-overlap:] == window[:overlap]:
+                self.lines.extend(window[overlap:])
+                self.offset += new_lines
+                return True
+        return False
+
+    def lines_after(self, offset: int) -> list[str]:
+        first_buffered = self.offset - len(self.lines)
+        start = max(offset, first_buffered) - first_buffered
+        return list(self.lines)[start:]
 
 
 class BibigridConnector:
@@ -34,6 +99,12 @@ class BibigridConnector:
         self._PRODUCTION = True
         self._DEFAULT_SECURITY_GROUP_NAME: str = "defaultSimpleVM"
 
+        # cluster id -> (state, fetched at)
+        self._cluster_state_cache: dict[str, tuple[ClusterState, float]] = {}
+        self._cluster_state_cache_lock = threading.Lock()
+        self._cluster_log_tails: dict[str, ClusterLogTail] = {}
+        self._cluster_log_tails_lock = threading.Lock()
+
         self.load_config_yml(config_file=config_file)
         self.session = self._create_session()
 
@@ -122,6 +193,75 @@ class BibigridConnector:
             logger.exception("Error while getting Cluster status")
             return {"error": str(e)}
 
+    def _fetch_cluster_log_lines(
+        self, cluster_id: str, lines: int = None  # type: ignore
+    ) -> tuple[str, list[str]]:
+        request_url = f"{self._BIBIGRID_EP}/bibigrid/log/{cluster_id}"
+        response = self.session.get(
+            url=request_url,
+            params={"lines": lines} if lines else None,
+            timeout=DEFAULT_TIMEOUT,
+        )
+        if response.status_code == 404:
+            raise ClusterNotFoundException(message=f"Cluster {cluster_id} not found!")
+        response.raise_for_status()
+        json_resp = response.json(strict=False)
+        log_lines = (json_resp["log"] or "").splitlines(keepends=True)
+        # a last line without newline is still being written
+        if log_lines and not log_lines[-1].endswith("\n"):
+            log_lines.pop()
+        return json_resp["message"], log_lines
+
+    def _get_cluster_log_tail(self, cluster_id: str) -> ClusterLogTail:
+        now = time.monotonic()
+        with self._cluster_log_tails_lock:
+            for tail_cluster_id, tail in list(self._cluster_log_tails.items()):
+                if now - tail.last_access > CLUSTER_LOG_TAIL_TTL:
+                    del self._cluster_log_tails[tail_cluster_id]
+            tail = self._cluster_log_tails.setdefault(cluster_id, ClusterLogTail())
+            tail.last_access = now
+            return tail
+
+    def drop_cluster_log_tail(self, cluster_id: str) -> None:
+        with self._cluster_log_tails_lock:
+            self._cluster_log_tails.pop(cluster_id, None)
+
+    def get_cluster_log_tail(self, cluster_id: str, offset: int) -> ClusterLog:
+        """
+        Get the log lines of a cluster after offset.
+
+        Only the last CLUSTER_LOG_TAIL_WINDOW lines are requested from BiBiGrid
+        as long as they overlap with the lines seen before, otherwise the whole
+        log is fetched again. The last CLUSTER_LOG_BUFFER_LINES lines are kept,
+        an older offset gets the oldest kept lines.
+
+        Returns:
+            ClusterLog: The new lines and the offset of the next request.
+        """
+        logger.info(f"Get Cluster {cluster_id} logs after line {offset}...")
+        tail = self._get_cluster_log_tail(cluster_id=cluster_id)
+        with tail.lock:
+            if tail.loaded:
+                message, window = self._fetch_cluster_log_lines(
+                    cluster_id=cluster_id, lines=CLUSTER_LOG_TAIL_WINDOW
+                )
+                merged = tail.merge(window, window_size=CLUSTER_LOG_TAIL_WINDOW)
+            else:
+                merged = False
+            if not merged:
+                message, log_lines = self._fetch_cluster_log_lines(
+                    cluster_id=cluster_id
+                )
+                tail.reset(log_lines)
+            lines = tail.lines_after(offset)
+            tail_offset = tail.offset
+        return ClusterLog(
+            cluster_id=cluster_id,
+            message=message,
+            log="".join(lines),
+            offset=tail_offset,
+        )
+
     def get_cluster_supported_ubuntu_os_versions(self) -> list[str]:
         """
         Retrieves the supported Ubuntu OS versions for cluster nodes.
@@ -160,10 +300,66 @@ class BibigridConnector:
 
         if response.status_code == 200:
             response_content = response.json()
-            return ClusterState(**response_content)
+            cluster_state = ClusterState(**response_content)
+            if (cluster_state.state or "").lower() in CLUSTER_TERMINAL_STATES:
+                self.drop_cluster_log_tail(cluster_id=cluster_id)
+            return cluster_state
         else:
             raise ClusterNotFoundException(message=f"Cluster {cluster_id} not found!")
 
+    def get_cluster_states(self, cluster_ids: list[str]) -> dict[str, ClusterState]:
+        """
+        Get the states of several clusters concurrently.
+
+        States are cached for CLUSTER_STATE_CACHE_TTL seconds. Clusters whose
+        state could not be fetched within CLUSTER_STATES_DEADLINE are left out.
+
+        Returns:
+            dict[str, ClusterState]: Cluster states keyed by cluster id.
+        """
+        logger.info(f"Get Cluster states from {cluster_ids}")
+        cluster_ids = list(dict.fromkeys(cluster_ids))
+        states: dict[str, ClusterState] = {}
+        now = time.monotonic()
+        with self._cluster_state_cache_lock:
+            for cluster_id in cluster_ids:
+                cached = self._cluster_state_cache.get(cluster_id)
+                if cached and now - cached[1] < CLUSTER_STATE_CACHE_TTL:
+                    states[cluster_id] = cached[0]
+        missing = [cluster_id for cluster_id in cluster_ids if cluster_id not in states]
+        if not missing:
+            return states
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(CLUSTER_STATES_WORKERS, len(missing))
+        )
+        futures = {
+            executor.submit(self.get_cluster_state, cluster_id): cluster_id
+            for cluster_id in missing
+        }
+        done, not_done = wait(futures, timeout=CLUSTER_STATES_DEADLINE)
+        executor.shutdown(wait=False, cancel_futures=True)
+        if not_done:
+            logger.warning(
+                f"Getting the state of {len(not_done)} clusters exceeded the deadline of {CLUSTER_STATES_DEADLINE}s"
+            )
+        fetched_at = time.monotonic()
+        with self._cluster_state_cache_lock:
+            for future in done:
+                cluster_id = futures[future]
+                if future.exception():
+                    logger.error(
+                        f"Getting the state of cluster {cluster_id} failed. {future.exception()}"
+                    )
+                    continue
+                states[cluster_id] = future.result()
+                self._cluster_state_cache[cluster_id] = (states[cluster_id], fetched_at)
+            # drop expired entries of clusters which are not polled anymore
+            for cluster_id, (_, cached_at) in list(self._cluster_state_cache.items()):
+                if fetched_at - cached_at >= CLUSTER_STATE_CACHE_TTL:
+                    del self._cluster_state_cache[cluster_id]
+        return states
+
     def get_cluster_info(self, cluster_id: str) -> ClusterInfo:
         logger.info(f"Get Cluster info from {cluster_id}")
         request_url = f"{self._BIBIGRID_EP}/bibigrid/info/{cluster_id}"
@@ -194,6 +390,7 @@ class BibigridConnector:
     def terminate_cluster(self, cluster_id: str) -> dict[str, str]:
         # TODO only needs specific config keywoards
         logger.info(f"Terminate cluster: {cluster_id}")
+        self.drop_cluster_log_tail(cluster_id=cluster_id)
         response: dict[str, str] = self.session.delete(
             url=f"{self._BIBIGRID_EP}/bibigrid/terminate/{cluster_id}",
             timeout=DEFAULT_TIMEOUT,
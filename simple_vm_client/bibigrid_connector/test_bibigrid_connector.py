@@ -1,15 +1,21 @@
 import os
 import tempfile
+import threading
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 
 import requests
 
-from simple_vm_client.bibigrid_connector.bibigrid_connector import BibigridConnector
+from simple_vm_client.bibigrid_connector import bibigrid_connector
+from simple_vm_client.bibigrid_connector.bibigrid_connector import (
+    BibigridConnector,
+    ClusterLogTail,
+)
 from simple_vm_client.ttypes import (
     ClusterInfo,
     ClusterInstance,
     ClusterInstanceMetadata,
+    ClusterLog,
     ClusterMessage,
     ClusterState,
     ClusterVolume,
@@ -316,3 +322,143 @@ class TestBibigridConnector(unittest.TestCase):
         mock_response.json.assert_called_once()
         mock_response.raise_for_status.assert_called_once()
         self.assertEqual(result, ClusterState(**response_data))
+
+    @patch(
+        "simple_vm_client.bibigrid_connector.bibigrid_connector.BibigridConnector.get_cluster_state"
+    )
+    def test_get_cluster_states(self, mock_get_cluster_state):
+        mock_get_cluster_state.side_effect = lambda cluster_id: ClusterState(
+            cluster_id=cluster_id, message="test", state="running"
+        )
+
+        result = self.connector.get_cluster_states(["1", "2", "1"])
+        self.assertEqual(
+            result,
+            {
+                "1": ClusterState(cluster_id="1", message="test", state="running"),
+                "2": ClusterState(cluster_id="2", message="test", state="running"),
+            },
+        )
+        self.assertEqual(mock_get_cluster_state.call_count, 2)
+
+        # served from the cache
+        self.assertEqual(self.connector.get_cluster_states(["2", "1"]), result)
+        self.assertEqual(mock_get_cluster_state.call_count, 2)
+
+    @patch(
+        "simple_vm_client.bibigrid_connector.bibigrid_connector.BibigridConnector.get_cluster_state"
+    )
+    def test_get_cluster_states_partial(self, mock_get_cluster_state):
+        def get_cluster_state(cluster_id):
+            if cluster_id == "404":
+                raise requests.HTTPError("not found")
+            return ClusterState(cluster_id=cluster_id, message="test", state="running")
+
+        mock_get_cluster_state.side_effect = get_cluster_state
+
+        result = self.connector.get_cluster_states(["1", "404"])
+
+        self.assertEqual(list(result), ["1"])
+        self.assertNotIn("404", self.connector._cluster_state_cache)
+
+    @patch.object(bibigrid_connector, "CLUSTER_STATES_DEADLINE", 0.1)
+    @patch(
+        "simple_vm_client.bibigrid_connector.bibigrid_connector.BibigridConnector.get_cluster_state"
+    )
+    def test_get_cluster_states_deadline(self, mock_get_cluster_state):
+        released = threading.Event()
+
+        def get_cluster_state(cluster_id):
+            if cluster_id == "slow":
+                released.wait(5)
+            return ClusterState(cluster_id=cluster_id, message="test", state="running")
+
+        mock_get_cluster_state.side_effect = get_cluster_state
+
+        result = self.connector.get_cluster_states(["1", "slow"])
+        released.set()
+
+        self.assertEqual(list(result), ["1"])
+
+    def test_cluster_log_tail_merge(self):
+        tail = ClusterLogTail(max_lines=4)
+        tail.reset(["1\n", "2\n", "3\n"])
+
+        # the whole log is shorter than the window
+        self.assertTrue(tail.merge(["1\n", "2\n", "3\n", "4\n"], window_size=5))
+        self.assertEqual(tail.offset, 4)
+        self.assertTrue(tail.merge(["3\n", "4\n", "5\n"], window_size=3))
+        self.assertEqual(tail.offset, 5)
+        self.assertEqual(list(tail.lines), ["2\n", "3\n", "4\n", "5\n"])
+        self.assertTrue(tail.merge(["3\n", "4\n", "5\n"], window_size=3))
+        self.assertEqual(tail.offset, 5)
+
+        # more new lines than the window holds
+        self.assertFalse(tail.merge(["7\n", "8\n", "9\n"], window_size=3))
+
+        self.assertEqual(tail.lines_after(3), ["4\n", "5\n"])
+        self.assertEqual(tail.lines_after(0), ["2\n", "3\n", "4\n", "5\n"])
+        self.assertEqual(tail.lines_after(5), [])
+
+    @patch.object(bibigrid_connector, "CLUSTER_LOG_TAIL_WINDOW", 3)
+    @patch(
+        "simple_vm_client.bibigrid_connector.bibigrid_connector.requests.Session.get"
+    )
+    def test_get_cluster_log_tail(self, mock_get):
+        cluster_id = "123"
+        logs = [
+            "line1\nline2\nline3\npartial",
+            "line2\nline3\nline4\n",
+            "line3\nline4\nline5\n",
+        ]
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                json=MagicMock(return_value={"message": "Log found", "log": log}),
+            )
+            for log in logs
+        ]
+
+        result = self.connector.get_cluster_log_tail(cluster_id, offset=0)
+        self.assertEqual(
+            result,
+            ClusterLog(
+                cluster_id=cluster_id,
+                message="Log found",
+                log="line1\nline2\nline3\n",
+                offset=3,
+            ),
+        )
+        mock_get.assert_called_with(
+            url=f"{self.connector._BIBIGRID_EP}/bibigrid/log/{cluster_id}",
+            params=None,
+            timeout=DEFAULT_TIMEOUT,
+        )
+
+        result = self.connector.get_cluster_log_tail(cluster_id, offset=3)
+        self.assertEqual((result.log, result.offset), ("line4\n", 4))
+        mock_get.assert_called_with(
+            url=f"{self.connector._BIBIGRID_EP}/bibigrid/log/{cluster_id}",
+            params={"lines": 3},
+            timeout=DEFAULT_TIMEOUT,
+        )
+        result = self.connector.get_cluster_log_tail(cluster_id, offset=2)
+        self.assertEqual((result.log, result.offset), ("line3\nline4\nline5\n", 5))
+
+    @patch(
+        "simple_vm_client.bibigrid_connector.bibigrid_connector.requests.Session.get"
+    )
+    def test_get_cluster_state_drops_log_tail(self, mock_get):
+        self.connector._get_cluster_log_tail("123")
+        mock_get.return_value = MagicMock(status_code=200)
+        mock_get.return_value.json.return_value = {
+            "cluster_id": "123",
+            "message": "test",
+            "state": "starting",
+        }
+        self.connector.get_cluster_state("123")
+        self.assertIn("123", self.connector._cluster_log_tails)
+
+        mock_get.return_value.json.return_value["state"] = "Running"
+        self.connector.get_cluster_state("123")
+        self.assertNotIn("123", self.connector._cluster_log_tails)
@@ -0,0 +1,70 @@
+import threading
+import time
+
+from simple_vm_client.ttypes import Backend
+
+BACKENDS_CACHE_TTL = 30
+
+
+class BackendRegistry:
+    """
+    In memory copy of the FORC backend list, indexed by id, owner and template.
+
+    The list is considered stale after ``ttl`` seconds or after invalidate().
+    """
+
+    def __init__(self, ttl: float = BACKENDS_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._backends: list[Backend] = []
+        self._by_id: dict[str, Backend] = {}
+        self._by_owner: dict[str, list[Backend]] = {}
+        self._by_template: dict[str, list[Backend]] = {}
+        self._loaded_at: float = 0.0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def is_fresh(self) -> bool:
+        return bool(self._loaded_at) and time.monotonic() - self._loaded_at < self.ttl
+
+    def update(self, backends: list[Backend], generation: int = None) -> None:  # type: ignore
+        """
+        Replace the cached list.
+
+        A list that was fetched before the last invalidate() is dropped.
+        """
+        by_id: dict[str, Backend] = {}
+        by_owner: dict[str, list[Backend]] = {}
+        by_template: dict[str, list[Backend]] = {}
+        for backend in backends:
+            by_id[str(backend.id)] = backend
+            by_owner.setdefault(backend.owner, []).append(backend)
+            by_template.setdefault(backend.template, []).append(backend)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._backends = list(backends)
+            self._by_id = by_id
+            self._by_owner = by_owner
+            self._by_template = by_template
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._loaded_at = 0.0
+
+    def get_all(self) -> list[Backend]:
+        return list(self._backends)
+
+    def get_by_id(self, backend_id: str) -> Backend | None:
+        return self._by_id.get(str(backend_id))
+
+    def get_by_owner(self, owner: str) -> list[Backend]:
+        return list(self._by_owner.get(owner, []))
+
+    def get_by_template(self, template: str) -> list[Backend]:
+        return list(self._by_template.get(template, []))
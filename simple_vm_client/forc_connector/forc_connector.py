@@ -2,6 +2,7 @@ import json
 import os
 import time
 import urllib
+from concurrent.futures import ThreadPoolExecutor
 
 import redis
 import requests
@@ -18,14 +19,17 @@ from simple_vm_client.ttypes import (
     PlaybookResult,
     TemplateNotFoundException,
 )
+from simple_vm_client.util.http_client import HttpClient
 from simple_vm_client.util.logger import setup_custom_logger
 from simple_vm_client.util.state_enums import VmTaskStates
 
-from .playbook.playbook import Playbook
+from .backend_registry import BackendRegistry
+from .playbook.playbook import DEFAULT_ANSIBLE_SETTINGS, Playbook
 from .template.template import ResearchEnvironmentMetadata, Template
 
 logger = setup_custom_logger(__name__)
 BIOCONDA = "bioconda"
+BACKEND_USERS_WORKERS = 8
 
 
 class ForcConnector:
@@ -41,14 +45,20 @@ class ForcConnector:
         self.REDIS_PORT: int = None  # type: ignore
         self.FORC_API_KEY: str = ""
         self.UPDATE_TEMPLATES_SCHEDULE = 12
+        self.ANSIBLE_SETTINGS: dict = {}
+        # deploy requests which arrived during a template update
+        self.pending_playbooks: dict[str, dict] = {}
         self.redis_pool: redis.ConnectionPool = None  # type: ignore
         self.redis_connection: redis.Redis.connection_pool = None
         self.load_config(config_file=config_file)
         self.connect_to_redis()
+        self.http_client = HttpClient()
+        self.backend_registry = BackendRegistry()
         self.template = Template(
             github_playbook_repo=self.GITHUB_PLAYBOOKS_REPO,
             forc_backend_url=self.FORC_BACKEND_URL,
             forc_api_key=self.FORC_API_KEY,
+            http_client=self.http_client,
         )
         self.start_template_update_scheduler()
 
@@ -73,6 +83,7 @@ class ForcConnector:
             self.UPDATE_TEMPLATES_SCHEDULE = cfg["forc"].get(
                 "update_templates_schedule", 12
             )
+            self.ANSIBLE_SETTINGS = cfg["forc"].get("ansible", None) or {}
 
         self.load_env()
 
@@ -91,7 +102,19 @@ class ForcConnector:
 
         if not self.is_any_playbook_active():
             logger.info("No active playbook --start update \n\n\n\n")
-            self.template.update_playbooks()
+            try:
+                # deferred deploys start once the new playbooks are active
+                self.template.update_playbooks(
+                    on_activated=self.dispatch_pending_playbooks
+                )
+            finally:
+                self.dispatch_pending_playbooks()
+            Template.prune_playbook_fact_cache(
+                max_age=self.ANSIBLE_SETTINGS.get(
+                    "fact_caching_timeout",
+                    DEFAULT_ANSIBLE_SETTINGS["fact_caching_timeout"],
+                )
+            )
         else:
             logger.error(
                 "Failed to update templates after {} retries".format(max_retries)
@@ -131,7 +154,7 @@ class ForcConnector:
         logger.info(f"Get users from backend {backend_id}")
         get_url = f"{self.FORC_BACKEND_URL}users/{backend_id}"
         try:
-            response = requests.get(
+            response = self.http_client.get(
                 get_url,
                 timeout=(30, 30),
                 headers={"X-API-KEY": self.FORC_API_KEY},
@@ -151,7 +174,7 @@ class ForcConnector:
             "user": user_id,
         }
         try:
-            response = requests.delete(
+            response = self.http_client.delete(
                 delete_url,
                 json=user_info,
                 timeout=(30, 30),
@@ -170,12 +193,13 @@ class ForcConnector:
         logger.info(f"Activate authentication for backend {backend_id}")
         post_url = f"{self.FORC_BACKEND_URL}backends/{backend_id}/auth/"
         try:
-            response = requests.post(
+            response = self.http_client.post(
                 post_url,
                 timeout=(30, 30),
                 headers={"X-API-KEY": self.FORC_API_KEY},
                 json={"auth_enabled": True},
             )
+            self.backend_registry.invalidate()
             data = response.json()
             logger.info(f"activate_auth_for_backend response: {data}")
             # process data and return Backend object
@@ -199,12 +223,13 @@ class ForcConnector:
         logger.info(f"Deactivate authentication for backend {backend_id}")
         post_url = f"{self.FORC_BACKEND_URL}backends/{backend_id}/auth/"
         try:
-            response = requests.post(
+            response = self.http_client.post(
                 post_url,
                 timeout=(30, 30),
                 headers={"X-API-KEY": self.FORC_API_KEY},
                 json={"auth_enabled": False},
             )
+            self.backend_registry.invalidate()
             logger.debug(f"deactivate_auth_for_backend() Response: {response.text}")
             data = response.json()
             # process data and return Backend object
@@ -228,11 +253,12 @@ class ForcConnector:
         logger.info(f"Delete Backend {backend_id}")
         delete_url = f"{self.FORC_BACKEND_URL}backends/{backend_id}"
         try:
-            response = requests.delete(
+            response = self.http_client.delete(
                 delete_url,
                 timeout=(30, 30),
                 headers={"X-API-KEY": self.FORC_API_KEY},
             )
+            self.backend_registry.invalidate()
             if response.status_code:
                 if response.status_code == 404 or response.status_code == 500:
                     try:
@@ -259,7 +285,7 @@ class ForcConnector:
         }
 
         try:
-            response = requests.post(
+            response = self.http_client.post(
                 post_url,
                 json=user_info,
                 timeout=(30, 30),
@@ -280,6 +306,45 @@ class ForcConnector:
             logger.exception(e)
             raise BackendNotFoundException(message=str(e), name_or_id=backend_id)
 
+    def add_users_to_backend(
+        self, backend_id: str, user_ids: list[str]
+    ) -> dict[str, dict[str, str]]:
+        logger.info(f"Add users {user_ids} to backend {backend_id}")
+        return self._update_backend_users(
+            self.add_user_to_backend, backend_id=backend_id, user_ids=user_ids
+        )
+
+    def delete_users_from_backend(
+        self, backend_id: str, user_ids: list[str]
+    ) -> dict[str, dict[str, str]]:
+        logger.info(f"Delete users {user_ids} from backend {backend_id}")
+        return self._update_backend_users(
+            self.delete_user_from_backend, backend_id=backend_id, user_ids=user_ids
+        )
+
+    def _update_backend_users(
+        self, update_user, backend_id: str, user_ids: list[str]
+    ) -> dict[str, dict[str, str]]:
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return {}
+        results: dict[str, dict[str, str]] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(BACKEND_USERS_WORKERS, len(user_ids))
+        ) as executor:
+            futures = {
+                user_id: executor.submit(
+                    update_user, backend_id=backend_id, user_id=user_id
+                )
+                for user_id in user_ids
+            }
+            for user_id, future in futures.items():
+                try:
+                    results[user_id] = future.result()
+                except BackendNotFoundException as e:
+                    results[user_id] = {"Error": str(e.message)}
+        return results
+
     def create_backend(
         self, owner: str, user_key_url: str, template: str, upstream_url: str
     ) -> Backend:
@@ -307,12 +372,13 @@ class ForcConnector:
         }
 
         try:
-            response = requests.post(
+            response = self.http_client.post(
                 post_url,
                 json=backend_info,
                 timeout=(30, 30),
                 headers={"X-API-KEY": self.FORC_API_KEY},
             )
+            self.backend_registry.invalidate()
 
             data = response.json()
             logger.info(f"Backend created {data}")
@@ -323,7 +389,7 @@ class ForcConnector:
                 location_url=data["location_url"],
                 template=data["template"],
                 template_version=data["template_version"],
-                auth_enabled=data.get("auth_enabled",True),
+                auth_enabled=data.get("auth_enabled", True),
             )
             return new_backend
 
@@ -337,9 +403,12 @@ class ForcConnector:
 
     def get_backends(self) -> list[Backend]:
         logger.info("Get Backends")
+        if self.backend_registry.is_fresh():
+            return self.backend_registry.get_all()
         get_url = f"{self.FORC_BACKEND_URL}backends"
+        generation = self.backend_registry.generation
         try:
-            response = requests.get(
+            response = self.http_client.get(
                 get_url,
                 timeout=(30, 30),
                 headers={"X-API-KEY": self.FORC_API_KEY},
@@ -358,45 +427,30 @@ class ForcConnector:
                             template_version=data["template_version"],
                         )
                     )
+                self.backend_registry.update(backends, generation=generation)
                 return backends
         except requests.Timeout as e:
             logger.exception(msg=f"create_backend timed out. {e}")
             raise DefaultException(message=str(e))
 
+    def _load_backend_registry(self) -> BackendRegistry:
+        if not self.backend_registry.is_fresh():
+            self.get_backends()
+        return self.backend_registry
+
     def get_backends_by_template(self, template: str) -> list[Backend]:
         logger.info(f"Get Backends by template: {template}")
-        get_url = f"{self.FORC_BACKEND_URL}backends/byTemplate/{template}"
-        try:
-            response = requests.get(
-                get_url,
-                timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-            )
-            if response.status_code == 401:
-                raise DefaultException(message=str(response.json()))
-
-            else:
-                backends = []
-                for data in response.json():
-                    backends.append(
-                        Backend(
-                            id=data["id"],
-                            owner=data["owner"],
-                            location_url=data["location_url"],
-                            template=data["template"],
-                            template_version=data["template_version"],
-                        )
-                    )
-                return backends
-        except requests.Timeout as e:
-            logger.exception(msg=f"create_backend timed out. {e}")
-            raise DefaultException(message=str(e))
+        return self._load_backend_registry().get_by_template(template)
 
     def get_backend_by_id(self, id: str) -> Backend:
         logger.info(f"Get backends by id: {id}")
+        backend = self._load_backend_registry().get_by_id(id)
+        if backend:
+            return backend
+        # the backend may have been created after the list was loaded
         get_url = f"{self.FORC_BACKEND_URL}backends/{id}"
         try:
-            response = requests.get(
+            response = self.http_client.get(
                 get_url,
                 timeout=(30, 30),
                 headers={"X-API-KEY": self.FORC_API_KEY},
@@ -420,32 +474,16 @@ class ForcConnector:
 
     def get_backends_by_owner(self, owner: str) -> list[Backend]:
         logger.info(f"Get backends by owner: {owner}")
-        get_url = f"{self.FORC_BACKEND_URL}backends/byOwner/{owner}"
-        try:
-            response = requests.get(
-                get_url,
-                timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-            )
-            if response.status_code == 401:
-                raise DefaultException(message=str(response.json()))
+        return self._load_backend_registry().get_by_owner(owner)
 
-            else:
-                backends = []
-                for data in response.json():
-                    backends.append(
-                        Backend(
-                            id=data["id"],
-                            owner=data["owner"],
-                            location_url=data["location_url"],
-                            template=data["template"],
-                            template_version=data["template_version"],
-                        )
-                    )
-                return backends
-        except requests.Timeout as e:
-            logger.exception(msg=f"create_backend timed out. {e}")
-            raise DefaultException(message=str(e))
+    def warmup(self) -> None:
+        """Prefetch the backend list, an unreachable FORC does not fail the warmup."""
+        if not self.forc_activated:
+            return
+        try:
+            self.get_backends()
+        except Exception as e:
+            logger.warning(f"Prefetching the FORC backends failed: {e}")
 
     def has_forc(self) -> bool:
         logger.info("Check has forc")
@@ -455,6 +493,9 @@ class ForcConnector:
         logger.info("Get Forc Url")
         return self.FORC_BACKEND_URL
 
+    def get_http_metrics(self) -> dict[str, dict]:
+        return self.http_client.get_metrics()
+
     def get_forc_access_url(self) -> str:
         logger.info("Get Forc Access Url")
         return self.FORC_ACCESS_URL
@@ -576,6 +617,60 @@ class ForcConnector:
         cloud_site: str,
         base_url: str = "",
     ) -> int:
+        deployment = dict(
+            public_key=public_key,
+            research_environment_template=research_environment_template,
+            create_only_backend=create_only_backend,
+            conda_packages=conda_packages,
+            apt_packages=apt_packages,
+            port=port,
+            ip=ip,
+            cloud_site=cloud_site,
+            base_url=base_url,
+        )
+        with self.template.update_lock:
+            if self.template.is_update_locked():
+                logger.info(
+                    f"Template is currently updating, deferring playbook for (openstack_id): {openstack_id}"
+                )
+                self.redis_connection.hset(
+                    openstack_id, "status", VmTaskStates.PREPARE_PLAYBOOK_BUILD.value
+                )
+                self.pending_playbooks[openstack_id] = deployment
+                return 0
+        self.start_playbook(openstack_id=openstack_id, **deployment)
+        return 0
+
+    def dispatch_pending_playbooks(self) -> None:
+        with self.template.update_lock:
+            pending_playbooks, self.pending_playbooks = self.pending_playbooks, {}
+        for openstack_id, deployment in pending_playbooks.items():
+            logger.info(
+                f"Starting deferred Playbook for (openstack_id): {openstack_id}"
+            )
+            try:
+                self.start_playbook(openstack_id=openstack_id, **deployment)
+            except Exception:
+                logger.exception(
+                    f"Could not start deferred Playbook for (openstack_id): {openstack_id}"
+                )
+                self.redis_connection.hset(
+                    openstack_id, "status", VmTaskStates.PLAYBOOK_FAILED.value
+                )
+
+    def start_playbook(
+        self,
+        openstack_id: str,
+        public_key: str,
+        research_environment_template: str,
+        create_only_backend: bool,
+        conda_packages: list[CondaPackage],
+        apt_packages: list[str],
+        port: int,
+        ip: str,
+        cloud_site: str,
+        base_url: str = "",
+    ) -> None:
         logger.info(f"Starting Playbook for (openstack_id): {openstack_id}")
         key: str = self.redis_connection.hget(openstack_id, "key").decode("utf-8")
         playbook = Playbook(
@@ -593,27 +688,10 @@ class ForcConnector:
             apt_packages=apt_packages,
             cloud_site=cloud_site,
             base_url=base_url,
+            openstack_id=openstack_id,
+            ansible_settings=self.ANSIBLE_SETTINGS,
         )
         logger.info(playbook)
-        max_wait_time = 5 * 60  # 5 minutes in seconds
-        interval = 60  # Check every minute
-
-        start_time = time.time()
-        while self.template.is_update_locked():
-            elapsed_time = time.time() - start_time
-            if elapsed_time > max_wait_time:
-                logger.error(
-                    "Template update is taking too long, cancelling playbook creation."
-                )
-                self.redis_connection.hset(
-                    openstack_id, "status", VmTaskStates.PLAYBOOK_FAILED.value
-                )
-                return -1
-            logger.info(
-                f"Template is currently updating...Wait for {max_wait_time / 60 - int(elapsed_time / 60)} minutes..."
-            )
-            time.sleep(interval)
-
         self.redis_connection.hset(
             openstack_id, "status", VmTaskStates.BUILD_PLAYBOOK.value
         )
@@ -621,4 +699,3 @@ class ForcConnector:
 
         ForcConnector.active_playbooks[openstack_id] = playbook
         logger.info(f"Playbook for (openstack_id): {openstack_id} started!")
-        return 0
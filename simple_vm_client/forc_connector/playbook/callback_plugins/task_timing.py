@@ -0,0 +1,72 @@
+import json
+import os
+import time
+
+from ansible.plugins.callback import CallbackBase
+
+DOCUMENTATION = """
+    name: task_timing
+    type: aggregate
+    short_description: Stores the duration of every task as JSON
+    description:
+      - Writes the per task and host durations of a playbook run to the file
+        given by the SIMPLE_VM_TASK_TIMINGS_FILE environment variable.
+    requirements:
+      - enable in configuration
+"""
+
+TASK_TIMINGS_ENV = "SIMPLE_VM_TASK_TIMINGS_FILE"
+
+
+class CallbackModule(CallbackBase):
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "task_timing"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self):
+        super().__init__()
+        self._timings_file = os.environ.get(TASK_TIMINGS_ENV)
+        self._started: dict[str, tuple[str, float]] = {}
+        self._timings: list[dict] = []
+
+    def _start(self, task) -> None:
+        self._started[task._uuid] = (task.get_name(), time.monotonic())
+
+    def _record(self, result, status: str) -> None:
+        started = self._started.get(result._task._uuid)
+        if started is None:
+            return
+        name, start_time = started
+        self._timings.append(
+            {
+                "task": name,
+                "host": result._host.get_name(),
+                "status": status,
+                "duration": round(time.monotonic() - start_time, 3),
+            }
+        )
+
+    def v2_playbook_on_task_start(self, task, is_conditional):
+        self._start(task)
+
+    def v2_playbook_on_handler_task_start(self, task):
+        self._start(task)
+
+    def v2_runner_on_ok(self, result):
+        self._record(result, "ok")
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._record(result, "failed")
+
+    def v2_runner_on_skipped(self, result):
+        self._record(result, "skipped")
+
+    def v2_runner_on_unreachable(self, result):
+        self._record(result, "unreachable")
+
+    def v2_playbook_on_stats(self, stats):
+        if not self._timings_file:
+            return
+        with open(self._timings_file, "w") as timings_file:
+            json.dump(self._timings, timings_file)
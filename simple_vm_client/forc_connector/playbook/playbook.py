@@ -1,11 +1,14 @@
+import copy
+import json
 import os
 import shlex
-import shutil
 import subprocess
+import threading
 from tempfile import NamedTemporaryFile, TemporaryDirectory
+from typing import Any
 
 import redis
-import ruamel.yaml
+import yaml
 
 from simple_vm_client.forc_connector.template.template import Template
 from simple_vm_client.ttypes import CondaPackage
@@ -15,8 +18,83 @@ from simple_vm_client.util.state_enums import VmTaskStates
 CONDA = "conda"
 MOSH = "mosh"
 OPTIONAL = "optional"
+TASK_TIMINGS_FILE = "task_timings.json"
+TASK_TIMINGS_ENV = "SIMPLE_VM_TASK_TIMINGS_FILE"
+CALLBACK_PLUGINS_DIR = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "callback_plugins"
+)
+DEFAULT_CALLBACK_PLUGINS = (
+    "~/.ansible/plugins/callback:/usr/share/ansible/plugins/callback"
+)
+# the callbacks of the shipped ansible.cfg plus the task timings
+CALLBACKS_ENABLED = "ansible.posix.profile_tasks, ansible.posix.timer, task_timing"
+DEFAULT_ANSIBLE_SETTINGS = {
+    "strategy": "free",
+    "mitogen_strategy_plugins": "",
+    "control_persist": "120s",
+    "fact_caching_timeout": 86400,
+}
 logger = setup_custom_logger(__name__)
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper  # type: ignore
+    from yaml import SafeLoader as YamlLoader  # type: ignore
+
+# parsed vars templates per workspace version -> {workspace_dir: {file_path: data}}
+parsed_yaml_cache: dict[str, dict[str, Any]] = {}
+parsed_yaml_cache_lock = threading.Lock()
+
+
+def load_parsed_yaml(workspace_dir: str, file_path: str) -> Any:
+    """
+    Return the parsed content of a workspace YAML file.
+
+    Workspaces are immutable, so every file is parsed only once per workspace
+    version. Callers must not modify the returned data, copy it first.
+    """
+    with parsed_yaml_cache_lock:
+        workspace_cache = parsed_yaml_cache.get(workspace_dir)
+        if workspace_cache is None:
+            # drop templates of workspaces which were pruned in the meantime
+            for outdated_dir in [
+                cached_dir
+                for cached_dir in parsed_yaml_cache
+                if not os.path.isdir(cached_dir)
+            ]:
+                del parsed_yaml_cache[outdated_dir]
+            workspace_cache = parsed_yaml_cache.setdefault(workspace_dir, {})
+        if file_path not in workspace_cache:
+            with open(os.path.join(workspace_dir, file_path), mode="r") as yaml_file:
+                workspace_cache[file_path] = yaml.load(yaml_file, Loader=YamlLoader)
+        return workspace_cache[file_path]
+
+
+def link_layers(target: str, layers: list[str]) -> None:
+    """
+    Symlink the entries of all layers into target, later layers win.
+
+    Entries which already exist in target (generated files) are kept.
+    Directories present in more than one layer are merged recursively.
+    """
+    entries: dict[str, list[str]] = {}
+    for layer in layers:
+        for name in os.listdir(layer):
+            entries.setdefault(name, []).append(os.path.join(layer, name))
+
+    for name, sources in entries.items():
+        destination = os.path.join(target, name)
+        if os.path.lexists(destination):
+            continue
+        directories = [source for source in sources if os.path.isdir(source)]
+        if len(sources) > 1 and len(directories) == len(sources):
+            os.mkdir(destination)
+            link_layers(target=destination, layers=directories)
+        else:
+            os.symlink(sources[-1], destination)
+
 
 class Playbook(object):
     def __init__(
@@ -33,10 +111,13 @@ class Playbook(object):
         pool: redis.ConnectionPool,
         cloud_site: str,
         base_url: str,
+        openstack_id: str = "",
+        ansible_settings: dict = None,  # type: ignore
     ):
         self.cloud_site: str = cloud_site
+        self.openstack_id = openstack_id
+        self.ansible_settings = {**DEFAULT_ANSIBLE_SETTINGS, **(ansible_settings or {})}
         self.redis: redis.Redis = redis.Redis(connection_pool=pool)  # redis connection
-        self.yaml_exec = ruamel.yaml.YAML()  # yaml writer/reader
         self.vars_files: list[str] = []  # _vars_file.yml to read
         self.tasks: list[dict[str, str]] = []  # task list
         self.always_tasks: list[dict[str, str]] = []
@@ -52,6 +133,8 @@ class Playbook(object):
         self.stderr: str = ""
         self.research_environment_template = research_environment_template
         self.base_url = base_url
+        # released again by cleanup()
+        self.workspace_dir: str = Template.acquire_playbook_workspace()
         # init temporary directories and mandatory generic files
 
         self.directory: TemporaryDirectory = TemporaryDirectory(
@@ -70,6 +153,9 @@ class Playbook(object):
             mode="w+", dir=self.directory.name, delete=False, prefix="log_stderr_"
         )
 
+        self.task_timings_file = os.path.join(self.directory.name, TASK_TIMINGS_FILE)
+        self.ansible_environment = self.create_ansible_environment()
+
         # create the custom playbook and save its name
         self.playbook_exec_name: str = "generic_playbook.yml"
         self.copy_playbooks_and_init(public_key)
@@ -79,31 +165,58 @@ class Playbook(object):
             mode="w+", dir=self.directory.name, delete=False, prefix="inventory_"
         )
 
+        # the openstack id is used as host alias, so cached facts belong to exactly one vm
+        host = f"{self.openstack_id} ansible_host={ip}" if self.openstack_id else ip
         inventory_string = (
-            f"[vm]\n{ip}:{str(port)} ansible_user=ubuntu "
+            f"[vm]\n{host} ansible_port={str(port)} ansible_user=ubuntu "
             f"ansible_ssh_private_key_file={self.private_key.name} "
             f"ansible_python_interpreter=/usr/bin/python3"
         )
         self.inventory.write(inventory_string)
         self.inventory.close()
 
+    def create_ansible_environment(self) -> dict[str, str]:
+        """
+        ANSIBLE_* overrides for this run.
+
+        They only tune the run, everything else (roles_path, host key checking,
+        ...) still comes from the shipped ansible.cfg.
+        """
+        strategy = self.ansible_settings["strategy"]
+        environment = {
+            "ANSIBLE_CALLBACKS_ENABLED": CALLBACKS_ENABLED,
+            "ANSIBLE_CALLBACK_PLUGINS": f"{CALLBACK_PLUGINS_DIR}:{DEFAULT_CALLBACK_PLUGINS}",
+            "ANSIBLE_STRATEGY": strategy,
+            "ANSIBLE_PIPELINING": "True",
+            "ANSIBLE_SSH_ARGS": f"-C -o ControlMaster=auto -o ControlPersist={self.ansible_settings['control_persist']}",
+        }
+        if strategy.startswith("mitogen"):
+            if self.ansible_settings["mitogen_strategy_plugins"]:
+                environment["ANSIBLE_STRATEGY_PLUGINS"] = self.ansible_settings[
+                    "mitogen_strategy_plugins"
+                ]
+            else:
+                logger.warning(
+                    f"No mitogen strategy plugins configured, using linear instead of {strategy}"
+                )
+                environment["ANSIBLE_STRATEGY"] = "linear"
+        if self.openstack_id:
+            environment.update(
+                {
+                    "ANSIBLE_GATHERING": "smart",
+                    "ANSIBLE_CACHE_PLUGIN": "jsonfile",
+                    "ANSIBLE_CACHE_PLUGIN_CONNECTION": Template.get_playbook_fact_cache_dir(),
+                    "ANSIBLE_CACHE_PLUGIN_TIMEOUT": str(
+                        self.ansible_settings["fact_caching_timeout"]
+                    ),
+                }
+            )
+        return environment
+
     def copy_and_init_change_keys(self, public_key) -> None:
-        shutil.copy(
-            Template.get_playbook_dir() + "/change_key.yml", self.directory.name
-        )
-        shutil.copy(
-            Template.get_playbook_dir() + "/change_key_vars_file.yml",
-            self.directory.name,
-        )
-        with open(
-            self.directory.name + "/change_key_vars_file.yml", mode="r"
-        ) as key_file:
-            data_ck = self.yaml_exec.load(key_file)
-            data_ck["change_key_vars"]["key"] = public_key.strip('"')
-        with open(
-            self.directory.name + "/change_key_vars_file.yml", mode="w"
-        ) as key_file:
-            self.yaml_exec.dump(data_ck, key_file)
+        data_ck = self.load_workspace_yaml("change_key_vars_file.yml")
+        data_ck["change_key_vars"]["key"] = public_key.strip('"')
+        self.write_yaml("change_key_vars_file.yml", data_ck)
         self.add_to_playbook_always_lists("change_key")
 
     def copy_playbooks_and_init(self, public_key: str) -> None:
@@ -113,69 +226,84 @@ class Playbook(object):
         self.copy_and_init_apt_packages()
         self.copy_and_init_research_environment()
         self.copy_and_init_change_keys(public_key=public_key)
-        shutil.copytree(
-            f"{Template.get_playbook_resenvs_dir()}",
-            self.directory.name,
-            dirs_exist_ok=True,
-        )
 
         # write all vars_files and tasks in generic_playbook
-        shutil.copy(
-            Template.get_playbook_dir() + "/" + self.playbook_exec_name,
-            self.directory.name,
-        )
-
-        with open(
-            self.directory.name + "/" + self.playbook_exec_name, mode="r"
-        ) as generic_playbook:
-            data_gp = self.yaml_exec.load(generic_playbook)
-            data_gp[0]["vars_files"] = self.vars_files
-            data_gp[0]["tasks"][0]["block"] = self.tasks
-            data_gp[0]["tasks"][0]["always"] = self.always_tasks
-        with open(
-            self.directory.name + "/" + self.playbook_exec_name, mode="w"
-        ) as generic_playbook:
-            self.yaml_exec.dump(data_gp, generic_playbook)
+        data_gp = self.load_workspace_yaml(self.playbook_exec_name)
+        data_gp[0]["vars_files"] = self.vars_files
+        data_gp[0]["tasks"][0]["block"] = self.tasks
+        data_gp[0]["tasks"][0]["always"] = self.always_tasks
+        self.write_yaml(self.playbook_exec_name, data_gp)
+
+        # link everything else from the prebuilt workspace into the playbook directory
+        self.link_workspace()
+
+    def get_workspace_layers(self) -> list[str]:
+        # same precedence as the former copy order: later layers win
+        layers = []
+        if self.conda_packages:
+            layers.append(os.path.join(self.workspace_dir, CONDA))
+        if self.research_environment_template and not self.create_only_backend:
+            layers.append(
+                os.path.join(self.workspace_dir, self.research_environment_template)
+            )
+        layers.append(self.workspace_dir)
+        return [layer for layer in layers if os.path.isdir(layer)]
+
+    def link_workspace(self) -> None:
+        link_layers(target=self.directory.name, layers=self.get_workspace_layers())
+
+    def load_workspace_yaml(self, file_path: str) -> Any:
+        return copy.deepcopy(load_parsed_yaml(self.workspace_dir, file_path))
+
+    def write_yaml(self, file_name: str, data) -> None:
+        target = os.path.join(self.directory.name, file_name)
+        # never write through a link into the shared workspace
+        if os.path.islink(target):
+            os.unlink(target)
+        with open(target, mode="w") as yaml_file:
+            yaml.dump(
+                data,
+                yaml_file,
+                Dumper=YamlDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
 
     def copy_and_init_research_environment(self) -> None:
         if not self.research_environment_template or self.create_only_backend:
             return
 
-        shutil.copytree(
-            f"{Template.get_playbook_resenvs_dir()}{self.research_environment_template}",
-            self.directory.name,
-            dirs_exist_ok=True,
+        template_dir = os.path.join(
+            self.workspace_dir, self.research_environment_template
         )
-
         site_specific_yml = (
-            f"/{self.research_environment_template}{'-' + self.cloud_site}.yml"
+            f"{self.research_environment_template}{'-' + self.cloud_site}.yml"
         )
         playbook_name_local = self.research_environment_template
-        if os.path.isfile(self.directory.name + site_specific_yml):
+        if os.path.isfile(os.path.join(template_dir, site_specific_yml)):
             playbook_name_local = (
                 self.research_environment_template + "-" + self.cloud_site
             )
-        playbook_var_yml = f"/{self.research_environment_template}_vars_file.yml"
+        playbook_var_yml = f"{self.research_environment_template}_vars_file.yml"
 
         try:
-            with open(self.directory.name + playbook_var_yml, mode="r") as variables:
-                data = self.yaml_exec.load(variables)
-
-                data[self.research_environment_template + "_vars"][
-                    "template_version"
-                ] = self.research_environment_template_version
-                data[self.research_environment_template + "_vars"][
-                    "create_only_backend"
-                ] = self.create_only_backend
-                data[self.research_environment_template + "_vars"][
-                    "base_url"
-                ] = self.base_url
-            with open(self.directory.name + playbook_var_yml, mode="w") as variables:
-                self.yaml_exec.dump(data, variables)
-                self.add_to_playbook_lists(
-                    playbook_name_local, self.research_environment_template
-                )
-        except (shutil.Error, IOError):
+            data = self.load_workspace_yaml(
+                os.path.join(self.research_environment_template, playbook_var_yml)
+            )
+            data[self.research_environment_template + "_vars"][
+                "template_version"
+            ] = self.research_environment_template_version
+            data[self.research_environment_template + "_vars"][
+                "create_only_backend"
+            ] = self.create_only_backend
+            data[self.research_environment_template + "_vars"][
+                "base_url"
+            ] = self.base_url
+            self.write_yaml(playbook_var_yml, data)
+            self.add_to_playbook_lists(
+                playbook_name_local, self.research_environment_template
+            )
+        except IOError:
             logger.exception("Could not copy research environment template data")
             self.add_tasks_only(playbook_name_local)
 
@@ -186,84 +314,53 @@ class Playbook(object):
         site_specific_yml = f"{OPTIONAL}{'-' + self.cloud_site}.yml"
         playbook_name_local = OPTIONAL
 
-        if os.path.isfile(Template.get_playbook_dir() + site_specific_yml):
+        if os.path.isfile(os.path.join(self.workspace_dir, site_specific_yml)):
             playbook_name_local = OPTIONAL + "-" + self.cloud_site
 
-        playbook_yml = f"{playbook_name_local}.yml"
         playbook_var_yml = f"{OPTIONAL}_vars_file.yml"
 
         try:
-            full_playbook_path = os.path.join(Template.get_playbook_dir(), playbook_yml)
-            # Copy playbook YAML
-            shutil.copy(full_playbook_path, self.directory.name)
+            # Update apt_packages in playbook vars YAML
+            data = self.load_workspace_yaml(playbook_var_yml)
+            data["apt_packages"] = self.apt_packages
+            self.write_yaml(playbook_var_yml, data)
 
-            try:
-                full_vars_path = os.path.join(
-                    Template.get_playbook_dir(), playbook_var_yml
-                )
-                # Copy playbook vars YAML
-                shutil.copy(full_vars_path, self.directory.name)
-
-                # Update apt_packages in playbook vars YAML
-                with open(
-                    os.path.join(self.directory.name, playbook_var_yml), mode="r"
-                ) as variables:
-                    data = self.yaml_exec.load(variables)
-                    data["apt_packages"] = self.apt_packages
-
-                # Save updated playbook vars YAML
-                with open(
-                    os.path.join(self.directory.name, playbook_var_yml), mode="w"
-                ) as variables:
-                    self.yaml_exec.dump(data, variables)
-
-                # Add to playbook lists
-                self.add_to_playbook_lists(playbook_name_local, OPTIONAL)
-
-            except (shutil.Error, IOError):
-                logger.exception("Could not copy apt packages")
-                self.add_tasks_only(playbook_name_local)
-
-        except (shutil.Error, IOError):
+            # Add to playbook lists
+            self.add_to_playbook_lists(playbook_name_local, OPTIONAL)
+
+        except IOError:
             logger.exception("Could not copy apt packages")
+            self.add_tasks_only(playbook_name_local)
 
     def copy_and_init_conda_packages(self) -> None:
         if not self.conda_packages:
             return
 
-        shutil.copytree(
-            f"{Template.get_playbook_resenvs_dir()}{CONDA}",
-            self.directory.name,
-            dirs_exist_ok=True,
-        )
-
-        site_specific_yml = f"/{CONDA}{'-' + self.cloud_site}.yml"
+        site_specific_yml = f"{CONDA}{'-' + self.cloud_site}.yml"
         playbook_name_local = CONDA
-        if os.path.isfile(self.directory.name + site_specific_yml):
+        if os.path.isfile(os.path.join(self.workspace_dir, CONDA, site_specific_yml)):
             playbook_name_local = CONDA + "-" + self.cloud_site
-        playbook_var_yml = f"/{CONDA}_vars_file.yml"
+        playbook_var_yml = f"{CONDA}_vars_file.yml"
 
         try:
-            with open(self.directory.name + playbook_var_yml, mode="r") as variables:
-                data = self.yaml_exec.load(variables)
-                p_dict = {}
-
-                for conda_package in self.conda_packages:
-                    p_dict.update(
-                        {
-                            conda_package.name: {
-                                "version": conda_package.version,
-                                "build": conda_package.build,
-                            }
+            data = self.load_workspace_yaml(os.path.join(CONDA, playbook_var_yml))
+            p_dict = {}
+
+            for conda_package in self.conda_packages:
+                p_dict.update(
+                    {
+                        conda_package.name: {
+                            "version": conda_package.version,
+                            "build": conda_package.build,
                         }
-                    )
-                data[CONDA + "_vars"]["packages"] = p_dict
-            with open(self.directory.name + playbook_var_yml, mode="w") as variables:
-                self.yaml_exec.dump(data, variables)
+                    }
+                )
+            data[CONDA + "_vars"]["packages"] = p_dict
+            self.write_yaml(playbook_var_yml, data)
             self.add_to_playbook_lists(playbook_name_local, CONDA)
-        except (shutil.Error, IOError):
+        except IOError:
             logger.exception(
-                f"Could not open - {self.directory.name + playbook_var_yml}"
+                f"Could not open - {os.path.join(self.workspace_dir, CONDA, playbook_var_yml)}"
             )
             self.add_tasks_only(playbook_name_local)
 
@@ -315,11 +412,17 @@ class Playbook(object):
         command_string = f"/usr/local/bin/ansible-playbook -v -i {self.inventory.name} {self.directory.name}/{self.playbook_exec_name}"
         command_string = shlex.split(command_string)  # type: ignore
         logger.info(f"Run Playbook for {self.playbook_exec_name} - [{command_string}]")
+        env = dict(
+            os.environ,
+            **self.ansible_environment,
+            **{TASK_TIMINGS_ENV: self.task_timings_file},
+        )
         self.process = subprocess.Popen(
             command_string,
             stdout=self.log_file_stdout,
             stderr=self.log_file_stderr,
             universal_newlines=True,
+            env=env,
         )
 
     def check_status(self, openstack_id: str) -> int:
@@ -337,6 +440,7 @@ class Playbook(object):
             self.redis.hset(openstack_id, "status", VmTaskStates.PLAYBOOK_FAILED.value)
             self.returncode = self.process.returncode
             self.process.wait()
+            self.save_task_timings(openstack_id)
         else:
             logger.info(f"Playbook for (openstack_id) {openstack_id} is successful.")
             self.redis.hset(
@@ -345,6 +449,7 @@ class Playbook(object):
 
             self.returncode = self.process.returncode
             self.process.wait()
+            self.save_task_timings(openstack_id)
         return done
 
     def get_logs(self) -> tuple[int, str, str]:
@@ -358,13 +463,42 @@ class Playbook(object):
             self.stderr += line
         return self.returncode, self.stdout, self.stderr
 
+    def get_task_timings(self) -> list[dict]:
+        try:
+            with open(self.task_timings_file, mode="r") as timings_file:
+                return json.load(timings_file)
+        except (IOError, ValueError):
+            return []
+
+    def save_task_timings(self, openstack_id: str) -> None:
+        task_timings = self.get_task_timings()
+        if not task_timings:
+            return
+        slowest = max(task_timings, key=lambda timing: timing["duration"])
+        logger.info(
+            f"Playbook for (openstack_id) {openstack_id} ran {len(task_timings)} tasks, "
+            f"slowest: {slowest['task']} ({slowest['duration']}s)"
+        )
+        self.redis.hset(
+            name=f"pb_logs_{openstack_id}",
+            key="task_timings",
+            value=json.dumps(task_timings),
+        )
+
     def cleanup(self, openstack_id: str) -> None:
         self.directory.cleanup()
+        Template.release_playbook_workspace(self.workspace_dir)
+        self.workspace_dir = ""
         self.redis.delete(openstack_id)
 
     def stop(self, openstack_id: str) -> None:
         self.process.terminate()
         rc, stdout, stderr = self.get_logs()
-        logs_to_save = {"returncode": rc, "stdout": stdout, "stderr": stderr}
+        logs_to_save = {
+            "returncode": rc,
+            "stdout": stdout,
+            "stderr": stderr,
+            "task_timings": json.dumps(self.get_task_timings()),
+        }
         self.redis.hset(name=f"pb_logs_{openstack_id}", mapping=logs_to_save)  # type: ignore
         self.cleanup(openstack_id)
@@ -1,11 +1,24 @@
+import json
 import os
 import unittest
 from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
 import redis
-
-from simple_vm_client.forc_connector.playbook.playbook import CONDA, OPTIONAL, Playbook
+import yaml
+
+from simple_vm_client.forc_connector.playbook.playbook import (
+    CALLBACK_PLUGINS_DIR,
+    CONDA,
+    DEFAULT_ANSIBLE_SETTINGS,
+    OPTIONAL,
+    TASK_TIMINGS_ENV,
+    TASK_TIMINGS_FILE,
+    Playbook,
+    link_layers,
+    load_parsed_yaml,
+    parsed_yaml_cache,
+)
 from simple_vm_client.forc_connector.template.template import Template
 from simple_vm_client.ttypes import CondaPackage
 from simple_vm_client.util.state_enums import VmTaskStates
@@ -44,6 +57,14 @@ class TestPlaybook(unittest.TestCase):
             playbook.playbook_exec_name: str = "generic_playbook.yml"
 
             playbook.directory = TemporaryDirectory(dir=f"{playbook.playbooks_dir}")
+            playbook.workspace = TemporaryDirectory()
+            playbook.workspace_dir = os.path.join(playbook.workspace.name, "")
+            playbook.task_timings_file = os.path.join(
+                playbook.directory.name, TASK_TIMINGS_FILE
+            )
+            playbook.openstack_id = ""
+            playbook.ansible_settings = dict(DEFAULT_ANSIBLE_SETTINGS)
+            playbook.ansible_environment = playbook.create_ansible_environment()
         return playbook
 
     @patch("simple_vm_client.forc_connector.playbook.playbook.TemporaryDirectory")
@@ -61,12 +82,16 @@ class TestPlaybook(unittest.TestCase):
         instance.redis = mock_redis_instance
         instance.directory = mock_temporary_directory_instance
 
+        workspace_dir = instance.workspace_dir
+
         # Act
-        instance.cleanup(openstack_id)
+        with patch.object(Template, "release_playbook_workspace") as mock_release:
+            instance.cleanup(openstack_id)
 
         # Assert
         mock_temporary_directory_instance.cleanup.assert_called_once()
         mock_redis_instance.delete.assert_called_once_with(openstack_id)
+        mock_release.assert_called_once_with(workspace_dir)
 
     @patch("simple_vm_client.forc_connector.playbook.playbook.NamedTemporaryFile")
     @patch("simple_vm_client.forc_connector.playbook.playbook.NamedTemporaryFile")
@@ -136,6 +161,7 @@ class TestPlaybook(unittest.TestCase):
                 "returncode": mock_get_logs.return_value[0],
                 "stdout": mock_get_logs.return_value[1],
                 "stderr": mock_get_logs.return_value[2],
+                "task_timings": "[]",
             },
         )
         mock_cleanup.assert_called_once_with(openstack_id)
@@ -258,9 +284,88 @@ class TestPlaybook(unittest.TestCase):
             stdout=playbook.log_file_stdout,
             stderr=playbook.log_file_stderr,
             universal_newlines=True,
+            env=unittest.mock.ANY,
         )
+        env = mock_popen.call_args.kwargs["env"]
+        self.assertNotIn("ANSIBLE_CONFIG", env)
+        self.assertEqual(env["ANSIBLE_STRATEGY"], "free")
+        self.assertEqual(env[TASK_TIMINGS_ENV], playbook.task_timings_file)
         self.assertEqual(playbook.process, mock_process)
 
+    def test_create_ansible_environment(self):
+        playbook = self.init_playbook()
+        playbook.openstack_id = "openstack_id"
+
+        environment = playbook.create_ansible_environment()
+
+        self.assertEqual(environment["ANSIBLE_STRATEGY"], "free")
+        self.assertTrue(
+            environment["ANSIBLE_CALLBACK_PLUGINS"].startswith(CALLBACK_PLUGINS_DIR)
+        )
+        self.assertIn("task_timing", environment["ANSIBLE_CALLBACKS_ENABLED"])
+        self.assertIn(
+            "ansible.posix.profile_tasks", environment["ANSIBLE_CALLBACKS_ENABLED"]
+        )
+        self.assertEqual(environment["ANSIBLE_CACHE_PLUGIN"], "jsonfile")
+        self.assertEqual(
+            environment["ANSIBLE_CACHE_PLUGIN_CONNECTION"],
+            Template.get_playbook_fact_cache_dir(),
+        )
+        self.assertEqual(environment["ANSIBLE_PIPELINING"], "True")
+        self.assertIn("ControlPersist=120s", environment["ANSIBLE_SSH_ARGS"])
+        # left to the shipped ansible.cfg
+        self.assertNotIn("ANSIBLE_ROLES_PATH", environment)
+        self.assertNotIn("ANSIBLE_HOST_KEY_CHECKING", environment)
+
+    def test_create_ansible_environment_without_openstack_id(self):
+        playbook = self.init_playbook()
+
+        environment = playbook.create_ansible_environment()
+
+        self.assertNotIn("ANSIBLE_CACHE_PLUGIN", environment)
+
+    @patch("simple_vm_client.forc_connector.playbook.playbook.logger.warning")
+    def test_create_ansible_environment_mitogen(self, mock_logger_warning):
+        playbook = self.init_playbook()
+        playbook.ansible_settings["strategy"] = "mitogen_linear"
+
+        self.assertEqual(
+            playbook.create_ansible_environment()["ANSIBLE_STRATEGY"], "linear"
+        )
+        mock_logger_warning.assert_called_once()
+
+        playbook.ansible_settings["mitogen_strategy_plugins"] = "/mitogen/strategy"
+        environment = playbook.create_ansible_environment()
+        self.assertEqual(environment["ANSIBLE_STRATEGY"], "mitogen_linear")
+        self.assertEqual(environment["ANSIBLE_STRATEGY_PLUGINS"], "/mitogen/strategy")
+
+    def test_save_task_timings(self):
+        playbook = self.init_playbook()
+        playbook.redis = MagicMock()
+        task_timings = [
+            {"task": "apt", "host": "vm", "status": "ok", "duration": 12.5},
+            {"task": "conda", "host": "vm", "status": "ok", "duration": 60.0},
+        ]
+        with open(playbook.task_timings_file, "w") as timings_file:
+            json.dump(task_timings, timings_file)
+
+        playbook.save_task_timings("openstack_id")
+
+        playbook.redis.hset.assert_called_once_with(
+            name="pb_logs_openstack_id",
+            key="task_timings",
+            value=json.dumps(task_timings),
+        )
+
+    def test_save_task_timings_no_timings(self):
+        playbook = self.init_playbook()
+        playbook.redis = MagicMock()
+
+        playbook.save_task_timings("openstack_id")
+
+        self.assertEqual(playbook.get_task_timings(), [])
+        playbook.redis.hset.assert_not_called()
+
     def test_add_always_tasks_only(self):
         # Arrange
         instance = self.init_playbook()
@@ -342,24 +447,29 @@ class TestPlaybook(unittest.TestCase):
         self.assertIn(expected_vars_file, instance.vars_files)
         self.assertIn(expected_task, instance.tasks)
 
-    @patch("simple_vm_client.forc_connector.playbook.playbook.shutil.copytree")
-    @patch("simple_vm_client.forc_connector.playbook.playbook.open")
+    def write_workspace_yaml(self, playbook, file_path, data):
+        path = os.path.join(playbook.workspace_dir, file_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as yaml_file:
+            yaml.safe_dump(data, yaml_file)
+
+    def read_playbook_yaml(self, playbook, file_name):
+        with open(os.path.join(playbook.directory.name, file_name)) as yaml_file:
+            return yaml.safe_load(yaml_file)
+
     @patch("simple_vm_client.forc_connector.playbook.playbook.os.path.isfile")
-    def test_copy_and_init_conda_packages(self, mock_isfile, mock_open, mock_copytree):
+    def test_copy_and_init_conda_packages(self, mock_isfile):
         # Arrange
-        mock_yaml_exec = MagicMock()
         instance = self.init_playbook()
-        instance.yaml_exec = mock_yaml_exec
         instance.conda_packages = DEFAULT_CONDA_PACKAGES
         instance.add_to_playbook_lists = MagicMock()
         instance.add_tasks_only = MagicMock()
-
-        mock_tempdir = MagicMock()
-        mock_tempdir.name = "/tmp/test_temp_dir"
-        instance.playbooks_dir = Template.get_playbook_dir()
-
-        instance.directory = mock_tempdir
         instance.cloud_site = "your_cloud_site"
+        self.write_workspace_yaml(
+            instance,
+            os.path.join(CONDA, f"{CONDA}_vars_file.yml"),
+            {f"{CONDA}_vars": {"packages": {}}},
+        )
 
         # Set up mock for os.path.isfile
         mock_isfile.return_value = True
@@ -368,23 +478,23 @@ class TestPlaybook(unittest.TestCase):
         instance.copy_and_init_conda_packages()
 
         # Assert
-        mock_copytree.assert_called_once_with(
-            f"{instance.playbooks_dir}resenvs/{CONDA}",
-            mock_tempdir.name,
-            dirs_exist_ok=True,
+        mock_isfile.assert_called_once_with(
+            os.path.join(
+                instance.workspace_dir, CONDA, f"{CONDA}-{instance.cloud_site}.yml"
+            )
         )
-
-        mock_open.assert_any_call(
-            f"{mock_tempdir.name}/{CONDA}_vars_file.yml", mode="r"
-        )
-        mock_open.assert_any_call(
-            f"{mock_tempdir.name}/{CONDA}_vars_file.yml", mode="w"
+        self.assertEqual(
+            self.read_playbook_yaml(instance, f"{CONDA}_vars_file.yml"),
+            {
+                f"{CONDA}_vars": {
+                    "packages": {
+                        "conda1": {"version": "1.0.0", "build": None},
+                        "conda2": {"version": "2.0.0", "build": None},
+                    }
+                }
+            },
         )
 
-        mock_yaml_exec.load.assert_called_once()
-
-        mock_yaml_exec.dump.assert_called_once()
-
         instance.add_to_playbook_lists.assert_called_once_with(
             CONDA + "-" + instance.cloud_site, CONDA
         )
@@ -392,45 +502,32 @@ class TestPlaybook(unittest.TestCase):
         # Check that add_tasks_only is not called
         instance.add_tasks_only.assert_not_called()
 
-    @patch("simple_vm_client.forc_connector.playbook.playbook.shutil.copytree")
-    def test_copy_and_init_conda_packages_no_conda_packages(self, mock_copytree):
+    @patch("simple_vm_client.forc_connector.playbook.playbook.load_parsed_yaml")
+    def test_copy_and_init_conda_packages_no_conda_packages(
+        self, mock_load_parsed_yaml
+    ):
         playbook = self.init_playbook()
         playbook.copy_and_init_conda_packages()
-        mock_copytree.assert_not_called()
+        mock_load_parsed_yaml.assert_not_called()
 
-    @patch("simple_vm_client.forc_connector.playbook.playbook.shutil.copytree")
-    @patch("simple_vm_client.forc_connector.playbook.playbook.open")
     @patch("simple_vm_client.forc_connector.playbook.playbook.os.path.isfile")
     @patch("simple_vm_client.forc_connector.playbook.playbook.logger.exception")
     def test_copy_and_init_conda_packages_error(
-        self, mock_logger_exception, mock_is_file, mock_open, mock_copytree
+        self, mock_logger_exception, mock_is_file
     ):
         # Arrange
-        mock_yaml_exec = MagicMock()
-
         mock_is_file.return_value = True
         instance = self.init_playbook()
-        instance.yaml_exec = mock_yaml_exec
         instance.conda_packages = DEFAULT_CONDA_PACKAGES
         instance.add_to_playbook_lists = MagicMock()
         instance.add_tasks_only = MagicMock()
-
-        mock_tempdir = MagicMock()
-        mock_tempdir.name = "/tmp/test_temp_dir"
-        instance.playbooks_dir = Template.get_playbook_dir()
-
-        instance.directory = mock_tempdir
         instance.cloud_site = "your_cloud_site"
 
-        # Set up mock for os.path.isfile
-        mock_open.side_effect = IOError("Error reading file")
-
-        # Act and Assert
+        # Act and Assert - the workspace has no conda vars file
         instance.copy_and_init_conda_packages()
-        playbook_var_yml = f"/{CONDA}_vars_file.yml"
 
         mock_logger_exception.assert_called_once_with(
-            f"Could not open - {instance.directory.name + playbook_var_yml}"
+            f"Could not open - {os.path.join(instance.workspace_dir, CONDA, CONDA + '_vars_file.yml')}"
         )
 
         instance.add_to_playbook_lists.assert_not_called()
@@ -439,20 +536,17 @@ class TestPlaybook(unittest.TestCase):
             CONDA + "-" + instance.cloud_site
         )
 
-    @patch("simple_vm_client.forc_connector.playbook.playbook.shutil.copy")
     @patch(
         "simple_vm_client.forc_connector.playbook.playbook.os.path.isfile",
         return_value=True,
     )
-    @patch("builtins.open", new_callable=unittest.mock.mock_open)
     @patch("simple_vm_client.forc_connector.playbook.playbook.logger.info")
-    def test_copy_and_init_apt_packages(
-        self, mock_logger_info, mock_open, mock_isfile, mock_copy
-    ):
+    def test_copy_and_init_apt_packages(self, mock_logger_info, mock_isfile):
         # Arrange
         instance = self.init_playbook()  # Initialize your class with appropriate values
-        mock_yaml_exec = MagicMock()
-        instance.yaml_exec = mock_yaml_exec
+        self.write_workspace_yaml(
+            instance, OPTIONAL + "_vars_file.yml", {"apt_packages": []}
+        )
 
         # Mock apt_packages and other necessary attributes
         instance.apt_packages = DEFAULT_APT_PACKAGES
@@ -461,25 +555,15 @@ class TestPlaybook(unittest.TestCase):
         instance.copy_and_init_apt_packages()
 
         # Assert
-        # Add your assertions based on the expected behavior of the method
-
-        # Verify that shutil.copy is called with the correct arguments
-        playbook_yml = os.path.join(
-            instance.playbooks_dir, OPTIONAL + "-" + instance.cloud_site + ".yml"
-        )
-        mock_copy.assert_any_call(playbook_yml, instance.directory.name)
-        playbook_vars_yml = os.path.join(
-            instance.playbooks_dir, OPTIONAL + "_vars_file.yml"
+        mock_isfile.assert_called_once_with(
+            os.path.join(
+                instance.workspace_dir, OPTIONAL + "-" + instance.cloud_site + ".yml"
+            )
         )
-
-        mock_copy.assert_any_call(playbook_vars_yml, instance.directory.name)
-
-        target_playbook_vars = os.path.join(
-            instance.directory.name, OPTIONAL + "_vars_file.yml"
+        self.assertEqual(
+            self.read_playbook_yaml(instance, OPTIONAL + "_vars_file.yml"),
+            {"apt_packages": DEFAULT_APT_PACKAGES},
         )
-
-        # Verify that open is called with the correct arguments
-        mock_open.assert_any_call(target_playbook_vars, mode="r")
         mock_logger_info.assert_called_once_with(
             "Added playbook: "
             + OPTIONAL
@@ -491,27 +575,11 @@ class TestPlaybook(unittest.TestCase):
             + "_vars_file.yml"
         )
 
-    @patch("simple_vm_client.forc_connector.playbook.playbook.shutil.copytree")
-    def test_copy_and_init_apt_packages_no_apt_packages(self, mock_copytree):
+    @patch("simple_vm_client.forc_connector.playbook.playbook.load_parsed_yaml")
+    def test_copy_and_init_apt_packages_no_apt_packages(self, mock_load_parsed_yaml):
         playbook = self.init_playbook()
         playbook.copy_and_init_apt_packages()
-        mock_copytree.assert_not_called()
-
-    @patch(
-        "simple_vm_client.forc_connector.playbook.playbook.shutil.copy",
-        side_effect=IOError("Error copying file"),
-    )
-    @patch("simple_vm_client.forc_connector.playbook.playbook.logger.exception")
-    def test_copy_and_init_apt_packages_raises_io_error(
-        self, mock_logger_exception, mock_copy
-    ):
-        # Arrange
-        obj = self.init_playbook()
-        obj.apt_packages = DEFAULT_APT_PACKAGES  # Set your desired apt_packages
-
-        # Act and Assert
-        obj.copy_and_init_apt_packages()
-        mock_logger_exception.assert_called_once_with("Could not copy apt packages")
+        mock_load_parsed_yaml.assert_not_called()
 
     @patch(
         "simple_vm_client.forc_connector.playbook.playbook.open",
@@ -531,20 +599,10 @@ class TestPlaybook(unittest.TestCase):
         mock_logger_exception.assert_called_once_with("Could not copy apt packages")
         obj.add_tasks_only.assert_called_once_with(OPTIONAL)
 
-    @patch("simple_vm_client.forc_connector.playbook.playbook.shutil.copytree")
-    @patch(
-        "simple_vm_client.forc_connector.playbook.playbook.os.path.isfile",
-        return_value=True,
-    )  # Mocking os.path.isfile to return True
-    @patch("builtins.open", new_callable=unittest.mock.mock_open)
     @patch("simple_vm_client.forc_connector.playbook.playbook.logger.info")
-    def test_copy_and_init_research_environment(
-        self, mock_logger_info, mock_open, mock_isfile, mock_copytree
-    ):
+    def test_copy_and_init_research_environment(self, mock_logger_info):
         # Arrange
         instance = self.init_playbook()  # Create an instance of YourClass
-        mock_yaml_exec = MagicMock()
-        instance.yaml_exec = mock_yaml_exec
 
         # Mock data and methods
         instance.research_environment_template = "template_name"
@@ -552,44 +610,50 @@ class TestPlaybook(unittest.TestCase):
         instance.research_environment_template_version = "template_version"
         instance.create_only_backend = False
         instance.base_url = "base_url"
+        self.write_workspace_yaml(
+            instance,
+            os.path.join("template_name", "template_name_vars_file.yml"),
+            {"template_name_vars": {"template_version": None, "port": 8080}},
+        )
+        self.write_workspace_yaml(
+            instance, os.path.join("template_name", "template_name-cloud_site.yml"), []
+        )
 
         # Act
         instance.copy_and_init_research_environment()
 
         # Assert
-        mock_copytree.assert_called_once_with(
-            f"{instance.playbooks_dir}resenvs/template_name",
-            instance.directory.name,
-            dirs_exist_ok=True,
-        )
-        mock_isfile.assert_any_call(
-            f"{instance.directory.name}/template_name-cloud_site.yml"
-        )
-        mock_open.assert_any_call(
-            f"{instance.directory.name}/template_name_vars_file.yml", mode="r"
-        )
-        mock_open.assert_any_call(
-            f"{instance.directory.name}/template_name_vars_file.yml", mode="w"
+        self.assertEqual(
+            self.read_playbook_yaml(instance, "template_name_vars_file.yml"),
+            {
+                "template_name_vars": {
+                    "template_version": "template_version",
+                    "port": 8080,
+                    "create_only_backend": False,
+                    "base_url": "base_url",
+                }
+            },
         )
         mock_logger_info.assert_called_once_with(
             f"Added playbook: {instance.research_environment_template}-{instance.cloud_site}.yml,"
             f" vars file: {instance.research_environment_template}_vars_file.yml"
         )
 
-    @patch("simple_vm_client.forc_connector.playbook.playbook.shutil.copytree")
-    def test_copy_and_init_research_environment_no_template(self, mock_copytree):
+    @patch("simple_vm_client.forc_connector.playbook.playbook.load_parsed_yaml")
+    def test_copy_and_init_research_environment_no_template(
+        self, mock_load_parsed_yaml
+    ):
         playbook = self.init_playbook()
         playbook.copy_and_init_research_environment()
-        mock_copytree.assert_not_called()
+        mock_load_parsed_yaml.assert_not_called()
 
     @patch(
         "simple_vm_client.forc_connector.playbook.playbook.open",
         side_effect=IOError("Error copying file"),
     )
     @patch("simple_vm_client.forc_connector.playbook.playbook.logger.exception")
-    @patch("simple_vm_client.forc_connector.playbook.playbook.shutil.copytree")
     def test_copy_and_init_research_environment_error(
-        self, mock_copy, mock_logger_exception, mock_open
+        self, mock_logger_exception, mock_open
     ):
         # Arrange
         obj = self.init_playbook()
@@ -604,22 +668,20 @@ class TestPlaybook(unittest.TestCase):
         )
         obj.add_tasks_only.assert_called_once_with(obj.research_environment_template)
 
-    @patch("shutil.copytree")
-    @patch(
-        "os.path.isfile", return_value=False
-    )  # Mocking os.path.isfile to return False
-    @patch("shutil.copy")
-    @patch("builtins.open", new_callable=unittest.mock.mock_open)
-    def test_copy_playbooks_and_init(
-        self, mock_open, mock_copy, mock_copytree, mock_isfile
-    ):
+    def test_copy_playbooks_and_init(self):
         playbook = self.init_playbook()
-        mock_yaml_exec = MagicMock()
-        playbook.yaml_exec = mock_yaml_exec
+        self.write_workspace_yaml(
+            playbook,
+            playbook.playbook_exec_name,
+            [{"hosts": "all", "vars_files": [], "tasks": [{"block": []}]}],
+        )
         playbook.copy_and_init_conda_packages = MagicMock()
         playbook.copy_and_init_apt_packages = MagicMock()
         playbook.copy_and_init_research_environment = MagicMock()
         playbook.copy_and_init_change_keys = MagicMock()
+        playbook.link_workspace = MagicMock()
+        playbook.add_to_playbook_lists("conda", "conda")
+        playbook.add_always_tasks_only("change_key")
         playbook.copy_playbooks_and_init(public_key=DEFAULT_PUBLIC_KEY)
 
         playbook.copy_and_init_conda_packages.assert_called_once_with()
@@ -628,55 +690,138 @@ class TestPlaybook(unittest.TestCase):
         playbook.copy_and_init_change_keys.assert_called_once_with(
             public_key=DEFAULT_PUBLIC_KEY
         )
+        self.assertEqual(
+            self.read_playbook_yaml(playbook, playbook.playbook_exec_name),
+            [
+                {
+                    "hosts": "all",
+                    "vars_files": ["conda_vars_file.yml"],
+                    "tasks": [
+                        {
+                            "block": playbook.tasks,
+                            "always": playbook.always_tasks,
+                        }
+                    ],
+                }
+            ],
+        )
+        playbook.link_workspace.assert_called_once_with()
 
-    patch("shutil.copy")
-
-    @patch(
-        "os.path.isfile", return_value=True
-    )  # Mocking os.path.isfile to return False
-    @patch("builtins.open", new_callable=unittest.mock.mock_open)
-    @patch("simple_vm_client.forc_connector.playbook.playbook.shutil.copy")
-    def test_copy_and_init_change_keys(self, mock_copy, mock_open, mock_isfile):
+    def test_copy_and_init_change_keys(self):
         playbook = self.init_playbook()
-        mock_yaml_exec = MagicMock()
-        mock_yaml_exec.load.return_value = {"change_key_vars": {"key": None}}
-        playbook.yaml_exec = mock_yaml_exec
         playbook.add_to_playbook_always_lists = MagicMock()
-        key_file_mock = MagicMock()
-
-        mock_open.side_effect = [key_file_mock, key_file_mock]
+        self.write_workspace_yaml(
+            playbook, "change_key_vars_file.yml", {"change_key_vars": {"key": None}}
+        )
 
         # Act
-        playbook.copy_and_init_change_keys(public_key=DEFAULT_PUBLIC_KEY)
+        playbook.copy_and_init_change_keys(public_key=f'"{DEFAULT_PUBLIC_KEY}"')
 
         # Assert
-        expected_copy_calls = [
-            unittest.mock.call(
-                "/path/to/playbooks/change_key.yml", "/path/to/directory"
-            ),
-            unittest.mock.call(
-                "/path/to/playbooks/change_key_vars_file.yml", "/path/to/directory"
-            ),
-        ]
-        mock_copy(expected_copy_calls, any_order=True)
+        self.assertEqual(
+            self.read_playbook_yaml(playbook, "change_key_vars_file.yml"),
+            {"change_key_vars": {"key": DEFAULT_PUBLIC_KEY}},
+        )
+        playbook.add_to_playbook_always_lists.assert_called_once_with("change_key")
 
-        key_file = playbook.directory.name + "/change_key_vars_file.yml"
+    def test_load_workspace_yaml_is_cached_and_copied(self):
+        playbook = self.init_playbook()
+        self.write_workspace_yaml(
+            playbook, "change_key_vars_file.yml", {"change_key_vars": {"key": None}}
+        )
 
-        data_ck = {"change_key_vars": {"key": None}}
-        data_ck["change_key_vars"]["key"] = DEFAULT_PUBLIC_KEY.strip('"')
+        first = playbook.load_workspace_yaml("change_key_vars_file.yml")
+        first["change_key_vars"]["key"] = DEFAULT_PUBLIC_KEY
+        os.remove(os.path.join(playbook.workspace_dir, "change_key_vars_file.yml"))
+        second = playbook.load_workspace_yaml("change_key_vars_file.yml")
 
-        mock_open.assert_any_call(key_file, mode="r"),
-        mock_open.assert_any_call(key_file, mode="w")
-        mock_yaml_exec.load.assert_called_once_with(key_file_mock.__enter__())
-        mock_yaml_exec.dump.assert_called_once_with(data_ck, key_file_mock.__enter__())
-        playbook.add_to_playbook_always_lists.assert_called_once_with("change_key")
+        self.assertEqual(second, {"change_key_vars": {"key": None}})
+        self.assertIn(playbook.workspace_dir, parsed_yaml_cache)
+
+    def test_load_parsed_yaml_drops_pruned_workspaces(self):
+        playbook = self.init_playbook()
+        self.write_workspace_yaml(playbook, "vars_file.yml", {"key": "value"})
+        load_parsed_yaml(playbook.workspace_dir, "vars_file.yml")
+        playbook.workspace.cleanup()
+
+        new_workspace = self.init_playbook()
+        self.write_workspace_yaml(new_workspace, "vars_file.yml", {"key": "value"})
+        load_parsed_yaml(new_workspace.workspace_dir, "vars_file.yml")
+
+        self.assertNotIn(playbook.workspace_dir, parsed_yaml_cache)
+        self.assertIn(new_workspace.workspace_dir, parsed_yaml_cache)
+
+    def test_write_yaml_replaces_workspace_link(self):
+        playbook = self.init_playbook()
+        workspace_file = os.path.join(playbook.workspace_dir, "vars_file.yml")
+        with open(workspace_file, "w") as f:
+            f.write("shared")
+        os.symlink(
+            workspace_file, os.path.join(playbook.directory.name, "vars_file.yml")
+        )
+
+        playbook.write_yaml("vars_file.yml", {"key": "value"})
+
+        self.assertFalse(
+            os.path.islink(os.path.join(playbook.directory.name, "vars_file.yml"))
+        )
+        self.assertEqual(
+            self.read_playbook_yaml(playbook, "vars_file.yml"), {"key": "value"}
+        )
+        with open(workspace_file) as f:
+            self.assertEqual(f.read(), "shared")
+
+    def test_get_workspace_layers(self):
+        playbook = self.init_playbook()
+        playbook.conda_packages = DEFAULT_CONDA_PACKAGES
+        playbook.research_environment_template = "vscode"
+        playbook.create_only_backend = False
+        os.mkdir(os.path.join(playbook.workspace_dir, CONDA))
+        os.mkdir(os.path.join(playbook.workspace_dir, "vscode"))
+
+        layers = playbook.get_workspace_layers()
+
+        self.assertEqual(
+            layers,
+            [
+                os.path.join(playbook.workspace_dir, CONDA),
+                os.path.join(playbook.workspace_dir, "vscode"),
+                playbook.workspace_dir,
+            ],
+        )
+
+    def test_link_layers(self):
+        with TemporaryDirectory() as base, TemporaryDirectory() as target:
+            first = os.path.join(base, "first")
+            second = os.path.join(base, "second")
+            for layer in [first, second]:
+                os.makedirs(os.path.join(layer, "files"))
+                with open(os.path.join(layer, "tasks.yml"), "w") as f:
+                    f.write(layer)
+            with open(os.path.join(first, "files", "first.txt"), "w") as f:
+                f.write("first")
+            with open(os.path.join(second, "files", "second.txt"), "w") as f:
+                f.write("second")
+            with open(os.path.join(target, "generated.yml"), "w") as f:
+                f.write("generated")
+            with open(os.path.join(second, "generated.yml"), "w") as f:
+                f.write("workspace")
+
+            link_layers(target=target, layers=[first, second])
+
+            self.assertEqual(
+                os.readlink(os.path.join(target, "tasks.yml")),
+                os.path.join(second, "tasks.yml"),
+            )
+            self.assertFalse(os.path.islink(os.path.join(target, "files")))
+            self.assertTrue(os.path.islink(os.path.join(target, "files", "first.txt")))
+            self.assertTrue(os.path.islink(os.path.join(target, "files", "second.txt")))
+            self.assertFalse(os.path.islink(os.path.join(target, "generated.yml")))
 
-    @patch("simple_vm_client.forc_connector.playbook.playbook.shutil.copytree")
     @patch(
-        "os.path.isfile", return_value=True
-    )  # Mocking os.path.isfile to return False
-    @patch("shutil.copy")
-    @patch("builtins.open", new_callable=unittest.mock.mock_open)
+        "simple_vm_client.forc_connector.playbook.playbook.Template.get_playbook_workspace_dir",
+        return_value="/path/to/workspace/",
+    )
     @patch(
         "simple_vm_client.forc_connector.playbook.playbook.Playbook.copy_playbooks_and_init"
     )
@@ -685,10 +830,7 @@ class TestPlaybook(unittest.TestCase):
         self,
         mock_redis,
         mock_copy_playbooks_and_init,
-        mock_open,
-        mock_copy,
-        mock_isfile,
-        mock_copytree,
+        mock_get_playbook_workspace_dir,
     ):
         # Act
         instance = Playbook(
@@ -709,7 +851,6 @@ class TestPlaybook(unittest.TestCase):
         # Assert
         self.assertEqual(instance.cloud_site, DEFAULT_CLOUD_SITE)
         self.assertIsNotNone(instance.redis)
-        self.assertIsNotNone(instance.yaml_exec)
         self.assertEqual(instance.conda_packages, DEFAULT_CONDA_PACKAGES)
         self.assertEqual(instance.apt_packages, DEFAULT_APT_PACKAGES)
         self.assertIsNone(instance.process)
@@ -726,5 +867,9 @@ class TestPlaybook(unittest.TestCase):
             DEFAULT_RESEARCH_ENVIRONMENT_TEMPLATE,
         )
         self.assertEqual(instance.base_url, DEFAULT_BASE_URL)
+        self.assertEqual(instance.workspace_dir, "/path/to/workspace/")
+        self.assertEqual(instance.ansible_settings, DEFAULT_ANSIBLE_SETTINGS)
+        with open(instance.inventory.name) as inventory:
+            self.assertIn(f"{DEFAULT_IP} ansible_port={DEFAULT_PORT}", inventory.read())
 
         mock_copy_playbooks_and_init.assert_called_once()
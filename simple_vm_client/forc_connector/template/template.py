@@ -1,15 +1,21 @@
-import glob
+import hashlib
 import os
 import shutil
 import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
 from distutils.version import LooseVersion
 from pathlib import Path
+from typing import Callable
 
 import requests
 import yaml
 
 from simple_vm_client.ttypes import ResearchEnvironmentTemplate
+from simple_vm_client.util.http_client import HttpClient
 from simple_vm_client.util.logger import setup_custom_logger
 
 # from resenv.backend.Backend import Backend
@@ -40,6 +46,21 @@ NEEDS_FORC_SUPPORT = "needs_forc_support"
 MIN_RAM = "min_ram"
 MIN_CORES = "min_cores"
 FILENAME = "resenv_repo"
+WORKSPACES_DIR_NAME = "workspaces"
+WORKSPACE_BUILD_PREFIX = ".building_"
+WORKSPACE_KEEP_VERSIONS = 2
+FACT_CACHE_DIR_NAME = "facts_cache"
+RESENVS_DIR_NAME = "resenvs"
+RESENVS_VERSIONS_DIR_NAME = "resenvs_versions"
+RESENVS_KEEP_VERSIONS = 2
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+FORC_VERSION_CHECK_WORKERS = 8
+FORC_VERSION_CHECK_DEADLINE = 60
+FORC_VERSION_CHECK_TIMEOUT = (5, 15)
+FORC_VERSION_CACHE_TTL = 6 * 60 * 60
+FORC_VERSION_UNAVAILABLE_TTL = 5 * 60
+FORC_TEMPLATES_CACHE_TTL = 5 * 60
+FORC_TEMPLATES_UNAVAILABLE_TTL = 30
 
 
 class ResearchEnvironmentMetadata:
@@ -94,12 +115,19 @@ class ResearchEnvironmentMetadata:
 
 class Template(object):
     is_locked = False
+    # guards is_locked, so deploy requests can be deferred without racing the update
+    update_lock = threading.Lock()
+    workspace_dir = ""
+    # playbooks per workspace, workspaces in use are never pruned
+    workspace_refs: dict[str, int] = {}
+    workspace_refs_lock = threading.Lock()
 
     def __init__(
         self,
         github_playbook_repo: str,
         forc_backend_url: str,
         forc_api_key: str,
+        http_client: HttpClient = None,  # type: ignore
     ):
         self.GITHUB_PLAYBOOKS_REPO = github_playbook_repo
         self.FORC_BACKEND_URL = forc_backend_url
@@ -118,66 +146,142 @@ class Template(object):
         self._all_templates = [CONDA]
         self._loaded_resenv_metadata: dict[str, ResearchEnvironmentMetadata] = {}
         self._allowed_forc_templates: list[ResearchEnvironmentTemplate] = []
+        self._playbooks_etag: str = ""
+        self._galaxy_requirements_sha: str = ""
+        # (template, forc version) -> (available, checked at)
+        self._forc_version_cache: dict[tuple[str, str], tuple[bool, float]] = {}
+        self.session = http_client or self._create_session()
+        # FORC template catalog: name -> versions
+        self._forc_templates_index: dict[str, set[str]] = {}
+        self._forc_templates_fetched_at: float = 0.0
+        self._forc_templates_ttl: float = FORC_TEMPLATES_CACHE_TTL
+        self._forc_templates_lock = threading.Lock()
+        self._forc_templates_refreshing = False
 
         self.update_playbooks()
 
+    def _create_session(self) -> HttpClient:
+        # all version checks go to the same FORC host
+        return HttpClient(pool_maxsize=FORC_VERSION_CHECK_WORKERS)
+
     @property
     def loaded_research_env_metadata(self) -> dict[str, ResearchEnvironmentMetadata]:
         return self._loaded_resenv_metadata
 
-    def _download_and_extract_playbooks(self) -> None:
-        logger.info(f"STARTED update of playbooks from - {self.GITHUB_PLAYBOOKS_REPO}")
+    def _download_and_extract_playbooks(self) -> tuple[str, str]:
+        """
+        Download the playbooks repository and extract it as a resenvs version.
+
+        The download is conditional on the ETag of the last activated version and
+        streamed to disk. Versions are named by the SHA-256 of the archive, so an
+        unchanged archive maps to the already extracted version.
 
-        # Create a temporary file for downloading and extracting the playbook
-        temp_filename = tempfile.mkstemp()[1]
+        Returns:
+            The version directory (empty if unchanged) and the ETag of the archive.
+        """
+        logger.info(f"STARTED update of playbooks from - {self.GITHUB_PLAYBOOKS_REPO}")
+        headers = {}
+        if self._playbooks_etag:
+            headers["If-None-Match"] = self._playbooks_etag
 
+        # Create a temporary file for downloading the playbooks
+        fd, temp_filename = tempfile.mkstemp()
+        os.close(fd)
         try:
-            r = requests.get(self.GITHUB_PLAYBOOKS_REPO)
-            with open(temp_filename, "wb") as output_file:
-                output_file.write(r.content)
+            archive_sha = hashlib.sha256()
+            with requests.get(
+                self.GITHUB_PLAYBOOKS_REPO,
+                headers=headers,
+                stream=True,
+                timeout=(30, 300),
+            ) as response:
+                if response.status_code == 304:
+                    logger.info("Playbooks not modified since last download")
+                    return "", self._playbooks_etag
+                response.raise_for_status()
+                with open(temp_filename, "wb") as output_file:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        archive_sha.update(chunk)
+                        output_file.write(chunk)
+                etag = response.headers.get("ETag", "")
 
             logger.info("Downloading Completed")
-
-            # Extract the zip file to a temporary directory
-            temp_dir = tempfile.mkdtemp()
-            try:
-                with zipfile.ZipFile(temp_filename, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Atomically replace the old playbook directory with the new one
-                shutil.rmtree(Template.get_playbook_resenvs_dir())
-                for src_path in Path(temp_dir).rglob("*"):
-                    rel_path = os.path.relpath(src_path, temp_dir)
-                    dest_path = Path(Template.get_playbook_resenvs_dir(), rel_path)
-
-                    if not dest_path.parent.exists():
-                        dest_path.parent.mkdir(parents=True)
-
-                    shutil.move(str(src_path), str(dest_path))
-
-            except Exception as e:
-                logger.error(f"Error downloading or extracting playbook: {e}")
-                raise
-
+            version_dir = self._extract_playbooks(
+                zip_filename=temp_filename, version=archive_sha.hexdigest()
+            )
+        except Exception as e:
+            logger.error(f"Error downloading or extracting playbook: {e}")
+            raise
         finally:
-            # Clean up the temporary file and directory
+            # Clean up the temporary file
             if os.path.exists(temp_filename):
                 os.remove(temp_filename)
 
-        if not os.path.exists(Template.get_playbook_resenvs_dir()):
-            raise FileNotFoundError("Playbook directory does not exist")
+        return version_dir, etag
 
-    def _copy_resenvs_templates(self) -> None:
-        resenvs_unziped_dir = next(
-            filter(
-                lambda f: os.path.isdir(f) and "resenvs" in f,
-                glob.glob(Template.get_playbook_resenvs_dir() + "*"),
-            )
-        )
-        shutil.copytree(
-            resenvs_unziped_dir, Template.get_playbook_resenvs_dir(), dirs_exist_ok=True
+    @staticmethod
+    def _extract_playbooks(zip_filename: str, version: str) -> str:
+        versions_dir = Template.get_playbook_resenvs_versions_dir()
+        version_dir = os.path.join(versions_dir, version)
+        if os.path.isdir(version_dir):
+            logger.info(f"Playbooks version {version} already extracted")
+            return version_dir
+
+        temp_dir = tempfile.mkdtemp(dir=versions_dir, prefix=WORKSPACE_BUILD_PREFIX)
+        try:
+            with zipfile.ZipFile(zip_filename, "r") as zip_ref:
+                zip_ref.extractall(temp_dir)
+            # github archives contain a single top level directory, e.g. resenvs-staging
+            entries = os.listdir(temp_dir)
+            extracted_dir = temp_dir
+            if len(entries) == 1 and os.path.isdir(os.path.join(temp_dir, entries[0])):
+                extracted_dir = os.path.join(temp_dir, entries[0])
+            os.rename(extracted_dir, version_dir)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        return version_dir
+
+    @staticmethod
+    def get_active_resenvs_version_dir() -> str:
+        resenvs_path = os.path.join(Template.get_playbook_dir(), RESENVS_DIR_NAME)
+        if os.path.islink(resenvs_path):
+            return os.path.realpath(resenvs_path)
+        return ""
+
+    @staticmethod
+    def _activate_resenvs_version(version_dir: str) -> None:
+        """
+        Point the resenvs directory to a version with an atomic symlink swap.
+        """
+        resenvs_path = os.path.join(Template.get_playbook_dir(), RESENVS_DIR_NAME)
+        if os.path.isdir(resenvs_path) and not os.path.islink(resenvs_path):
+            # migrate from the former plain resenvs directory
+            shutil.rmtree(resenvs_path)
+        temp_link = f"{resenvs_path}.{os.getpid()}.tmp"
+        if os.path.lexists(temp_link):
+            os.remove(temp_link)
+        os.symlink(version_dir, temp_link)
+        os.replace(temp_link, resenvs_path)
+        os.utime(version_dir)
+        logger.info(f"Activated playbooks version - {os.path.basename(version_dir)}")
+        Template._prune_resenvs_versions(active_version_dir=version_dir)
+
+    @staticmethod
+    def _prune_resenvs_versions(active_version_dir: str) -> None:
+        versions_dir = Template.get_playbook_resenvs_versions_dir()
+        versions = sorted(
+            (
+                os.path.join(versions_dir, name)
+                for name in os.listdir(versions_dir)
+                if not name.startswith(WORKSPACE_BUILD_PREFIX)
+            ),
+            key=os.path.getmtime,
         )
-        shutil.rmtree(resenvs_unziped_dir, ignore_errors=True)
+        for version_dir in versions[:-RESENVS_KEEP_VERSIONS]:
+            if os.path.realpath(version_dir) == os.path.realpath(active_version_dir):
+                continue
+            logger.info(f"Remove outdated playbooks version - {version_dir}")
+            shutil.rmtree(version_dir, ignore_errors=True)
 
     def _update_loaded_templates(self) -> None:
         self._all_templates = [
@@ -190,19 +294,31 @@ class Template(object):
     def _load_and_update_resenv_metadata(self) -> None:
         templates_metadata = self._load_resenv_metadata()
 
+        # validate the versions of all templates at once, under a single deadline
+        available = self._check_forc_versions(
+            [
+                (template_metadata.template_name, forc_version)
+                for template_metadata in templates_metadata
+                if template_metadata.needs_forc_support
+                for forc_version in template_metadata.forc_versions
+            ]
+        )
+
         for template_metadata in templates_metadata:
             try:
-                self._process_template_metadata(template_metadata)
+                self._process_template_metadata(template_metadata, available)
             except Exception as e:
                 logger.exception(
                     f"Failed to parse Metadata yml: {template_metadata}\n{e}"
                 )
 
     def _process_template_metadata(
-        self, template_metadata: ResearchEnvironmentMetadata
+        self,
+        template_metadata: ResearchEnvironmentMetadata,
+        available: set[tuple[str, str]],
     ) -> None:
         if template_metadata.needs_forc_support:
-            self._update_forc_allowed(template_metadata)
+            self._update_forc_allowed(template_metadata, available)
 
             if template_metadata.template_name not in self._loaded_resenv_metadata:
                 self._loaded_resenv_metadata[template_metadata.template_name] = (
@@ -216,32 +332,58 @@ class Template(object):
                     template_metadata
                 )
 
-    def update_playbooks(self) -> None:
+    def update_playbooks(
+        self, on_activated: Callable[[], None] = None  # type: ignore
+    ) -> None:
+        """
+        Download, activate and load the playbooks.
+
+        `on_activated` is called as soon as deploys use the new version, before
+        the slower metadata refresh.
+        """
         if not self.GITHUB_PLAYBOOKS_REPO:
             logger.warning(
                 "Github playbooks repo URL is None. Aborting download of playbooks."
             )
             return
-        Template.is_locked = True
         try:
-            self._download_and_extract_playbooks()
+            version_dir, etag = self._download_and_extract_playbooks()
+            if version_dir and (
+                os.path.realpath(version_dir)
+                != Template.get_active_resenvs_version_dir()
+                or not Template.workspace_dir
+            ):
+                self._install_ansible_galaxy_requirements(resenvs_dir=version_dir)
+                workspace_dir = Template._build_playbook_workspace(
+                    resenvs_dir=version_dir
+                )
 
-            self._copy_resenvs_templates()
+                # only the swap itself is locked, deploys read immutable workspaces
+                with Template.update_lock:
+                    Template.is_locked = True
+                try:
+                    Template._activate_resenvs_version(version_dir)
+                    Template._activate_playbook_workspace(workspace_dir)
+                finally:
+                    with Template.update_lock:
+                        Template.is_locked = False
 
-            self._update_loaded_templates()
+                self._update_loaded_templates()
 
-            logger.info(f"Loaded Template Names: {self._all_templates}")
+                logger.info(f"Loaded Template Names: {self._all_templates}")
 
-            self._install_ansible_galaxy_requirements()
+                if on_activated:
+                    on_activated()
+                Template._prune_playbook_workspaces()
+            else:
+                logger.info("Playbooks are up to date")
+            self._playbooks_etag = etag
 
             self._load_and_update_resenv_metadata()
 
             logger.info(f"Allowed Forc {self._forc_allowed}")
         except Exception:
             logger.exception("Could not update playbooks")
-        finally:
-
-            Template.is_locked = False
 
     def is_update_locked(self):
         return Template.is_locked
@@ -249,7 +391,7 @@ class Template(object):
     def _get_forc_templates(self) -> list[dict]:
         if self.TEMPLATES_URL:
             try:
-                response = requests.get(
+                response = self.session.get(
                     self.TEMPLATES_URL,
                     timeout=(30, 30),
                     headers={"X-API-KEY": self.FORC_API_KEY},
@@ -260,22 +402,65 @@ class Template(object):
                 logger.exception(f"Error while fetching FORC templates: {e}")
         return []
 
+    def _refresh_forc_templates_index(self) -> None:
+        # an empty catalog is retried soon, FORC was probably not reachable
+        ttl = FORC_TEMPLATES_UNAVAILABLE_TTL
+        try:
+            index: dict[str, set[str]] = {}
+            for template_dict in self._get_forc_templates():
+                index.setdefault(template_dict["name"], set()).add(
+                    template_dict["version"]
+                )
+            # keep the last known catalog if FORC could not be reached
+            if index:
+                self._forc_templates_index = index
+                ttl = FORC_TEMPLATES_CACHE_TTL
+        finally:
+            with self._forc_templates_lock:
+                self._forc_templates_fetched_at = time.monotonic()
+                self._forc_templates_ttl = ttl
+                self._forc_templates_refreshing = False
+
+    def get_forc_templates_index(self) -> dict[str, set[str]]:
+        """
+        Return the FORC template catalog, indexed by template name.
+
+        Without a catalog, e.g. on the first call, it is fetched right away.
+        Afterwards a stale catalog is returned right away while it is
+        refreshed in the background.
+        """
+        with self._forc_templates_lock:
+            fetched_at = self._forc_templates_fetched_at
+            refresh = not self._forc_templates_refreshing and (
+                not fetched_at
+                or time.monotonic() - fetched_at > self._forc_templates_ttl
+            )
+            if refresh:
+                self._forc_templates_refreshing = True
+        if refresh and not self._forc_templates_index:
+            self._refresh_forc_templates_index()
+        elif refresh:
+            threading.Thread(
+                target=self._refresh_forc_templates_index,
+                name="forc-templates-refresh",
+                daemon=True,
+            ).start()
+        return self._forc_templates_index
+
     def cross_check_forc_image(self, tags: list[str]) -> bool:
         try:
-            templates = self._get_forc_templates()
+            templates_index = self.get_forc_templates_index()
         except Exception:
             logger.exception("Could not get templates from FORC.")
-            templates = []
+            templates_index = {}
 
         cross_tags = set(self._all_templates).intersection(tags)
 
-        for template_dict in templates:
-            template_name = template_dict["name"]
-
-            if template_name in self._forc_allowed and template_name in cross_tags:
-                template_version = template_dict["version"]
-                if template_version in self._forc_allowed[template_name]:
-                    return True
+        for template_name in cross_tags:
+            if template_name in self._forc_allowed and templates_index.get(
+                template_name, set()
+            ).intersection(self._forc_allowed[template_name]):
+                return True
 
         return False
 
@@ -295,6 +480,119 @@ class Template(object):
         dir_path = f"{os.path.dirname(os.path.realpath(__file__))}/plays/resenvs/"
         return dir_path
 
+    @staticmethod
+    def get_playbook_resenvs_versions_dir() -> str:
+        dir_path = os.path.join(
+            Template.get_playbook_dir(), RESENVS_VERSIONS_DIR_NAME, ""
+        )
+        Path(dir_path).mkdir(parents=True, exist_ok=True)
+        return dir_path
+
+    @staticmethod
+    def get_playbook_fact_cache_dir() -> str:
+        dir_path = os.path.join(Template.get_playbook_dir(), FACT_CACHE_DIR_NAME, "")
+        Path(dir_path).mkdir(parents=True, exist_ok=True)
+        return dir_path
+
+    @staticmethod
+    def prune_playbook_fact_cache(max_age: int) -> None:
+        fact_cache_dir = Template.get_playbook_fact_cache_dir()
+        expired = datetime.now().timestamp() - max_age
+        for name in os.listdir(fact_cache_dir):
+            path = os.path.join(fact_cache_dir, name)
+            if os.path.getmtime(path) < expired:
+                logger.info(f"Remove expired facts - {name}")
+                os.remove(path)
+
+    @staticmethod
+    def get_playbook_workspaces_dir() -> str:
+        dir_path = os.path.join(Template.get_playbook_dir(), WORKSPACES_DIR_NAME, "")
+        Path(dir_path).mkdir(parents=True, exist_ok=True)
+        return dir_path
+
+    @staticmethod
+    def build_playbook_workspace() -> str:
+        """Build a workspace from the active resenvs and use it for new playbooks."""
+        workspace_dir = Template._build_playbook_workspace(
+            resenvs_dir=Template.get_playbook_resenvs_dir()
+        )
+        Template._activate_playbook_workspace(workspace_dir)
+        Template._prune_playbook_workspaces()
+        return Template.workspace_dir
+
+    @staticmethod
+    def _build_playbook_workspace(resenvs_dir: str) -> str:
+        """
+        Build an immutable, versioned base workspace for playbook runs.
+
+        The workspace holds the generic plays and the complete resenvs tree, so
+        every playbook only needs to link against it instead of copying it.
+        """
+        workspaces_dir = Template.get_playbook_workspaces_dir()
+        version = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        build_dir = tempfile.mkdtemp(dir=workspaces_dir, prefix=WORKSPACE_BUILD_PREFIX)
+        try:
+            plays_dir = Template.get_playbook_dir()
+            for name in os.listdir(plays_dir):
+                path = os.path.join(plays_dir, name)
+                if os.path.isfile(path):
+                    shutil.copy(path, build_dir)
+            shutil.copytree(resenvs_dir, build_dir, dirs_exist_ok=True)
+            workspace_dir = os.path.join(workspaces_dir, version)
+            os.rename(build_dir, workspace_dir)
+        except Exception:
+            shutil.rmtree(build_dir, ignore_errors=True)
+            raise
+        logger.info(f"Built playbook workspace - {workspace_dir}")
+        return os.path.join(workspace_dir, "")
+
+    @staticmethod
+    def _activate_playbook_workspace(workspace_dir: str) -> None:
+        Template.workspace_dir = workspace_dir
+        logger.info(f"Activated playbook workspace - {workspace_dir}")
+
+    @staticmethod
+    def _prune_playbook_workspaces() -> None:
+        workspaces_dir = Template.get_playbook_workspaces_dir()
+        versions = sorted(
+            name
+            for name in os.listdir(workspaces_dir)
+            if not name.startswith(WORKSPACE_BUILD_PREFIX)
+        )
+        with Template.workspace_refs_lock:
+            for version in versions[:-WORKSPACE_KEEP_VERSIONS]:
+                workspace_dir = os.path.join(workspaces_dir, version, "")
+                if Template.workspace_refs.get(workspace_dir):
+                    # running playbooks link into it
+                    continue
+                logger.info(f"Remove outdated playbook workspace - {version}")
+                shutil.rmtree(workspace_dir, ignore_errors=True)
+
+    @staticmethod
+    def get_playbook_workspace_dir() -> str:
+        if not Template.workspace_dir or not os.path.isdir(Template.workspace_dir):
+            return Template.build_playbook_workspace()
+        return Template.workspace_dir
+
+    @staticmethod
+    def acquire_playbook_workspace() -> str:
+        """Current workspace, kept until release_playbook_workspace is called."""
+        workspace_dir = Template.get_playbook_workspace_dir()
+        with Template.workspace_refs_lock:
+            Template.workspace_refs[workspace_dir] = (
+                Template.workspace_refs.get(workspace_dir, 0) + 1
+            )
+        return workspace_dir
+
+    @staticmethod
+    def release_playbook_workspace(workspace_dir: str) -> None:
+        with Template.workspace_refs_lock:
+            refs = Template.workspace_refs.get(workspace_dir, 0) - 1
+            if refs > 0:
+                Template.workspace_refs[workspace_dir] = refs
+            else:
+                Template.workspace_refs.pop(workspace_dir, None)
+
     def _add_forc_allowed_template(self, metadata: ResearchEnvironmentMetadata) -> None:
         if metadata.needs_forc_support:
             logger.info(f"Add {metadata.template_name} - to allowed templates")
@@ -359,13 +657,30 @@ class Template(object):
             return template_versions[0]
         return ""
 
-    def _install_ansible_galaxy_requirements(self):
-        logger.info("Installing Ansible galaxy requirements..")
-        stream = os.popen(
-            f"ansible-galaxy install -r {Template.get_playbook_resenvs_dir()}/packer/requirements.yml"
+    def _install_ansible_galaxy_requirements(self, resenvs_dir: str = "") -> None:
+        requirements_file = os.path.join(
+            resenvs_dir or Template.get_playbook_resenvs_dir(),
+            "packer",
+            "requirements.yml",
         )
+        try:
+            with open(requirements_file, "rb") as requirements:
+                requirements_sha = hashlib.sha256(requirements.read()).hexdigest()
+        except IOError:
+            logger.warning(
+                f"No Ansible galaxy requirements found - {requirements_file}"
+            )
+            return
+        if requirements_sha == self._galaxy_requirements_sha:
+            logger.info("Ansible galaxy requirements unchanged. Skipping install..")
+            return
+
+        logger.info("Installing Ansible galaxy requirements..")
+        stream = os.popen(f"ansible-galaxy install -r {requirements_file}")
         output = stream.read()
         logger.info(output)
+        if stream.close() is None:
+            self._galaxy_requirements_sha = requirements_sha
 
     def get_allowed_templates(self) -> list[ResearchEnvironmentTemplate]:
         logger.info("Allowed templates:")
@@ -379,12 +694,74 @@ class Template(object):
     ) -> requests.Response:
         get_url = f"{self.TEMPLATES_URL}/{template_name}/{forc_version}"
         logger.info(f"Get Forc Template Version - {get_url}")
-        return requests.get(
+        return self.session.get(
             get_url,
-            timeout=(30, 30),
+            timeout=FORC_VERSION_CHECK_TIMEOUT,
             headers={"X-API-KEY": self.FORC_API_KEY},
         )
 
+    def _is_forc_version_available(self, template_name: str, forc_version: str) -> bool:
+        cached = self._forc_version_cache.get((template_name, forc_version))
+        if cached:
+            available, checked_at = cached
+            ttl = FORC_VERSION_CACHE_TTL if available else FORC_VERSION_UNAVAILABLE_TTL
+            if time.monotonic() - checked_at < ttl:
+                return available
+        try:
+            response = self._get_forc_template_version(
+                template_name=template_name, forc_version=forc_version
+            )
+        except requests.Timeout as e:
+            logger.error(f"Checking template/version timed out. {e}")
+            return False
+        available = response.status_code == 200
+        self._forc_version_cache[(template_name, forc_version)] = (
+            available,
+            time.monotonic(),
+        )
+        return available
+
+    def _check_forc_versions(
+        self, checks: list[tuple[str, str]]
+    ) -> set[tuple[str, str]]:
+        """
+        Check (template, forc version) pairs concurrently against FORC.
+
+        All checks share one overall deadline, pairs which are not checked
+        in time are treated as unavailable.
+
+        Returns:
+            The available (template, forc version) pairs.
+        """
+        checks = list(dict.fromkeys(checks))
+        if not checks:
+            return set()
+        executor = ThreadPoolExecutor(
+            max_workers=min(FORC_VERSION_CHECK_WORKERS, len(checks))
+        )
+        futures = {
+            executor.submit(self._is_forc_version_available, name, version): (
+                name,
+                version,
+            )
+            for name, version in checks
+        }
+        done, not_done = wait(futures, timeout=FORC_VERSION_CHECK_DEADLINE)
+        executor.shutdown(wait=False, cancel_futures=True)
+        if not_done:
+            logger.warning(
+                f"Checking {len(not_done)} template versions exceeded the deadline of {FORC_VERSION_CHECK_DEADLINE}s"
+            )
+        available = set()
+        for future in done:
+            if future.exception():
+                logger.error(
+                    f"Checking template/version {futures[future]} failed. {future.exception()}"
+                )
+            elif future.result():
+                available.add(futures[future])
+        return available
+
     def _update_forc_allowed_versions(
         self, name: str, allowed_versions: list[str]
     ) -> None:
@@ -392,22 +769,19 @@ class Template(object):
         self._forc_allowed[name] = allowed_versions
 
     def _update_forc_allowed(
-        self, template_metadata: ResearchEnvironmentMetadata
+        self,
+        template_metadata: ResearchEnvironmentMetadata,
+        available: set[tuple[str, str]],
     ) -> None:
+        """`available` are the (template, forc version) pairs FORC provides."""
         if not template_metadata.needs_forc_support:
             return
 
         name = template_metadata.template_name
-        allowed_versions = []
-
-        for forc_version in template_metadata.forc_versions:
-            try:
-                response = self._get_forc_template_version(
-                    template_name=name, forc_version=forc_version
-                )
-                if response.status_code == 200:
-                    allowed_versions.append(forc_version)
-            except requests.Timeout as e:
-                logger.error(f"Checking template/version timed out. {e}")
+        allowed_versions = [
+            forc_version
+            for forc_version in template_metadata.forc_versions
+            if (name, forc_version) in available
+        ]
 
         self._update_forc_allowed_versions(name, allowed_versions)
@@ -1,7 +1,12 @@
 import copy
+import hashlib
 import os
+import threading
+import time
 import unittest
+import zipfile
 from distutils.version import LooseVersion
+from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, Mock, call, mock_open, patch
 
 import pytest
@@ -10,7 +15,10 @@ import yaml
 
 from simple_vm_client.forc_connector.template.template import (
     CONDA,
-    FILENAME,
+    FORC_TEMPLATES_CACHE_TTL,
+    FORC_TEMPLATES_UNAVAILABLE_TTL,
+    FORC_VERSION_CHECK_TIMEOUT,
+    FORC_VERSION_UNAVAILABLE_TTL,
     ResearchEnvironmentMetadata,
     Template,
 )
@@ -121,93 +129,105 @@ class TestTemplate(unittest.TestCase):
                 {}
             )
             template._allowed_forc_templates: list[ResearchEnvironmentTemplate] = []
+            template._playbooks_etag = ""
+            template._galaxy_requirements_sha = ""
+            template._forc_version_cache = {}
+            template.session = template._create_session()
+            template._forc_templates_index = {}
+            template._forc_templates_fetched_at = 0.0
+            template._forc_templates_ttl = FORC_TEMPLATES_CACHE_TTL
+            template._forc_templates_lock = threading.Lock()
+            template._forc_templates_refreshing = False
 
         return template
 
-    @patch("tempfile.mkstemp")
-    @patch("requests.get")
-    @patch("zipfile.ZipFile")
-    @patch("builtins.open", create=True)
+    def create_playbooks_zip(self, directory, content="- hosts: all"):
+        zip_filename = os.path.join(directory, "resenvs.zip")
+        with zipfile.ZipFile(zip_filename, "w") as zip_file:
+            zip_file.writestr("resenvs-staging/vscode/vscode.yml", content)
+            zip_file.writestr("resenvs-staging/packer/requirements.yml", "roles: []")
+        with open(zip_filename, "rb") as f:
+            return f.read()
+
+    @patch("simple_vm_client.forc_connector.template.template.requests.get")
     @patch("simple_vm_client.forc_connector.template.template.logger.info")
-    def test_download_and_extract_playbooks(
-        self, mock_logger_info, mock_open, mock_zipfile, mock_requests, mock_tempfile
-    ):
+    def test_download_and_extract_playbooks(self, mock_logger_info, mock_requests):
         template = self.init_template(
             github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
             forc_backend_url=TestTemplate.FORC_BACKEND_URL,
         )
-
-        # Set up mock responses
-        mock_response = Mock()
-        mock_response.content = b"Mock content"
-        mock_requests.return_value = mock_response
-        mock_tempfile.return_value = ["", FILENAME]
-
-        # Call the method to test
-        template._download_and_extract_playbooks()
-
-        # Assert that the requests.get method was called with the correct URL
-        mock_requests.assert_called_once_with(template.GITHUB_PLAYBOOKS_REPO)
-
-        # Assert logging messages
+        with TemporaryDirectory() as plays_dir:
+            archive = self.create_playbooks_zip(plays_dir)
+            mock_response = mock_requests.return_value.__enter__.return_value
+            mock_response.status_code = 200
+            mock_response.headers = {"ETag": '"etag"'}
+            mock_response.iter_content.return_value = [archive[:10], archive[10:]]
+
+            with patch.object(Template, "get_playbook_dir", return_value=plays_dir):
+                version_dir, etag = template._download_and_extract_playbooks()
+
+                self.assertEqual(etag, '"etag"')
+                self.assertEqual(
+                    os.path.basename(version_dir), hashlib.sha256(archive).hexdigest()
+                )
+                self.assertTrue(
+                    os.path.isfile(os.path.join(version_dir, "vscode", "vscode.yml"))
+                )
+                # the same archive maps to the already extracted version
+                self.assertEqual(
+                    template._download_and_extract_playbooks()[0], version_dir
+                )
+
+        mock_requests.assert_called_with(
+            template.GITHUB_PLAYBOOKS_REPO, headers={}, stream=True, timeout=(30, 300)
+        )
         mock_logger_info.assert_any_call(
             f"STARTED update of playbooks from - {template.GITHUB_PLAYBOOKS_REPO}"
         )
         mock_logger_info.assert_any_call("Downloading Completed")
 
-        # Assert that the open method was called with the correct file name and mode
-        mock_open.assert_called_once_with(FILENAME, "wb")
-
-        # Assert that the write method was called on the file object
-        mock_open.return_value.__enter__.return_value.write.assert_called_once_with(
-            mock_response.content
-        )
-
-        # Assert that the zipfile.ZipFile constructor was called with the correct file name and mode
-        mock_zipfile.assert_called_once_with(FILENAME, "r")
-
-    @patch("glob.glob")
-    @patch("shutil.copytree")
-    @patch("shutil.rmtree")
-    @patch(
-        "os.path.isdir", return_value=True
-    )  # Mock os.path.isdir to always return True
-    def test_copy_resenvs_templates(
-        self, mock_isdir, mock_rmtree, mock_copytree, mock_glob
-    ):
+    @patch("simple_vm_client.forc_connector.template.template.requests.get")
+    def test_download_and_extract_playbooks_not_modified(self, mock_requests):
         template = self.init_template(
             github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
             forc_backend_url=TestTemplate.FORC_BACKEND_URL,
         )
-
-        # Set up mock responses
-        mock_glob.return_value = ["/path/to/directory/resenvs"]
-
-        def mock_glob_side_effect(pattern):
-            if pattern == Template.get_playbook_resenvs_dir() + "*":
-                return ["/path/to/directory/resenvs"]
-            else:
-                return []
-
-        mock_glob.side_effect = mock_glob_side_effect
-
-        # Call the method to test
-        template._copy_resenvs_templates()
-
-        # Assert that glob.glob was called with the correct parameters
-        mock_glob.assert_called_once_with(Template.get_playbook_resenvs_dir() + "*")
-
-        # Assert that shutil.copytree was called with the correct parameters
-        mock_copytree.assert_called_once_with(
-            "/path/to/directory/resenvs",
-            Template.get_playbook_resenvs_dir(),
-            dirs_exist_ok=True,
+        template._playbooks_etag = '"etag"'
+        mock_requests.return_value.__enter__.return_value.status_code = 304
+
+        self.assertEqual(template._download_and_extract_playbooks(), ("", '"etag"'))
+        mock_requests.assert_called_once_with(
+            template.GITHUB_PLAYBOOKS_REPO,
+            headers={"If-None-Match": '"etag"'},
+            stream=True,
+            timeout=(30, 300),
         )
 
-        # Assert that shutil.rmtree was called with the correct parameters
-        mock_rmtree.assert_called_once_with(
-            "/path/to/directory/resenvs", ignore_errors=True
-        )
+    def test_activate_resenvs_version(self):
+        with TemporaryDirectory() as plays_dir:
+            os.makedirs(os.path.join(plays_dir, "resenvs", "old_template"))
+            with patch.object(Template, "get_playbook_dir", return_value=plays_dir):
+                versions_dir = Template.get_playbook_resenvs_versions_dir()
+                versions = []
+                for i in range(3):
+                    version_dir = os.path.join(versions_dir, f"version{i}")
+                    os.makedirs(version_dir)
+                    os.utime(version_dir, (i, i))
+                    versions.append(version_dir)
+
+                Template._activate_resenvs_version(versions[0])
+                self.assertEqual(
+                    Template.get_active_resenvs_version_dir(),
+                    os.path.realpath(versions[0]),
+                )
+                Template._activate_resenvs_version(versions[2])
+
+                self.assertEqual(
+                    Template.get_active_resenvs_version_dir(),
+                    os.path.realpath(versions[2]),
+                )
+                self.assertFalse(os.path.exists(versions[1]))
+                self.assertTrue(os.path.exists(versions[0]))
 
     @patch("os.listdir")
     @patch("os.path.isdir")
@@ -283,6 +303,7 @@ class TestTemplate(unittest.TestCase):
         mock_os_popen_instance = MagicMock()
         mock_os_popen.return_value = mock_os_popen_instance
         mock_os_popen_instance.read.return_value = "Mocked output"
+        mock_os_popen_instance.close.return_value = None
 
         # Create an instance of the Template class
         template = self.init_template(
@@ -290,13 +311,23 @@ class TestTemplate(unittest.TestCase):
             forc_backend_url=TestTemplate.FORC_BACKEND_URL,
         )
 
-        # Call the method to be tested
-        template._install_ansible_galaxy_requirements()
+        with TemporaryDirectory() as resenvs_dir:
+            requirements_file = os.path.join(resenvs_dir, "packer", "requirements.yml")
+            os.makedirs(os.path.dirname(requirements_file))
+            with open(requirements_file, "w") as f:
+                f.write("roles: []")
+
+            # Call the method to be tested
+            template._install_ansible_galaxy_requirements(resenvs_dir=resenvs_dir)
+            template._install_ansible_galaxy_requirements(resenvs_dir=resenvs_dir)
 
         # Assertions
         mock_logger_info.assert_any_call("Installing Ansible galaxy requirements..")
-        mock_os_popen.assert_called_with(
-            f"ansible-galaxy install -r {Template.get_playbook_resenvs_dir()}/packer/requirements.yml"
+        mock_logger_info.assert_any_call(
+            "Ansible galaxy requirements unchanged. Skipping install.."
+        )
+        mock_os_popen.assert_called_once_with(
+            f"ansible-galaxy install -r {requirements_file}"
         )
         mock_os_popen_instance.read.assert_called_once()
         mock_logger_info.assert_any_call("Mocked output")
@@ -353,16 +384,17 @@ class TestTemplate(unittest.TestCase):
         for template in MOCK_TEMPLATES:
             mock_logger_info.assert_any_call(template)
 
-    @patch("simple_vm_client.forc_connector.template.template.requests.get")
     @patch("simple_vm_client.forc_connector.template.template.logger.info")
-    def test_get_forc_template_version(self, mock_logger_info, mock_requests_get):
+    def test_get_forc_template_version(self, mock_logger_info):
         # Set up the mock response
         expected_response = Mock()
-        mock_requests_get.return_value = expected_response
         template = self.init_template(
             github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
             forc_backend_url=TestTemplate.FORC_BACKEND_URL,
         )
+        mock_requests_get = template.session.get = MagicMock(
+            return_value=expected_response
+        )
 
         # Call the method to be tested
         result_response = template._get_forc_template_version(
@@ -380,7 +412,7 @@ class TestTemplate(unittest.TestCase):
 
         mock_requests_get.assert_called_once_with(
             get_url,
-            timeout=(30, 30),
+            timeout=FORC_VERSION_CHECK_TIMEOUT,
             headers={"X-API-KEY": template.FORC_API_KEY},
         )
 
@@ -399,6 +431,15 @@ class TestTemplate(unittest.TestCase):
         expected_forc_allowed = {"mock_name": ["2.0.0", "1.5.0", "1.0.0"]}
         self.assertEqual(template._forc_allowed, expected_forc_allowed)
 
+    @staticmethod
+    def check_forc_versions(template, metadata):
+        return template._check_forc_versions(
+            [
+                (metadata.template_name, forc_version)
+                for forc_version in metadata.forc_versions
+            ]
+        )
+
     @patch(
         "simple_vm_client.forc_connector.template.template.Template._get_forc_template_version"
     )
@@ -412,7 +453,9 @@ class TestTemplate(unittest.TestCase):
 
         # Call the method to be tested
         metadata_example = self.get_metadata_example()
-        template._update_forc_allowed(metadata_example)
+        template._update_forc_allowed(
+            metadata_example, self.check_forc_versions(template, metadata_example)
+        )
         versions = template._forc_allowed[metadata_example.template_name]
         versions.sort(key=LooseVersion, reverse=True)
 
@@ -436,30 +479,37 @@ class TestTemplate(unittest.TestCase):
         )
         metadata_example = self.get_metadata_example()
         metadata_example.needs_forc_support = False
-        template._update_forc_allowed(metadata_example)
+        template._update_forc_allowed(
+            metadata_example,
+            {(metadata_example.template_name, metadata_example.forc_versions[0])},
+        )
         mock_get_forc_template_version.assert_not_called()
+        self.assertNotIn(metadata_example.template_name, template._forc_allowed)
 
-    @patch("simple_vm_client.forc_connector.template.template.requests.get")
     @patch("simple_vm_client.forc_connector.template.template.logger.error")
     @patch("simple_vm_client.forc_connector.template.template.logger.info")
     def test_update_forc_allowed_with_exception(
-        self, mock_logger_info, mock_logger_error, mock_requests_get
+        self, mock_logger_info, mock_logger_error
     ):
-        mock_requests_get.side_effect = requests.exceptions.Timeout("Timeout occurred")
-
         template = self.init_template(
             github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
             forc_backend_url=TestTemplate.FORC_BACKEND_URL,
         )
+        mock_requests_get = template.session.get = MagicMock(
+            side_effect=requests.exceptions.Timeout("Timeout occurred")
+        )
         metadata_example = self.get_metadata_example()
 
-        template._update_forc_allowed(metadata_example)
+        template._update_forc_allowed(
+            metadata_example, self.check_forc_versions(template, metadata_example)
+        )
+        self.assertEqual(template._forc_allowed[metadata_example.template_name], [])
         for forc_version in metadata_example.forc_versions:
             get_url = f"{template.TEMPLATES_URL}/{metadata_example.template_name}/{forc_version}"
             mock_logger_info.assert_any_call(f"Get Forc Template Version - {get_url}")
             mock_requests_get.assert_any_call(
                 get_url,
-                timeout=(30, 30),
+                timeout=FORC_VERSION_CHECK_TIMEOUT,
                 headers={"X-API-KEY": template.FORC_API_KEY},
             )
 
@@ -469,6 +519,56 @@ class TestTemplate(unittest.TestCase):
         ] * len(METADATA_EXAMPLE.forc_versions)
         mock_logger_error.assert_has_calls(expected_calls, any_order=True)
 
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._get_forc_template_version"
+    )
+    def test_check_forc_versions_cached(self, mock_get_forc_template_version):
+        template = self.init_template(
+            github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
+            forc_backend_url=TestTemplate.FORC_BACKEND_URL,
+        )
+        available_response = Mock(status_code=200)
+        missing_response = Mock(status_code=404)
+        mock_get_forc_template_version.side_effect = (
+            lambda template_name, forc_version: (
+                available_response if forc_version == "1.0.0" else missing_response
+            )
+        )
+        checks = [("vscode", "1.0.0"), ("vscode", "2.0.0"), ("vscode", "1.0.0")]
+
+        self.assertEqual(template._check_forc_versions(checks), {("vscode", "1.0.0")})
+        self.assertEqual(template._check_forc_versions(checks), {("vscode", "1.0.0")})
+        self.assertEqual(mock_get_forc_template_version.call_count, 2)
+
+        # unavailable versions are checked again once their short ttl expired
+        template._forc_version_cache[("vscode", "2.0.0")] = (
+            False,
+            time.monotonic() - FORC_VERSION_UNAVAILABLE_TTL,
+        )
+        template._check_forc_versions(checks)
+        self.assertEqual(mock_get_forc_template_version.call_count, 3)
+
+    @patch(
+        "simple_vm_client.forc_connector.template.template.FORC_VERSION_CHECK_DEADLINE",
+        0.1,
+    )
+    @patch("simple_vm_client.forc_connector.template.template.logger.warning")
+    def test_check_forc_versions_deadline(self, mock_logger_warning):
+        template = self.init_template(
+            github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
+            forc_backend_url=TestTemplate.FORC_BACKEND_URL,
+        )
+        release = threading.Event()
+        template._is_forc_version_available = MagicMock(
+            side_effect=lambda name, version: release.wait(5)
+        )
+
+        available = template._check_forc_versions([("vscode", "1.0.0")])
+        release.set()
+
+        self.assertEqual(available, set())
+        mock_logger_warning.assert_called_once()
+
     @patch("builtins.open", new_callable=mock_open, read_data="key: value\n")
     @patch("simple_vm_client.forc_connector.template.template.yaml.load")
     def test_load_yaml(self, mock_yaml_load, mock_open):
@@ -599,7 +699,7 @@ class TestTemplate(unittest.TestCase):
             added_template.template_name, mock_template_metadata.template_name
         )
 
-    @patch("simple_vm_client.forc_connector.template.template.requests.get")
+    @patch("simple_vm_client.forc_connector.template.template.HttpClient.get")
     def test_get_forc_templates(self, mock_requests_get):
         # Arrange
         template = self.init_template(
@@ -625,7 +725,7 @@ class TestTemplate(unittest.TestCase):
             result, expected_response
         )  # Check if the result matches the expected response
 
-    @patch("simple_vm_client.forc_connector.template.template.requests.get")
+    @patch("simple_vm_client.forc_connector.template.template.HttpClient.get")
     @patch("simple_vm_client.forc_connector.template.template.logger.exception")
     def test_get_forc_templates_exception(
         self, mock_logger_exception, mock_requests_get
@@ -702,6 +802,111 @@ class TestTemplate(unittest.TestCase):
             "Could not get templates from FORC."
         )
 
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._get_forc_templates"
+    )
+    def test_cross_check_forc_image_cached(self, mock_get_forc_templates):
+        template = self.init_template(
+            github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
+            forc_backend_url=TestTemplate.FORC_BACKEND_URL,
+        )
+        mock_get_forc_templates.return_value = [
+            {"name": "template1", "version": "version1"},
+            {"name": "template1", "version": "version2"},
+        ]
+        template._forc_allowed = {"template1": ["version2"]}
+        template._all_templates = ["template1"]
+
+        self.assertTrue(template.cross_check_forc_image(["template1"]))
+        self.assertFalse(template.cross_check_forc_image(["template2"]))
+
+        mock_get_forc_templates.assert_called_once()
+        self.assertEqual(
+            template.get_forc_templates_index(),
+            {"template1": {"version1", "version2"}},
+        )
+
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._get_forc_templates"
+    )
+    def test_get_forc_templates_index_stale_while_revalidate(
+        self, mock_get_forc_templates
+    ):
+        template = self.init_template(
+            github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
+            forc_backend_url=TestTemplate.FORC_BACKEND_URL,
+        )
+        template._forc_templates_index = {"template1": {"version1"}}
+        template._forc_templates_fetched_at = (
+            time.monotonic() - FORC_TEMPLATES_CACHE_TTL - 1
+        )
+        refreshed = threading.Event()
+        mock_get_forc_templates.side_effect = lambda: refreshed.wait(5) and [
+            {"name": "template1", "version": "version2"}
+        ]
+
+        # the stale catalog is served while the refresh is running
+        self.assertEqual(
+            template.get_forc_templates_index(), {"template1": {"version1"}}
+        )
+        self.assertEqual(
+            template.get_forc_templates_index(), {"template1": {"version1"}}
+        )
+        refreshed.set()
+        for thread in threading.enumerate():
+            if thread.name == "forc-templates-refresh":
+                thread.join(5)
+
+        mock_get_forc_templates.assert_called_once()
+        self.assertEqual(
+            template.get_forc_templates_index(), {"template1": {"version2"}}
+        )
+
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._get_forc_templates",
+        return_value=[],
+    )
+    def test_get_forc_templates_index_keeps_catalog_on_error(
+        self, mock_get_forc_templates
+    ):
+        template = self.init_template(
+            github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
+            forc_backend_url=TestTemplate.FORC_BACKEND_URL,
+        )
+        template._forc_templates_index = {"template1": {"version1"}}
+
+        template._refresh_forc_templates_index()
+
+        self.assertEqual(template._forc_templates_index, {"template1": {"version1"}})
+        self.assertFalse(template._forc_templates_refreshing)
+        self.assertEqual(template._forc_templates_ttl, FORC_TEMPLATES_UNAVAILABLE_TTL)
+
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._get_forc_templates"
+    )
+    def test_get_forc_templates_index_failed_first_fetch(self, mock_get_forc_templates):
+        template = self.init_template(
+            github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
+            forc_backend_url=TestTemplate.FORC_BACKEND_URL,
+        )
+        mock_get_forc_templates.return_value = []
+
+        self.assertEqual(template.get_forc_templates_index(), {})
+        # the failure is only cached briefly
+        self.assertEqual(template.get_forc_templates_index(), {})
+        mock_get_forc_templates.assert_called_once()
+
+        template._forc_templates_fetched_at -= FORC_TEMPLATES_UNAVAILABLE_TTL + 1
+        mock_get_forc_templates.return_value = [
+            {"name": "template1", "version": "version1"}
+        ]
+        # without a catalog the next fetch is not deferred to the background
+        self.assertEqual(
+            template.get_forc_templates_index(), {"template1": {"version1"}}
+        )
+        self.assertEqual(mock_get_forc_templates.call_count, 2)
+        self.assertEqual(template._forc_templates_ttl, FORC_TEMPLATES_CACHE_TTL)
+
     @patch(
         "simple_vm_client.forc_connector.template.template.Template._update_forc_allowed"
     )
@@ -714,10 +919,10 @@ class TestTemplate(unittest.TestCase):
         metadata = self.get_metadata_example()
 
         # Act
-        template._process_template_metadata(metadata)
+        template._process_template_metadata(metadata, set())
 
         # Assert
-        mock_update_forc_allowed.assert_called_once_with(metadata)
+        mock_update_forc_allowed.assert_called_once_with(metadata, set())
         self.assertEqual(
             template._loaded_resenv_metadata[metadata.template_name], metadata
         )
@@ -740,10 +945,10 @@ class TestTemplate(unittest.TestCase):
             existing_metadata
         )
         # Act
-        template._process_template_metadata(new_metadata)
+        template._process_template_metadata(new_metadata, set())
 
         # Assert
-        mock_update_forc_allowed.assert_called_once_with(new_metadata)
+        mock_update_forc_allowed.assert_called_once_with(new_metadata, set())
         self.assertEqual(
             template._loaded_resenv_metadata[existing_metadata.template_name],
             new_metadata,
@@ -755,10 +960,14 @@ class TestTemplate(unittest.TestCase):
     @patch(
         "simple_vm_client.forc_connector.template.template.Template._process_template_metadata"
     )
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._check_forc_versions"
+    )
     @patch("simple_vm_client.forc_connector.template.template.logger.exception")
     def test_load_and_update_resenv_metadata(
         self,
         mock_logger_exception,
+        mock_check_forc_versions,
         mock_process_template_metadata,
         mock_load_resenv_metadata,
     ):
@@ -781,18 +990,25 @@ class TestTemplate(unittest.TestCase):
 
         # Assert
         mock_load_resenv_metadata.assert_called_once()  # Check if _load_resenv_metadata was called
+        # one check for the versions of all templates
+        mock_check_forc_versions.assert_called_once()
+        available = mock_check_forc_versions.return_value
         mock_process_template_metadata.assert_has_calls(
-            [unittest.mock.call(mock_metadata1), unittest.mock.call(mock_metadata2)]
+            [
+                unittest.mock.call(mock_metadata1, available),
+                unittest.mock.call(mock_metadata2, available),
+            ]
         )  # Check if _process_template_metadata was called for each metadata instance
         mock_logger_exception.assert_called_once_with(
             f"Failed to parse Metadata yml: {mock_metadata2}\n{mock_exception}"
         )  # Check if logger.exception was called for the exception case
 
     @patch(
-        "simple_vm_client.forc_connector.template.template.Template._download_and_extract_playbooks"
+        "simple_vm_client.forc_connector.template.template.Template._download_and_extract_playbooks",
+        return_value=("/plays/resenvs_versions/version", '"etag"'),
     )
     @patch(
-        "simple_vm_client.forc_connector.template.template.Template._copy_resenvs_templates"
+        "simple_vm_client.forc_connector.template.template.Template._activate_resenvs_version"
     )
     @patch(
         "simple_vm_client.forc_connector.template.template.Template._update_loaded_templates"
@@ -803,16 +1019,25 @@ class TestTemplate(unittest.TestCase):
     @patch(
         "simple_vm_client.forc_connector.template.template.Template._load_and_update_resenv_metadata"
     )
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._prune_playbook_workspaces"
+    )
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._build_playbook_workspace",
+        return_value="/plays/workspaces/version/",
+    )
     @patch("simple_vm_client.forc_connector.template.template.logger.error")
     @patch("simple_vm_client.forc_connector.template.template.logger.info")
     def test_update_playbooks(
         self,
         mock_logger_info,
         mock_logger_error,
+        mock_build_playbook_workspace,
+        mock_prune_playbook_workspaces,
         mock_load_and_update_resenv_metadata,
         mock_install_ansible_galaxy_requirements,
         mock_update_loaded_templates,
-        mock_copy_resenvs_templates,
+        mock_activate_resenvs_version,
         mock_download_and_extract_playbooks,
     ):
         # Arrange
@@ -821,19 +1046,150 @@ class TestTemplate(unittest.TestCase):
             forc_backend_url=TestTemplate.FORC_BACKEND_URL,
         )
 
+        locked_during = {}
+
+        def on_activated():
+            locked_during["on_activated"] = template.is_update_locked()
+            # deferred deploys run before the metadata refresh
+            mock_load_and_update_resenv_metadata.assert_not_called()
+
+        def build_playbook_workspace(resenvs_dir):
+            locked_during["build"] = template.is_update_locked()
+            return "/plays/workspaces/version/"
+
+        mock_build_playbook_workspace.side_effect = build_playbook_workspace
+        mock_activate_resenvs_version.side_effect = lambda version_dir: (
+            locked_during.update(activate=template.is_update_locked())
+        )
+
         # Act
-        template.update_playbooks()
+        with patch.object(Template, "workspace_dir", ""):
+            template.update_playbooks(on_activated=on_activated)
+            self.assertEqual(Template.workspace_dir, "/plays/workspaces/version/")
 
         # Assert
+        self.assertEqual(
+            locked_during, {"build": False, "activate": True, "on_activated": False}
+        )
+        mock_prune_playbook_workspaces.assert_called_once()
         mock_logger_error.assert_not_called()  # Check if logger.error was not called when GITHUB_PLAYBOOKS_REPO is not None
         mock_download_and_extract_playbooks.assert_called_once()  # Check if _download_and_extract_playbooks was called
-        mock_copy_resenvs_templates.assert_called_once()  # Check if _copy_resenvs_templates was called
+        mock_install_ansible_galaxy_requirements.assert_called_once_with(
+            resenvs_dir="/plays/resenvs_versions/version"
+        )  # Check if _install_ansible_galaxy_requirements was called
+        mock_activate_resenvs_version.assert_called_once_with(
+            "/plays/resenvs_versions/version"
+        )
         mock_update_loaded_templates.assert_called_once()  # Check if _update_loaded_templates was called
-        mock_install_ansible_galaxy_requirements.assert_called_once()  # Check if _install_ansible_galaxy_requirements was called
         mock_load_and_update_resenv_metadata.assert_called_once()  # Check if _load_and_update_resenv_metadata was called
+        mock_build_playbook_workspace.assert_called_once_with(
+            resenvs_dir="/plays/resenvs_versions/version"
+        )
         mock_logger_info.assert_any_call(
             f"Loaded Template Names: {template._all_templates}"
         )  # Check if logger.info was called
+        self.assertEqual(template._playbooks_etag, '"etag"')
+        self.assertFalse(template.is_update_locked())
+
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._download_and_extract_playbooks",
+        return_value=("", '"etag"'),
+    )
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._activate_resenvs_version"
+    )
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._load_and_update_resenv_metadata"
+    )
+    @patch(
+        "simple_vm_client.forc_connector.template.template.Template._build_playbook_workspace"
+    )
+    def test_update_playbooks_unchanged(
+        self,
+        mock_build_playbook_workspace,
+        mock_load_and_update_resenv_metadata,
+        mock_activate_resenvs_version,
+        mock_download_and_extract_playbooks,
+    ):
+        template = self.init_template(
+            github_playbook_repo=TestTemplate.GITHUB_REPO_STAGING,
+            forc_backend_url=TestTemplate.FORC_BACKEND_URL,
+        )
+
+        template.update_playbooks()
+
+        mock_activate_resenvs_version.assert_not_called()
+        mock_build_playbook_workspace.assert_not_called()
+        mock_load_and_update_resenv_metadata.assert_called_once()
+
+    def test_prune_playbook_fact_cache(self):
+        with TemporaryDirectory() as fact_cache_dir:
+            expired = os.path.join(fact_cache_dir, "expired_vm")
+            current = os.path.join(fact_cache_dir, "current_vm")
+            for path in [expired, current]:
+                with open(path, "w") as f:
+                    f.write("{}")
+            os.utime(expired, (0, 0))
+            with patch.object(
+                Template, "get_playbook_fact_cache_dir", return_value=fact_cache_dir
+            ):
+                Template.prune_playbook_fact_cache(max_age=3600)
+
+            self.assertFalse(os.path.exists(expired))
+            self.assertTrue(os.path.exists(current))
+
+    def test_build_playbook_workspace(self):
+        with TemporaryDirectory() as plays_dir:
+            resenvs_dir = os.path.join(plays_dir, "resenvs")
+            os.makedirs(os.path.join(resenvs_dir, "vscode"))
+            with open(os.path.join(plays_dir, "generic_playbook.yml"), "w") as f:
+                f.write("- hosts: all")
+            with open(os.path.join(resenvs_dir, "vscode", "vscode.yml"), "w") as f:
+                f.write("- hosts: all")
+            with patch.object(
+                Template, "get_playbook_dir", return_value=plays_dir
+            ), patch.object(
+                Template, "get_playbook_resenvs_dir", return_value=resenvs_dir
+            ), patch.object(
+                Template, "workspace_dir", ""
+            ):
+                workspaces = [Template.build_playbook_workspace() for _ in range(3)]
+
+                self.assertEqual(Template.workspace_dir, workspaces[-1])
+                self.assertEqual(Template.get_playbook_workspace_dir(), workspaces[-1])
+                self.assertTrue(
+                    os.path.isfile(os.path.join(workspaces[-1], "generic_playbook.yml"))
+                )
+                self.assertTrue(
+                    os.path.isfile(os.path.join(workspaces[-1], "vscode", "vscode.yml"))
+                )
+                self.assertFalse(os.path.exists(workspaces[0]))
+                self.assertTrue(os.path.isdir(workspaces[1]))
+
+    def test_prune_keeps_workspaces_in_use(self):
+        with TemporaryDirectory() as plays_dir:
+            resenvs_dir = os.path.join(plays_dir, "resenvs")
+            os.makedirs(resenvs_dir)
+            with patch.object(
+                Template, "get_playbook_dir", return_value=plays_dir
+            ), patch.object(
+                Template, "get_playbook_resenvs_dir", return_value=resenvs_dir
+            ), patch.object(
+                Template, "workspace_dir", ""
+            ), patch.object(
+                Template, "workspace_refs", {}
+            ):
+                Template.build_playbook_workspace()
+                in_use = Template.acquire_playbook_workspace()
+                workspaces = [Template.build_playbook_workspace() for _ in range(3)]
+
+                self.assertTrue(os.path.isdir(in_use))
+                self.assertFalse(os.path.exists(workspaces[0]))
+
+                Template.release_playbook_workspace(in_use)
+                self.assertEqual(Template.workspace_refs, {})
+                Template.build_playbook_workspace()
+                self.assertFalse(os.path.exists(in_use))
 
     @patch(
         "simple_vm_client.forc_connector.template.template.Template.update_playbooks"
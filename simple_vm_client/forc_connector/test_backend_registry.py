@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch
+
+from simple_vm_client.forc_connector.backend_registry import BackendRegistry
+from simple_vm_client.ttypes import Backend
+
+BACKENDS = [
+    Backend(id=1, owner="owner1", template="vscode", template_version="v1"),
+    Backend(id=2, owner="owner2", template="vscode", template_version="v1"),
+    Backend(id=3, owner="owner1", template="rstudio", template_version="v2"),
+]
+
+
+class TestBackendRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = BackendRegistry(ttl=30)
+
+    def test_indexes(self):
+        self.assertFalse(self.registry.is_fresh())
+        self.registry.update(BACKENDS)
+
+        self.assertTrue(self.registry.is_fresh())
+        self.assertEqual(self.registry.get_all(), BACKENDS)
+        self.assertEqual(self.registry.get_by_id("3"), BACKENDS[2])
+        self.assertEqual(self.registry.get_by_id(2), BACKENDS[1])
+        self.assertIsNone(self.registry.get_by_id("4"))
+        self.assertEqual(
+            self.registry.get_by_owner("owner1"), [BACKENDS[0], BACKENDS[2]]
+        )
+        self.assertEqual(self.registry.get_by_template("vscode"), BACKENDS[:2])
+        self.assertEqual(self.registry.get_by_template("jupyter"), [])
+
+    @patch("simple_vm_client.forc_connector.backend_registry.time.monotonic")
+    def test_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.registry.update(BACKENDS)
+        mock_monotonic.return_value = 129
+        self.assertTrue(self.registry.is_fresh())
+        mock_monotonic.return_value = 131
+        self.assertFalse(self.registry.is_fresh())
+
+    def test_invalidate_drops_outdated_update(self):
+        self.registry.update(BACKENDS)
+        generation = self.registry.generation
+        self.registry.invalidate()
+        self.assertFalse(self.registry.is_fresh())
+
+        # fetched before the invalidation
+        self.registry.update(BACKENDS[:1], generation=generation)
+        self.assertFalse(self.registry.is_fresh())
+        self.assertEqual(self.registry.get_all(), BACKENDS)
+
+        self.registry.update(BACKENDS[:1], generation=self.registry.generation)
+        self.assertTrue(self.registry.is_fresh())
+        self.assertEqual(self.registry.get_all(), BACKENDS[:1])
+
+
+if __name__ == "__main__":
+    unittest.main()
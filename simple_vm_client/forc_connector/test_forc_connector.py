@@ -63,13 +63,14 @@ class TestForcConnector(unittest.TestCase):
     def test_init(self, mock_template, mock_redis, mock_connection_pool):
         with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
             temp_file.write(CONFIG_DATA)
-        ForcConnector(temp_file.name)
+        forc_connector = ForcConnector(temp_file.name)
         os.remove(temp_file.name)
 
         mock_template.assert_called_with(
             github_playbook_repo=GITHUB_REPO,
             forc_backend_url=FORC_BACKEND_URL,
             forc_api_key=FORC_API_KEY,
+            http_client=forc_connector.http_client,
         )
         mock_connection_pool.assert_called_with(host=REDIS_HOST, port=REDIS_PORT)
         mock_redis.assert_called_with(connection_pool=mock_connection_pool.return_value)
@@ -107,7 +108,7 @@ class TestForcConnector(unittest.TestCase):
         self.forc_connector.connect_to_redis()
         mock_logger_error.assert_any_call("Could not connect to redis!")
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_users_from_backend(self, mock_get):
         backend_id = "backend_id"
         get_url = f"{self.forc_connector.FORC_BACKEND_URL}users/{backend_id}"
@@ -122,7 +123,7 @@ class TestForcConnector(unittest.TestCase):
         )
         self.assertEqual(result, ["data"])
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_users_from_backend_401(self, mock_get):
         backend_id = "backend_id"
         get_url = f"{self.forc_connector.FORC_BACKEND_URL}users/{backend_id}"
@@ -136,7 +137,7 @@ class TestForcConnector(unittest.TestCase):
         )
         self.assertEqual(result, ["Error: 401"])
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_users_from_backend_timeout(self, mock_get):
         backend_id = "backend_id"
         get_url = f"{self.forc_connector.FORC_BACKEND_URL}users/{backend_id}"
@@ -150,7 +151,7 @@ class TestForcConnector(unittest.TestCase):
         )
         self.assertEqual(result, [])
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.delete")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.delete")
     def test_delete_user_from_backend(self, mock_delete):
         backend_id = "backend_id"
         user_id = "user_id"
@@ -172,7 +173,7 @@ class TestForcConnector(unittest.TestCase):
 
         self.assertEqual(result, {"data": "success"})
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.delete")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.delete")
     def test_delete_user_from_backend_timeout(self, mock_delete):
         backend_id = "backend_id"
         user_id = "user_id"
@@ -192,7 +193,7 @@ class TestForcConnector(unittest.TestCase):
 
         self.assertEqual(result, {"Error": "Timeout."})
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.delete")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.delete")
     def test_delete_user_from_backend_exception(self, mock_delete):
         backend_id = "backend_id"
         user_id = "user_id"
@@ -211,7 +212,7 @@ class TestForcConnector(unittest.TestCase):
             headers={"X-API-KEY": self.forc_connector.FORC_API_KEY},
         )
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.delete")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.delete")
     @patch("simple_vm_client.forc_connector.forc_connector.json")
     def test_delete_backend_not_found_json(self, mock_json, mock_delete):
         backend_id = "backend_id"
@@ -223,7 +224,7 @@ class TestForcConnector(unittest.TestCase):
         with self.assertRaises(BackendNotFoundException):
             self.forc_connector.delete_backend(backend_id)
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.delete")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.delete")
     def test_delete_backend(self, mock_delete):
         backend_id = "backend_id"
         delete_url = f"{self.forc_connector.FORC_BACKEND_URL}backends/{backend_id}"
@@ -240,7 +241,7 @@ class TestForcConnector(unittest.TestCase):
             headers={"X-API-KEY": self.forc_connector.FORC_API_KEY},
         )
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.delete")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.delete")
     def test_delete_backend_not_found(self, mock_delete):
         backend_id = "backend_id"
         delete_url = f"{self.forc_connector.FORC_BACKEND_URL}backends/{backend_id}"
@@ -258,7 +259,7 @@ class TestForcConnector(unittest.TestCase):
             headers={"X-API-KEY": self.forc_connector.FORC_API_KEY},
         )
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.delete")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.delete")
     def test_delete_backend_server_error(self, mock_delete):
         backend_id = "backend_id"
         delete_url = f"{self.forc_connector.FORC_BACKEND_URL}backends/{backend_id}"
@@ -278,7 +279,7 @@ class TestForcConnector(unittest.TestCase):
             headers={"X-API-KEY": self.forc_connector.FORC_API_KEY},
         )
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.delete")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.delete")
     def test_delete_backend_timeout(self, mock_delete):
         backend_id = "backend_id"
         delete_url = f"{self.forc_connector.FORC_BACKEND_URL}backends/{backend_id}"
@@ -296,7 +297,7 @@ class TestForcConnector(unittest.TestCase):
             headers={"X-API-KEY": self.forc_connector.FORC_API_KEY},
         )
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.post")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.post")
     def test_add_user_to_backend_backend_not_found(self, mock_post):
         mock_response = MagicMock()
 
@@ -305,7 +306,7 @@ class TestForcConnector(unittest.TestCase):
         with self.assertRaises(BackendNotFoundException):
             self.forc_connector.add_user_to_backend(backend_id="test", user_id="test")
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.post")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.post")
     def test_add_user_to_backend(self, mock_post):
         # Create an instance of your class
         # Mock the response from requests.post
@@ -327,7 +328,7 @@ class TestForcConnector(unittest.TestCase):
         )
         self.assertEqual(result, {"key": "value"})
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.post")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.post")
     def test_add_user_to_backend_timeout(self, mock_post):
         mock_post.side_effect = requests.Timeout("Unit Test")
 
@@ -343,7 +344,7 @@ class TestForcConnector(unittest.TestCase):
         )
         self.assertEqual(result, {"Error": "Timeout."})
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.post")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.post")
     def test_add_user_to_backend_exception(self, mock_post):
         mock_post.side_effect = Exception("Unit Test")
 
@@ -359,6 +360,51 @@ class TestForcConnector(unittest.TestCase):
             headers={"X-API-KEY": self.forc_connector.FORC_API_KEY},
         )
 
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.post")
+    def test_add_users_to_backend(self, mock_post):
+        backend_id = "backend_id"
+        mock_post.side_effect = lambda url, json, **kwargs: MagicMock(
+            json=MagicMock(return_value={"user": json["user"]})
+        )
+
+        result = self.forc_connector.add_users_to_backend(
+            backend_id=backend_id, user_ids=["user1", "user2", "user1"]
+        )
+
+        self.assertEqual(
+            result, {"user1": {"user": "user1"}, "user2": {"user": "user2"}}
+        )
+        self.assertEqual(mock_post.call_count, 2)
+        mock_post.assert_any_call(
+            f"{self.forc_connector.FORC_BACKEND_URL}users/{backend_id}",
+            json={"user": "user2"},
+            timeout=(30, 30),
+            headers={"X-API-KEY": self.forc_connector.FORC_API_KEY},
+        )
+
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.delete")
+    def test_delete_users_from_backend(self, mock_delete):
+        def delete(url, json, **kwargs):
+            if json["user"] == "user2":
+                raise Exception("not found")
+            return MagicMock(json=MagicMock(return_value={"user": json["user"]}))
+
+        mock_delete.side_effect = delete
+
+        result = self.forc_connector.delete_users_from_backend(
+            backend_id="backend_id", user_ids=["user1", "user2"]
+        )
+
+        self.assertEqual(
+            result, {"user1": {"user": "user1"}, "user2": {"Error": "not found"}}
+        )
+        self.assertEqual(
+            self.forc_connector.delete_users_from_backend(
+                backend_id="backend_id", user_ids=[]
+            ),
+            {},
+        )
+
     def test_has_forc(self):
         result = self.forc_connector.has_forc()
         self.assertEqual(result, self.forc_connector.FORC_BACKEND_URL is not None)
@@ -457,7 +503,101 @@ class TestForcConnector(unittest.TestCase):
         active_play = ForcConnector.active_playbooks[openstack_id]
         self.assertEqual(active_play, playbook_mock)
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.post")
+    @patch("simple_vm_client.forc_connector.forc_connector.Playbook")
+    def test_create_and_deploy_playbook_template_locked(self, mock_playbook):
+        openstack_id = "openstack_id"
+        self.forc_connector.template.is_update_locked.return_value = True
+
+        res = self.forc_connector.create_and_deploy_playbook(
+            public_key="key",
+            research_environment_template="vscode",
+            create_only_backend=False,
+            conda_packages=[],
+            apt_packages=[],
+            openstack_id=openstack_id,
+            port=80,
+            ip="192.168.0.1",
+            cloud_site="Bielefeld",
+            base_url="base_url",
+        )
+
+        self.assertEqual(res, 0)
+        mock_playbook.assert_not_called()
+        self.forc_connector.redis_connection.hset.assert_called_once_with(
+            openstack_id, "status", VmTaskStates.PREPARE_PLAYBOOK_BUILD.value
+        )
+        self.assertEqual(
+            self.forc_connector.pending_playbooks[openstack_id]["port"], 80
+        )
+
+    @patch("simple_vm_client.forc_connector.forc_connector.Playbook")
+    def test_dispatch_pending_playbooks(self, mock_playbook):
+        openstack_id = "openstack_id"
+        playbook_mock = MagicMock()
+        mock_playbook.return_value = playbook_mock
+        self.forc_connector.redis_connection.hget.return_value = b"key"
+        self.forc_connector.pending_playbooks[openstack_id] = dict(
+            public_key="key",
+            research_environment_template="vscode",
+            create_only_backend=False,
+            conda_packages=[],
+            apt_packages=[],
+            port=80,
+            ip="192.168.0.1",
+            cloud_site="Bielefeld",
+        )
+
+        self.forc_connector.dispatch_pending_playbooks()
+
+        self.assertEqual(self.forc_connector.pending_playbooks, {})
+        playbook_mock.run_it.assert_called_once()
+        self.forc_connector.redis_connection.hset.assert_called_once_with(
+            openstack_id, "status", VmTaskStates.BUILD_PLAYBOOK.value
+        )
+        self.assertEqual(ForcConnector.active_playbooks[openstack_id], playbook_mock)
+
+    @patch(
+        "simple_vm_client.forc_connector.forc_connector.Playbook",
+        side_effect=IOError("Workspace missing"),
+    )
+    def test_dispatch_pending_playbooks_error(self, mock_playbook):
+        openstack_id = "openstack_id"
+        self.forc_connector.redis_connection.hget.return_value = b"key"
+        self.forc_connector.pending_playbooks[openstack_id] = dict(
+            public_key="key",
+            research_environment_template="vscode",
+            create_only_backend=False,
+            conda_packages=[],
+            apt_packages=[],
+            port=80,
+            ip="192.168.0.1",
+            cloud_site="Bielefeld",
+        )
+
+        self.forc_connector.dispatch_pending_playbooks()
+
+        self.forc_connector.redis_connection.hset.assert_called_once_with(
+            openstack_id, "status", VmTaskStates.PLAYBOOK_FAILED.value
+        )
+
+    @patch(
+        "simple_vm_client.forc_connector.forc_connector.Template.prune_playbook_fact_cache"
+    )
+    def test_update_templates_dispatches_pending_playbooks(
+        self, mock_prune_playbook_fact_cache
+    ):
+        self.forc_connector.is_any_playbook_active = MagicMock(return_value=False)
+        self.forc_connector.dispatch_pending_playbooks = MagicMock()
+
+        self.forc_connector.update_templates()
+
+        self.forc_connector.template.update_playbooks.assert_called_once_with(
+            on_activated=self.forc_connector.dispatch_pending_playbooks
+        )
+        self.forc_connector.dispatch_pending_playbooks.assert_called_once()
+        mock_prune_playbook_fact_cache.assert_called_once()
+
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.post")
     @patch("simple_vm_client.forc_connector.forc_connector.Backend")
     def test_create_backend(self, mock_backend, mock_post):
         # Arrange
@@ -512,7 +652,7 @@ class TestForcConnector(unittest.TestCase):
         self.assertEqual(result, mock_backend.return_value)
 
     @patch(
-        "simple_vm_client.forc_connector.forc_connector.requests.post",
+        "simple_vm_client.forc_connector.forc_connector.HttpClient.post",
         side_effect=requests.Timeout,
     )
     def test_create_backend_timeout(self, mock_post):
@@ -531,7 +671,7 @@ class TestForcConnector(unittest.TestCase):
         mock_post.assert_called_once()
 
     @patch(
-        "simple_vm_client.forc_connector.forc_connector.requests.post",
+        "simple_vm_client.forc_connector.forc_connector.HttpClient.post",
         side_effect=Exception("Test error"),
     )
     def test_create_backend_exception(self, mock_post):
@@ -549,7 +689,7 @@ class TestForcConnector(unittest.TestCase):
 
         mock_post.assert_called_once()
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.post")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.post")
     @patch("simple_vm_client.forc_connector.forc_connector.Backend")
     def test_activate_auth_for_backend(self, mock_backend, mock_post):
         # Arrange
@@ -589,7 +729,7 @@ class TestForcConnector(unittest.TestCase):
         self.assertEqual(result, mock_backend.return_value)
 
     @patch(
-        "simple_vm_client.forc_connector.forc_connector.requests.post",
+        "simple_vm_client.forc_connector.forc_connector.HttpClient.post",
         side_effect=requests.Timeout,
     )
     def test_activate_auth_for_backend_timeout(self, mock_post):
@@ -603,7 +743,7 @@ class TestForcConnector(unittest.TestCase):
         mock_post.assert_called_once()
 
     @patch(
-        "simple_vm_client.forc_connector.forc_connector.requests.post",
+        "simple_vm_client.forc_connector.forc_connector.HttpClient.post",
         side_effect=Exception("Test error"),
     )
     def test_activate_auth_for_backend_exception(self, mock_post):
@@ -616,7 +756,7 @@ class TestForcConnector(unittest.TestCase):
 
         mock_post.assert_called_once()
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.post")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.post")
     @patch("simple_vm_client.forc_connector.forc_connector.Backend")
     def test_deactivate_auth_for_backend(self, mock_backend, mock_post):
         # Arrange
@@ -656,7 +796,7 @@ class TestForcConnector(unittest.TestCase):
         self.assertEqual(result, mock_backend.return_value)
 
     @patch(
-        "simple_vm_client.forc_connector.forc_connector.requests.post",
+        "simple_vm_client.forc_connector.forc_connector.HttpClient.post",
         side_effect=requests.Timeout,
     )
     def test_deactivate_auth_for_backend_timeout(self, mock_post):
@@ -670,7 +810,7 @@ class TestForcConnector(unittest.TestCase):
         mock_post.assert_called_once()
 
     @patch(
-        "simple_vm_client.forc_connector.forc_connector.requests.post",
+        "simple_vm_client.forc_connector.forc_connector.HttpClient.post",
         side_effect=Exception("Test error"),
     )
     def test_deactivate_auth_for_backend_exception(self, mock_post):
@@ -683,7 +823,20 @@ class TestForcConnector(unittest.TestCase):
 
         mock_post.assert_called_once()
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch.object(ForcConnector, "get_backends")
+    def test_warmup(self, mock_get_backends):
+        self.forc_connector.warmup()
+        mock_get_backends.assert_called_once_with()
+
+    @patch.object(ForcConnector, "get_backends")
+    def test_warmup_forc_unavailable(self, mock_get_backends):
+        mock_get_backends.side_effect = DefaultException(message="unavailable")
+        self.forc_connector.warmup()
+        self.forc_connector.forc_activated = False
+        self.forc_connector.warmup()
+        mock_get_backends.assert_called_once_with()
+
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_backends(self, mock_get):
         # Arrange
 
@@ -737,8 +890,52 @@ class TestForcConnector(unittest.TestCase):
 
         self.assertEqual(result, expected_backends)
 
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
+    def test_get_backends_cached(self, mock_get):
+        mock_response = MagicMock(status_code=200)
+        mock_response.json.return_value = [
+            {
+                "id": 1,
+                "owner": "test_owner",
+                "location_url": "test_location_url",
+                "template": "test_template",
+                "template_version": "test_version",
+            },
+            {
+                "id": 2,
+                "owner": "another_owner",
+                "location_url": "another_location_url",
+                "template": "test_template",
+                "template_version": "another_version",
+            },
+        ]
+        mock_get.return_value = mock_response
+
+        backends = self.forc_connector.get_backends()
+        self.assertEqual(self.forc_connector.get_backends(), backends)
+        self.assertEqual(
+            self.forc_connector.get_backends_by_owner("another_owner"), [backends[1]]
+        )
+        self.assertEqual(
+            self.forc_connector.get_backends_by_template("test_template"), backends
+        )
+        self.assertEqual(self.forc_connector.get_backend_by_id("1"), backends[0])
+        mock_get.assert_called_once()
+
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.post")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
+    def test_get_backends_invalidated(self, mock_get, mock_post):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = []
+        self.forc_connector.get_backends()
+
+        self.forc_connector.activate_auth_for_backend(backend_id="1")
+        self.forc_connector.get_backends()
+
+        self.assertEqual(mock_get.call_count, 2)
+
     @patch(
-        "simple_vm_client.forc_connector.forc_connector.requests.get",
+        "simple_vm_client.forc_connector.forc_connector.HttpClient.get",
         side_effect=requests.Timeout,
     )
     def test_get_backends_timeout(self, mock_get):
@@ -787,21 +984,21 @@ class TestForcConnector(unittest.TestCase):
                 upstream_url="de",
             )
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_backend_sexc(self, mock_get):
         mock_response = MagicMock(status_code=401)
         mock_get.return_value = mock_response
         with self.assertRaises(DefaultException):
             self.forc_connector.get_backends()
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_backends_by_template_exc(self, mock_get):
         mock_response = MagicMock(status_code=401)
         mock_get.return_value = mock_response
         with self.assertRaises(DefaultException):
             self.forc_connector.get_backends_by_template(template="ds")
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_backends_by_template(self, mock_get):
         # Arrange
         template = "test_template"
@@ -830,7 +1027,7 @@ class TestForcConnector(unittest.TestCase):
 
         # Assert
         mock_get.assert_called_once_with(
-            f"{self.forc_connector.FORC_BACKEND_URL}backends/byTemplate/{template}",
+            f"{self.forc_connector.FORC_BACKEND_URL}backends",
             timeout=(30, 30),
             headers={"X-API-KEY": self.forc_connector.FORC_API_KEY},
         )
@@ -857,7 +1054,7 @@ class TestForcConnector(unittest.TestCase):
         self.assertEqual(result, expected_backends)
 
     @patch(
-        "simple_vm_client.forc_connector.forc_connector.requests.get",
+        "simple_vm_client.forc_connector.forc_connector.HttpClient.get",
         side_effect=requests.Timeout,
     )
     def test_get_backends_by_template_timeout(self, mock_get):
@@ -905,7 +1102,7 @@ class TestForcConnector(unittest.TestCase):
         )
         self.assertEqual(None, None)
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_backend_by_id_exc(self, mock_get):
         backend_id = "your_backend_id"
         mock_response = MagicMock()
@@ -915,7 +1112,7 @@ class TestForcConnector(unittest.TestCase):
         with self.assertRaises(Exception):
             self.forc_connector.get_backend_by_id(backend_id)
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_backend_by_id(self, mock_get):
         backend_id = "your_backend_id"
         mock_response = MagicMock()
@@ -927,6 +1124,8 @@ class TestForcConnector(unittest.TestCase):
             "template_version": "template_version",
         }
         mock_get.return_value = mock_response
+        # not part of the cached backend list
+        self.forc_connector.backend_registry.update([])
 
         result = self.forc_connector.get_backend_by_id(backend_id)
 
@@ -946,7 +1145,7 @@ class TestForcConnector(unittest.TestCase):
 
         self.assertEqual(result, expected_backend)
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_backend_by_id_timeout(self, mock_get):
         backend_id = "your_backend_id"
         mock_get.side_effect = requests.Timeout("Unit Test Timeout")
@@ -956,14 +1155,14 @@ class TestForcConnector(unittest.TestCase):
 
         self.assertIn("Unit Test Timeout", str(context.exception))
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_backends_by_owner_default_exc(self, mock_get):
         mock_response = MagicMock(status_code=401)
         mock_get.return_value = mock_response
         with self.assertRaises(DefaultException):
             self.forc_connector.get_backends_by_owner(owner="user")
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_backends_by_owner(self, mock_get):
         owner = "your_owner"
         mock_response = MagicMock()
@@ -988,7 +1187,7 @@ class TestForcConnector(unittest.TestCase):
         result = self.forc_connector.get_backends_by_owner(owner)
 
         mock_get.assert_called_once_with(
-            f"{self.forc_connector.FORC_BACKEND_URL}backends/byOwner/{owner}",
+            f"{self.forc_connector.FORC_BACKEND_URL}backends",
             timeout=(30, 30),
             headers={"X-API-KEY": self.forc_connector.FORC_API_KEY},
         )
@@ -1012,7 +1211,7 @@ class TestForcConnector(unittest.TestCase):
 
         self.assertEqual(result, expected_backends)
 
-    @patch("simple_vm_client.forc_connector.forc_connector.requests.get")
+    @patch("simple_vm_client.forc_connector.forc_connector.HttpClient.get")
     def test_get_backends_by_owner_timeout(self, mock_get):
         owner = "your_owner"
         mock_get.side_effect = requests.Timeout("Unit Test Timeout")
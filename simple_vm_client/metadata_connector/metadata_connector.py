@@ -1,4 +1,3 @@
-import json
 import os
 from urllib.parse import urljoin
 
@@ -7,7 +6,7 @@ import yaml
 
 from simple_vm_client.ttypes import VirtualMachineServerMetadata
 from simple_vm_client.util.logger import setup_custom_logger
-from simple_vm_client.util.thrift_converter import thrift_to_dict
+from simple_vm_client.util.thrift_converter import thrift_to_json
 
 logger = setup_custom_logger(__name__)
 
@@ -90,8 +89,7 @@ class MetadataConnector:
 
     def _serialize_metadata(self, metadata: VirtualMachineServerMetadata) -> str:
         try:
-            metadata_dict = thrift_to_dict(metadata)
-            return json.dumps(metadata_dict)
+            return thrift_to_json(metadata)
         except Exception as e:
             logger.error(f"Failed to serialize metadata: {e}")
             raise
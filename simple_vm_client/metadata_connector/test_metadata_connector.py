@@ -5,7 +5,12 @@ import pytest
 import requests
 from metadata_connector import MetadataConnector
 
-from simple_vm_client.ttypes import VirtualMachineServerMetadata
+from simple_vm_client.ttypes import (
+    MetadataUser,
+    MetadataUserData,
+    VirtualMachineServerMetadata,
+)
+from simple_vm_client.util.thrift_converter import thrift_to_dict
 
 
 @pytest.fixture
@@ -77,7 +82,12 @@ def test_set_metadata_success(connector_with_env):
     mock_response.raise_for_status.return_value = None
     connector_with_env.session.post.return_value = mock_response
 
-    metadata = VirtualMachineServerMetadata()
+    metadata = VirtualMachineServerMetadata(
+        ip="10.0.0.3",
+        userdata=MetadataUserData(
+            data={"user": MetadataUser(user_id="user", public_keys=["ssh-ed25519 k"])}
+        ),
+    )
     result = connector_with_env.set_metadata("10.0.0.3", metadata)
 
     assert result is True
@@ -85,6 +95,7 @@ def test_set_metadata_success(connector_with_env):
     args, kwargs = connector_with_env.session.post.call_args
     assert "10.0.0.3" in args[0]
     assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert kwargs["data"] == json.dumps(thrift_to_dict(metadata))
 
 
 def test_set_metadata_failure(connector_with_env):
@@ -0,0 +1,124 @@
+"""Background deletion of the temporary keypairs used to start servers.
+
+Deleting a keypair is not needed for the server to start, so it is queued and
+done by a worker thread. The same thread periodically sweeps keypairs created
+by this process which leaked, e.g. because their deletion failed.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Callable, Iterable
+
+from simple_vm_client.util.logger import setup_custom_logger
+
+logger = setup_custom_logger(__name__)
+
+KEYPAIR_SWEEP_INTERVAL = 3600
+
+_STOP = object()
+
+
+class KeypairCleanup:
+    """
+    Deletes queued keypairs and sweeps leaked ones.
+
+    A sweep only deletes keypairs recorded by this process which were already
+    listed by the previous sweep, so keypairs of other clients and of servers
+    which are starting right now are kept.
+    """
+
+    def __init__(
+        self,
+        list_keypair_names: Callable[[], Iterable[str]],
+        delete_keypair: Callable[[str], None],
+        sweep_interval: float = KEYPAIR_SWEEP_INTERVAL,
+    ):
+        self._list_keypair_names = list_keypair_names
+        self._delete_keypair = delete_keypair
+        self.sweep_interval = sweep_interval
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._created: set[str] = set()
+        self._sweep_candidates: set[str] = set()
+        self._missing: set[str] = set()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="keypair-cleanup", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Deletes the queued keypairs and stops the worker."""
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def record(self, key_name: str) -> None:
+        """Marks a keypair as created by this process, only those are swept."""
+        with self._lock:
+            self._created.add(key_name)
+
+    def enqueue(self, key_name: str) -> None:
+        self._queue.put(key_name)
+        self.start()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def delete(self, key_name: str) -> bool:
+        try:
+            self._delete_keypair(key_name)
+        except Exception as e:
+            # left for the sweeper
+            logger.warning(f"Could not delete keypair {key_name}: {e}")
+            return False
+        with self._lock:
+            self._created.discard(key_name)
+        return True
+
+    def sweep(self) -> list[str]:
+        """Deletes recorded keypairs listed by this and the previous sweep."""
+        try:
+            names = set(self._list_keypair_names())
+        except Exception as e:
+            logger.warning(f"Could not list keypairs to sweep: {e}")
+            return []
+        with self._lock:
+            # recorded keypairs missing twice were deleted by someone else
+            missing = self._created - names
+            self._created -= missing & self._missing
+            self._missing = missing
+            names &= self._created
+        leaked = sorted(names & self._sweep_candidates)
+        self._sweep_candidates = names - set(leaked)
+        deleted = [key_name for key_name in leaked if self.delete(key_name)]
+        if leaked:
+            logger.info(f"Swept {len(deleted)} of {len(leaked)} leaked keypairs")
+        return deleted
+
+    def _run(self) -> None:
+        next_sweep = time.monotonic() + self.sweep_interval
+        while True:
+            timeout = (
+                max(0.0, next_sweep - time.monotonic())
+                if self.sweep_interval > 0
+                else None
+            )
+            try:
+                key_name = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self.sweep()
+                next_sweep = time.monotonic() + self.sweep_interval
+                continue
+            if key_name is _STOP:
+                return
+            self.delete(key_name)
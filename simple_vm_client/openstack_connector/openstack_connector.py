@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import math
 import os
+import re
 import socket
 import sys
 import threading
+import time
 import urllib
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, wait
 from contextlib import closing
+from functools import lru_cache
 from typing import Union
 from uuid import uuid4
 
-import sympy
 import yaml
 from keystoneauth1 import session
 from keystoneauth1.identity import v3
@@ -29,6 +32,7 @@ from openstack.exceptions import (
     OpenStackCloudException,
     ResourceFailure,
     ResourceNotFound,
+    raise_from_response,
 )
 from openstack.network.v2.network import Network
 from openstack.network.v2.security_group import SecurityGroup
@@ -38,6 +42,26 @@ from requests.adapters import HTTPAdapter
 from simple_vm_client.forc_connector.template.template import (
     ResearchEnvironmentMetadata,
 )
+from simple_vm_client.openstack_connector.keypair_cleanup import (
+    KEYPAIR_SWEEP_INTERVAL,
+    KeypairCleanup,
+)
+from simple_vm_client.openstack_connector.session_metrics import SessionMetrics
+from simple_vm_client.openstack_connector.userdata import (
+    ADD_KEYS_SCRIPT,
+    MOUNT_SCRIPT,
+    NOVA_USERDATA_LIMIT,
+    SAVE_METADATA_AUTH_TOKEN_SCRIPT,
+    UNLOCK_UBUNTU_USER_SCRIPT,
+    USERDATA_FORMAT_PLAIN,
+    USERDATA_FORMATS,
+    encoded_size,
+    pack_userdata,
+    render_add_keys_script,
+    render_mount_script,
+    render_save_metadata_auth_token_script,
+    volume_pairs,
+)
 from simple_vm_client.ttypes import (
     DefaultException,
     FlavorNotFoundException,
@@ -49,8 +73,9 @@ from simple_vm_client.ttypes import (
     SnapshotNotFoundException,
     VolumeNotFoundException,
 )
-from simple_vm_client.util.logger import setup_custom_logger
+from simple_vm_client.util.logger import Lazy, setup_custom_logger
 from simple_vm_client.util.state_enums import VmStates, VmTaskStates
+from simple_vm_client.util.ttl_cache import TTLCache
 
 logger = setup_custom_logger(__name__)
 
@@ -58,6 +83,26 @@ BIOCONDA = "bioconda"
 
 ALL_TEMPLATES = [BIOCONDA]
 SUPPORTED_OS_VERSIONS = ["22.04", "24.04"]
+SCALE_UP_WORKERS = 5
+SNAPSHOT_TAG_WORKERS = 4
+IMAGE_PATCH_CONTENT_TYPE = "application/openstack-images-v2.1-json-patch"
+RESOURCE_CACHE_TTL = 60
+# glance states an image passes on its way to active, e.g. a fresh snapshot
+IMAGE_PENDING_STATUSES = frozenset(["importing", "queued", "saving", "uploading"])
+LIMITS_CACHE_TTL = 10
+WARMUP_DEADLINE = 120
+# <8 hex>_<servername[:10]>_<project>, see create_launch_keypair
+LAUNCH_KEYPAIR_PATTERN = re.compile(r"^[0-9a-f]{8}_.{1,10}_.+$")
+
+
+@lru_cache(maxsize=8)
+def _parse_port_calculation(expression: str):
+    # sympy takes a noticeable part of the startup time, only load it when needed
+    import sympy
+
+    return sympy.sympify(expression)
+
+
 lock_dict = {}
 lock_access = threading.Lock()
 
@@ -92,10 +137,25 @@ class OpenStackConnector:
         self.USE_APPLICATION_CREDENTIALS: bool = False
         self.NOVA_MICROVERSION = "2.1"
         self.THREADS = 32
+        self.RESOURCE_CACHE_TTL: float = RESOURCE_CACHE_TTL
+        self.LIMITS_CACHE_TTL: float = LIMITS_CACHE_TTL
+        self.USERDATA_FORMAT: str = USERDATA_FORMAT_PLAIN
+        self.KEYPAIR_SWEEP_INTERVAL: float = KEYPAIR_SWEEP_INTERVAL
 
         self.load_env_config()
         logger.info(f"Loading config file: {config_file}")
         self.load_config_yml(config_file)
+        # flavors and images, filled on first use or by warmup()
+        self.resource_cache = TTLCache(ttl=self.RESOURCE_CACHE_TTL)
+        # compute and volume quotas, dropped when servers or volumes change
+        self.limits_cache = TTLCache(ttl=self.LIMITS_CACHE_TTL)
+        # objects named by the config, kept until a server start fails
+        self.resource_handles = TTLCache(ttl=math.inf)
+        self.keypair_cleanup = KeypairCleanup(
+            list_keypair_names=self.list_launch_keypair_names,
+            delete_keypair=self.delete_keypair,
+            sweep_interval=self.KEYPAIR_SWEEP_INTERVAL,
+        )
 
         try:
 
@@ -133,23 +193,26 @@ class OpenStackConnector:
             sess = session.Session(auth=auth, timeout=30)
             sess.session.mount("http://", adapter)
             sess.session.mount("https://", adapter)
+            self.session_metrics = SessionMetrics(auth=auth, adapter=adapter)
             self.openstack_connection = connection.Connection(
                 session=sess,
                 compute_api_version=self.NOVA_MICROVERSION,
             )
 
             self.openstack_connection.authorize()
+            self.session_metrics.verify_reuse(self.openstack_connection.session)
             self.get_network()
             logger.info(
                 "Connected to OpenStack",
                 extra={"cloud_site": self.CLOUD_SITE, "network": self.NETWORK},
             )
-            self.create_or_get_default_ssh_security_group()
+            self.get_default_security_group()
         except Exception as e:
             logger.error("Client failed authentication at Openstack!")
             raise ConnectionError("Client failed authentication at Openstack") from e
 
         self.DEACTIVATE_UPGRADES_SCRIPT = self.create_deactivate_update_script()
+        self.keypair_cleanup.start()
 
     def load_config_yml(self, config_file: str) -> None:
         logger.info("Loading OpenStack config file", extra={"config_file": config_file})
@@ -167,6 +230,24 @@ class OpenStackConnector:
                 "forc_security_group_id", None
             )
             self.THREADS = cfg["server"].get("threads", 32)
+            self.RESOURCE_CACHE_TTL = cfg["openstack"].get(
+                "resource_cache_ttl", RESOURCE_CACHE_TTL
+            )
+            self.LIMITS_CACHE_TTL = cfg["openstack"].get(
+                "limits_cache_ttl", LIMITS_CACHE_TTL
+            )
+            self.USERDATA_FORMAT = cfg["openstack"].get(
+                "userdata_format", USERDATA_FORMAT_PLAIN
+            )
+            self.KEYPAIR_SWEEP_INTERVAL = cfg["openstack"].get(
+                "keypair_sweep_interval", KEYPAIR_SWEEP_INTERVAL
+            )
+            if self.USERDATA_FORMAT not in USERDATA_FORMATS:
+                logger.warning(
+                    "Unknown userdata format, using plain",
+                    extra={"userdata_format": self.USERDATA_FORMAT},
+                )
+                self.USERDATA_FORMAT = USERDATA_FORMAT_PLAIN
 
             if not self.FORC_SECURITY_GROUP_ID:
                 logger.warning(
@@ -289,17 +370,23 @@ class OpenStackConnector:
                 "security_groups": security_groups,
             },
         )
-        server: Server = self.openstack_connection.create_server(
-            name=name,
-            image=image_id,
-            flavor=flavor_id,
-            network=[network_id],
-            userdata=userdata,
-            key_name=key_name,
-            meta=metadata,
-            security_groups=security_groups,
-            boot_from_volume=False,
-        )
+        try:
+            server: Server = self.openstack_connection.create_server(
+                name=name,
+                image=image_id,
+                flavor=flavor_id,
+                network=[network_id],
+                userdata=userdata,
+                key_name=key_name,
+                meta=metadata,
+                security_groups=security_groups,
+                boot_from_volume=False,
+            )
+        except OpenStackCloudException:
+            # the network may have been replaced, resolve it again next time
+            self.resource_handles.invalidate()
+            raise
+        self.limits_cache.invalidate()
         logger.info(
             "OpenStack server created successfully",
             extra={"server_id": server.id, "server_name": name},
@@ -329,6 +416,7 @@ class OpenStackConnector:
         logger.info("Deleting volume", extra={"volume_id": volume_id})
         try:
             self.openstack_connection.delete_volume(name_or_id=volume_id, wait=False)
+            self.limits_cache.invalidate()
             logger.info("Volume deleted successfully", extra={"volume_id": volume_id})
         except ResourceNotFound as e:
             logger.warning(
@@ -450,6 +538,7 @@ class OpenStackConnector:
             volume: Volume = self.openstack_connection.block_storage.create_volume(
                 name=volume_name, metadata=metadata, source_volume_id=source_volume_id
             )
+            self.limits_cache.invalidate()
             logger.info(
                 "Volume created from source volume",
                 extra={"volume_id": volume.id, "source_volume_id": source_volume_id},
@@ -474,6 +563,7 @@ class OpenStackConnector:
             volume: Volume = self.openstack_connection.block_storage.create_volume(
                 name=volume_name, metadata=metadata, snapshot_id=volume_snap_id
             )
+            self.limits_cache.invalidate()
             logger.info(
                 "Volume created from snapshot",
                 extra={"volume_id": volume.id, "snapshot_id": volume_snap_id},
@@ -493,7 +583,10 @@ class OpenStackConnector:
             servers: list[Server] = self.openstack_connection.list_servers()
             logger.debug(
                 "Servers fetched successfully",
-                extra={"count": len(servers), "server_ids": [s.id for s in servers]},
+                extra={
+                    "count": len(servers),
+                    "server_ids": Lazy(lambda: [s.id for s in servers]),
+                },
             )
 
             flavors = {}
@@ -568,7 +661,10 @@ class OpenStackConnector:
 
         logger.debug(
             "Servers by IDs fetch complete",
-            extra={"count": len(servers), "found_ids": [s.id for s in servers]},
+            extra={
+                "count": len(servers),
+                "found_ids": Lazy(lambda: [s.id for s in servers]),
+            },
         )
         return servers
 
@@ -631,6 +727,7 @@ class OpenStackConnector:
         logger.info("Resizing volume", extra={"volume_id": volume_id, "new_size": size})
         try:
             self.openstack_connection.block_storage.extend_volume(volume_id, size)
+            self.limits_cache.invalidate()
             logger.info(
                 "Volume resized successfully",
                 extra={"volume_id": volume_id, "new_size": size},
@@ -665,6 +762,7 @@ class OpenStackConnector:
             volume: Volume = self.openstack_connection.block_storage.create_volume(
                 name=volume_name, size=volume_storage, metadata=metadata
             )
+            self.limits_cache.invalidate()
             logger.info(
                 "Volume created successfully",
                 extra={
@@ -687,6 +785,9 @@ class OpenStackConnector:
             raise ResourceNotAvailableException(message=e.message)
 
     def get_network(self) -> Network:
+        return self.resource_handles.get_or_load("network", self._find_network)
+
+    def _find_network(self) -> Network:
         logger.debug("Fetching network", extra={"network_name": self.NETWORK})
         try:
             network: Network = self.openstack_connection.get_network(
@@ -705,6 +806,49 @@ class OpenStackConnector:
             )
             raise
 
+    def warmup(self) -> dict[str, float]:
+        """
+        Prefetch what the first portal requests need.
+
+        Fills the flavor and image cache, resolves the network and default
+        security group and opens pooled connections to the compute, image and
+        network endpoints. Returns the seconds per step.
+        """
+        steps = {
+            "flavors": lambda: self.resource_cache.set("flavors", self._list_flavors()),
+            "images": lambda: self.resource_cache.set("images", self._list_images()),
+            "network": self.get_network,
+            "default_security_group": self.get_default_security_group,
+            # connection warmup only, the listed groups are not cached
+            "security_groups": self.openstack_connection.list_security_groups,
+        }
+        durations: dict[str, float] = {}
+
+        def run_step(name, step):
+            start_time = time.monotonic()
+            step()
+            durations[name] = round(time.monotonic() - start_time, 3)
+
+        executor = ThreadPoolExecutor(max_workers=len(steps))
+        futures = {
+            executor.submit(run_step, name, step): name for name, step in steps.items()
+        }
+        done, not_done = wait(futures, timeout=WARMUP_DEADLINE)
+        executor.shutdown(wait=False, cancel_futures=True)
+        if not_done:
+            raise DefaultException(
+                message=f"OpenStack warmup exceeded {WARMUP_DEADLINE}s: {sorted(futures[future] for future in not_done)}"
+            )
+        for future in done:
+            if future.exception():
+                logger.error(
+                    "OpenStack warmup step failed",
+                    extra={"step": futures[future], "error": str(future.exception())},
+                )
+                raise future.exception()  # type: ignore
+        logger.info("OpenStack warmup done", extra={"durations": durations})
+        return durations
+
     def import_keypair(self, keyname: str, public_key: str) -> dict[str, str]:
         logger.debug("Fetching keypair", extra={"keyname": keyname})
         keypair: dict[str, str] = self.openstack_connection.get_keypair(
@@ -745,16 +889,40 @@ class OpenStackConnector:
             return key_pair.public_key
         return ""
 
+    def create_launch_keypair(
+        self, servername: str, project_name: str, public_key: str
+    ) -> str:
+        """
+        Imports the public key under a new unique name for one server start.
+
+        The name is never reused, so there is nothing to look up or replace.
+        """
+        key_name = f"{uuid4().hex[:8]}_{servername[:10]}_{project_name}"
+        logger.debug("Creating launch keypair", extra={"keyname": key_name})
+        self.openstack_connection.create_keypair(name=key_name, public_key=public_key)
+        self.keypair_cleanup.record(key_name)
+        return key_name
+
+    def list_launch_keypair_names(self) -> list[str]:
+        return [
+            key_pair.name
+            for key_pair in self.openstack_connection.list_keypairs()
+            if LAUNCH_KEYPAIR_PATTERN.match(key_pair.name)
+        ]
+
     def delete_keypair(self, key_name: str) -> None:
         logger.info("Deleting keypair", extra={"keyname": key_name})
-        key_pair = self.openstack_connection.get_keypair(name_or_id=key_name)
-        if key_pair:
-            self.openstack_connection.delete_keypair(name=key_name)
+        # returns False if the keypair does not exist, which is fine as well
+        if self.openstack_connection.delete_keypair(name=key_name):
             logger.info("Keypair deleted successfully", extra={"keyname": key_name})
+        else:
+            logger.debug("Keypair already deleted", extra={"keyname": key_name})
 
     def create_add_keys_script(
         self, additional_owner_keys: list[str], addtional_user_keys: list[str]
-    ) -> str:
+    ) -> bytes:
+        additional_owner_keys = additional_owner_keys or []
+        addtional_user_keys = addtional_user_keys or []
         logger.debug(
             "Creating add keys script",
             extra={
@@ -762,60 +930,23 @@ class OpenStackConnector:
                 "user_key_count": len(addtional_user_keys),
             },
         )
-        file_dir = os.path.dirname(os.path.abspath(__file__))
-        key_script = os.path.join(file_dir, "scripts/bash/add_keys_to_authorized.sh")
-        if not additional_owner_keys:
-            additional_owner_keys = []
-        if not addtional_user_keys:
-            addtional_user_keys = []
-
-        bash_addtional_user_keys_array = "("
-        for key in addtional_user_keys:
-            bash_addtional_user_keys_array += f'"{key}" '
-        bash_addtional_user_keys_array += ")"
-        bash_addtional_owner_keys_array = "("
-        for key in additional_owner_keys:
-            bash_addtional_owner_keys_array += f'"{key}" '
-        bash_addtional_owner_keys_array += ")"
-        with open(key_script, "r") as file:
-            text = file.read()
-            text = text.replace(
-                "ADDITIONAL_USER_KEYS_TO_ADD", bash_addtional_user_keys_array
-            )
-            text = text.replace("OWNER_KEYS_TO_ADD", bash_addtional_owner_keys_array)
-            text = encodeutils.safe_encode(text.encode("utf-8"))
-        key_script = text
-        return key_script
+        return render_add_keys_script(
+            tuple(additional_owner_keys), tuple(addtional_user_keys)
+        )
 
     def create_save_metadata_auth_token_script(
         self, token: str, metadata_endpoint: str
-    ) -> str:
+    ) -> bytes:
         logger.debug(
             "Creating save metadata auth token script",
             extra={
                 "metadata_endpoint": metadata_endpoint,
             },
         )
-        file_dir = os.path.dirname(os.path.abspath(__file__))
-        metadata_token_script_path = os.path.join(
-            file_dir, "scripts/bash/save_metadata_auth_token.sh"
+        return render_save_metadata_auth_token_script(
+            token=token, metadata_endpoint=metadata_endpoint
         )
 
-        with open(metadata_token_script_path, "r") as file:
-            text = file.read()
-
-            # Use a unique placeholder in the script for replacement
-            placeholder = "REPLACE_WITH_ACTUAL_TOKEN"
-            endpoint_placeholder = "REPLACE_WITH_ACTUAL_METADATA_INFO_ENDPOINT"
-
-            # Replace the placeholder with the actual token
-            text = text.replace(placeholder, token)
-            text = text.replace(endpoint_placeholder, metadata_endpoint)
-
-            text = encodeutils.safe_encode(text.encode("utf-8"))
-
-        return text
-
     def netcat(self, port: int) -> bool:
         host = self.INTERNAL_GATEWAY_IP if self.INTERNAL_GATEWAY_IP else self.GATEWAY_IP
         logger.debug("Checking SSH connectivity", extra={"host": host, "port": port})
@@ -861,6 +992,9 @@ class OpenStackConnector:
             raise
 
     def get_flavors(self) -> list[Flavor]:
+        return list(self.resource_cache.get_or_load("flavors", self._list_flavors))
+
+    def _list_flavors(self) -> list[Flavor]:
         logger.debug("Fetching all flavors")
         try:
             flavors: list[Flavor] = self.openstack_connection.list_flavors(
@@ -870,7 +1004,7 @@ class OpenStackConnector:
                 "Flavors fetched successfully",
                 extra={
                     "count": len(flavors),
-                    "flavor_names": [f.name for f in flavors],
+                    "flavor_names": Lazy(lambda: [f.name for f in flavors]),
                 },
             )
             return flavors
@@ -1168,6 +1302,52 @@ class OpenStackConnector:
         )
         return image
 
+    def add_image_tags(self, image_id: str, tags: list[str]) -> str:
+        """
+        Adds tags to an image and returns how they were added.
+
+        Tags already on the image are kept. Glance only patches the tag list
+        as a whole, so the current tags are merged into a single JSON patch.
+        If Glance rejects it the tags are added one by one in parallel.
+        """
+        tags = list(dict.fromkeys(tags or []))
+        if not tags:
+            return "none"
+        try:
+            current_tags = list(
+                self.openstack_connection.image.get_image(image_id).tags or []
+            )
+            response = self.openstack_connection.image.patch(
+                f"/images/{image_id}",
+                json=[
+                    {
+                        "op": "replace",
+                        "path": "/tags",
+                        "value": list(dict.fromkeys(current_tags + tags)),
+                    }
+                ],
+                headers={"Content-Type": IMAGE_PATCH_CONTENT_TYPE},
+            )
+            raise_from_response(response)
+            return "patch"
+        except OpenStackCloudException as e:
+            logger.warning(
+                "Failed to add image tags with one update, adding them one by one",
+                extra={"image_id": image_id, "error": str(e)},
+            )
+        with ThreadPoolExecutor(
+            max_workers=min(SNAPSHOT_TAG_WORKERS, len(tags))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self.openstack_connection.image.add_tag, image=image_id, tag=tag
+                )
+                for tag in tags
+            ]
+        for future in futures:
+            future.result()
+        return "add_tag"
+
     def create_snapshot(
         self,
         openstack_id: str,
@@ -1188,20 +1368,25 @@ class OpenStackConnector:
         )
 
         try:
+            start_time = time.monotonic()
             snapshot_munch = self.openstack_connection.create_image_snapshot(
                 server=openstack_id, name=name, description=description
             )
-            for tag in base_tags:
-                self.openstack_connection.image.add_tag(
-                    image=snapshot_munch["id"], tag=tag
-                )
             snapshot_id: str = snapshot_munch["id"]
+            create_duration = round(time.monotonic() - start_time, 3)
+            start_time = time.monotonic()
+            tag_method = self.add_image_tags(image_id=snapshot_id, tags=base_tags)
+            tag_duration = round(time.monotonic() - start_time, 3)
+            self.resource_cache.invalidate("images")
             logger.info(
                 "Snapshot created successfully",
                 extra={
                     "snapshot_id": snapshot_id,
                     "server_id": openstack_id,
                     "snapshot_name": name,
+                    "create_duration": create_duration,
+                    "tag_duration": tag_duration,
+                    "tag_method": tag_method,
                 },
             )
             return snapshot_id
@@ -1241,6 +1426,7 @@ class OpenStackConnector:
                     message=f"Image not found: {image_id}", name_or_id=image_id
                 )
             self.openstack_connection.compute.delete_image(image_id)
+            self.resource_cache.invalidate("images")
             logger.info("Image deleted successfully", extra={"image_id": image_id})
         except Exception as e:
             logger.error(
@@ -1261,7 +1447,7 @@ class OpenStackConnector:
             images = [
                 image for image in images if "tags" in image and len(image["tags"]) > 0
             ]
-            image_names = [image.name for image in images]
+            image_names = Lazy(lambda: [image.name for image in images])
             logger.debug(
                 "Public images fetched successfully",
                 extra={"count": len(images), "image_names": image_names},
@@ -1282,7 +1468,7 @@ class OpenStackConnector:
             images = [
                 image for image in images if "tags" in image and len(image["tags"]) > 0
             ]
-            image_names = [image.name for image in images]
+            image_names = Lazy(lambda: [image.name for image in images])
             logger.debug(
                 "Private images fetched successfully",
                 extra={"count": len(images), "image_names": image_names},
@@ -1295,13 +1481,20 @@ class OpenStackConnector:
             raise
 
     def get_images(self) -> list[Image]:
+        images = self.resource_cache.get_or_load("images", self._list_images)
+        if any(image.status in IMAGE_PENDING_STATUSES for image in images):
+            # the cached entry would keep a pending image until the ttl expires
+            self.resource_cache.invalidate("images")
+        return [image for image in images if image.status == "active"]
+
+    def _list_images(self) -> list[Image]:
         logger.debug("Fetching all images")
         try:
-            images = self.openstack_connection.image.images(status="active")
+            images = self.openstack_connection.image.images()
             images = [
                 image for image in images if "tags" in image and len(image["tags"]) > 0
             ]
-            image_names = [image.name for image in images]
+            image_names = Lazy(lambda: [image.name for image in images])
             logger.debug(
                 "Images fetched successfully",
                 extra={"count": len(images), "image_names": image_names},
@@ -1350,52 +1543,9 @@ class OpenStackConnector:
             logger.debug("No volumes to mount, returning empty script")
             return ""
 
-        file_dir: str = os.path.dirname(os.path.abspath(__file__))
-        mount_script: str = os.path.join(file_dir, "scripts/bash/mount.sh")
-
-        if new_volumes:
-            volume_ids_new = [vol["openstack_id"] for vol in new_volumes]
-            paths_new = [vol["path"] for vol in new_volumes]
-        else:
-            volume_ids_new = []
-            paths_new = []
-
-        if attach_volumes:
-            volume_ids_attach = [vol["openstack_id"] for vol in attach_volumes]
-            paths_attach = [vol["path"] for vol in attach_volumes]
-        else:
-            volume_ids_attach = []
-            paths_attach = []
-
-        bash_volume_path_new_array_string = "("
-        for path in paths_new:
-            bash_volume_path_new_array_string += path + " "
-        bash_volume_path_new_array_string += ")"
-
-        bash_volume_path_attach_array_string = "("
-        for path in paths_attach:
-            bash_volume_path_attach_array_string += path + " "
-        bash_volume_path_attach_array_string += ")"
-
-        bash_volume_id_new_array_string = "("
-        for volume_id in volume_ids_new:
-            bash_volume_id_new_array_string += "virtio-" + volume_id[0:20] + " "
-        bash_volume_id_new_array_string += ")"
-
-        bash_volume_id_attach_array_string = "("
-        for volume_id in volume_ids_attach:
-            bash_volume_id_attach_array_string += "virtio-" + volume_id[0:20] + " "
-        bash_volume_id_attach_array_string += ")"
-
-        with open(mount_script, "r") as file:
-            text = file.read()
-            text = text.replace("VOLUME_IDS_NEW", bash_volume_id_new_array_string)
-            text = text.replace("VOLUME_PATHS_NEW", bash_volume_path_new_array_string)
-            text = text.replace("VOLUME_IDS_ATTACH", bash_volume_id_attach_array_string)
-            text = text.replace(
-                "VOLUME_PATHS_ATTACH", bash_volume_path_attach_array_string
-            )
-            text = encodeutils.safe_encode(text.encode("utf-8"))
+        text = render_mount_script(
+            volume_pairs(new_volumes), volume_pairs(attach_volumes)
+        )
         logger.debug(
             "Mount init script created successfully",
             extra={
@@ -1430,15 +1580,32 @@ class OpenStackConnector:
         )
         return sec
 
+    def get_default_security_group(self) -> SecurityGroup:
+        return self.resource_handles.get_or_load(
+            "default_security_group", self.create_or_get_default_ssh_security_group
+        )
+
     def add_default_security_groups_to_server(self, openstack_id):
         logger.info(
             "Adding default security group to server", extra={"server_id": openstack_id}
         )
         server = self.get_server(openstack_id=openstack_id)
-        sec_group = self._get_default_security_groups()
-        self.openstack_connection.add_server_security_groups(
-            server=server, security_groups=sec_group
-        )
+        # the resolved group saves its lookup by name
+        sec_group = [
+            (
+                self.get_default_security_group()
+                if name == self.DEFAULT_SECURITY_GROUP_NAME
+                else name
+            )
+            for name in self._get_default_security_groups()
+        ]
+        try:
+            self.openstack_connection.add_server_security_groups(
+                server=server, security_groups=sec_group
+            )
+        except OpenStackCloudException:
+            self.resource_handles.invalidate("default_security_group")
+            raise
         logger.debug("Default security group added", extra={"server_id": openstack_id})
 
     def delete_security_group_rule(self, openstack_id):
@@ -1865,27 +2032,35 @@ class OpenStackConnector:
             )
             return new_security_group["id"]
 
+    def _fetch_limits(self) -> dict[str, str]:
+        # compute and volume limits come from different services
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            compute_future = executor.submit(
+                self.openstack_connection.get_compute_limits
+            )
+            volume_future = executor.submit(self.openstack_connection.get_volume_limits)
+        compute_limits = compute_future.result()
+        volume_limits = volume_future.result()["absolute"]
+
+        # Merge compute and volume limits into a single dictionary
+        limits = {**compute_limits, **volume_limits}
+        return {
+            "cores_limit": str(limits["max_total_cores"]),
+            "vms_limit": str(limits["max_total_instances"]),
+            "ram_limit": str(math.ceil(limits["max_total_ram_size"] / 1024)),
+            "current_used_cores": str(limits["total_cores_used"]),
+            "current_used_vms": str(limits["total_instances_used"]),
+            "current_used_ram": str(math.ceil(limits["total_ram_used"] / 1024)),
+            "volume_counter_limit": str(limits["max_total_volumes"]),
+            "volume_storage_limit": str(limits["max_total_volume_gigabytes"]),
+            "current_used_volumes": str(limits["total_volumes_used"]),
+            "current_used_volume_storage": str(limits["total_gigabytes_used"]),
+        }
+
     def get_limits(self) -> dict[str, str]:
         logger.debug("Fetching OpenStack limits")
         try:
-            # Retrieve compute and volume limits
-            compute_limits = self.openstack_connection.get_compute_limits()
-            volume_limits = self.openstack_connection.get_volume_limits()["absolute"]
-
-            # Merge compute and volume limits into a single dictionary
-            limits = {**compute_limits, **volume_limits}
-            result = {
-                "cores_limit": str(limits["max_total_cores"]),
-                "vms_limit": str(limits["max_total_instances"]),
-                "ram_limit": str(math.ceil(limits["max_total_ram_size"] / 1024)),
-                "current_used_cores": str(limits["total_cores_used"]),
-                "current_used_vms": str(limits["total_instances_used"]),
-                "current_used_ram": str(math.ceil(limits["total_ram_used"] / 1024)),
-                "volume_counter_limit": str(limits["max_total_volumes"]),
-                "volume_storage_limit": str(limits["max_total_volume_gigabytes"]),
-                "current_used_volumes": str(limits["total_volumes_used"]),
-                "current_used_volume_storage": str(limits["total_gigabytes_used"]),
-            }
+            result = dict(self.limits_cache.get_or_load("limits", self._fetch_limits))
             logger.debug(
                 "Limits fetched successfully",
                 extra={
@@ -1904,6 +2079,28 @@ class OpenStackConnector:
             )
             raise
 
+    def get_session_metrics(self) -> dict[str, int]:
+        return self.session_metrics.as_dict()
+
+    def is_token_valid(self) -> bool:
+        """
+        Cheap connection check, Keystone validates the token of the session.
+
+        Re-authenticates first if the cached token expired.
+        """
+        try:
+            token = self.openstack_connection.session.get_token()
+            response = self.openstack_connection.identity.head(
+                "/auth/tokens", headers={"X-Subject-Token": token}
+            )
+            raise_from_response(response)
+            return True
+        except Exception as e:
+            logger.error(
+                "OpenStack token check failed", extra={"error": str(e)}, exc_info=True
+            )
+            return False
+
     def exist_server(self, name: str) -> bool:
         logger.debug("Checking if server exists", extra={"server_name": name})
         try:
@@ -2252,6 +2449,7 @@ class OpenStackConnector:
                 extra={"server_id": openstack_id, "server_name": server.name},
             )
             self.openstack_connection.compute.delete_server(server.id, force=True)
+            self.limits_cache.invalidate()
 
             security_groups = server.security_groups
             self._delete_security_groups_if_not_used(security_groups)
@@ -2330,8 +2528,8 @@ class OpenStackConnector:
             f"oct{enum + 1}": int(elem)
             for enum, elem in enumerate(server.private_v4.split("."))
         }
-        ssh_port = int(sympy.sympify(self.SSH_PORT_CALCULATION).subs(dict(octets)))
-        udp_port = int(sympy.sympify(self.UDP_PORT_CALCULATION).subs(dict(octets)))
+        ssh_port = int(_parse_port_calculation(self.SSH_PORT_CALCULATION).subs(octets))
+        udp_port = int(_parse_port_calculation(self.UDP_PORT_CALCULATION).subs(octets))
 
         return ssh_port, udp_port
 
@@ -2361,7 +2559,8 @@ class OpenStackConnector:
         metadata_token: str = None,
         metadata_endpoint: str = None,
         additional_script: str = "",
-    ) -> str:
+        userdata_format: str = USERDATA_FORMAT_PLAIN,
+    ) -> bytes:
         logger.debug(
             "Creating user data script",
             extra={
@@ -2372,52 +2571,47 @@ class OpenStackConnector:
                 "has_metadata_token": metadata_token is not None,
             },
         )
-        unlock_ubuntu_user_script = "#!/bin/bash\npasswd -u ubuntu\n"
-        unlock_ubuntu_user_script_encoded = encodeutils.safe_encode(
-            unlock_ubuntu_user_script.encode("utf-8")
-        )
-        init_script = unlock_ubuntu_user_script_encoded
-
+        scripts: list[tuple[str, bytes]] = []
         if additional_owner_keys or additional_user_keys:
-            add_key_script = self.create_add_keys_script(
-                additional_owner_keys=additional_owner_keys,
-                addtional_user_keys=additional_user_keys,
-            )
-            init_script = (
-                add_key_script
-                + encodeutils.safe_encode("\n".encode("utf-8"))
-                + init_script
+            scripts.append(
+                (
+                    ADD_KEYS_SCRIPT,
+                    self.create_add_keys_script(
+                        additional_owner_keys=additional_owner_keys,
+                        addtional_user_keys=additional_user_keys,
+                    ),
+                )
             )
+        scripts.append(("unlock_ubuntu_user.sh", UNLOCK_UBUNTU_USER_SCRIPT))
 
         if volume_ids_path_new or volume_ids_path_attach:
-            mount_script = self.create_mount_init_script(
-                new_volumes=volume_ids_path_new,
-                attach_volumes=volume_ids_path_attach,
-            )
-            init_script = (
-                init_script
-                + encodeutils.safe_encode("\n".encode("utf-8"))
-                + mount_script
+            scripts.append(
+                (
+                    MOUNT_SCRIPT,
+                    self.create_mount_init_script(
+                        new_volumes=volume_ids_path_new,
+                        attach_volumes=volume_ids_path_attach,
+                    ),
+                )
             )
 
         if metadata_token and metadata_endpoint:
-            save_metadata_token_script = self.create_save_metadata_auth_token_script(
-                token=metadata_token, metadata_endpoint=metadata_endpoint
-            )
-            init_script = (
-                init_script
-                + encodeutils.safe_encode("\n".encode("utf-8"))
-                + save_metadata_token_script
+            scripts.append(
+                (
+                    SAVE_METADATA_AUTH_TOKEN_SCRIPT,
+                    self.create_save_metadata_auth_token_script(
+                        token=metadata_token, metadata_endpoint=metadata_endpoint
+                    ),
+                )
             )
 
         if additional_script:
-            init_script = (
-                init_script
-                + encodeutils.safe_encode("\n".encode("utf-8"))
-                + encodeutils.safe_encode(additional_script.encode("utf-8"))
-            )
+            scripts.append(("additional_script.sh", additional_script.encode("utf-8")))
 
-        logger.debug(
+        init_script, used_format = pack_userdata(scripts, userdata_format)
+        encoded_init_script_size = encoded_size(init_script)
+        # one line per launch, the format and sizes show how close it gets to the limit
+        logger.info(
             "User data script created successfully",
             extra={
                 "has_volumes_new": len(volume_ids_path_new or []) > 0,
@@ -2426,8 +2620,21 @@ class OpenStackConnector:
                 "has_user_keys": len(additional_user_keys or []) > 0,
                 "has_metadata_token": metadata_token is not None,
                 "has_additional_script": bool(additional_script),
+                "userdata_format": used_format,
+                "plain_size": sum(len(script) + 1 for _, script in scripts) - 1,
+                "size": len(init_script),
+                "encoded_size": encoded_init_script_size,
             },
         )
+        if encoded_init_script_size > NOVA_USERDATA_LIMIT:
+            logger.warning(
+                "User data exceeds the Nova limit, the server will be rejected",
+                extra={
+                    "userdata_format": used_format,
+                    "encoded_size": encoded_init_script_size,
+                    "limit": NOVA_USERDATA_LIMIT,
+                },
+            )
         return init_script
 
     def start_server(
@@ -2447,6 +2654,7 @@ class OpenStackConnector:
         metadata_token: str = None,
         metadata_endpoint: str = None,
         additional_script: str = "",
+        userdata_format: str = None,
     ) -> str:
         logger.info(
             "Starting new server",
@@ -2459,13 +2667,7 @@ class OpenStackConnector:
             },
         )
 
-        key_name: str = (
-            str(uuid4())[0:3]
-            + "_"
-            + servername[:10]
-            + "_"
-            + metadata.get("project_name", "")
-        )
+        key_name = None
         try:
             image: Image = self.get_image(
                 name_or_id=image_name,
@@ -2476,7 +2678,6 @@ class OpenStackConnector:
             )
             flavor: Flavor = self.get_flavor(name_or_id=flavor_name)
             network: Network = self.get_network()
-            logger.debug("Using key name", extra={"key_name": key_name})
             project_name = metadata.get("project_name")
             project_id = metadata.get("project_id")
             security_groups = self._get_security_groups_starting_machine(
@@ -2486,8 +2687,12 @@ class OpenStackConnector:
                 research_environment_metadata=research_environment_metadata,
             )
 
-            public_key = urllib.parse.unquote(public_key)
-            self.import_keypair(key_name, public_key)
+            key_name = self.create_launch_keypair(
+                servername=servername,
+                project_name=metadata.get("project_name", ""),
+                public_key=urllib.parse.unquote(public_key),
+            )
+            logger.debug("Using key name", extra={"key_name": key_name})
             volumes = self._get_volumes_machines_start(
                 volume_ids_path_new=volume_ids_path_new,
                 volume_ids_path_attach=volume_ids_path_attach,
@@ -2501,6 +2706,7 @@ class OpenStackConnector:
                 metadata_token=metadata_token,
                 metadata_endpoint=metadata_endpoint,
                 additional_script=additional_script,
+                userdata_format=userdata_format or self.USERDATA_FORMAT,
             )
             logger.info(
                 "Creating OpenStack server instance",
@@ -2523,19 +2729,22 @@ class OpenStackConnector:
                 boot_from_volume=False,
                 boot_volume=None,
             )
+            self.limits_cache.invalidate()
 
             openstack_id: str = server["id"]
             logger.info(
                 "Server started successfully",
                 extra={"server_id": openstack_id, "servername": servername},
             )
-            self.delete_keypair(key_name=key_name)
+            # the key was injected at boot, deleting it can wait
+            self.keypair_cleanup.enqueue(key_name)
 
             return openstack_id
 
         except OpenStackCloudException as e:
             if key_name:
-                self.delete_keypair(key_name=key_name)
+                self.keypair_cleanup.enqueue(key_name)
+            self.resource_handles.invalidate()
 
             logger.error(
                 "Failed to start server",
@@ -2611,6 +2820,7 @@ class OpenStackConnector:
         metadata_token: str = None,
         metadata_endpoint: str = None,
         additional_script: str = "",
+        userdata_format: str = None,
     ) -> tuple[str, str]:
         logger.info(
             "Starting server with playbook",
@@ -2657,6 +2867,7 @@ class OpenStackConnector:
                 metadata_token=metadata_token,
                 metadata_endpoint=metadata_endpoint,
                 additional_script=additional_script,
+                userdata_format=userdata_format or self.USERDATA_FORMAT,
             )
             server = self.openstack_connection.create_server(
                 name=servername,
@@ -2671,8 +2882,9 @@ class OpenStackConnector:
                 boot_from_volume=False,
             )
 
+            self.limits_cache.invalidate()
             openstack_id = server["id"]
-            self.delete_keypair(key_name=key_creation.name)
+            self.keypair_cleanup.enqueue(key_creation.name)
 
             logger.info(
                 "Server with playbook started successfully",
@@ -2682,7 +2894,8 @@ class OpenStackConnector:
 
         except OpenStackCloudException as e:
             if key_name:
-                self.delete_keypair(key_name=key_name)
+                self.keypair_cleanup.enqueue(key_name)
+            self.resource_handles.invalidate()
 
             logger.error(
                 "Failed to start server with playbook",
@@ -2875,6 +3088,32 @@ class OpenStackConnector:
         image: Image = self.get_image(name_or_id=image_name, replace_inactive=True)
         flavor: Flavor = self.get_flavor(name_or_id=flavor_name)
         network = self.get_network()
+        return self._create_cluster_machine(
+            cluster_id=cluster_id,
+            cluster_user=cluster_user,
+            cluster_group_id=cluster_group_id,
+            image=image,
+            flavor=flavor,
+            network=network,
+            name=name,
+            key_name=key_name,
+            batch_idx=batch_idx,
+            worker_idx=worker_idx,
+        )
+
+    def _create_cluster_machine(
+        self,
+        cluster_id: str,
+        cluster_user: str,
+        cluster_group_id: list[str],
+        image: Image,
+        flavor: Flavor,
+        network: Network,
+        name: str,
+        key_name: str,
+        batch_idx: int,
+        worker_idx: int,
+    ) -> str:
         metadata = {
             "bibigrid-id": cluster_id,
             "user": cluster_user or "",
@@ -2903,3 +3142,110 @@ class OpenStackConnector:
         )
         server_id: str = server["id"]
         return server_id
+
+    def get_cluster_reference_server(self, cluster_id: str) -> Server:
+        """
+        Return a running server of the cluster, preferring workers added by
+        add_cluster_machine. Its user, key and security groups are used for new workers.
+        """
+        reference = None
+        for server in self.openstack_connection.list_servers():
+            metadata = server.metadata or {}
+            if metadata.get("bibigrid-id") == cluster_id:
+                return server
+            if reference is None and (server.name or "").endswith(f"-{cluster_id}"):
+                reference = server
+        if reference is None:
+            logger.error("Cluster not found", extra={"cluster_id": cluster_id})
+            raise DefaultException(message=f"Cluster {cluster_id} not found!")
+        return reference
+
+    def scale_up_cluster(
+        self,
+        cluster_id: str,
+        image_name: str,
+        flavor_name: str,
+        count: int,
+        names: list[str],
+        start_idx: int,
+        batch_idx: int,
+    ) -> dict[str, list[str]]:
+        """
+        Launch count workers for a cluster concurrently.
+
+        Image, flavor and network are resolved once for all workers. Workers get
+        the worker indexes start_idx..start_idx+count-1 of batch batch_idx.
+
+        Returns:
+            dict[str, list[str]]: Ids of the created servers under "server_ids",
+            names of the workers which could not be created under "failed".
+        """
+        logger.info(
+            "Scaling up cluster",
+            extra={
+                "cluster_id": cluster_id,
+                "count": count,
+                "batch_idx": batch_idx,
+                "start_idx": start_idx,
+            },
+        )
+        reference = self.get_cluster_reference_server(cluster_id=cluster_id)
+        cluster_user = (reference.metadata or {}).get("user", "")
+        cluster_group_id = [
+            security_group["name"] for security_group in reference.security_groups or []
+        ]
+        image: Image = self.get_image(name_or_id=image_name, replace_inactive=True)
+        flavor: Flavor = self.get_flavor(name_or_id=flavor_name)
+        network = self.get_network()
+
+        names = names or []
+        workers = []
+        for idx in range(count):
+            worker_idx = start_idx + idx
+            name = (
+                names[idx]
+                if idx < len(names)
+                else f"bibigrid-worker-{cluster_id}-{batch_idx}-{worker_idx}"
+            )
+            workers.append((name, worker_idx))
+        if not workers:
+            return {"server_ids": [], "failed": []}
+
+        with ThreadPoolExecutor(
+            max_workers=min(SCALE_UP_WORKERS, len(workers))
+        ) as executor:
+            futures = [
+                (
+                    name,
+                    executor.submit(
+                        self._create_cluster_machine,
+                        cluster_id=cluster_id,
+                        cluster_user=cluster_user,
+                        cluster_group_id=cluster_group_id,
+                        image=image,
+                        flavor=flavor,
+                        network=network,
+                        name=name,
+                        key_name=reference.key_name,
+                        batch_idx=batch_idx,
+                        worker_idx=worker_idx,
+                    ),
+                )
+                for name, worker_idx in workers
+            ]
+        server_ids = []
+        failed = []
+        for name, future in futures:
+            try:
+                server_ids.append(future.result())
+            except Exception as e:
+                logger.error(
+                    "Error creating cluster machine",
+                    extra={
+                        "cluster_id": cluster_id,
+                        "machine_name": name,
+                        "error": str(e),
+                    },
+                )
+                failed.append(name)
+        return {"server_ids": server_ids, "failed": failed}
@@ -0,0 +1,74 @@
+"""Token and connection reuse of the keystoneauth session.
+
+The session keeps its token until it is about to expire and sends every
+request through the pooled HTTP adapter. The counters show whether that holds,
+a token fetched again and again shows up as growing reauthentications and
+missing keep-alive as one connection per request.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from keystoneauth1 import session
+from keystoneauth1.identity.base import BaseIdentityPlugin
+from requests.adapters import HTTPAdapter
+
+from simple_vm_client.util.logger import setup_custom_logger
+
+logger = setup_custom_logger(__name__)
+
+
+class SessionMetrics:
+    def __init__(self, auth: BaseIdentityPlugin, adapter: HTTPAdapter):
+        self.authentications = 0
+        self._adapter = adapter
+        self._lock = threading.Lock()
+        get_auth_ref = auth.get_auth_ref
+
+        # every new token, the first one included, is fetched by get_auth_ref
+        def counted_get_auth_ref(sess: session.Session, **kwargs: Any) -> Any:
+            with self._lock:
+                self.authentications += 1
+            return get_auth_ref(sess, **kwargs)
+
+        auth.get_auth_ref = counted_get_auth_ref  # type: ignore
+
+    @property
+    def reauthentications(self) -> int:
+        return max(0, self.authentications - 1)
+
+    def verify_reuse(self, sess: session.Session) -> bool:
+        """Checks that a second token comes from the cache and the pool is mounted."""
+        token = sess.get_token()
+        authentications = self.authentications
+        token_reused = (
+            sess.get_token() == token and self.authentications == authentications
+        )
+        pool_mounted = all(
+            sess.session.get_adapter(prefix) is self._adapter
+            for prefix in ("http://", "https://")
+        )
+        if not token_reused:
+            logger.warning("OpenStack session does not reuse its token")
+        if not pool_mounted:
+            logger.warning("OpenStack session does not use the pooled adapter")
+        return token_reused and pool_mounted
+
+    def as_dict(self) -> dict[str, int]:
+        connections = 0
+        requests = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                requests += pool.num_requests
+        return {
+            "authentications": self.authentications,
+            "reauthentications": self.reauthentications,
+            "pools": len(pools),
+            "connections": connections,
+            "requests": requests,
+        }
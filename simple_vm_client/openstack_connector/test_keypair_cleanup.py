@@ -0,0 +1,97 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from simple_vm_client.openstack_connector.keypair_cleanup import KeypairCleanup
+
+
+class TestKeypairCleanup(unittest.TestCase):
+    def setUp(self):
+        self.list_keypair_names = MagicMock(return_value=[])
+        self.delete_keypair = MagicMock()
+        self.cleanup = KeypairCleanup(
+            list_keypair_names=self.list_keypair_names,
+            delete_keypair=self.delete_keypair,
+            sweep_interval=0,
+        )
+
+    def tearDown(self):
+        self.cleanup.stop(timeout=5)
+
+    def test_enqueue_deletes_in_background(self):
+        deleted = threading.Event()
+        self.delete_keypair.side_effect = lambda key_name: deleted.set()
+        self.cleanup.enqueue("abc_vm_project")
+        self.assertTrue(deleted.wait(5))
+        self.delete_keypair.assert_called_once_with("abc_vm_project")
+
+    def test_stop_deletes_queued_keypairs(self):
+        self.cleanup.enqueue("abc_vm1_project")
+        self.cleanup.enqueue("abc_vm2_project")
+        self.cleanup.stop(timeout=5)
+        self.assertEqual(self.delete_keypair.call_count, 2)
+        self.assertEqual(self.cleanup.pending(), 0)
+
+    def test_delete_failure_is_logged(self):
+        self.delete_keypair.side_effect = Exception("nova down")
+        self.assertFalse(self.cleanup.delete("abc_vm_project"))
+
+    def test_sweep_deletes_keypairs_seen_twice(self):
+        self.cleanup.record("abc_vm1_project")
+        self.cleanup.record("def_vm2_project")
+        self.list_keypair_names.return_value = ["abc_vm1_project"]
+        self.assertEqual(self.cleanup.sweep(), [])
+        self.delete_keypair.assert_not_called()
+
+        self.list_keypair_names.return_value = ["abc_vm1_project", "def_vm2_project"]
+        self.assertEqual(self.cleanup.sweep(), ["abc_vm1_project"])
+        self.delete_keypair.assert_called_once_with("abc_vm1_project")
+
+        self.list_keypair_names.return_value = ["def_vm2_project"]
+        self.assertEqual(self.cleanup.sweep(), ["def_vm2_project"])
+
+    def test_sweep_skips_keypairs_not_recorded(self):
+        self.list_keypair_names.return_value = ["abc_vm1_project"]
+        self.cleanup.sweep()
+        self.assertEqual(self.cleanup.sweep(), [])
+        self.delete_keypair.assert_not_called()
+
+    def test_deleted_keypairs_are_not_swept(self):
+        self.cleanup.record("abc_vm1_project")
+        self.assertTrue(self.cleanup.delete("abc_vm1_project"))
+        self.list_keypair_names.return_value = ["abc_vm1_project"]
+        self.cleanup.sweep()
+        self.assertEqual(self.cleanup.sweep(), [])
+        self.delete_keypair.assert_called_once_with("abc_vm1_project")
+
+    def test_sweep_forgets_keypairs_missing_twice(self):
+        self.cleanup.record("abc_vm1_project")
+        self.cleanup.sweep()
+        self.assertIn("abc_vm1_project", self.cleanup._created)
+        self.cleanup.sweep()
+        self.assertNotIn("abc_vm1_project", self.cleanup._created)
+
+    def test_sweep_skips_keypairs_which_are_gone(self):
+        self.cleanup.record("abc_vm1_project")
+        self.list_keypair_names.return_value = ["abc_vm1_project"]
+        self.cleanup.sweep()
+        self.list_keypair_names.return_value = []
+        self.cleanup.sweep()
+        self.list_keypair_names.return_value = ["abc_vm1_project"]
+        self.assertEqual(self.cleanup.sweep(), [])
+        self.delete_keypair.assert_not_called()
+
+    def test_sweep_list_failure(self):
+        self.list_keypair_names.side_effect = Exception("nova down")
+        self.assertEqual(self.cleanup.sweep(), [])
+
+    def test_periodic_sweep(self):
+        swept = threading.Event()
+        self.list_keypair_names.side_effect = lambda: swept.set() or []
+        self.cleanup.sweep_interval = 0.01
+        self.cleanup.start()
+        self.assertTrue(swept.wait(5))
+
+
+if __name__ == "__main__":
+    unittest.main()
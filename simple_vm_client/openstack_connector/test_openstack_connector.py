@@ -1,3 +1,6 @@
+import email
+import gzip
+import math
 import os
 import random
 import socket
@@ -23,7 +26,14 @@ from openstack.test import fakes
 from simple_vm_client.forc_connector.template.template import (
     ResearchEnvironmentMetadata,
 )
-from simple_vm_client.openstack_connector.openstack_connector import OpenStackConnector
+from simple_vm_client.openstack_connector.openstack_connector import (
+    IMAGE_PATCH_CONTENT_TYPE,
+    OpenStackConnector,
+)
+from simple_vm_client.openstack_connector.userdata import (
+    NOVA_USERDATA_LIMIT,
+    encoded_size,
+)
 from simple_vm_client.ttypes import (
     DefaultException,
     FlavorNotFoundException,
@@ -35,6 +45,7 @@ from simple_vm_client.ttypes import (
     VolumeNotFoundException,
 )
 from simple_vm_client.util.state_enums import VmStates, VmTaskStates
+from simple_vm_client.util.ttl_cache import TTLCache
 
 METADATA_EXAMPLE_NO_FORC = ResearchEnvironmentMetadata(
     template_name="example_template",
@@ -122,6 +133,7 @@ IMAGES = [
     ),
     INACTIVE_IMAGE,
 ]
+ACTIVE_IMAGES = [image for image in IMAGES if image.status == "active"]
 PORT_CALCULATION = "30000 + oct4 + oct3 * 256"
 DEFAULT_SECURITY_GROUPS = ["defaultSimpleVM"]
 CONFIG_DATA = f"""
@@ -177,6 +189,11 @@ class TestOpenStackConnector(unittest.TestCase):
                 self.mock_openstack_connection
             )
             self.openstack_connector.DEFAULT_SECURITY_GROUPS = DEFAULT_SECURITY_GROUPS
+            self.openstack_connector.resource_cache = TTLCache(ttl=60)
+            self.openstack_connector.limits_cache = TTLCache(ttl=10)
+            self.openstack_connector.resource_handles = TTLCache(ttl=math.inf)
+            self.openstack_connector.keypair_cleanup = MagicMock()
+            self.openstack_connector.USERDATA_FORMAT = "plain"
             self.openstack_connector.DEACTIVATE_UPGRADES_SCRIPT = (
                 self.openstack_connector.create_deactivate_update_script()
             )
@@ -196,6 +213,10 @@ class TestOpenStackConnector(unittest.TestCase):
             openstack_connector = OpenStackConnector(None, None)
             openstack_connector.openstack_connection = self.mock_openstack_connection
             openstack_connector.DEFAULT_SECURITY_GROUPS = DEFAULT_SECURITY_GROUPS
+            openstack_connector.resource_cache = TTLCache(ttl=60)
+            openstack_connector.limits_cache = TTLCache(ttl=10)
+            openstack_connector.resource_handles = TTLCache(ttl=math.inf)
+            openstack_connector.keypair_cleanup = MagicMock()
 
         return openstack_connector
 
@@ -479,13 +500,40 @@ class TestOpenStackConnector(unittest.TestCase):
         mock_logger_debug.assert_any_call("Fetching all images")
         image_names = [image.name for image in IMAGES]
 
-        mock_logger_debug.assert_any_call(
-            "Images fetched successfully",
-            extra={"count": len(IMAGES), "image_names": image_names},
+        extra = next(
+            c.kwargs["extra"]
+            for c in mock_logger_debug.call_args_list
+            if c.args == ("Images fetched successfully",)
         )
+        self.assertEqual(extra["count"], len(IMAGES))
+        self.assertEqual(extra["image_names"].resolve(), image_names)
 
-        # Assert that the method returns the expected result
-        self.assertEqual(result, IMAGES)
+        # only active images are returned, the cache keeps all of them
+        self.assertEqual(result, ACTIVE_IMAGES)
+        self.mock_openstack_connection.image.images.assert_called_once_with()
+
+    def test_get_images_refetches_pending_images(self):
+        snapshot = image_module.Image(
+            id="snapshot_id", status="queued", name="snapshot", tags=["portalclient"]
+        )
+        active_snapshot = image_module.Image(
+            id="snapshot_id", status="active", name="snapshot", tags=["portalclient"]
+        )
+        self.mock_openstack_connection.image.images.side_effect = [
+            IMAGES + [snapshot],
+            IMAGES + [active_snapshot],
+            IMAGES + [active_snapshot],
+        ]
+
+        self.assertEqual(self.openstack_connector.get_images(), ACTIVE_IMAGES)
+        self.assertEqual(
+            self.openstack_connector.get_images(), ACTIVE_IMAGES + [active_snapshot]
+        )
+        # nothing pending anymore, served from the cache
+        self.assertEqual(
+            self.openstack_connector.get_images(), ACTIVE_IMAGES + [active_snapshot]
+        )
+        self.assertEqual(self.mock_openstack_connection.image.images.call_count, 2)
 
     @patch("simple_vm_client.openstack_connector.openstack_connector.logger.debug")
     def test_get_private_images(self, mock_logger_debug):
@@ -497,10 +545,13 @@ class TestOpenStackConnector(unittest.TestCase):
         mock_logger_debug.assert_any_call("Fetching private images")
         image_names = [image.name for image in IMAGES]
 
-        mock_logger_debug.assert_any_call(
-            "Private images fetched successfully",
-            extra={"count": len(IMAGES), "image_names": image_names},
+        extra = next(
+            c.kwargs["extra"]
+            for c in mock_logger_debug.call_args_list
+            if c.args == ("Private images fetched successfully",)
         )
+        self.assertEqual(extra["count"], len(IMAGES))
+        self.assertEqual(extra["image_names"].resolve(), image_names)
 
         # Assert that the method returns the expected result
         self.assertEqual(result, IMAGES)
@@ -596,6 +647,66 @@ class TestOpenStackConnector(unittest.TestCase):
         )
         self.openstack_connector.get_limits()
 
+    def _mock_limits(self):
+        self.mock_openstack_connection.get_compute_limits.return_value = {
+            "max_total_cores": 64,
+            "max_total_instances": 10,
+            "max_total_ram_size": 131072,
+            "total_cores_used": 8,
+            "total_instances_used": 2,
+            "total_ram_used": 16384,
+        }
+        self.mock_openstack_connection.get_volume_limits.return_value = {
+            "absolute": {
+                "max_total_volumes": 20,
+                "max_total_volume_gigabytes": 1000,
+                "total_volumes_used": 3,
+                "total_gigabytes_used": 150,
+            }
+        }
+
+    def test_get_limits_is_cached(self):
+        self._mock_limits()
+        limits = self.openstack_connector.get_limits()
+        self.assertEqual(limits["ram_limit"], "128")
+        self.assertEqual(limits["current_used_vms"], "2")
+        self.assertEqual(limits["current_used_volume_storage"], "150")
+        limits["vms_limit"] = "changed"
+
+        self.assertEqual(self.openstack_connector.get_limits()["vms_limit"], "10")
+        self.mock_openstack_connection.get_compute_limits.assert_called_once()
+        self.mock_openstack_connection.get_volume_limits.assert_called_once()
+
+    def test_get_limits_cache_dropped_on_changes(self):
+        self._mock_limits()
+        self.openstack_connector.get_limits()
+        self.openstack_connector.delete_volume("volume_id")
+        self.openstack_connector.get_limits()
+        self.assertEqual(
+            self.mock_openstack_connection.get_compute_limits.call_count, 2
+        )
+
+    def test_is_token_valid(self):
+        self.mock_openstack_connection.session.get_token.return_value = "token"
+        self.mock_openstack_connection.identity.head.return_value = MagicMock(
+            status_code=200
+        )
+        self.assertTrue(self.openstack_connector.is_token_valid())
+        self.mock_openstack_connection.identity.head.assert_called_once_with(
+            "/auth/tokens", headers={"X-Subject-Token": "token"}
+        )
+        self.mock_openstack_connection.get_compute_limits.assert_not_called()
+
+        self.mock_openstack_connection.identity.head.return_value = MagicMock(
+            status_code=404, headers={}
+        )
+        self.assertFalse(self.openstack_connector.is_token_valid())
+
+        self.mock_openstack_connection.session.get_token.side_effect = Exception(
+            "Keystone unreachable"
+        )
+        self.assertFalse(self.openstack_connector.is_token_valid())
+
     @patch("simple_vm_client.openstack_connector.openstack_connector.logger.info")
     @patch("simple_vm_client.openstack_connector.openstack_connector.logger.error")
     def test_create_server(self, mock_logger_error, mock_logger_info):
@@ -1208,6 +1319,47 @@ class TestOpenStackConnector(unittest.TestCase):
         )
         mock_logger_error.assert_not_called()  # Ensure no exception is logged
 
+    def test_get_network_is_cached(self):
+        network = fakes.generate_fake_resource(Network)
+        self.mock_openstack_connection.get_network.return_value = network
+        self.assertIs(self.openstack_connector.get_network(), network)
+        self.assertIs(self.openstack_connector.get_network(), network)
+        self.mock_openstack_connection.get_network.assert_called_once()
+
+    def test_network_is_resolved_again_after_failed_server_create(self):
+        self.mock_openstack_connection.get_network.return_value = (
+            fakes.generate_fake_resource(Network)
+        )
+        network = self.openstack_connector.get_network()
+        self.mock_openstack_connection.create_server.side_effect = (
+            OpenStackCloudException(message="Network not found")
+        )
+        with self.assertRaises(OpenStackCloudException):
+            self.openstack_connector.create_server(
+                "name", "image", "flavor", network.id, "", "key", {}, []
+            )
+        self.openstack_connector.get_network()
+        self.assertEqual(self.mock_openstack_connection.get_network.call_count, 2)
+
+    def test_add_default_security_groups_to_server(self):
+        self.openstack_connector.DEFAULT_SECURITY_GROUP_NAME = "defaultSimpleVM"
+        self.openstack_connector.DEFAULT_SECURITY_GROUPS = ["defaultSimpleVM"]
+        default_group = fakes.generate_fake_resource(security_group.SecurityGroup)
+        self.mock_openstack_connection.get_security_group.return_value = default_group
+        server = fakes.generate_fake_resource(Server)
+
+        with patch.object(OpenStackConnector, "get_server", return_value=server):
+            for _ in range(2):
+                self.openstack_connector.add_default_security_groups_to_server(
+                    server.id
+                )
+        self.mock_openstack_connection.get_security_group.assert_called_once_with(
+            name_or_id="defaultSimpleVM"
+        )
+        self.mock_openstack_connection.add_server_security_groups.assert_called_with(
+            server=server, security_groups=[default_group]
+        )
+
     @patch("simple_vm_client.openstack_connector.openstack_connector.logger.debug")
     @patch("simple_vm_client.openstack_connector.openstack_connector.logger.info")
     def test_import_existing_keypair(self, mock_logger_info, mock_logger_debug):
@@ -1354,6 +1506,57 @@ class TestOpenStackConnector(unittest.TestCase):
             extra={"owner_key_count": 3, "user_key_count": 1},
         )
 
+    def test_create_launch_keypair(self):
+        key_name = self.openstack_connector.create_launch_keypair(
+            servername="averylongservername", project_name="project", public_key="key"
+        )
+        self.assertRegex(key_name, r"^[0-9a-f]{8}_averylongs_project$")
+        self.mock_openstack_connection.create_keypair.assert_called_once_with(
+            name=key_name, public_key="key"
+        )
+        self.mock_openstack_connection.get_keypair.assert_not_called()
+        self.openstack_connector.keypair_cleanup.record.assert_called_once_with(
+            key_name
+        )
+
+    def test_list_launch_keypair_names(self):
+        names = [
+            "1a2_vm_project",
+            "1a2b3c4d_vm_project",
+            "1a2b3c4d_key",
+            "my_key",
+            "xyz_vm_project",
+        ]
+        key_pairs = []
+        for name in names:
+            key_pair = fakes.generate_fake_resource(keypair.Keypair)
+            key_pair.name = name
+            key_pairs.append(key_pair)
+        self.mock_openstack_connection.list_keypairs.return_value = key_pairs
+        self.assertEqual(
+            self.openstack_connector.list_launch_keypair_names(),
+            ["1a2b3c4d_vm_project"],
+        )
+
+    @patch("simple_vm_client.openstack_connector.openstack_connector.logger.info")
+    def test_delete_keypair(self, mock_logger_info):
+        self.mock_openstack_connection.delete_keypair.return_value = True
+        self.openstack_connector.delete_keypair(key_name="key")
+        self.mock_openstack_connection.delete_keypair.assert_called_once_with(
+            name="key"
+        )
+        self.mock_openstack_connection.get_keypair.assert_not_called()
+        mock_logger_info.assert_called_with(
+            "Keypair deleted successfully", extra={"keyname": "key"}
+        )
+
+    def test_delete_keypair_not_found(self):
+        self.mock_openstack_connection.delete_keypair.return_value = False
+        self.openstack_connector.delete_keypair(key_name="key")
+        self.mock_openstack_connection.delete_keypair.assert_called_once_with(
+            name="key"
+        )
+
     @patch("simple_vm_client.openstack_connector.openstack_connector.socket.socket")
     @patch("simple_vm_client.openstack_connector.openstack_connector.logger.debug")
     def test_netcat(self, mock_logger_debug, mock_socket):
@@ -1442,6 +1645,63 @@ class TestOpenStackConnector(unittest.TestCase):
             get_extra=True
         )
 
+    def test_get_flavors_and_images_cached(self):
+        expected_flavors = list(fakes.generate_fake_resources(flavor.Flavor, count=3))
+        self.mock_openstack_connection.list_flavors.return_value = expected_flavors
+        self.mock_openstack_connection.image.images.return_value = IMAGES
+
+        self.openstack_connector.get_flavors()
+        self.assertEqual(self.openstack_connector.get_flavors(), expected_flavors)
+        self.openstack_connector.get_images()
+        self.assertEqual(self.openstack_connector.get_images(), ACTIVE_IMAGES)
+
+        self.mock_openstack_connection.list_flavors.assert_called_once()
+        self.mock_openstack_connection.image.images.assert_called_once()
+
+    def test_delete_image_invalidates_image_cache(self):
+        self.mock_openstack_connection.image.images.return_value = IMAGES
+        self.openstack_connector.get_images()
+        self.openstack_connector.delete_image("image_id")
+        self.openstack_connector.get_images()
+        self.assertEqual(self.mock_openstack_connection.image.images.call_count, 2)
+
+    def test_warmup(self):
+        self.openstack_connector.NETWORK = "portalexternalnetwork"
+        self.openstack_connector.DEFAULT_SECURITY_GROUP_NAME = "defaultSimpleVM"
+        expected_flavors = list(fakes.generate_fake_resources(flavor.Flavor, count=3))
+        self.mock_openstack_connection.list_flavors.return_value = expected_flavors
+        self.mock_openstack_connection.image.images.return_value = IMAGES
+
+        durations = self.openstack_connector.warmup()
+
+        self.assertEqual(
+            set(durations),
+            {
+                "flavors",
+                "images",
+                "network",
+                "default_security_group",
+                "security_groups",
+            },
+        )
+        self.mock_openstack_connection.get_network.assert_called_once_with(
+            name_or_id="portalexternalnetwork"
+        )
+        self.mock_openstack_connection.get_security_group.assert_called_once_with(
+            name_or_id="defaultSimpleVM"
+        )
+        self.mock_openstack_connection.list_security_groups.assert_called_once()
+        # the first requests are served from the warm cache
+        self.assertEqual(self.openstack_connector.get_flavors(), expected_flavors)
+        self.assertEqual(self.openstack_connector.get_images(), ACTIVE_IMAGES)
+        self.mock_openstack_connection.list_flavors.assert_called_once()
+        self.mock_openstack_connection.image.images.assert_called_once()
+
+    def test_warmup_failure(self):
+        self.mock_openstack_connection.list_flavors.side_effect = Exception("down")
+        with self.assertRaises(Exception):
+            self.openstack_connector.warmup()
+
     @mock.patch("simple_vm_client.openstack_connector.openstack_connector.logger.debug")
     def test_get_servers_by_bibigrid_id(self, mock_logger_debug):
         # Replace with the actual Bibigrid ID you want to test
@@ -1483,7 +1743,11 @@ class TestOpenStackConnector(unittest.TestCase):
 
         # Mock the create_image_snapshot and image.add_tag methods
         self.mock_openstack_connection.create_image_snapshot.return_value = new_snapshot
-        self.mock_openstack_connection.image.add_tag.return_value = None
+        self.mock_openstack_connection.image.get_image.return_value = new_snapshot
+        new_snapshot.tags = []
+        self.mock_openstack_connection.image.patch.return_value = MagicMock(
+            status_code=200
+        )
 
         # Case 1: No exception
         result_snapshot_id = self.openstack_connector.create_snapshot(
@@ -1506,8 +1770,17 @@ class TestOpenStackConnector(unittest.TestCase):
                 "snapshot_id": new_snapshot.id,
                 "server_id": openstack_id,
                 "snapshot_name": name,
+                "create_duration": mock.ANY,
+                "tag_duration": mock.ANY,
+                "tag_method": "patch",
             },
         )
+        self.mock_openstack_connection.image.patch.assert_called_once_with(
+            f"/images/{new_snapshot.id}",
+            json=[{"op": "replace", "path": "/tags", "value": base_tags}],
+            headers={"Content-Type": IMAGE_PATCH_CONTENT_TYPE},
+        )
+        self.mock_openstack_connection.image.add_tag.assert_not_called()
 
         # Case 2: ConflictException
         self.mock_openstack_connection.create_image_snapshot.side_effect = (
@@ -1532,6 +1805,67 @@ class TestOpenStackConnector(unittest.TestCase):
                 openstack_id, name, username, base_tags, description
             )
 
+    def test_add_image_tags_without_tags(self):
+        self.assertEqual(
+            self.openstack_connector.add_image_tags("image_id", []), "none"
+        )
+        self.mock_openstack_connection.image.patch.assert_not_called()
+        self.mock_openstack_connection.image.add_tag.assert_not_called()
+
+    def test_add_image_tags_keeps_existing_tags(self):
+        self.mock_openstack_connection.image.get_image.return_value = MagicMock(
+            tags=["existing", "tag1"]
+        )
+        self.mock_openstack_connection.image.patch.return_value = MagicMock(
+            status_code=200
+        )
+        self.assertEqual(
+            self.openstack_connector.add_image_tags("image_id", ["tag1", "tag2"]),
+            "patch",
+        )
+        self.mock_openstack_connection.image.get_image.assert_called_once_with(
+            "image_id"
+        )
+        self.mock_openstack_connection.image.patch.assert_called_once_with(
+            "/images/image_id",
+            json=[
+                {
+                    "op": "replace",
+                    "path": "/tags",
+                    "value": ["existing", "tag1", "tag2"],
+                }
+            ],
+            headers={"Content-Type": IMAGE_PATCH_CONTENT_TYPE},
+        )
+
+    def test_add_image_tags_falls_back_to_add_tag(self):
+        self.mock_openstack_connection.image.patch.return_value = MagicMock(
+            status_code=403, headers={}
+        )
+        self.assertEqual(
+            self.openstack_connector.add_image_tags(
+                "image_id", ["tag1", "tag2", "tag1"]
+            ),
+            "add_tag",
+        )
+        self.assertEqual(
+            sorted(
+                call.kwargs["tag"]
+                for call in self.mock_openstack_connection.image.add_tag.call_args_list
+            ),
+            ["tag1", "tag2"],
+        )
+
+    def test_add_image_tags_add_tag_error(self):
+        self.mock_openstack_connection.image.patch.side_effect = (
+            OpenStackCloudException(message="patch failed")
+        )
+        self.mock_openstack_connection.image.add_tag.side_effect = (
+            OpenStackCloudException(message="tag failed")
+        )
+        with self.assertRaises(OpenStackCloudException):
+            self.openstack_connector.add_image_tags("image_id", ["tag1"])
+
     def test_delete_image_not_found(self):
         self.openstack_connector.openstack_connection.get_image.return_value = None
         with self.assertRaises(Exception):
@@ -1679,6 +2013,79 @@ class TestOpenStackConnector(unittest.TestCase):
         )
         self.assertEqual(result, mock_server["id"])
 
+    @patch.object(OpenStackConnector, "get_image")
+    @patch.object(OpenStackConnector, "get_flavor")
+    @patch.object(OpenStackConnector, "get_network")
+    @patch.object(OpenStackConnector, "create_server")
+    def test_scale_up_cluster(
+        self, mock_create_server, mock_get_network, mock_get_flavor, mock_get_image
+    ):
+        cluster_id = "123"
+        master = fakes.generate_fake_resource(Server)
+        master.name = f"bibigrid-master-{cluster_id}"
+        master.metadata = {}
+        worker = fakes.generate_fake_resource(Server)
+        worker.metadata = {"bibigrid-id": cluster_id, "user": "user1"}
+        worker.key_name = "key1"
+        worker.security_groups = [{"name": "group1"}, {"name": "group2"}]
+        self.mock_openstack_connection.list_servers.return_value = [master, worker]
+
+        def create_server(name, **kwargs):
+            if name == "worker3":
+                raise OpenStackCloudException("quota exceeded")
+            return {"id": f"id-{name}"}
+
+        mock_create_server.side_effect = create_server
+
+        result = self.openstack_connector.scale_up_cluster(
+            cluster_id=cluster_id,
+            image_name="image1",
+            flavor_name="flavor1",
+            count=4,
+            names=["worker1", "worker2", "worker3"],
+            start_idx=5,
+            batch_idx=2,
+        )
+
+        self.assertEqual(
+            result,
+            {
+                "server_ids": [
+                    "id-worker1",
+                    "id-worker2",
+                    f"id-bibigrid-worker-{cluster_id}-2-8",
+                ],
+                "failed": ["worker3"],
+            },
+        )
+        mock_get_image.assert_called_once_with(
+            name_or_id="image1", replace_inactive=True
+        )
+        mock_get_flavor.assert_called_once_with(name_or_id="flavor1")
+        mock_get_network.assert_called_once()
+        self.assertEqual(mock_create_server.call_count, 4)
+        mock_create_server.assert_any_call(
+            name="worker2",
+            image_id=mock_get_image.return_value.id,
+            flavor_id=mock_get_flavor.return_value.id,
+            network_id=mock_get_network.return_value.id,
+            userdata=self.openstack_connector.DEACTIVATE_UPGRADES_SCRIPT,
+            key_name="key1",
+            metadata={
+                "bibigrid-id": cluster_id,
+                "user": "user1",
+                "worker-batch": "2",
+                "name": "worker2",
+                "worker-index": "6",
+            },
+            security_groups=["group1", "group2"],
+        )
+
+    def test_get_cluster_reference_server_not_found(self):
+        self.mock_openstack_connection.list_servers.return_value = []
+        with self.assertRaises(DefaultException):
+            self.openstack_connector.get_cluster_reference_server(cluster_id="123")
+
     def test_add_udp_security_group_existing_group(self):
         # Test when an existing UDP security group is found
         server = fakes.generate_fake_resource(Server)
@@ -1789,12 +2196,10 @@ class TestOpenStackConnector(unittest.TestCase):
     @patch.object(OpenStackConnector, "_get_security_groups_starting_machine")
     @patch.object(OpenStackConnector, "_get_volumes_machines_start")
     @patch.object(OpenStackConnector, "create_userdata")
-    @patch.object(OpenStackConnector, "delete_keypair")
     @patch("simple_vm_client.openstack_connector.openstack_connector.logger.info")
     def test_start_server_with_playbook(
         self,
         mock_logger_info,
-        mock_delete_keypair,
         mock_create_userdata,
         mock_get_volumes,
         mock_get_security_groups_starting_machine,
@@ -1881,6 +2286,7 @@ class TestOpenStackConnector(unittest.TestCase):
             metadata_token="test",
             metadata_endpoint=None,
             additional_script="",
+            userdata_format="plain",
         )
 
         mock_get_security_groups_starting_machine.assert_called_once_with(
@@ -1899,7 +2305,9 @@ class TestOpenStackConnector(unittest.TestCase):
             volume_ids_path_attach=volume_ids_path_attach,
         )
 
-        mock_delete_keypair.assert_called_once_with(key_name=server_keypair.name)
+        self.openstack_connector.keypair_cleanup.enqueue.assert_called_once_with(
+            server_keypair.name
+        )
 
         # Check the result
         self.assertEqual(result, (server.id, server_keypair.private_key))
@@ -1923,12 +2331,10 @@ class TestOpenStackConnector(unittest.TestCase):
     @patch.object(OpenStackConnector, "_get_security_groups_starting_machine")
     @patch.object(OpenStackConnector, "_get_volumes_machines_start")
     @patch.object(OpenStackConnector, "create_userdata")
-    @patch.object(OpenStackConnector, "delete_keypair")
     @patch("simple_vm_client.openstack_connector.openstack_connector.logger.error")
     def test_start_server_with_playbook_exception(
         self,
         mock_logger_error,
-        mock_delete_keypair,
         mock_create_userdata,
         mock_get_volumes,
         mock_get_security_groups_starting_machine,
@@ -1985,7 +2391,9 @@ class TestOpenStackConnector(unittest.TestCase):
                 additional_user_keys=additional_user_keys,
                 additional_security_group_ids=additional_security_group_ids,
             )
-        mock_delete_keypair.assert_called_once_with(key_name=server_keypair.name)
+        self.openstack_connector.keypair_cleanup.enqueue.assert_called_once_with(
+            server_keypair.name
+        )
         mock_logger_error.assert_called_once_with(
             "Failed to start server with playbook",
             extra={
@@ -2104,10 +2512,8 @@ class TestOpenStackConnector(unittest.TestCase):
     @patch.object(OpenStackConnector, "_get_security_groups_starting_machine")
     @patch.object(OpenStackConnector, "_get_volumes_machines_start")
     @patch.object(OpenStackConnector, "create_userdata")
-    @patch.object(OpenStackConnector, "delete_keypair")
     def test_start_server(
         self,
-        mock_delete_keypair,
         mock_create_userdata,
         mock_get_volumes,
         mock_get_security_groups_starting_machine,
@@ -2202,6 +2608,7 @@ class TestOpenStackConnector(unittest.TestCase):
             metadata_token="test",
             metadata_endpoint=None,
             additional_script="",
+            userdata_format="plain",
         )
 
         mock_get_security_groups_starting_machine.assert_called_once_with(
@@ -2220,10 +2627,14 @@ class TestOpenStackConnector(unittest.TestCase):
             volume_ids_path_attach=volume_ids_path_attach,
         )
 
-        self.openstack_connector.openstack_connection.get_keypair.assert_called_once_with(
-            name_or_id=ANY
+        self.openstack_connector.openstack_connection.get_keypair.assert_not_called()
+        key_name = self.openstack_connector.openstack_connection.create_keypair.call_args.kwargs[
+            "name"
+        ]
+        self.assertRegex(key_name, rf"^[0-9a-f]{{8}}_{server.name[:10]}_mock_project$")
+        self.openstack_connector.keypair_cleanup.enqueue.assert_called_once_with(
+            key_name
         )
-        mock_delete_keypair.assert_any_call(key_name=ANY)
 
         # Check the result
         self.assertEqual(result, server.id)
@@ -2231,12 +2642,10 @@ class TestOpenStackConnector(unittest.TestCase):
     @patch.object(OpenStackConnector, "_get_security_groups_starting_machine")
     @patch.object(OpenStackConnector, "_get_volumes_machines_start")
     @patch.object(OpenStackConnector, "create_userdata")
-    @patch.object(OpenStackConnector, "delete_keypair")
     @patch("simple_vm_client.openstack_connector.openstack_connector.logger.error")
     def test_start_server_exception(
         self,
         mock_logger_error,
-        mock_delete_keypair,
         mock_create_userdata,
         mock_get_volumes,
         mock_get_security_groups_starting_machine,
@@ -2338,6 +2747,47 @@ class TestOpenStackConnector(unittest.TestCase):
         )
         self.assertEqual(result, expected_result)
 
+    @patch("simple_vm_client.openstack_connector.openstack_connector.logger.info")
+    @patch("simple_vm_client.openstack_connector.openstack_connector.logger.warning")
+    def test_create_userdata_multipart(self, mock_logger_warning, mock_logger_info):
+        owner_keys = [f"ssh-ed25519 {'A' * 68} owner{i}@host" for i in range(600)]
+
+        plain = self.openstack_connector.create_userdata(
+            volume_ids_path_new=None,
+            volume_ids_path_attach=None,
+            additional_owner_keys=owner_keys,
+            additional_user_keys=[],
+            additional_script="echo done",
+        )
+        mock_logger_warning.assert_called_once()
+        self.assertGreater(encoded_size(plain), NOVA_USERDATA_LIMIT)
+        mock_logger_warning.reset_mock()
+
+        packed = self.openstack_connector.create_userdata(
+            volume_ids_path_new=None,
+            volume_ids_path_attach=None,
+            additional_owner_keys=owner_keys,
+            additional_user_keys=[],
+            additional_script="echo done",
+            userdata_format="multipart",
+        )
+        mock_logger_warning.assert_not_called()
+        self.assertLess(encoded_size(packed), NOVA_USERDATA_LIMIT)
+        self.assertEqual(mock_logger_info.call_count, 2)
+        extra = mock_logger_info.call_args.kwargs["extra"]
+        self.assertEqual(extra["userdata_format"], "multipart")
+        self.assertEqual(extra["size"], len(packed))
+        self.assertEqual(extra["encoded_size"], encoded_size(packed))
+        message = email.message_from_bytes(gzip.decompress(packed))
+        self.assertEqual(
+            [part.get_filename() for part in message.get_payload()],
+            [
+                "000-add_keys_to_authorized.sh",
+                "001-unlock_ubuntu_user.sh",
+                "002-additional_script.sh",
+            ],
+        )
+
     @patch.object(OpenStackConnector, "get_server")
     def test_get_vm_ports(self, mock_get_server):
         # Set up mocks
@@ -3181,21 +3631,11 @@ class TestOpenStackConnector(unittest.TestCase):
         self.assertEqual(result.id, new_security_group.id)
         self.openstack_connector.openstack_connection.create_security_group.assert_called_once()
 
-    @patch("simple_vm_client.openstack_connector.openstack_connector.os.path.dirname")
-    @patch("simple_vm_client.openstack_connector.openstack_connector.os.path.abspath")
-    @patch("simple_vm_client.openstack_connector.openstack_connector.os.path.join")
     @patch(
-        "simple_vm_client.openstack_connector.openstack_connector.open",
-        new_callable=unittest.mock.mock_open,
-        read_data="mock_script_content",
+        "simple_vm_client.openstack_connector.openstack_connector.render_mount_script"
     )
-    def test_create_mount_init_script(
-        self, mock_open, mock_join, mock_abspath, mock_dirname
-    ):
-        # Mock the relevant parts for os.path operations
-        mock_abspath.return_value = "/mock/absolute/path"
-        mock_dirname.return_value = "/mock/directory"
-        mock_join.return_value = "/mock/join/path"
+    def test_create_mount_init_script(self, mock_render_mount_script):
+        mock_render_mount_script.return_value = b"mock_script_content"
 
         # Call the method with sample volume data
         result = self.openstack_connector.create_mount_init_script(
@@ -3205,8 +3645,9 @@ class TestOpenStackConnector(unittest.TestCase):
 
         # Assertions
         self.assertEqual(result, b"mock_script_content")
-        mock_open.assert_called_once_with("/mock/join/path", "r")
-        mock_open().read.assert_called_once()
+        mock_render_mount_script.assert_called_once_with(
+            (("vol_id_1", "/path_1"),), (("vol_id_2", "/path_2"),)
+        )
 
     def test_create_mount_init_script_no_volumes(self):
         result = self.openstack_connector.create_mount_init_script(
@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import MagicMock
+
+from requests.adapters import HTTPAdapter
+
+from simple_vm_client.openstack_connector.session_metrics import SessionMetrics
+
+
+class FakeAuth:
+    def __init__(self):
+        self.tokens = 0
+
+    def get_auth_ref(self, sess, **kwargs):
+        self.tokens += 1
+        return f"token-{self.tokens}"
+
+
+class TestSessionMetrics(unittest.TestCase):
+    def setUp(self):
+        self.auth = FakeAuth()
+        self.adapter = HTTPAdapter()
+        self.metrics = SessionMetrics(auth=self.auth, adapter=self.adapter)
+
+    def test_counts_authentications(self):
+        self.assertEqual(self.metrics.as_dict()["authentications"], 0)
+        for _ in range(3):
+            self.auth.get_auth_ref(None)
+        self.assertEqual(self.metrics.authentications, 3)
+        self.assertEqual(self.metrics.reauthentications, 2)
+
+    def test_verify_reuse(self):
+        sess = MagicMock()
+        sess.get_token.return_value = "token"
+        sess.session.get_adapter.return_value = self.adapter
+        self.assertTrue(self.metrics.verify_reuse(sess))
+
+        sess.session.get_adapter.return_value = HTTPAdapter()
+        self.assertFalse(self.metrics.verify_reuse(sess))
+
+    def test_verify_reuse_new_token(self):
+        sess = MagicMock()
+        sess.get_token.side_effect = lambda: self.auth.get_auth_ref(None)
+        sess.session.get_adapter.return_value = self.adapter
+        self.assertFalse(self.metrics.verify_reuse(sess))
+
+    def test_pool_counters(self):
+        pool = self.adapter.poolmanager.connection_from_host(
+            "keystone.example.org", port=443, scheme="https"
+        )
+        pool.num_connections = 2
+        pool.num_requests = 10
+        self.assertEqual(
+            self.metrics.as_dict(),
+            {
+                "authentications": 0,
+                "reauthentications": 0,
+                "pools": 1,
+                "connections": 2,
+                "requests": 10,
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import email
+import gzip
+import unittest
+from unittest.mock import mock_open, patch
+
+from simple_vm_client.openstack_connector import userdata
+from simple_vm_client.openstack_connector.userdata import (
+    USERDATA_FORMAT_MULTIPART,
+    USERDATA_FORMAT_PLAIN,
+    ScriptTemplate,
+    bash_array,
+    clear_userdata_cache,
+    encoded_size,
+    load_script_template,
+    pack_userdata,
+    render_add_keys_script,
+    render_mount_script,
+    render_save_metadata_auth_token_script,
+    volume_pairs,
+)
+
+
+class TestScriptTemplate(unittest.TestCase):
+    def test_substitute(self):
+        template = ScriptTemplate(
+            "a=KEYS_TO_ADD\nb=OWNER_KEYS_TO_ADD\n", ["KEYS_TO_ADD", "OWNER_KEYS_TO_ADD"]
+        )
+        self.assertEqual(
+            template.substitute({"KEYS_TO_ADD": "(1 )", "OWNER_KEYS_TO_ADD": "(2 )"}),
+            b"a=(1 )\nb=(2 )\n",
+        )
+
+    def test_values_are_not_substituted_again(self):
+        template = ScriptTemplate("A B", ["A", "B"])
+        self.assertEqual(template.substitute({"A": "B", "B": "A"}), b"B A")
+
+    def test_without_placeholders(self):
+        self.assertEqual(ScriptTemplate("echo ü", []).substitute({}), "echo ü".encode())
+
+    def test_bash_array(self):
+        self.assertEqual(bash_array([]), "()")
+        self.assertEqual(bash_array(["/a", "/b"]), "(/a /b )")
+        self.assertEqual(bash_array(["k1", "k2"], quote=True), '("k1" "k2" )')
+
+
+class TestRenderScripts(unittest.TestCase):
+    def setUp(self):
+        clear_userdata_cache()
+
+    def test_render_add_keys_script(self):
+        script = render_add_keys_script(("owner",), ("user1", "user2"))
+        self.assertIn(
+            b'declare -a additional_user_keys_to_add=("user1" "user2" )', script
+        )
+        self.assertIn(b'declare -a additional_owner_keys_to_add=("owner" )', script)
+
+    def test_render_mount_script(self):
+        script = render_mount_script(
+            volume_pairs([{"openstack_id": "a" * 36, "path": "/vol/a"}]),
+            volume_pairs(None),
+        )
+        self.assertIn(f"volumes_new=(virtio-{'a' * 20} )".encode(), script)
+        self.assertIn(b"paths_new=(/vol/a )", script)
+        self.assertIn(b"volumes_attach=()", script)
+        self.assertIn(b"paths_attach=()", script)
+
+    def test_render_save_metadata_auth_token_script(self):
+        script = render_save_metadata_auth_token_script(
+            token="secret", metadata_endpoint="http://metadata/info"
+        )
+        self.assertIn(b"TOKEN_ESCAPED='secret'", script)
+        self.assertIn(b"METADATA_INFO_ENDPOINT_ESCAPED='http://metadata/info'", script)
+        self.assertNotIn(b"REPLACE_WITH_ACTUAL", script)
+
+    def test_identical_arguments_reuse_the_script(self):
+        first = render_add_keys_script(("owner",), ())
+        self.assertIs(render_add_keys_script(("owner",), ()), first)
+        self.assertEqual(render_add_keys_script.cache_info().hits, 1)
+
+    def test_template_is_read_once(self):
+        load_script_template.cache_clear()
+        try:
+            with patch.object(
+                userdata, "open", mock_open(read_data="X=PLACEHOLDER"), create=True
+            ) as mocked_open:
+                for _ in range(3):
+                    template = load_script_template("test.sh", ("PLACEHOLDER",))
+                    self.assertEqual(template.substitute({"PLACEHOLDER": "1"}), b"X=1")
+            mocked_open.assert_called_once()
+        finally:
+            load_script_template.cache_clear()
+
+
+class TestPackUserdata(unittest.TestCase):
+    def setUp(self):
+        self.scripts = [
+            ("keys.sh", b"#!/bin/bash\n" + b"echo key >> authorized_keys\n" * 500),
+            ("additional_script.sh", b"echo done"),
+        ]
+
+    def test_plain(self):
+        payload, used_format = pack_userdata(self.scripts, USERDATA_FORMAT_PLAIN)
+        self.assertEqual(used_format, USERDATA_FORMAT_PLAIN)
+        self.assertEqual(payload, self.scripts[0][1] + b"\n" + b"echo done")
+
+    def test_multipart(self):
+        payload, used_format = pack_userdata(self.scripts, USERDATA_FORMAT_MULTIPART)
+        self.assertEqual(used_format, USERDATA_FORMAT_MULTIPART)
+        self.assertLess(len(payload), len(self.scripts[0][1]))
+
+        message = email.message_from_bytes(gzip.decompress(payload))
+        self.assertTrue(message.is_multipart())
+        parts = message.get_payload()
+        self.assertEqual(
+            [part.get_filename() for part in parts],
+            ["000-keys.sh", "001-additional_script.sh"],
+        )
+        self.assertEqual(parts[0].get_content_type(), "text/x-shellscript")
+        self.assertEqual(parts[0].get_payload(decode=True), self.scripts[0][1])
+        # every part needs its own interpreter line
+        self.assertEqual(parts[1].get_payload(decode=True), b"#!/bin/bash\necho done")
+
+    def test_multipart_is_deterministic(self):
+        self.assertEqual(
+            pack_userdata(self.scripts, USERDATA_FORMAT_MULTIPART),
+            pack_userdata(list(self.scripts), USERDATA_FORMAT_MULTIPART),
+        )
+
+    def test_multipart_falls_back_to_plain_if_not_smaller(self):
+        scripts = [("unlock.sh", b"#!/bin/bash\npasswd -u ubuntu\n")]
+        payload, used_format = pack_userdata(scripts, USERDATA_FORMAT_MULTIPART)
+        self.assertEqual(used_format, USERDATA_FORMAT_PLAIN)
+        self.assertEqual(payload, scripts[0][1])
+
+    def test_encoded_size(self):
+        self.assertEqual(encoded_size(b""), 0)
+        self.assertEqual(encoded_size(b"a"), 4)
+        self.assertEqual(encoded_size(b"abcd"), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
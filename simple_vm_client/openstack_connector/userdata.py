@@ -0,0 +1,201 @@
+"""Bash scripts which end up in the cloud-init userdata of new VMs.
+
+The scripts are read once and split at their placeholders, filling one in is a
+single join. Key and mount scripts only depend on their arguments, so they are
+cached and identical payloads of a batch start are built only once.
+
+Nova accepts at most 64 KiB of base64 encoded userdata, the multipart format
+packs the scripts into a gzip compressed MIME multipart message which
+cloud-init unpacks on the VM.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import math
+import os
+import re
+from functools import lru_cache
+from typing import Iterable
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts/bash")
+USERDATA_CACHE_SIZE = 128
+NOVA_USERDATA_LIMIT = 65535
+
+USERDATA_FORMAT_PLAIN = "plain"
+USERDATA_FORMAT_MULTIPART = "multipart"
+USERDATA_FORMATS = (USERDATA_FORMAT_PLAIN, USERDATA_FORMAT_MULTIPART)
+
+ADD_KEYS_SCRIPT = "add_keys_to_authorized.sh"
+MOUNT_SCRIPT = "mount.sh"
+SAVE_METADATA_AUTH_TOKEN_SCRIPT = "save_metadata_auth_token.sh"
+
+UNLOCK_UBUNTU_USER_SCRIPT = b"#!/bin/bash\npasswd -u ubuntu\n"
+
+
+class ScriptTemplate:
+    """Script text split into literal parts and the placeholders between them."""
+
+    __slots__ = ("placeholders", "_parts")
+
+    def __init__(self, text: str, placeholders: Iterable[str]):
+        self.placeholders = frozenset(placeholders)
+        if not self.placeholders:
+            self._parts = [text]
+            return
+        # longest first, a placeholder may start with another one
+        pattern = re.compile(
+            "("
+            + "|".join(
+                re.escape(placeholder)
+                for placeholder in sorted(self.placeholders, key=len, reverse=True)
+            )
+            + ")"
+        )
+        # literals at even, placeholders at odd indices
+        self._parts = pattern.split(text)
+
+    def substitute(self, values: dict[str, str]) -> bytes:
+        parts = self._parts.copy()
+        parts[1::2] = [values[placeholder] for placeholder in parts[1::2]]
+        return "".join(parts).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def load_script_template(name: str, placeholders: tuple[str, ...]) -> ScriptTemplate:
+    with open(os.path.join(SCRIPTS_DIR, name), "r") as file:
+        return ScriptTemplate(file.read(), placeholders)
+
+
+def bash_array(values: Iterable[str], quote: bool = False) -> str:
+    """Bash array literal, e.g. ``("a" "b" )``."""
+    if quote:
+        return "(" + "".join(f'"{value}" ' for value in values) + ")"
+    return "(" + "".join(f"{value} " for value in values) + ")"
+
+
+@lru_cache(maxsize=USERDATA_CACHE_SIZE)
+def render_add_keys_script(
+    owner_keys: tuple[str, ...], user_keys: tuple[str, ...]
+) -> bytes:
+    template = load_script_template(
+        ADD_KEYS_SCRIPT, ("ADDITIONAL_USER_KEYS_TO_ADD", "OWNER_KEYS_TO_ADD")
+    )
+    return template.substitute(
+        {
+            "ADDITIONAL_USER_KEYS_TO_ADD": bash_array(user_keys, quote=True),
+            "OWNER_KEYS_TO_ADD": bash_array(owner_keys, quote=True),
+        }
+    )
+
+
+@lru_cache(maxsize=USERDATA_CACHE_SIZE)
+def render_mount_script(
+    new_volumes: tuple[tuple[str, str], ...],
+    attach_volumes: tuple[tuple[str, str], ...],
+) -> bytes:
+    """Volumes are given as (openstack_id, path) pairs."""
+    template = load_script_template(
+        MOUNT_SCRIPT,
+        (
+            "VOLUME_IDS_NEW",
+            "VOLUME_PATHS_NEW",
+            "VOLUME_IDS_ATTACH",
+            "VOLUME_PATHS_ATTACH",
+        ),
+    )
+    return template.substitute(
+        {
+            "VOLUME_IDS_NEW": bash_array(
+                f"virtio-{volume_id[:20]}" for volume_id, _ in new_volumes
+            ),
+            "VOLUME_PATHS_NEW": bash_array(path for _, path in new_volumes),
+            "VOLUME_IDS_ATTACH": bash_array(
+                f"virtio-{volume_id[:20]}" for volume_id, _ in attach_volumes
+            ),
+            "VOLUME_PATHS_ATTACH": bash_array(path for _, path in attach_volumes),
+        }
+    )
+
+
+def render_save_metadata_auth_token_script(token: str, metadata_endpoint: str) -> bytes:
+    # not cached, every VM gets its own token
+    template = load_script_template(
+        SAVE_METADATA_AUTH_TOKEN_SCRIPT,
+        (
+            "REPLACE_WITH_ACTUAL_TOKEN",
+            "REPLACE_WITH_ACTUAL_METADATA_INFO_ENDPOINT",
+        ),
+    )
+    return template.substitute(
+        {
+            "REPLACE_WITH_ACTUAL_TOKEN": token,
+            "REPLACE_WITH_ACTUAL_METADATA_INFO_ENDPOINT": metadata_endpoint,
+        }
+    )
+
+
+def volume_pairs(volumes: list[dict[str, str]] | None) -> tuple[tuple[str, str], ...]:
+    return tuple((volume["openstack_id"], volume["path"]) for volume in volumes or [])
+
+
+def clear_userdata_cache() -> None:
+    render_add_keys_script.cache_clear()
+    render_mount_script.cache_clear()
+
+
+def encoded_size(payload: bytes) -> int:
+    """Size of the payload once base64 encoded for the Nova API."""
+    return 4 * math.ceil(len(payload) / 3)
+
+
+def encode_multipart(scripts: list[tuple[str, bytes]]) -> bytes:
+    """
+    MIME multipart cloud-init userdata with one shell script part per script.
+
+    cloud-init runs the parts in the order of their file names, the index
+    prefix keeps the order of `scripts`.
+    """
+    # derived from the content, identical scripts give identical messages
+    digest = hashlib.sha256()
+    for _, script in scripts:
+        digest.update(script)
+    boundary = f"=============={digest.hexdigest()[:32]}=="
+    lines = [
+        f'Content-Type: multipart/mixed; boundary="{boundary}"'.encode(),
+        b"MIME-Version: 1.0",
+        b"",
+    ]
+    for index, (name, script) in enumerate(scripts):
+        if not script.startswith(b"#!"):
+            script = b"#!/bin/bash\n" + script
+        lines += [
+            f"--{boundary}".encode(),
+            b'Content-Type: text/x-shellscript; charset="utf-8"',
+            b"MIME-Version: 1.0",
+            b"Content-Transfer-Encoding: 8bit",
+            f'Content-Disposition: attachment; filename="{index:03d}-{name}"'.encode(),
+            b"",
+            script,
+        ]
+    lines += [f"--{boundary}--".encode(), b""]
+    return b"\n".join(lines)
+
+
+def pack_userdata(
+    scripts: list[tuple[str, bytes]], userdata_format: str
+) -> tuple[bytes, str]:
+    """
+    Userdata in the requested format and the format which was used.
+
+    Falls back to the plain script if packing does not make it smaller.
+    """
+    plain = b"\n".join(script for _, script in scripts)
+    if userdata_format != USERDATA_FORMAT_MULTIPART:
+        return plain, USERDATA_FORMAT_PLAIN
+    # without a timestamp the compressed payload only depends on the scripts
+    packed = gzip.compress(encode_multipart(scripts), compresslevel=9, mtime=0)
+    if len(packed) >= len(plain):
+        return plain, USERDATA_FORMAT_PLAIN
+    return packed, USERDATA_FORMAT_MULTIPART
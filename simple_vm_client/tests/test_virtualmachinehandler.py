@@ -7,7 +7,12 @@ from openstack.compute.v2 import flavor, server
 from openstack.image.v2 import image
 from openstack.test import fakes
 
-from simple_vm_client.ttypes import ClusterInstanceMetadata, ClusterVolume
+from simple_vm_client.ttypes import (
+    ClusterInstanceMetadata,
+    ClusterVolume,
+    DefaultException,
+    ResourceNotFoundException,
+)
 from simple_vm_client.VirtualMachineHandler import VirtualMachineHandler
 
 IMAGES_LIST = list(fakes.generate_fake_resources(image.Image, 3))
@@ -35,12 +40,21 @@ CLUS_TER_SHARED_VOLUME = ClusterVolume(
 
 
 class TestVirtualMachineHandler(unittest.TestCase):
+    @patch("simple_vm_client.VirtualMachineHandler.OperationManager")
     @patch("simple_vm_client.VirtualMachineHandler.OpenStackConnector")
     @patch("simple_vm_client.VirtualMachineHandler.BibigridConnector")
     @patch("simple_vm_client.VirtualMachineHandler.ForcConnector")
     @patch("simple_vm_client.VirtualMachineHandler.MetadataConnector")
-    def setUp(self, mock_template, mock_redis, mock_connection_pool, mock_meta):
+    def setUp(
+        self,
+        mock_template,
+        mock_redis,
+        mock_connection_pool,
+        mock_meta,
+        mock_operation_manager,
+    ):
         self.handler = VirtualMachineHandler(config_file="config_path")
+        self.handler.init_connectors()
 
     @patch("simple_vm_client.VirtualMachineHandler.thrift_converter")
     def test_get_images(self, converter):
@@ -416,6 +430,20 @@ class TestVirtualMachineHandler(unittest.TestCase):
             backend_id=OPENSTACK_ID, user_id=USERNAME
         )
 
+    def test_add_users_to_backend(self):
+        self.handler.add_users_to_backend(backend_id=OPENSTACK_ID, user_ids=[USERNAME])
+        self.handler.forc_connector.add_users_to_backend.assert_called_once_with(
+            backend_id=OPENSTACK_ID, user_ids=[USERNAME]
+        )
+
+    def test_delete_users_from_backend(self):
+        self.handler.delete_users_from_backend(
+            backend_id=OPENSTACK_ID, user_ids=[USERNAME]
+        )
+        self.handler.forc_connector.delete_users_from_backend.assert_called_once_with(
+            backend_id=OPENSTACK_ID, user_ids=[USERNAME]
+        )
+
     def test_activate_auth_for_backend(self):
         self.handler.activate_auth_for_backend(backend_id=OPENSTACK_ID)
         self.handler.forc_connector.activate_auth_for_backend.assert_called_once_with(
@@ -656,18 +684,17 @@ class TestVirtualMachineHandler(unittest.TestCase):
         self.handler.bibigrid_connector.is_bibigrid_available.assert_called_once()
 
     def test_is_openstack_connection_available_success(self):
-        self.handler.openstack_connector.get_limits.return_value = {"test": "value"}
+        self.handler.openstack_connector.is_token_valid.return_value = True
         result = self.handler.is_openstack_connection_available()
         self.assertTrue(result)
-        self.handler.openstack_connector.get_limits.assert_called_once()
+        self.handler.openstack_connector.is_token_valid.assert_called_once()
+        self.handler.openstack_connector.get_limits.assert_not_called()
 
     def test_is_openstack_connection_available_failure(self):
-        self.handler.openstack_connector.get_limits.side_effect = Exception(
-            "Connection failed"
-        )
+        self.handler.openstack_connector.is_token_valid.return_value = False
         result = self.handler.is_openstack_connection_available()
         self.assertFalse(result)
-        self.handler.openstack_connector.get_limits.assert_called_once()
+        self.handler.openstack_connector.is_token_valid.assert_called_once()
 
     #  def test_get_cluster_info(self):
     #     self.handler.get_cluster_info(cluster_id=OPENSTACK_ID)
@@ -681,6 +708,18 @@ class TestVirtualMachineHandler(unittest.TestCase):
             cluster_id=OPENSTACK_ID
         )
 
+    def test_get_cluster_log_tail(self):
+        self.handler.get_cluster_log_tail(cluster_id=OPENSTACK_ID, offset=10)
+        self.handler.bibigrid_connector.get_cluster_log_tail.assert_called_once_with(
+            cluster_id=OPENSTACK_ID, offset=10
+        )
+
+    def test_get_cluster_states(self):
+        self.handler.get_cluster_states(cluster_ids=[OPENSTACK_ID])
+        self.handler.bibigrid_connector.get_cluster_states.assert_called_once_with(
+            cluster_ids=[OPENSTACK_ID]
+        )
+
     def test_start_cluster(self):
         master = MagicMock()
         worker_instances = [MagicMock()]
@@ -727,6 +766,26 @@ class TestVirtualMachineHandler(unittest.TestCase):
             worker_idx=1,
         )
 
+    def test_scale_up_cluster(self):
+        self.handler.scale_up_cluster(
+            cluster_id=OPENSTACK_ID,
+            image_name=IMAGE.name,
+            flavor_name=FLAVOR.name,
+            count=2,
+            names=[NAME],
+            start_idx=1,
+            batch_idx=2,
+        )
+        self.handler.openstack_connector.scale_up_cluster.assert_called_once_with(
+            cluster_id=OPENSTACK_ID,
+            image_name=IMAGE.name,
+            flavor_name=FLAVOR.name,
+            count=2,
+            names=[NAME],
+            start_idx=1,
+            batch_idx=2,
+        )
+
     def test_keyboard_interrupt_handler_playbooks(self):
         mock_stop_a = MagicMock()
         mock_stop_b = MagicMock()
@@ -754,3 +813,174 @@ class TestVirtualMachineHandler(unittest.TestCase):
         mock_stop_a.stop.assert_called_once()
         mock_stop_b.stop.assert_called_once()
         mock_stop_c.stop.assert_called_once()
+
+    def test_create_snapshot_async(self):
+        self.handler.operation_manager.submit.return_value = "operation_id"
+        result = self.handler.create_snapshot_async(
+            openstack_id=OPENSTACK_ID,
+            name=NAME,
+            username=USERNAME,
+            base_tags=["tag"],
+            description=DESCRIPTION,
+        )
+        self.assertEqual(result, "operation_id")
+        operation_type, func = self.handler.operation_manager.submit.call_args.args
+        self.assertEqual(operation_type, "create_snapshot")
+        self.handler.openstack_connector.create_snapshot.assert_not_called()
+
+        func()
+        self.handler.openstack_connector.create_snapshot.assert_called_once_with(
+            openstack_id=OPENSTACK_ID,
+            name=NAME,
+            username=USERNAME,
+            base_tags=["tag"],
+            description=DESCRIPTION,
+        )
+
+    def test_create_volume_by_source_volume_async(self):
+        self.handler.openstack_connector.create_volume_by_source_volume.return_value = (
+            VOLUME
+        )
+        self.handler.create_volume_by_source_volume_async(
+            volume_name=NAME, metadata=METADATA, source_volume_id="source_id"
+        )
+        func = self.handler.operation_manager.submit.call_args.args[1]
+        self.assertEqual(func(), VOLUME.id)
+
+    def test_rescue_server_async_keeps_admin_pass_out_of_params(self):
+        self.handler.rescue_server_async(
+            openstack_id=OPENSTACK_ID, admin_pass="secret", image_ref="image"
+        )
+        submit_call = self.handler.operation_manager.submit.call_args
+        self.assertNotIn("admin_pass", submit_call.kwargs["params"])
+        submit_call.args[1]()
+        self.handler.openstack_connector.rescue_server.assert_called_once_with(
+            openstack_id=OPENSTACK_ID, admin_pass="secret", image_ref="image"
+        )
+
+    def test_get_operation(self):
+        operation = MagicMock()
+        self.handler.operation_manager.get_operation.return_value = operation
+        self.assertIs(self.handler.get_operation("operation_id"), operation)
+
+    def test_get_operation_not_found(self):
+        self.handler.operation_manager.get_operation.return_value = None
+        with self.assertRaises(ResourceNotFoundException):
+            self.handler.get_operation("operation_id")
+
+    def test_list_operations(self):
+        self.handler.list_operations(operation_type="detach_volume", status="")
+        self.handler.operation_manager.list_operations.assert_called_once_with(
+            operation_type="detach_volume", status=""
+        )
+
+
+class TestLazyConnectors(unittest.TestCase):
+    def setUp(self):
+        self.handler = VirtualMachineHandler(config_file="config_path")
+
+    @patch("simple_vm_client.VirtualMachineHandler.OpenStackConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.ForcConnector")
+    def test_connectors_built_on_first_use(self, mock_forc, mock_openstack):
+        states = self.handler.get_connector_states()
+        self.assertEqual(
+            set(states),
+            {
+                "openstack_connector",
+                "bibigrid_connector",
+                "forc_connector",
+                "metadata_connetor",
+                "flavor_resource_exporter",
+                "operation_manager",
+            },
+        )
+        self.assertTrue(all(s["state"] == "pending" for s in states.values()))
+        mock_openstack.assert_not_called()
+
+        self.handler.get_images()
+        self.handler.get_images()
+
+        mock_openstack.assert_called_once_with(config_file="config_path")
+        mock_forc.assert_not_called()
+        self.assertTrue(self.handler.is_connector_initialized("openstack_connector"))
+        self.assertFalse(self.handler.is_connector_initialized("forc_connector"))
+        self.assertEqual(
+            self.handler.get_connector_states()["openstack_connector"]["state"],
+            "ready",
+        )
+
+    @patch("simple_vm_client.VirtualMachineHandler.OpenStackConnector")
+    def test_failed_connector_is_retried(self, mock_openstack):
+        connector = MagicMock()
+        mock_openstack.side_effect = [Exception("keystone down"), connector]
+        with self.assertRaises(Exception):
+            self.handler.openstack_connector
+        state = self.handler.get_connector_states()["openstack_connector"]
+        self.assertEqual(state, {"state": "failed", "error": "keystone down"})
+
+        self.assertIs(self.handler.openstack_connector, connector)
+        self.assertEqual(mock_openstack.call_count, 2)
+
+    @patch("simple_vm_client.VirtualMachineHandler.ForcConnector")
+    def test_keyboard_interrupt_handler_without_forc(self, mock_forc):
+        with self.assertRaises(SystemExit):
+            self.handler.keyboard_interrupt_handler_playbooks()
+        mock_forc.assert_not_called()
+
+    @patch("simple_vm_client.VirtualMachineHandler.OperationManager")
+    @patch("simple_vm_client.VirtualMachineHandler.FlavorResourceExporterConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.MetadataConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.BibigridConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.ForcConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.OpenStackConnector")
+    def test_warmup(self, mock_openstack, mock_forc, *mocks):
+        self.assertFalse(self.handler.is_ready())
+        self.handler.warmup()
+        mock_openstack.return_value.warmup.assert_called_once_with()
+        mock_forc.return_value.warmup.assert_called_once_with()
+        self.assertTrue(self.handler.is_ready())
+        readiness = self.handler.get_readiness()
+        self.assertTrue(readiness["ready"])
+        self.assertTrue(
+            all(s["state"] == "ready" for s in readiness["connectors"].values())
+        )
+        self.assertEqual(
+            readiness["openstack_session"],
+            mock_openstack.return_value.get_session_metrics.return_value,
+        )
+
+    @patch("simple_vm_client.VirtualMachineHandler.OperationManager")
+    @patch("simple_vm_client.VirtualMachineHandler.FlavorResourceExporterConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.MetadataConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.BibigridConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.ForcConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.OpenStackConnector")
+    def test_warmup_failure(self, mock_openstack, *mocks):
+        mock_openstack.return_value.warmup.side_effect = Exception("nova down")
+        with self.assertRaises(DefaultException):
+            self.handler.warmup()
+        self.assertFalse(self.handler.is_ready())
+
+    @patch("simple_vm_client.VirtualMachineHandler.OperationManager")
+    @patch("simple_vm_client.VirtualMachineHandler.FlavorResourceExporterConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.MetadataConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.BibigridConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.ForcConnector")
+    @patch("simple_vm_client.VirtualMachineHandler.OpenStackConnector")
+    def test_warmup_optional_connector_failure(
+        self, mock_openstack, mock_forc, mock_bibigrid, *mocks
+    ):
+        mock_forc.side_effect = Exception("redis down")
+        mock_bibigrid.return_value.warmup.side_effect = Exception("unreachable")
+
+        self.handler.warmup()
+
+        self.assertTrue(self.handler.is_ready())
+        states = self.handler.get_connector_states()
+        self.assertEqual(states["forc_connector"]["state"], "failed")
+        self.assertEqual(states["openstack_connector"]["state"], "ready")
+        self.assertFalse(self.handler.is_connector_initialized("forc_connector"))
+
+    def test_mark_ready(self):
+        self.handler.mark_ready()
+        self.assertTrue(self.handler.is_ready())
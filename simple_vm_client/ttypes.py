@@ -3182,6 +3182,7 @@ class ClusterLog(object):
      - message
      - cluster_id
      - log
+     - offset
 
     """
 
@@ -3192,10 +3193,12 @@ class ClusterLog(object):
         message=None,
         cluster_id=None,
         log=None,
+        offset=None,
     ):
         self.message = message
         self.cluster_id = cluster_id
         self.log = log
+        self.offset = offset
 
     def read(self, iprot):
         if (
@@ -3237,6 +3240,11 @@ class ClusterLog(object):
                     )
                 else:
                     iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.offset = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -3272,6 +3280,10 @@ class ClusterLog(object):
                 self.log.encode("utf-8") if sys.version_info[0] == 2 else self.log
             )
             oprot.writeFieldEnd()
+        if self.offset is not None:
+            oprot.writeFieldBegin("offset", TType.I64, 4)
+            oprot.writeI64(self.offset)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -3406,6 +3418,231 @@ class PlaybookResult(object):
         return not (self == other)
 
 
+class Operation(object):
+    """
+    This Struct defines the state of an asynchronous operation.
+
+    Attributes:
+     - id: Id of the operation
+     - type: Name of the call which is executed, e.g. create_snapshot
+     - status: pending, running, succeeded or failed
+     - progress: Progress in percent: 0 pending, 50 running, 100 succeeded or failed
+     - result: Result of the call, e.g. the id of the new snapshot
+     - error: Error message if the operation failed
+     - params: Parameters of the call
+     - created_at: Unix timestamp of the submission
+     - updated_at: Unix timestamp of the last status change
+
+    """
+
+    thrift_spec = None
+
+    def __init__(
+        self,
+        id=None,
+        type=None,
+        status=None,
+        progress=None,
+        result=None,
+        error=None,
+        params=None,
+        created_at=None,
+        updated_at=None,
+    ):
+        self.id = id
+        self.type = type
+        self.status = status
+        self.progress = progress
+        self.result = result
+        self.error = error
+        self.params = params
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            fname, ftype, fid = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.type = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.status = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I32:
+                    self.progress = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.result = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.error = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.MAP:
+                    self.params = {}
+                    _ktype63, _vtype64, _size62 = iprot.readMapBegin()
+                    for _i65 in range(_size62):
+                        _key66 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val67 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.params[_key66] = _val67
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.I64:
+                    self.created_at = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.I64:
+                    self.updated_at = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("Operation")
+        if self.id is not None:
+            oprot.writeFieldBegin("id", TType.STRING, 1)
+            oprot.writeString(
+                self.id.encode("utf-8") if sys.version_info[0] == 2 else self.id
+            )
+            oprot.writeFieldEnd()
+        if self.type is not None:
+            oprot.writeFieldBegin("type", TType.STRING, 2)
+            oprot.writeString(
+                self.type.encode("utf-8") if sys.version_info[0] == 2 else self.type
+            )
+            oprot.writeFieldEnd()
+        if self.status is not None:
+            oprot.writeFieldBegin("status", TType.STRING, 3)
+            oprot.writeString(
+                self.status.encode("utf-8") if sys.version_info[0] == 2 else self.status
+            )
+            oprot.writeFieldEnd()
+        if self.progress is not None:
+            oprot.writeFieldBegin("progress", TType.I32, 4)
+            oprot.writeI32(self.progress)
+            oprot.writeFieldEnd()
+        if self.result is not None:
+            oprot.writeFieldBegin("result", TType.STRING, 5)
+            oprot.writeString(
+                self.result.encode("utf-8") if sys.version_info[0] == 2 else self.result
+            )
+            oprot.writeFieldEnd()
+        if self.error is not None:
+            oprot.writeFieldBegin("error", TType.STRING, 6)
+            oprot.writeString(
+                self.error.encode("utf-8") if sys.version_info[0] == 2 else self.error
+            )
+            oprot.writeFieldEnd()
+        if self.params is not None:
+            oprot.writeFieldBegin("params", TType.MAP, 7)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.params))
+            for kiter68, viter69 in self.params.items():
+                oprot.writeString(
+                    kiter68.encode("utf-8") if sys.version_info[0] == 2 else kiter68
+                )
+                oprot.writeString(
+                    viter69.encode("utf-8") if sys.version_info[0] == 2 else viter69
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.created_at is not None:
+            oprot.writeFieldBegin("created_at", TType.I64, 8)
+            oprot.writeI64(self.created_at)
+            oprot.writeFieldEnd()
+        if self.updated_at is not None:
+            oprot.writeFieldBegin("updated_at", TType.I64, 9)
+            oprot.writeI64(self.updated_at)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        if self.id is None:
+            raise TProtocolException(message="Required field id is unset!")
+        if self.type is None:
+            raise TProtocolException(message="Required field type is unset!")
+        if self.status is None:
+            raise TProtocolException(message="Required field status is unset!")
+        if self.progress is None:
+            raise TProtocolException(message="Required field progress is unset!")
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
 class MetadataServerNotAvailableException(TException):
     """
     Attributes:
@@ -6326,6 +6563,13 @@ ClusterLog.thrift_spec = (
         "UTF8",
         None,
     ),  # 3
+    (
+        4,
+        TType.I64,
+        "offset",
+        None,
+        None,
+    ),  # 4
 )
 all_structs.append(PlaybookResult)
 PlaybookResult.thrift_spec = (
@@ -6352,6 +6596,73 @@ PlaybookResult.thrift_spec = (
         None,
     ),  # 3
 )
+all_structs.append(Operation)
+Operation.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "id",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "type",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "status",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.I32,
+        "progress",
+        None,
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRING,
+        "result",
+        "UTF8",
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRING,
+        "error",
+        "UTF8",
+        None,
+    ),  # 6
+    (
+        7,
+        TType.MAP,
+        "params",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 7
+    (
+        8,
+        TType.I64,
+        "created_at",
+        None,
+        None,
+    ),  # 8
+    (
+        9,
+        TType.I64,
+        "updated_at",
+        None,
+        None,
+    ),  # 9
+)
 all_structs.append(MetadataServerNotAvailableException)
 MetadataServerNotAvailableException.thrift_spec = (
     None,  # 0
@@ -0,0 +1,56 @@
+"""HTTP liveness/readiness endpoint for load balancers.
+
+``/health`` answers 200 as long as the process is running, ``/ready`` answers
+200 once the server finished its warmup and 503 before.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+from simple_vm_client.util.logger import setup_custom_logger
+
+logger = setup_custom_logger(__name__)
+
+
+class HealthRequestHandler(BaseHTTPRequestHandler):
+    readiness: Callable[[], dict[str, Any]]
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send(200, {"alive": True})
+        elif self.path == "/ready":
+            readiness = self.readiness()
+            self._send(200 if readiness["ready"] else 503, readiness)
+        else:
+            self._send(404, {"error": f"Unknown path {self.path}"})
+
+    def _send(self, status: int, body: dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # probes arrive every few seconds, keep them out of the log
+        pass
+
+
+def start_health_server(
+    host: str, port: int, readiness: Callable[[], dict[str, Any]]
+) -> ThreadingHTTPServer:
+    handler = type(
+        "BoundHealthRequestHandler",
+        (HealthRequestHandler,),
+        {"readiness": staticmethod(readiness)},
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="health-server", daemon=True
+    ).start()
+    logger.info(f"Health endpoint listening on {host}:{port}")
+    return server
@@ -0,0 +1,223 @@
+"""Shared HTTP client for backend services.
+
+Wraps a pooled ``requests.Session`` with retries for idempotent requests,
+a circuit breaker per endpoint and per endpoint connection/latency metrics.
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from simple_vm_client.util.logger import setup_custom_logger
+
+logger = setup_custom_logger(__name__)
+
+IDEMPOTENT_METHODS = frozenset(["DELETE", "GET", "HEAD", "OPTIONS", "PUT"])
+# a 500 is an answer of the backend itself (e.g. FORC on deleting an unknown
+# backend), only gateway errors and overload are retried or open the breaker
+RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+FAILURE_STATUS_CODES = frozenset([502, 503, 504])
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised when requests to an endpoint are rejected by its circuit breaker."""
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if (
+                self.state == self.OPEN
+                and time.monotonic() - self.opened_at >= self.reset_timeout
+            ):
+                # let a single trial request through
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def release_trial(self) -> None:
+        """Reopens a half open breaker whose trial request ended without a result."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class EndpointMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.rejected = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def record(self, latency: float, failed: bool) -> None:
+        self.requests += 1
+        self.failures += failed
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "latency_avg": (
+                round(self.latency_total / self.requests, 4) if self.requests else 0.0
+            ),
+            "latency_max": round(self.latency_max, 4),
+        }
+
+
+class HttpClient:
+    def __init__(
+        self,
+        pool_maxsize: int = 20,
+        retries: int = 3,
+        backoff_factor: float = 0.3,
+        backoff_jitter: float = 0.2,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._metrics: dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=retries,
+            # a read timeout is raised right away, the request may have been processed
+            read=False,
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_jitter,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=IDEMPOTENT_METHODS,
+            raise_on_status=False,
+        )
+        self.adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=pool_maxsize, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    @staticmethod
+    def get_endpoint(url: str) -> str:
+        parts = urlsplit(url)
+        path = parts.path.strip("/").split("/", 1)[0]
+        return f"{parts.netloc}/{path}"
+
+    def _get_breaker(self, endpoint: str) -> tuple[CircuitBreaker, EndpointMetrics]:
+        with self._lock:
+            if endpoint not in self._breakers:
+                self._breakers[endpoint] = CircuitBreaker(
+                    failure_threshold=self.failure_threshold,
+                    reset_timeout=self.reset_timeout,
+                )
+                self._metrics[endpoint] = EndpointMetrics()
+            return self._breakers[endpoint], self._metrics[endpoint]
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        failure_status_codes: frozenset[int] = FAILURE_STATUS_CODES,
+        **kwargs,
+    ) -> requests.Response:
+        endpoint = self.get_endpoint(url)
+        breaker, metrics = self._get_breaker(endpoint)
+        if not breaker.allow_request():
+            with self._lock:
+                metrics.rejected += 1
+            raise CircuitOpenError(f"Circuit breaker for {endpoint} is open")
+
+        start_time = time.monotonic()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            self._record(endpoint, start_time, failed=True)
+            raise
+        except Exception:
+            breaker.release_trial()
+            raise
+        self._record(
+            endpoint,
+            start_time,
+            failed=response.status_code in failure_status_codes,
+        )
+        return response
+
+    def _record(self, endpoint: str, start_time: float, failed: bool) -> None:
+        breaker, metrics = self._get_breaker(endpoint)
+        with self._lock:
+            metrics.record(time.monotonic() - start_time, failed)
+        if failed:
+            breaker.record_failure()
+            if breaker.state == CircuitBreaker.OPEN:
+                logger.warning(
+                    f"Circuit breaker for {endpoint} opened after {breaker.failures} failures"
+                )
+        else:
+            breaker.record_success()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def get_metrics(self) -> dict[str, dict]:
+        with self._lock:
+            endpoints = {
+                endpoint: dict(
+                    endpoint_metrics.as_dict(), state=self._breakers[endpoint].state
+                )
+                for endpoint, endpoint_metrics in self._metrics.items()
+            }
+        pools = self.adapter.poolmanager.pools
+        with pools.lock:
+            pool_list = list(pools._container.values())
+        connections = {
+            f"{pool.host}:{pool.port}": {
+                "opened": pool.num_connections,
+                "requests": pool.num_requests,
+            }
+            for pool in pool_list
+        }
+        return {"endpoints": endpoints, "connections": connections}
@@ -1,87 +1,204 @@
+import atexit
+import copy
+import json
 import logging
 import os
-import traceback
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Callable
 
 from colorama import Fore, Style, init
 
 # Initialize colorama to support ANSI color codes on Windows terminals
 init()
 
+LOG_FORMAT = "%(asctime)s - [%(levelname)s] - [%(pathname)s:%(funcName)s:%(lineno)d] - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-def setup_custom_logger(name):
-    LOG_FILE_HANDLER_ACTIVATED = os.environ.get("LOG_FILE_HANDLER_ACTIVATED", True)
-    LOG_LEVEL = os.environ.get("LOG_LEVEL", "DEBUG")
+# attributes every LogRecord has, everything else was passed with extra=
+STANDARD_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
+
+LEVEL_COLORS = {
+    logging.CRITICAL: Fore.RED,
+    logging.ERROR: Fore.RED,
+    logging.WARNING: Fore.YELLOW,
+}
+
+_queue_handler: QueueHandler = None  # type: ignore
+_listener: QueueListener = None  # type: ignore
+_setup_lock = threading.Lock()
+_exception_formatter = logging.Formatter()
+
+
+class Lazy:
+    """
+    Extra value which is only computed when the record is emitted.
+
+    Use it for values which are expensive to build, e.g.
+    ``extra={"image_names": Lazy(lambda: [image.name for image in images])}``.
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
+    def resolve(self) -> Any:
+        try:
+            return self.func()
+        except Exception as e:
+            return f"<failed to compute: {e}>"
+
+
+def get_extra_fields(record: logging.LogRecord) -> dict[str, Any]:
+    extra_fields = {}
+    for key, value in record.__dict__.items():
+        if key not in STANDARD_RECORD_ATTRS:
+            extra_fields[key] = value.resolve() if isinstance(value, Lazy) else value
+    return extra_fields
+
+
+class ColoredFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        message = self.formatMessage(record)
+
+        # Append extra fields if any exist
+        extra_fields = get_extra_fields(record)
+        if extra_fields:
+            extra_str = ", ".join(
+                f"{key}={value}" for key, value in extra_fields.items()
+            )
+            message = f"{message} [{extra_str}]"
+
+        color = LEVEL_COLORS.get(record.levelno)
+        if color:
+            message = f"{color}{message}{Style.RESET_ALL}"
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message += f"\n{Fore.RED}{record.exc_text}{Style.RESET_ALL}"
+        if record.stack_info:
+            message += f"\n{self.formatStack(record.stack_info)}"
+        return message
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for filebeat's ndjson parser."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "pathname": record.pathname,
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        extra_fields = get_extra_fields(record)
+        if extra_fields:
+            data["extra"] = extra_fields
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread, which does the formatting and I/O.
+
+    Unlike QueueHandler.prepare this keeps the extra fields and the traceback,
+    the handlers behind the listener still need them.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            # do not keep the frames alive until the listener got to the record
+            record.exc_info = None
+        # arguments of lazy values may change once the caller moved on
+        for key, value in record.__dict__.items():
+            if isinstance(value, Lazy):
+                record.__dict__[key] = value.resolve()
+        return record
+
+
+def _is_enabled(value: str) -> bool:
+    return str(value).lower() not in ("false", "0", "no", "off")
+
+
+def _create_handlers() -> list[logging.Handler]:
+    LOG_FILE_HANDLER_ACTIVATED = _is_enabled(
+        os.environ.get("LOG_FILE_HANDLER_ACTIVATED", "True")
+    )
     LOG_FILE = os.environ.get("LOG_FILE", "log/portal_client.log")
+    LOG_FILE_FORMAT = os.environ.get("LOG_FILE_FORMAT", "text").lower()
     LOG_BACKUP_COUNT = int(os.environ.get("LOG_BACKUP_COUNT", 5))
-    LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BATES", 1073741824))
-
-    # Define the formatter with color coding
-    class ColoredFormatter(logging.Formatter):
-        def format(self, record):
-            # Handle potential key conflicts from extra parameters
-            # by temporarily removing conflicting keys from record.__dict__
-            original_record = record.__dict__.copy()
-            try:
-                # Collect extra fields to append to the message
-                extra_fields = {}
-                standard_attrs = logging.LogRecord(
-                    "", 0, "", 0, "", [], None
-                ).__dict__.keys()
-                for key in record.__dict__:
-                    if key not in standard_attrs:
-                        extra_fields[key] = record.__dict__[key]
-
-                base_message = super().format(record)
-
-                # Append extra fields if any exist
-                if extra_fields:
-                    extra_str = ", ".join(
-                        f"{key}={value}" for key, value in extra_fields.items()
-                    )
-                    message = f"{base_message} [{extra_str}]"
-                else:
-                    message = base_message
-
-                if (
-                    record.levelno == logging.ERROR
-                    or record.levelno == logging.CRITICAL
-                ):
-                    message = f"{Fore.RED}{message}{Style.RESET_ALL}"
-                elif record.levelno == logging.WARNING:
-                    message = f"{Fore.YELLOW}{message}{Style.RESET_ALL}"
-
-                if record.exc_info:
-                    tb_lines = traceback.format_exception(*record.exc_info)
-                    tb_message = "".join(tb_lines)
-                    message += f"\n{Fore.RED}{tb_message}{Style.RESET_ALL}"
-                return message
-            finally:
-                # Restore original record state
-                record.__dict__.clear()
-                record.__dict__.update(original_record)
-
-    formatter = ColoredFormatter(
-        fmt="%(asctime)s - [%(levelname)s] - [%(pathname)s:%(funcName)s:%(lineno)d] - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    LOG_MAX_BYTES = int(
+        os.environ.get("LOG_MAX_BYTES", os.environ.get("LOG_MAX_BATES", 1073741824))
     )
 
+    formatter = ColoredFormatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+
     handler = logging.StreamHandler()
     handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [handler]
 
-    # Create the log directory if it does not exist
-    log_dir = os.path.dirname(LOG_FILE)
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    if LOG_FILE_HANDLER_ACTIVATED:
+        # Create the log directory if it does not exist
+        log_dir = os.path.dirname(LOG_FILE)
+        if log_dir and not os.path.exists(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
+
+        file_handler = RotatingFileHandler(
+            maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, filename=LOG_FILE
+        )
+        if LOG_FILE_FORMAT == "json":
+            file_handler.setFormatter(JsonFormatter(datefmt=LOG_DATE_FORMAT))
+        else:
+            file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    return handlers
+
+
+def get_queue_handler() -> QueueHandler:
+    """Shared handler of all loggers, the output handlers run on one listener thread."""
+    global _queue_handler, _listener
+    with _setup_lock:
+        if _queue_handler is None:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            _listener = QueueListener(
+                log_queue, *_create_handlers(), respect_handler_level=True
+            )
+            _listener.start()
+            atexit.register(_listener.stop)
+            _queue_handler = LogQueueHandler(log_queue)
+    return _queue_handler
+
+
+def setup_custom_logger(name):
+    LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 
-    file_handler = RotatingFileHandler(
-        maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, filename=LOG_FILE
-    )
-    file_handler.setFormatter(formatter)
     logger = logging.getLogger(name)
     logger.setLevel(LOG_LEVEL)
-    logger.addHandler(handler)
-    if LOG_FILE_HANDLER_ACTIVATED:
-        logger.addHandler(file_handler)
+    handler = get_queue_handler()
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
 
     return logger
@@ -0,0 +1,238 @@
+"""Runs slow OpenStack calls in the background and tracks them in Redis.
+
+The RPC only submits the call and returns the id of the operation, the portal
+polls its state with get_operation instead of keeping a server thread busy
+until OpenStack answered.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from uuid import uuid4
+
+import redis
+import yaml
+
+from simple_vm_client.ttypes import DefaultException, Operation
+from simple_vm_client.util.logger import setup_custom_logger
+
+logger = setup_custom_logger(__name__)
+
+OPERATION_PENDING = "pending"
+OPERATION_RUNNING = "running"
+OPERATION_SUCCEEDED = "succeeded"
+OPERATION_FAILED = "failed"
+# the calls report no steps of their own, so progress follows the status
+OPERATION_PROGRESS = {
+    OPERATION_PENDING: 0,
+    OPERATION_RUNNING: 50,
+    OPERATION_SUCCEEDED: 100,
+    OPERATION_FAILED: 100,
+}
+
+OPERATION_WORKERS = 8
+OPERATION_QUEUE_SIZE = 100
+OPERATION_TTL = 86400
+OPERATION_LIST_LIMIT = 100
+OPERATION_KEY_PREFIX = "operation:"
+OPERATION_INDEX_KEY = "operations"
+OPERATION_REQUIRED_FIELDS = ("id", "type", "status")
+
+
+def _to_string(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
+
+
+class OperationManager:
+    def __init__(self, config_file: str):
+        logger.info("Initializing Operation Manager")
+        self.REDIS_HOST: str = ""
+        self.REDIS_PORT: int = None  # type: ignore
+        self.WORKERS: int = OPERATION_WORKERS
+        self.QUEUE_SIZE: int = OPERATION_QUEUE_SIZE
+        self.TTL: int = OPERATION_TTL
+        self.load_config(config_file=config_file)
+        # connects on first use
+        self.redis_connection = redis.Redis(
+            connection_pool=redis.ConnectionPool(
+                host=self.REDIS_HOST, port=self.REDIS_PORT, decode_responses=True
+            )
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.WORKERS, thread_name_prefix="operation"
+        )
+        # running and queued operations, further submissions are rejected
+        self._slots = threading.BoundedSemaphore(self.WORKERS + self.QUEUE_SIZE)
+
+    def load_config(self, config_file: str) -> None:
+        with open(config_file, "r") as ymlfile:
+            cfg = yaml.load(ymlfile, Loader=yaml.SafeLoader)
+            self.REDIS_HOST = cfg["redis"]["host"]
+            self.REDIS_PORT = cfg["redis"]["port"]
+            operations_cfg = cfg.get("operations", {})
+            self.WORKERS = operations_cfg.get("workers", OPERATION_WORKERS)
+            self.QUEUE_SIZE = operations_cfg.get("queue_size", OPERATION_QUEUE_SIZE)
+            self.TTL = operations_cfg.get("ttl", OPERATION_TTL)
+
+    def warmup(self) -> None:
+        self.redis_connection.ping()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(
+        self,
+        operation_type: str,
+        func: Callable[[], Any],
+        params: dict[str, Any] = None,  # type: ignore
+    ) -> str:
+        """
+        Runs `func` in the background and returns the id of the operation.
+
+        The return value of `func` becomes the result of the operation, an
+        exception marks it as failed.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise DefaultException(
+                message="Too many operations in progress, try again later"
+            )
+        operation_id = str(uuid4())
+        now = int(time.time())
+        try:
+            self._save(
+                operation_id,
+                {
+                    "id": operation_id,
+                    "type": operation_type,
+                    "status": OPERATION_PENDING,
+                    "params": json.dumps(
+                        {
+                            key: _to_string(value)
+                            for key, value in (params or {}).items()
+                            if value is not None
+                        }
+                    ),
+                    "created_at": now,
+                    "updated_at": now,
+                },
+            )
+            with self.redis_connection.pipeline() as pipe:
+                pipe.zadd(OPERATION_INDEX_KEY, {operation_id: now})
+                # ids of expired operations
+                pipe.zremrangebyscore(OPERATION_INDEX_KEY, "-inf", now - self.TTL)
+                pipe.execute()
+            self._executor.submit(self._run, operation_id, func)
+        except Exception:
+            self._slots.release()
+            raise
+        logger.info(f"Submitted operation {operation_id} ({operation_type})")
+        return operation_id
+
+    def get_operation(self, operation_id: str) -> Operation | None:
+        data = self.redis_connection.hgetall(OPERATION_KEY_PREFIX + operation_id)
+        return self._to_operation(data) if self._is_complete(data) else None
+
+    def list_operations(
+        self,
+        operation_type: str = None,  # type: ignore
+        status: str = None,  # type: ignore
+        limit: int = OPERATION_LIST_LIMIT,
+    ) -> list[Operation]:
+        """Most recent operations first, empty filters match everything."""
+        operations: list[Operation] = []
+        start = 0
+        while len(operations) < limit:
+            operation_ids = self.redis_connection.zrevrange(
+                OPERATION_INDEX_KEY, start, start + limit - 1
+            )
+            if not operation_ids:
+                break
+            start += len(operation_ids)
+            with self.redis_connection.pipeline() as pipe:
+                for operation_id in operation_ids:
+                    pipe.hgetall(OPERATION_KEY_PREFIX + operation_id)
+                results = pipe.execute()
+            expired = []
+            for operation_id, data in zip(operation_ids, results):
+                if not self._is_complete(data):
+                    expired.append(operation_id)
+                elif (not operation_type or data["type"] == operation_type) and (
+                    not status or data["status"] == status
+                ):
+                    operations.append(self._to_operation(data))
+            if expired:
+                self.redis_connection.zrem(OPERATION_INDEX_KEY, *expired)
+                start -= len(expired)
+        return operations[:limit]
+
+    def _run(self, operation_id: str, func: Callable[[], Any]) -> None:
+        try:
+            self._update(operation_id, status=OPERATION_RUNNING)
+            result = func()
+        except Exception as e:
+            message = getattr(e, "message", None) or str(e)
+            logger.error(f"Operation {operation_id} failed: {message}")
+            self._update(operation_id, status=OPERATION_FAILED, error=message)
+        else:
+            logger.info(f"Operation {operation_id} succeeded")
+            self._update(
+                operation_id,
+                status=OPERATION_SUCCEEDED,
+                result=_to_string(result),
+            )
+        finally:
+            self._slots.release()
+
+    def _update(self, operation_id: str, **fields: Any) -> None:
+        fields["updated_at"] = int(time.time())
+        key = OPERATION_KEY_PREFIX + operation_id
+
+        def update(pipe: redis.client.Pipeline) -> bool:
+            # a plain hset would recreate an expired operation without id and type
+            if not pipe.exists(key):
+                return False
+            pipe.multi()
+            pipe.hset(key, mapping=fields)
+            pipe.expire(key, self.TTL)
+            return True
+
+        try:
+            if not self.redis_connection.transaction(
+                update, key, value_from_callable=True
+            ):
+                logger.warning(f"Operation {operation_id} expired before its update")
+        except redis.RedisError as e:
+            logger.error(f"Could not update operation {operation_id}: {e}")
+
+    def _save(self, operation_id: str, fields: dict[str, Any]) -> None:
+        key = OPERATION_KEY_PREFIX + operation_id
+        with self.redis_connection.pipeline() as pipe:
+            pipe.hset(key, mapping=fields)
+            pipe.expire(key, self.TTL)
+            pipe.execute()
+
+    @staticmethod
+    def _is_complete(data: dict[str, str]) -> bool:
+        return all(data.get(field) for field in OPERATION_REQUIRED_FIELDS)
+
+    @staticmethod
+    def _to_operation(data: dict[str, str]) -> Operation:
+        return Operation(
+            id=data["id"],
+            type=data["type"],
+            status=data["status"],
+            progress=OPERATION_PROGRESS.get(data["status"], 0),
+            result=data.get("result"),
+            error=data.get("error"),
+            params=json.loads(data.get("params") or "{}"),
+            created_at=int(data["created_at"]) if "created_at" in data else None,
+            updated_at=int(data["updated_at"]) if "updated_at" in data else None,
+        )
@@ -0,0 +1,38 @@
+import json
+import unittest
+import urllib.error
+import urllib.request
+
+from simple_vm_client.util.health_server import start_health_server
+
+
+class TestHealthServer(unittest.TestCase):
+    def setUp(self):
+        self.readiness = {"ready": False, "connectors": {}}
+        self.server = start_health_server(
+            host="127.0.0.1", port=0, readiness=lambda: self.readiness
+        )
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _get(self, path):
+        try:
+            with urllib.request.urlopen(self.url + path, timeout=5) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_health(self):
+        self.assertEqual(self._get("/health"), (200, {"alive": True}))
+
+    def test_ready(self):
+        self.assertEqual(self._get("/ready"), (503, self.readiness))
+        self.readiness = {"ready": True, "connectors": {}}
+        self.assertEqual(self._get("/ready"), (200, self.readiness))
+
+    def test_unknown_path(self):
+        status, _ = self._get("/metrics")
+        self.assertEqual(status, 404)
@@ -0,0 +1,147 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from simple_vm_client.util.http_client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpClient,
+)
+
+URL = "https://forc.example.org:5000/backends/1"
+
+
+class TestHttpClient(unittest.TestCase):
+    def setUp(self):
+        self.client = HttpClient(failure_threshold=2, reset_timeout=30)
+
+    def test_get_endpoint(self):
+        self.assertEqual(HttpClient.get_endpoint(URL), "forc.example.org:5000/backends")
+        self.assertEqual(
+            HttpClient.get_endpoint("https://forc.example.org:5000/users/1"),
+            "forc.example.org:5000/users",
+        )
+
+    def test_retry_config(self):
+        retry = self.client.adapter.max_retries
+        self.assertFalse(retry.is_retry("POST", 503))
+        self.assertTrue(retry.is_retry("GET", 503))
+        self.assertTrue(retry.is_retry("DELETE", 429))
+        self.assertFalse(retry.is_retry("DELETE", 500))
+        self.assertGreater(retry.backoff_jitter, 0)
+
+    @patch("simple_vm_client.util.http_client.requests.Session.request")
+    def test_request_metrics(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=200)
+
+        response = self.client.get(URL, timeout=(30, 30))
+
+        self.assertEqual(response, mock_request.return_value)
+        mock_request.assert_called_once_with("GET", URL, timeout=(30, 30))
+        metrics = self.client.get_metrics()["endpoints"][
+            "forc.example.org:5000/backends"
+        ]
+        self.assertEqual(metrics["requests"], 1)
+        self.assertEqual(metrics["failures"], 0)
+        self.assertEqual(metrics["state"], CircuitBreaker.CLOSED)
+
+    @patch("simple_vm_client.util.http_client.requests.Session.request")
+    def test_circuit_opens_per_endpoint(self, mock_request):
+        mock_request.side_effect = requests.ConnectionError("down")
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                self.client.get(URL)
+
+        with self.assertRaises(CircuitOpenError):
+            self.client.get(URL)
+        self.assertEqual(mock_request.call_count, 2)
+
+        mock_request.side_effect = None
+        mock_request.return_value = MagicMock(status_code=200)
+        self.client.get("https://forc.example.org:5000/users/1")
+        metrics = self.client.get_metrics()["endpoints"]
+        self.assertEqual(metrics["forc.example.org:5000/backends"]["rejected"], 1)
+        self.assertEqual(
+            metrics["forc.example.org:5000/backends"]["state"], CircuitBreaker.OPEN
+        )
+        self.assertEqual(
+            metrics["forc.example.org:5000/users"]["state"], CircuitBreaker.CLOSED
+        )
+
+    @patch("simple_vm_client.util.http_client.requests.Session.request")
+    def test_gateway_error_counts_as_failure(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=503)
+        self.client.delete(URL)
+        self.client.delete(URL)
+
+        with self.assertRaises(CircuitOpenError):
+            self.client.delete(URL)
+
+    @patch("simple_vm_client.util.http_client.requests.Session.request")
+    def test_internal_server_error_is_no_failure(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=500)
+        for _ in range(3):
+            self.client.delete(URL)
+
+        metrics = self.client.get_metrics()["endpoints"][
+            "forc.example.org:5000/backends"
+        ]
+        self.assertEqual(metrics["failures"], 0)
+        self.assertEqual(metrics["state"], CircuitBreaker.CLOSED)
+
+    @patch("simple_vm_client.util.http_client.requests.Session.request")
+    def test_failure_status_codes_per_request(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=500)
+        self.client.get(URL, failure_status_codes=frozenset([500]))
+        self.client.get(URL, failure_status_codes=frozenset([500]))
+
+        with self.assertRaises(CircuitOpenError):
+            self.client.get(URL)
+        mock_request.assert_called_with("GET", URL)
+
+    @patch("simple_vm_client.util.http_client.time.monotonic")
+    @patch("simple_vm_client.util.http_client.requests.Session.request")
+    def test_unexpected_error_releases_trial(self, mock_request, mock_monotonic):
+        mock_monotonic.return_value = 100
+        mock_request.side_effect = requests.ConnectionError("down")
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                self.client.get(URL)
+
+        mock_monotonic.return_value = 131
+        mock_request.side_effect = ValueError("bad")
+        with self.assertRaises(ValueError):
+            self.client.get(URL)
+        breaker, _ = self.client._get_breaker("forc.example.org:5000/backends")
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        mock_request.side_effect = None
+        mock_request.return_value = MagicMock(status_code=200)
+        self.client.get(URL)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    @patch("simple_vm_client.util.http_client.time.monotonic")
+    def test_circuit_breaker_half_open(self, mock_monotonic):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        mock_monotonic.return_value = 100
+        breaker.record_failure()
+        self.assertFalse(breaker.allow_request())
+
+        mock_monotonic.return_value = 131
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        # only a single trial request
+        self.assertFalse(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        mock_monotonic.return_value = 200
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+
+if __name__ == "__main__":
+    unittest.main()
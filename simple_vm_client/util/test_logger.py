@@ -0,0 +1,98 @@
+import json
+import logging
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+from colorama import Fore
+
+from simple_vm_client.util.logger import (
+    ColoredFormatter,
+    JsonFormatter,
+    Lazy,
+    LogQueueHandler,
+    get_queue_handler,
+    setup_custom_logger,
+)
+
+
+def create_record(level=logging.INFO, exc_info=None, **extra):
+    record = logging.LogRecord(
+        "test", level, "/path/module.py", 10, "Server %s", ("vm1",), exc_info, "func"
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+class TestFormatters(unittest.TestCase):
+    def setUp(self):
+        self.formatter = ColoredFormatter(fmt="%(levelname)s - %(message)s")
+
+    def test_colored_formatter_extra_fields(self):
+        record = create_record(server_id="vm1", names=Lazy(lambda: ["a", "b"]))
+        self.assertEqual(
+            self.formatter.format(record),
+            "INFO - Server vm1 [server_id=vm1, names=['a', 'b']]",
+        )
+
+    def test_colored_formatter_warning(self):
+        message = self.formatter.format(create_record(level=logging.WARNING))
+        self.assertTrue(message.startswith(Fore.YELLOW))
+
+    def test_colored_formatter_exception(self):
+        try:
+            raise ValueError("broken")
+        except ValueError:
+            record = create_record(level=logging.ERROR, exc_info=sys.exc_info())
+        message = self.formatter.format(record)
+        self.assertEqual(message.count("ValueError: broken"), 1)
+        self.assertTrue(message.startswith(Fore.RED))
+
+    def test_json_formatter(self):
+        try:
+            raise ValueError("broken")
+        except ValueError:
+            record = create_record(exc_info=sys.exc_info(), count=2)
+        data = json.loads(JsonFormatter().format(record))
+        self.assertEqual(data["message"], "Server vm1")
+        self.assertEqual(data["level"], "INFO")
+        self.assertEqual(data["function"], "func")
+        self.assertEqual(data["line"], 10)
+        self.assertEqual(data["extra"], {"count": 2})
+        self.assertIn("ValueError: broken", data["exception"])
+
+
+class TestLogQueueHandler(unittest.TestCase):
+    def test_prepare(self):
+        handler = LogQueueHandler(MagicMock())
+        try:
+            raise ValueError("broken")
+        except ValueError:
+            record = create_record(
+                exc_info=sys.exc_info(), names=Lazy(lambda: ["a"]), count=1
+            )
+        prepared = handler.prepare(record)
+        self.assertEqual(prepared.msg, "Server vm1")
+        self.assertIsNone(prepared.args)
+        self.assertIsNone(prepared.exc_info)
+        self.assertIn("ValueError: broken", prepared.exc_text)
+        self.assertEqual(prepared.names, ["a"])
+        self.assertEqual(prepared.count, 1)
+        # the record of the caller stays untouched
+        self.assertIsInstance(record.names, Lazy)
+
+    def test_lazy_not_evaluated_for_disabled_level(self):
+        logger = setup_custom_logger("simple_vm_client.test_logger")
+        logger.setLevel(logging.INFO)
+        func = MagicMock()
+        logger.debug("Servers", extra={"server_ids": Lazy(func)})
+        func.assert_not_called()
+
+    def test_setup_custom_logger_shares_handler(self):
+        logger = setup_custom_logger("simple_vm_client.test_logger")
+        setup_custom_logger("simple_vm_client.test_logger")
+        self.assertEqual(logger.handlers, [get_queue_handler()])
+
+
+if __name__ == "__main__":
+    unittest.main()
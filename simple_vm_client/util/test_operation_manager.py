@@ -0,0 +1,287 @@
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from simple_vm_client.ttypes import DefaultException
+from simple_vm_client.util.operation_manager import (
+    OPERATION_FAILED,
+    OPERATION_INDEX_KEY,
+    OPERATION_KEY_PREFIX,
+    OPERATION_PENDING,
+    OPERATION_RUNNING,
+    OPERATION_SUCCEEDED,
+    OperationManager,
+)
+
+CONFIG_DATA = """
+redis:
+  host: localhost
+  port: 6379
+operations:
+  workers: 2
+  queue_size: 1
+  ttl: 3600
+"""
+
+
+class FakeRedis:
+    """The few commands the manager uses, with decoded responses."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+        self.lock = threading.Lock()
+
+    def ping(self):
+        return True
+
+    def hset(self, key, mapping):
+        with self.lock:
+            self.hashes.setdefault(key, {}).update(
+                {field: str(value) for field, value in mapping.items()}
+            )
+
+    def hgetall(self, key):
+        with self.lock:
+            return dict(self.hashes.get(key, {}))
+
+    def exists(self, key):
+        with self.lock:
+            return int(key in self.hashes)
+
+    def expire(self, key, ttl):
+        pass
+
+    def zadd(self, key, mapping):
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+
+    def zremrangebyscore(self, key, minimum, maximum):
+        members = self.sorted_sets.get(key, {})
+        for member, score in list(members.items()):
+            if score <= maximum:
+                del members[member]
+
+    def zrevrange(self, key, start, end):
+        members = sorted(
+            self.sorted_sets.get(key, {}).items(), key=lambda item: -item[1]
+        )
+        stop = end + 1
+        return [member for member, _ in members[start:stop]]
+
+    def zrem(self, key, *members):
+        for member in members:
+            self.sorted_sets.get(key, {}).pop(member, None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def transaction(self, func, *watches, value_from_callable=False):
+        with self.pipeline() as pipe:
+            pipe.watch(*watches)
+            func_value = func(pipe)
+            exec_value = pipe.execute()
+        return func_value if value_from_callable else exec_value
+
+
+class FakePipeline:
+    def __init__(self, redis_connection):
+        self.redis_connection = redis_connection
+        self.commands = []
+        # commands run right away between watch and multi
+        self.immediate = False
+
+    def watch(self, *keys):
+        self.immediate = True
+
+    def multi(self):
+        self.immediate = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            if self.immediate:
+                return getattr(self.redis_connection, name)(*args, **kwargs)
+            self.commands.append((name, args, kwargs))
+
+        return command
+
+    def execute(self):
+        return [
+            getattr(self.redis_connection, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class TestOperationManager(unittest.TestCase):
+    @patch("simple_vm_client.util.operation_manager.redis.Redis")
+    def setUp(self, mock_redis):
+        self.redis_connection = FakeRedis()
+        mock_redis.return_value = self.redis_connection
+        with tempfile.NamedTemporaryFile(mode="w+", suffix=".yml") as config_file:
+            config_file.write(CONFIG_DATA)
+            config_file.flush()
+            self.manager = OperationManager(config_file=config_file.name)
+
+    def tearDown(self):
+        self.manager.shutdown()
+
+    def test_load_config(self):
+        self.assertEqual(self.manager.REDIS_HOST, "localhost")
+        self.assertEqual(self.manager.WORKERS, 2)
+        self.assertEqual(self.manager.QUEUE_SIZE, 1)
+        self.assertEqual(self.manager.TTL, 3600)
+
+    def test_submit_returns_before_the_call_finished(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def create_snapshot():
+            started.set()
+            release.wait(5)
+            return "snapshot_id"
+
+        operation_id = self.manager.submit(
+            "create_snapshot",
+            create_snapshot,
+            params={"name": "snap", "base_tags": ["a"], "description": None},
+        )
+        self.assertTrue(started.wait(5))
+        operation = self.manager.get_operation(operation_id)
+        self.assertEqual(operation.type, "create_snapshot")
+        self.assertEqual(operation.status, OPERATION_RUNNING)
+        self.assertEqual(operation.progress, 50)
+        self.assertEqual(operation.params, {"name": "snap", "base_tags": '["a"]'})
+
+        release.set()
+        self.manager._executor.shutdown(wait=True)
+        operation = self.manager.get_operation(operation_id)
+        self.assertEqual(operation.status, OPERATION_SUCCEEDED)
+        self.assertEqual(operation.progress, 100)
+        self.assertEqual(operation.result, "snapshot_id")
+
+    def test_failed_operation(self):
+        def detach_volume():
+            raise DefaultException(message="volume busy")
+
+        operation_id = self.manager.submit("detach_volume", detach_volume)
+        self.manager._executor.shutdown(wait=True)
+        operation = self.manager.get_operation(operation_id)
+        self.assertEqual(operation.status, OPERATION_FAILED)
+        self.assertEqual(operation.progress, 100)
+        self.assertEqual(operation.error, "volume busy")
+
+    def test_dict_result_is_json(self):
+        operation_id = self.manager.submit(
+            "attach_volume_to_server", lambda: {"device": "/dev/vdb"}
+        )
+        self.manager._executor.shutdown(wait=True)
+        self.assertEqual(
+            self.manager.get_operation(operation_id).result, '{"device": "/dev/vdb"}'
+        )
+
+    def test_submit_is_bounded(self):
+        release = threading.Event()
+        # two workers and one queued operation
+        for _ in range(3):
+            self.manager.submit("detach_volume", lambda: release.wait(5))
+        with self.assertRaises(DefaultException):
+            self.manager.submit("detach_volume", lambda: None)
+        release.set()
+        self.manager._executor.shutdown(wait=True)
+        self.assertTrue(self.manager._slots.acquire(blocking=False))
+
+    def test_get_unknown_operation(self):
+        self.assertIsNone(self.manager.get_operation("unknown"))
+
+    def test_get_incomplete_operation(self):
+        self.redis_connection.hset(
+            OPERATION_KEY_PREFIX + "partial", {"status": OPERATION_FAILED}
+        )
+        self.assertIsNone(self.manager.get_operation("partial"))
+
+    def test_update_does_not_recreate_expired_operation(self):
+        submitted = threading.Event()
+
+        def create_snapshot():
+            submitted.wait(5)
+            # the hash expires while the call is running
+            self.redis_connection.hashes.pop(OPERATION_KEY_PREFIX + operation_id)
+            return "snapshot_id"
+
+        operation_id = self.manager.submit("create_snapshot", create_snapshot)
+        submitted.set()
+        self.manager._executor.shutdown(wait=True)
+        self.assertNotIn(
+            OPERATION_KEY_PREFIX + operation_id, self.redis_connection.hashes
+        )
+        self.assertIsNone(self.manager.get_operation(operation_id))
+
+    def test_list_operations(self):
+        for score, (operation_type, status) in enumerate(
+            [
+                ("create_snapshot", OPERATION_SUCCEEDED),
+                ("detach_volume", OPERATION_FAILED),
+                ("create_snapshot", OPERATION_PENDING),
+            ]
+        ):
+            operation_id = f"operation-{score}"
+            self.redis_connection.hset(
+                OPERATION_KEY_PREFIX + operation_id,
+                {
+                    "id": operation_id,
+                    "type": operation_type,
+                    "status": status,
+                    "created_at": score,
+                },
+            )
+            self.redis_connection.zadd(OPERATION_INDEX_KEY, {operation_id: score})
+        # expired operation which is still indexed
+        self.redis_connection.zadd(OPERATION_INDEX_KEY, {"operation-expired": 10})
+        # only the fields of a late update are left
+        self.redis_connection.hset(
+            OPERATION_KEY_PREFIX + "operation-partial", {"status": OPERATION_FAILED}
+        )
+        self.redis_connection.zadd(OPERATION_INDEX_KEY, {"operation-partial": 11})
+
+        operations = self.manager.list_operations()
+        self.assertEqual(
+            [operation.id for operation in operations],
+            ["operation-2", "operation-1", "operation-0"],
+        )
+        self.assertEqual(
+            [operation.progress for operation in operations], [0, 100, 100]
+        )
+        for operation_id in ("operation-expired", "operation-partial"):
+            self.assertNotIn(
+                operation_id, self.redis_connection.sorted_sets[OPERATION_INDEX_KEY]
+            )
+        self.assertEqual(
+            [
+                operation.id
+                for operation in self.manager.list_operations(
+                    operation_type="create_snapshot"
+                )
+            ],
+            ["operation-2", "operation-0"],
+        )
+        self.assertEqual(
+            [
+                operation.id
+                for operation in self.manager.list_operations(status=OPERATION_FAILED)
+            ],
+            ["operation-1"],
+        )
+        self.assertEqual(
+            [operation.id for operation in self.manager.list_operations(limit=1)],
+            ["operation-2"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import json
 import unittest
 from unittest.mock import patch
 
@@ -8,11 +9,58 @@ from openstack.compute.v2.server import Server as OpenStackServer
 from openstack.image.v2.image import Image as OpenStackImage
 from openstack.test import fakes
 
-from simple_vm_client.ttypes import VM, Flavor, Image, Snapshot, Volume
+from simple_vm_client.ttypes import (
+    VM,
+    Flavor,
+    Image,
+    MetadataUser,
+    MetadataUserData,
+    Snapshot,
+    VirtualMachineServerMetadata,
+    Volume,
+)
 from simple_vm_client.util import thrift_converter
 from simple_vm_client.util.state_enums import VmStates
 
 
+def reference_thrift_to_dict(obj):
+    # the former recursive thrift_to_dict, the new one has to stay identical to it
+    if hasattr(obj, "thrift_spec") and obj.thrift_spec is not None:
+        result = {}
+        for field in obj.thrift_spec:
+            if field is not None:
+                field_id, field_type, field_name, *rest = field
+                value = getattr(obj, field_name, None)
+                result[field_name] = reference_thrift_to_dict(value)
+        return result
+    elif isinstance(obj, list):
+        return [reference_thrift_to_dict(item) for item in obj]
+    elif isinstance(obj, dict):
+        return {
+            reference_thrift_to_dict(key): reference_thrift_to_dict(value)
+            for key, value in obj.items()
+        }
+    else:
+        return obj
+
+
+def create_metadata() -> VirtualMachineServerMetadata:
+    return VirtualMachineServerMetadata(
+        ip="192.168.0.1",
+        hashed_auth_token="token",
+        userdata=MetadataUserData(
+            data={
+                f"user{i}": MetadataUser(
+                    user_id=f"user{i}",
+                    public_keys=[f"ssh-ed25519 key{i}", 'ssh-rsa \u00e4"quoted"'],
+                    unix_name=f"unix{i}",
+                )
+                for i in range(3)
+            }
+        ),
+    )
+
+
 class TestThriftConverter(unittest.TestCase):
     def test_os_to_thrift_image(self):
         openstack_image = fakes.generate_fake_resource(OpenStackImage)
@@ -260,6 +308,121 @@ class TestThriftConverter(unittest.TestCase):
         )
         self.assertEqual(len(result_servers), len(openstack_servers))
 
+    def _create_servers(self, count, flavor, image):
+        openstack_servers = list(fakes.generate_fake_resources(OpenStackServer, count))
+        for openstack_server in openstack_servers:
+            openstack_server.flavor = flavor
+            openstack_server.image = image
+        return openstack_servers
+
+    def test_os_to_thrift_servers_matches_attribute_access(self):
+        openstack_servers = self._create_servers(
+            3,
+            fakes.generate_fake_resource(OpenStackFlavor),
+            fakes.generate_fake_resource(OpenStackImage),
+        )
+        openstack_servers[1].image = None
+        openstack_servers[2].addresses = {
+            "network": [
+                {"OS-EXT-IPS:type": "floating", "addr": "127.0.0.1"},
+                {"OS-EXT-IPS:type": "fixed", "addr": "192.168.0.1"},
+            ]
+        }
+        raw_server = OpenStackServer.existing(
+            id="server_id",
+            name="raw",
+            flavor={"original_name": "de.NBI small", "vcpus": 2, "ram": 4096},
+            image="",
+            addresses={},
+        )
+        openstack_servers.append(raw_server)
+
+        result_servers = thrift_converter.os_to_thrift_servers(
+            openstack_servers=openstack_servers
+        )
+
+        self.assertEqual(
+            result_servers,
+            [
+                thrift_converter._os_to_thrift_server_attributes(
+                    openstack_server=openstack_server
+                )
+                for openstack_server in openstack_servers
+            ],
+        )
+        self.assertEqual(result_servers[3].flavor.name, "de.NBI small")
+        self.assertIsNone(result_servers[3].image)
+
+    @patch(
+        "simple_vm_client.util.thrift_converter.os_to_thrift_image",
+        wraps=thrift_converter.os_to_thrift_image,
+    )
+    @patch(
+        "simple_vm_client.util.thrift_converter.os_to_thrift_flavor",
+        wraps=thrift_converter.os_to_thrift_flavor,
+    )
+    def test_os_to_thrift_servers_shares_flavor_and_image(
+        self, mock_flavor, mock_image
+    ):
+        openstack_image = fakes.generate_fake_resource(OpenStackImage)
+        openstack_servers = self._create_servers(
+            5, fakes.generate_fake_resource(OpenStackFlavor), openstack_image
+        )
+
+        result_servers = thrift_converter.os_to_thrift_servers(
+            openstack_servers=openstack_servers
+        )
+        thrift_converter.os_to_thrift_servers(openstack_servers=openstack_servers)
+
+        mock_flavor.assert_called_once()
+        mock_image.assert_called_once()
+        self.assertTrue(
+            all(vm.image is result_servers[0].image for vm in result_servers)
+        )
+
+        # a changed image gets a new version stamp
+        openstack_image.updated_at = "2030-01-01T00:00:00Z"
+        thrift_converter.os_to_thrift_servers(openstack_servers=openstack_servers)
+        self.assertEqual(mock_image.call_count, 2)
+
+    def test_thrift_to_dict_matches_reference(self):
+        openstack_server = fakes.generate_fake_resource(OpenStackServer)
+        openstack_server.flavor = fakes.generate_fake_resource(OpenStackFlavor)
+        openstack_server.image = fakes.generate_fake_resource(OpenStackImage)
+        vm = thrift_converter.os_to_thrift_server(openstack_server=openstack_server)
+        objects = [
+            create_metadata(),
+            VirtualMachineServerMetadata(),
+            vm,
+            [vm, None, [1, {"a": Flavor(name="nested")}]],
+            {"a": [VM(), 1.5], 2: "b"},
+            "plain",
+            None,
+        ]
+        for obj in objects:
+            self.assertEqual(
+                json.dumps(thrift_converter.thrift_to_dict(obj)),
+                json.dumps(reference_thrift_to_dict(obj)),
+            )
+
+    def test_thrift_to_dict_does_not_share_containers(self):
+        metadata = create_metadata()
+        result = thrift_converter.thrift_to_dict(metadata)
+        public_keys = result["userdata"]["data"]["user0"]["public_keys"]
+        self.assertIsNot(public_keys, metadata.userdata.data["user0"].public_keys)
+
+    def test_thrift_to_json(self):
+        # the metadata payload has to stay byte-identical to the former one
+        for obj in [create_metadata(), VirtualMachineServerMetadata()]:
+            self.assertEqual(
+                thrift_converter.thrift_to_json(obj),
+                json.dumps(reference_thrift_to_dict(obj)),
+            )
+
+    def test_thrift_to_json_unknown_type(self):
+        with self.assertRaises(TypeError):
+            thrift_converter.thrift_to_json({"a": object()})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from simple_vm_client.util.ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TTLCache(ttl=10)
+
+    @patch("simple_vm_client.util.ttl_cache.time.monotonic")
+    def test_get_or_load(self, mock_monotonic):
+        loader = MagicMock(side_effect=[["a"], ["b"]])
+        mock_monotonic.return_value = 100
+        self.assertEqual(self.cache.get_or_load("flavors", loader), ["a"])
+        mock_monotonic.return_value = 109
+        self.assertEqual(self.cache.get_or_load("flavors", loader), ["a"])
+        loader.assert_called_once()
+
+        mock_monotonic.return_value = 110
+        self.assertEqual(self.cache.get_or_load("flavors", loader), ["b"])
+        self.assertEqual(loader.call_count, 2)
+
+    def test_loader_error_is_not_cached(self):
+        loader = MagicMock(side_effect=[Exception("down"), ["a"]])
+        with self.assertRaises(Exception):
+            self.cache.get_or_load("images", loader)
+        self.assertIsNone(self.cache.get("images"))
+        self.assertEqual(self.cache.get_or_load("images", loader), ["a"])
+
+    def test_invalidate(self):
+        self.cache.set("flavors", ["a"])
+        self.cache.set("images", ["b"])
+        self.cache.invalidate("images")
+        self.assertEqual(self.cache.get("flavors"), ["a"])
+        self.assertIsNone(self.cache.get("images"))
+        self.cache.invalidate()
+        self.assertEqual(self.cache.get("flavors", []), [])
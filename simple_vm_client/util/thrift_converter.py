@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from openstack.block_storage.v2.snapshot import Snapshot as OpenStack_Snapshot
 from openstack.block_storage.v2.volume import Volume as OpenStack_Volume
 from openstack.compute.v2.flavor import Flavor as OpenStack_Flavor
@@ -100,11 +102,153 @@ def os_to_thrift_volume_snapshot(openstack_snapshot: OpenStack_Snapshot) -> Snap
     return snapshot
 
 
-def os_to_thrift_server(openstack_server: OpenStack_Server) -> VM:
+# converted flavors and images of earlier calls, keyed by their version stamp
+CONVERTED_RESOURCES_MAX = 4096
+_converted_resources: dict[tuple, Flavor | Image] = {}
+
+
+class ServerRecord:
+    """The fields of a server which end up in a VM, read from the raw body."""
+
+    __slots__ = (
+        "openstack_id",
+        "name",
+        "metadata",
+        "project_id",
+        "keyname",
+        "created_at",
+        "task_state",
+        "vm_state",
+        "fixed_ip",
+        "floating_ip",
+        "attached_volume_ids",
+        "flavor",
+        "image",
+    )
+
+    def __init__(self, body: dict):
+        get = body.get
+        self.openstack_id = get("id")
+        self.name = get("name")
+        self.metadata = get("metadata")
+        self.project_id = get("tenant_id")
+        self.keyname = get("key_name")
+        self.created_at = get("created")
+        self.task_state = get("OS-EXT-STS:task_state") or ""
+        self.vm_state = get("OS-EXT-STS:vm_state")
+        self.fixed_ip = ""
+        self.floating_ip = ""
+        for values in (get("addresses") or {}).values():
+            for address in values:
+                if address["OS-EXT-IPS:type"] == "floating":
+                    self.floating_ip = address["addr"]
+                elif address["OS-EXT-IPS:type"] == "fixed":
+                    self.fixed_ip = address["addr"]
+        self.attached_volume_ids = [
+            volume["id"] for volume in get("os-extended-volumes:volumes_attached") or []
+        ]
+        self.flavor = get("flavor")
+        self.image = get("image")
+
+
+def _flavor_stamp(body: dict) -> tuple:
+    # nova flavors are immutable apart from the description
+    return (
+        "flavor",
+        body.get("id"),
+        body.get("name"),
+        body.get("original_name"),
+        body.get("description"),
+        body.get("vcpus"),
+        body.get("ram"),
+        body.get("disk"),
+        body.get("OS-FLV-EXT-DATA:ephemeral"),
+    )
+
+
+def _image_stamp(body: dict) -> tuple | None:
+    # glance bumps updated_at on every change, the compute API calls it updated
+    updated_at = body.get("updated_at") or body.get("updated")
+    if not body.get("id") or not updated_at:
+        return None
+    return (
+        "image",
+        body["id"],
+        updated_at,
+        body.get("status"),
+        tuple(body.get("tags") or ()),
+    )
+
+
+def _convert_nested(resource, memo: dict, stamp, convert):
+    # the memo keeps the resource alive, so its id cannot be reused in this call
+    cached = memo.get(id(resource))
+    if cached is not None:
+        return cached[1]
+    body = getattr(resource, "_body", None)
+    key = stamp(body.attributes) if body is not None else None
+    converted = _converted_resources.get(key) if key else None
+    if converted is None:
+        converted = convert(resource)
+        if key:
+            if len(_converted_resources) >= CONVERTED_RESOURCES_MAX:
+                _converted_resources.clear()
+            _converted_resources[key] = converted
+    memo[id(resource)] = (resource, converted)
+    return converted
+
+
+def _server_record_to_vm(record: ServerRecord, memo: dict) -> VM:
+    flavor = None
+    if record.flavor:
+        flavor = _convert_nested(
+            record.flavor,
+            memo,
+            _flavor_stamp,
+            lambda resource: os_to_thrift_flavor(openstack_flavor=resource),
+        )
+    image = None
+    if record.image:
+        image = _convert_nested(
+            record.image,
+            memo,
+            _image_stamp,
+            lambda resource: os_to_thrift_image(openstack_image=resource),
+        )
+    return VM(
+        flavor=flavor,
+        image=image,
+        metadata=record.metadata,
+        project_id=record.project_id,
+        keyname=record.keyname,
+        openstack_id=record.openstack_id,
+        name=record.name,
+        created_at=record.created_at,
+        task_state=record.task_state,
+        vm_state=record.vm_state,
+        fixed_ip=record.fixed_ip,
+        floating_ip=record.floating_ip,
+        attached_volume_ids=record.attached_volume_ids,
+    )
+
+
+def _os_to_thrift_server(openstack_server: OpenStack_Server, memo: dict) -> VM:
     if not openstack_server:
         logger.info("Openstack server not found")
-
         return VM(vm_state=VmStates.NOT_FOUND)
+    body = getattr(openstack_server, "_body", None)
+    if body is None:
+        return _os_to_thrift_server_attributes(openstack_server=openstack_server)
+    record = ServerRecord(body.attributes)
+    # raw flavor/image dicts still need the resource conversion
+    if record.flavor and not hasattr(record.flavor, "_body"):
+        record.flavor = openstack_server.flavor
+    if record.image and not hasattr(record.image, "_body"):
+        record.image = openstack_server.image
+    return _server_record_to_vm(record, memo)
+
+
+def _os_to_thrift_server_attributes(openstack_server: OpenStack_Server) -> VM:
     fixed_ip = ""
     floating_ip = ""
     if openstack_server.flavor:
@@ -141,27 +285,73 @@ def os_to_thrift_server(openstack_server: OpenStack_Server) -> VM:
     return server
 
 
+def os_to_thrift_server(openstack_server: OpenStack_Server) -> VM:
+    return _os_to_thrift_server(openstack_server=openstack_server, memo={})
+
+
 def os_to_thrift_servers(openstack_servers: list[OpenStack_Server]) -> list[VM]:
+    # servers sharing a flavor or image also share the converted struct
+    memo: dict[int, tuple] = {}
     return [
-        os_to_thrift_server(openstack_server=openstack_server)
+        _os_to_thrift_server(openstack_server=openstack_server, memo=memo)
         for openstack_server in openstack_servers
     ]
 
 
+# field names per thrift struct class, taken from its thrift_spec
+_field_plans: dict[type, tuple[str, ...]] = {}
+_SCALAR_TYPES = frozenset([str, int, float, bool, bytes, type(None)])
+
+
+def _get_field_plan(obj) -> tuple[str, ...] | None:
+    plan = _field_plans.get(type(obj))
+    if plan is None:
+        thrift_spec = getattr(obj, "thrift_spec", None)
+        if thrift_spec is None:
+            return None
+        plan = tuple(field[2] for field in thrift_spec if field is not None)
+        _field_plans[type(obj)] = plan
+    return plan
+
+
 def thrift_to_dict(obj):
-    if hasattr(obj, "thrift_spec") and obj.thrift_spec is not None:
-        result = {}
-        for field in obj.thrift_spec:
-            if field is not None:
-                field_id, field_type, field_name, *rest = field
-                value = getattr(obj, field_name, None)
-                result[field_name] = thrift_to_dict(value)
-        return result
-    elif isinstance(obj, list):
-        return [thrift_to_dict(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {
-            thrift_to_dict(key): thrift_to_dict(value) for key, value in obj.items()
-        }
-    else:
-        return obj
+    root = [obj]
+    stack = [(root, 0, obj)]
+    while stack:
+        target, key, value = stack.pop()
+        plan = _get_field_plan(value)
+        if plan is not None:
+            converted = {name: getattr(value, name, None) for name in plan}
+            children = converted.items()
+        elif isinstance(value, list):
+            converted = list(value)
+            children = enumerate(converted)
+        elif isinstance(value, dict):
+            converted = {
+                (k if type(k) in _SCALAR_TYPES else thrift_to_dict(k)): v
+                for k, v in value.items()
+            }
+            children = converted.items()
+        else:
+            continue
+        target[key] = converted
+        for child_key, child in children:
+            if type(child) not in _SCALAR_TYPES:
+                stack.append((converted, child_key, child))
+    return root[0]
+
+
+def _thrift_struct_fields(obj) -> dict:
+    plan = _get_field_plan(obj)
+    if plan is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return {name: getattr(obj, name, None) for name in plan}
+
+
+def thrift_to_json(obj) -> str:
+    """
+    Serialize a thrift struct to JSON, identical to json.dumps(thrift_to_dict(obj)).
+
+    Structs are expanded by the encoder, so no intermediate dicts are built.
+    """
+    return json.dumps(obj, default=_thrift_struct_fields)
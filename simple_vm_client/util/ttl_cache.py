@@ -0,0 +1,44 @@
+import threading
+import time
+from typing import Any, Callable
+
+
+class TTLCache:
+    """
+    Thread safe key/value cache whose entries expire after ``ttl`` seconds.
+
+    Loaders run outside the lock, concurrent misses for the same key may both
+    call the loader and the last result wins.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return default
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        value = loader()
+        self.set(key, value)
+        return value
+
+    def invalidate(self, key: str = None) -> None:  # type: ignore
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)